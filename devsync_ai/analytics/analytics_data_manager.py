@@ -10,7 +10,7 @@ import logging
 import json
 import sqlite3
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import aiosqlite
@@ -45,11 +45,76 @@ class AnalyticsDataManager:
     
     Provides efficient storage, querying, aggregation, and data lifecycle
     management for all analytics data types.
+    
+    Writes go through a single long-lived WAL-mode connection. Records passed
+    to ``store_record``/``store_batch_records`` are queued and written behind
+    in batched ``executemany`` transactions; reads use a separate connection
+    and flush pending writes first so callers always see their own records.
+    """
+    
+    INSERT_RECORD_SQL = """
+        INSERT OR REPLACE INTO analytics_records 
+        (id, timestamp, record_type, team_id, data, metadata)
+        VALUES (?, ?, ?, ?, ?, ?)
     """
     
-    def __init__(self, db_path: str = "analytics.db"):
-        """Initialize the analytics data manager."""
+    # SQL expressions producing the same period keys as _get_period_key
+    PERIOD_BUCKET_SQL = {
+        'hourly': "substr(timestamp, 1, 10) || ' ' || substr(timestamp, 12, 2) || ':00'",
+        'daily': "substr(timestamp, 1, 10)",
+        'weekly': "date(substr(timestamp, 1, 10), '-6 days', 'weekday 1')",
+        'monthly': "substr(timestamp, 1, 7)",
+    }
+    
+    # Numeric data fields summarised per record type
+    AGGREGATED_FIELDS = {
+        'hook_execution': ('execution_time_ms',),
+        'system_metrics': ('cpu_usage', 'memory_usage'),
+        'team_productivity': ('productivity_score',),
+    }
+    
+    ROLLUP_ID_PREFIX = "rollup:"
+    
+    def __init__(
+        self,
+        db_path: str = "analytics.db",
+        write_batch_size: int = 1000,
+        flush_interval: float = 0.2,
+        max_pending_writes: int = 50000
+    ):
+        """
+        Initialize the analytics data manager.
+        
+        Args:
+            db_path: SQLite database path
+            write_batch_size: Maximum records written per transaction
+            flush_interval: Seconds between write-behind flushes
+            max_pending_writes: Queue bound; producers wait when it is full
+        """
         self.db_path = db_path
+        self.write_batch_size = write_batch_size
+        self.flush_interval = flush_interval
+        self.max_pending_writes = max_pending_writes
+        
+        # Long-lived connections (opened lazily)
+        self._write_db: Optional[aiosqlite.Connection] = None
+        self._read_db: Optional[aiosqlite.Connection] = None
+        self._connect_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._orphaned: Set[asyncio.Task] = set()
+        
+        # Write-behind queue of prepared rows
+        self._pending_writes: Optional[asyncio.Queue] = None
+        # Rows taken off the queue whose transaction failed; written first next flush
+        self._unwritten: List[Tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self.write_stats = {"records_written": 0, "transactions": 0}
+        
+        # Latest closed-bucket rollup end per record type; writes older than
+        # this invalidate the affected rollups
+        self._rollup_horizon: Dict[str, str] = {}
+        
+        # Data retention policies
         self.retention_policies = {
             'hook_execution': DataRetentionPolicy('hook_execution', 90, 'hourly', True),
             'system_metrics': DataRetentionPolicy('system_metrics', 30, 'hourly', True),
@@ -78,16 +143,185 @@ class AnalyticsDataManager:
         """Shutdown the data manager and cleanup resources."""
         self._running = False
         
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-        if self._aggregation_task:
-            self._aggregation_task.cancel()
+        maintenance_tasks = [t for t in (self._cleanup_task, self._aggregation_task) if t]
+        for task in maintenance_tasks:
+            task.cancel()
+        await asyncio.gather(*maintenance_tasks, return_exceptions=True)
+        self._cleanup_task = self._aggregation_task = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        # Write out anything still queued before closing
+        await self.flush()
+        await self._close_connections()
         
         logger.info("Analytics data manager shutdown")
     
+    async def _open_connection(self, *pragmas: str) -> aiosqlite.Connection:
+        """Open a connection that is closed on shutdown even if the caller is cancelled."""
+        async def _open() -> aiosqlite.Connection:
+            db = await aiosqlite.connect(self.db_path)
+            for pragma in pragmas:
+                await db.execute(pragma)
+            return db
+        
+        # Cancelling a connect midway would leave aiosqlite's thread running
+        task = asyncio.ensure_future(_open())
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            self._orphaned.add(task)
+            raise
+    
+    async def _get_write_db(self) -> aiosqlite.Connection:
+        """Return the long-lived write connection, opening it if needed."""
+        if self._write_db is None:
+            async with self._connect_lock:
+                if self._write_db is None:
+                    self._write_db = await self._open_connection(
+                        "PRAGMA journal_mode=WAL",
+                        "PRAGMA synchronous=NORMAL",
+                        "PRAGMA busy_timeout=5000"
+                    )
+        return self._write_db
+    
+    async def _get_read_db(self) -> aiosqlite.Connection:
+        """Return the read connection (the write connection for in-memory databases)."""
+        if self.db_path == ":memory:":
+            return await self._get_write_db()
+        
+        if self._read_db is None:
+            await self._get_write_db()  # ensures WAL mode is set first
+            async with self._connect_lock:
+                if self._read_db is None:
+                    self._read_db = await self._open_connection("PRAGMA busy_timeout=5000")
+        return self._read_db
+    
+    async def _close_connections(self):
+        """Close the long-lived connections."""
+        # Connections opened for a cancelled caller are closed as well
+        opened = await asyncio.gather(*self._orphaned, return_exceptions=True)
+        self._orphaned.clear()
+        orphans = [db for db in opened if isinstance(db, aiosqlite.Connection)]
+        for db in (self._read_db, self._write_db, *orphans):
+            if db is not None:
+                await db.close()
+        self._read_db = None
+        self._write_db = None
+    
+    def _get_write_queue(self) -> asyncio.Queue:
+        if self._pending_writes is None:
+            self._pending_writes = asyncio.Queue(maxsize=self.max_pending_writes)
+        return self._pending_writes
+    
+    @property
+    def pending_writes(self) -> int:
+        """Number of records queued but not yet written."""
+        queued = self._pending_writes.qsize() if self._pending_writes else 0
+        return queued + len(self._unwritten)
+    
+    def _record_to_row(self, record: AnalyticsRecord) -> Tuple[str, str, str, str, str, str]:
+        if not record.id:
+            record.id = f"{record.record_type}_{record.team_id}_{int(record.timestamp.timestamp())}"
+        return (
+            record.id,
+            record.timestamp.isoformat(),
+            record.record_type,
+            record.team_id,
+            json.dumps(record.data),
+            json.dumps(record.metadata)
+        )
+    
+    async def _enqueue_rows(self, rows: List[Tuple]) -> None:
+        """Queue rows for the write-behind flusher (waits when the queue is full)."""
+        queue = self._get_write_queue()
+        flusher_running = self._flush_task is not None and not self._flush_task.done()
+        
+        for row in rows:
+            if queue.full() and not flusher_running:
+                await self.flush()
+            await queue.put(row)
+        
+        # Without a running flusher, write through once a batch is ready
+        if not flusher_running and (queue.qsize() >= self.write_batch_size or not self._running):
+            await self.flush()
+    
+    async def flush(self) -> int:
+        """
+        Write all queued records in batched transactions.
+        
+        Returns:
+            Number of records written
+        """
+        queue = self._get_write_queue()
+        if queue.empty() and not self._unwritten:
+            return 0
+        
+        written = 0
+        async with self._write_lock:
+            db = await self._get_write_db()
+            while self._unwritten or not queue.empty():
+                batch, self._unwritten = self._unwritten, []
+                while len(batch) < self.write_batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                try:
+                    await db.executemany(self.INSERT_RECORD_SQL, batch)
+                    await self._invalidate_rollups(db, batch)
+                    await db.commit()
+                except BaseException:
+                    # Keep the batch for the next flush instead of dropping it
+                    self._unwritten = batch
+                    if db.in_transaction:
+                        await db.rollback()
+                    raise
+                
+                for _ in batch:
+                    queue.task_done()
+                written += len(batch)
+                self.write_stats["records_written"] += len(batch)
+                self.write_stats["transactions"] += 1
+        
+        return written
+    
+    async def _invalidate_rollups(self, db: aiosqlite.Connection, rows: List[Tuple]) -> None:
+        """Drop rollups for closed periods that received late records."""
+        if not self._rollup_horizon:
+            return
+        
+        oldest: Dict[str, str] = {}
+        for row in rows:
+            record_type, timestamp = row[2], row[1]
+            horizon = self._rollup_horizon.get(record_type)
+            if horizon and timestamp < horizon and timestamp < oldest.get(record_type, horizon):
+                oldest[record_type] = timestamp
+        
+        for record_type, timestamp in oldest.items():
+            await db.execute("""
+                DELETE FROM aggregated_data
+                WHERE substr(id, 1, ?) = ? AND record_type = ? AND period_end > ?
+            """, (len(self.ROLLUP_ID_PREFIX), self.ROLLUP_ID_PREFIX, record_type, timestamp))
+    
+    async def _flush_loop(self):
+        """Background task that periodically writes queued records."""
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Analytics write-behind flush error: {e}")
+    
     async def _create_tables(self):
         """Create database tables for analytics data."""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self._get_write_db()
+        async with self._write_lock:
             # Main analytics records table
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS analytics_records (
@@ -129,9 +363,18 @@ class AnalyticsDataManager:
             # Create indexes for performance
             await db.execute("CREATE INDEX IF NOT EXISTS idx_records_timestamp ON analytics_records(timestamp)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_records_type_team ON analytics_records(record_type, team_id)")
+            await db.execute("CREATE INDEX IF NOT EXISTS idx_records_type_timestamp ON analytics_records(record_type, timestamp)")
             await db.execute("CREATE INDEX IF NOT EXISTS idx_aggregated_period ON aggregated_data(aggregation_period, period_start)")
             
             await db.commit()
+            
+            async with db.execute("""
+                SELECT record_type, MAX(period_end) FROM aggregated_data
+                WHERE substr(id, 1, ?) = ?
+                GROUP BY record_type
+            """, (len(self.ROLLUP_ID_PREFIX), self.ROLLUP_ID_PREFIX)) as cursor:
+                async for record_type, period_end in cursor:
+                    self._rollup_horizon[record_type] = period_end
     
     async def store_record(self, record: AnalyticsRecord) -> str:
         """
@@ -143,24 +386,7 @@ class AnalyticsDataManager:
         Returns:
             Record ID
         """
-        if not record.id:
-            record.id = f"{record.record_type}_{record.team_id}_{int(record.timestamp.timestamp())}"
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                INSERT OR REPLACE INTO analytics_records 
-                (id, timestamp, record_type, team_id, data, metadata)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                record.id,
-                record.timestamp.isoformat(),
-                record.record_type,
-                record.team_id,
-                json.dumps(record.data),
-                json.dumps(record.metadata)
-            ))
-            await db.commit()
-        
+        await self._enqueue_rows([self._record_to_row(record)])
         return record.id
     
     async def store_batch_records(self, records: List[AnalyticsRecord]) -> List[str]:
@@ -173,32 +399,9 @@ class AnalyticsDataManager:
         Returns:
             List of record IDs
         """
-        record_ids = []
-        
-        async with aiosqlite.connect(self.db_path) as db:
-            for record in records:
-                if not record.id:
-                    record.id = f"{record.record_type}_{record.team_id}_{int(record.timestamp.timestamp())}"
-                record_ids.append(record.id)
-            
-            await db.executemany("""
-                INSERT OR REPLACE INTO analytics_records 
-                (id, timestamp, record_type, team_id, data, metadata)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, [
-                (
-                    record.id,
-                    record.timestamp.isoformat(),
-                    record.record_type,
-                    record.team_id,
-                    json.dumps(record.data),
-                    json.dumps(record.metadata)
-                )
-                for record in records
-            ])
-            await db.commit()
-        
-        return record_ids
+        rows = [self._record_to_row(record) for record in records]
+        await self._enqueue_rows(rows)
+        return [row[0] for row in rows]
     
     async def query_records(
         self,
@@ -252,18 +455,21 @@ class AnalyticsDataManager:
             query += " OFFSET ?"
             params.append(offset)
         
+        # Make queued writes visible to this read
+        await self.flush()
+        
         records = []
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute(query, params) as cursor:
-                async for row in cursor:
-                    records.append(AnalyticsRecord(
-                        id=row[0],
-                        timestamp=datetime.fromisoformat(row[1]),
-                        record_type=row[2],
-                        team_id=row[3],
-                        data=json.loads(row[4]),
-                        metadata=json.loads(row[5])
-                    ))
+        db = await self._get_read_db()
+        async with db.execute(query, params) as cursor:
+            async for row in cursor:
+                records.append(AnalyticsRecord(
+                    id=row[0],
+                    timestamp=datetime.fromisoformat(row[1]),
+                    record_type=row[2],
+                    team_id=row[3],
+                    data=json.loads(row[4]),
+                    metadata=json.loads(row[5])
+                ))
         
         return records
     
@@ -296,24 +502,328 @@ class AnalyticsDataManager:
             if datetime.now(timezone.utc) - cached_time < self.cache_ttl:
                 return cached_data
         
-        # Query raw data
-        records = await self.query_records(
-            record_type=record_type,
-            team_id=team_id,
-            start_time=start_time,
-            end_time=end_time
+        if aggregation_period in self.PERIOD_BUCKET_SQL:
+            aggregated_data = await self._aggregate_in_database(
+                record_type, aggregation_period, team_id, start_time, end_time
+            )
+            
+            if not aggregated_data["record_count"]:
+                return aggregated_data
+        else:
+            records = await self.query_records(
+                record_type=record_type,
+                team_id=team_id,
+                start_time=start_time,
+                end_time=end_time
+            )
+            
+            if not records:
+                return {"aggregated_data": {}, "record_count": 0}
+            
+            aggregated_data = await self._perform_aggregation(records, aggregation_period)
+        
+        # Cache result
+        self.aggregation_cache[cache_key] = (datetime.now(timezone.utc), aggregated_data)
+        
+        return aggregated_data
+    
+    async def _aggregate_in_database(
+        self,
+        record_type: str,
+        aggregation_period: str,
+        team_id: Optional[str],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        Aggregate per time bucket in SQLite.
+        
+        Closed buckets that lie entirely inside the requested window are read
+        from rollups in ``aggregated_data``; only the remaining ranges (the
+        open bucket, partially covered edge buckets and buckets without a
+        rollup yet) are grouped from raw rows. Newly computed closed buckets
+        are stored as rollups for the next query.
+        """
+        await self.flush()
+        
+        now = datetime.now(timezone.utc)
+        window_start = self._as_utc(start_time) if start_time else None
+        window_end = self._as_utc(end_time) if end_time else None
+        
+        rollups = await self._load_rollups(
+            record_type, aggregation_period, team_id, window_start, window_end, now
         )
         
-        if not records:
+        raw_buckets = await self._aggregate_raw_buckets(
+            record_type, aggregation_period, team_id, start_time, end_time,
+            skip=[(state["period_start"], state["period_end"]) for state in rollups.values()]
+        )
+        
+        buckets = dict(rollups)
+        new_rollups = []
+        for period_key, state in raw_buckets.items():
+            if period_key in buckets:
+                self._merge_bucket_state(buckets[period_key], state)
+                continue
+            
+            buckets[period_key] = state
+            bucket_start, bucket_end = self._get_period_bounds(period_key, aggregation_period)
+            if (bucket_end <= now
+                    and (window_start is None or window_start <= bucket_start)
+                    and (window_end is None or bucket_end <= window_end)):
+                new_rollups.append((period_key, state))
+        
+        if new_rollups:
+            await self._store_rollups(record_type, aggregation_period, team_id, new_rollups)
+        
+        record_count = sum(state["count"] for state in buckets.values())
+        if not record_count:
             return {"aggregated_data": {}, "record_count": 0}
         
-        # Perform aggregation based on record type
-        aggregated_data = await self._perform_aggregation(records, aggregation_period)
+        return {
+            "aggregated_data": {
+                period_key: self._finalize_bucket_state(record_type, buckets[period_key])
+                for period_key in sorted(buckets, reverse=True)
+            },
+            "record_count": record_count,
+            "period_count": len(buckets),
+            "aggregation_period": aggregation_period
+        }
+    
+    async def _aggregate_raw_buckets(
+        self,
+        record_type: str,
+        aggregation_period: str,
+        team_id: Optional[str],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        skip: List[Tuple[str, str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Group raw rows by time bucket, excluding the ``skip`` ranges."""
+        fields = self.AGGREGATED_FIELDS.get(record_type, ())
         
-        # Cache result
-        self.aggregation_cache[cache_key] = (datetime.now(timezone.utc), aggregated_data)
+        columns = [
+            f"{self.PERIOD_BUCKET_SQL[aggregation_period]} AS bucket",
+            "COUNT(*)",
+            "SUM(CASE WHEN json_extract(data, '$.success') THEN 1 ELSE 0 END)",
+            "MAX(timestamp)",
+            "MIN(timestamp)",
+        ]
+        for field in fields:
+            path = f"'$.{field}'"
+            columns.extend([
+                f"COUNT(json_type(data, {path}))",
+                f"SUM(json_extract(data, {path}))",
+                f"MIN(json_extract(data, {path}))",
+                f"MAX(json_extract(data, {path}))",
+            ])
         
-        return aggregated_data
+        query = f"SELECT {', '.join(columns)} FROM analytics_records WHERE record_type = ?"
+        params: List[Any] = [record_type]
+        
+        if team_id:
+            query += " AND team_id = ?"
+            params.append(team_id)
+        
+        if start_time:
+            query += " AND timestamp >= ?"
+            params.append(start_time.isoformat())
+        
+        if end_time:
+            query += " AND timestamp <= ?"
+            params.append(end_time.isoformat())
+        
+        # Scan only the gaps between rolled-up buckets
+        ranges = []
+        lower = None
+        for period_start, period_end in sorted(skip):
+            if lower is None:
+                ranges.append(("timestamp < ?", [period_start]))
+            elif lower < period_start:
+                ranges.append(("(timestamp >= ? AND timestamp < ?)", [lower, period_start]))
+            lower = period_end
+        if lower is not None:
+            ranges.append(("timestamp >= ?", [lower]))
+            query += " AND (" + " OR ".join(condition for condition, _ in ranges) + ")"
+            for _, range_params in ranges:
+                params.extend(range_params)
+        
+        query += " GROUP BY bucket"
+        
+        buckets = {}
+        db = await self._get_read_db()
+        async with db.execute(query, params) as cursor:
+            async for row in cursor:
+                state = {
+                    "count": row[1],
+                    "success_count": row[2],
+                    "first_timestamp": row[3],
+                    "last_timestamp": row[4],
+                    "fields": {}
+                }
+                for index, field in enumerate(fields):
+                    count, total, minimum, maximum = row[5 + index * 4:9 + index * 4]
+                    state["fields"][field] = {
+                        "count": count, "sum": total or 0, "min": minimum, "max": maximum
+                    }
+                buckets[row[0]] = state
+        
+        return buckets
+    
+    async def _load_rollups(
+        self,
+        record_type: str,
+        aggregation_period: str,
+        team_id: Optional[str],
+        window_start: Optional[datetime],
+        window_end: Optional[datetime],
+        now: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load rollups for closed buckets fully inside the window."""
+        upper = min(window_end, now) if window_end else now
+        query = """
+            SELECT aggregated_data FROM aggregated_data
+            WHERE substr(id, 1, ?) = ? AND record_type = ? AND aggregation_period = ?
+              AND team_id IS ? AND period_end <= ?
+        """
+        params: List[Any] = [
+            len(self.ROLLUP_ID_PREFIX), self.ROLLUP_ID_PREFIX,
+            record_type, aggregation_period, team_id or None, upper.isoformat()
+        ]
+        if window_start:
+            query += " AND period_start >= ?"
+            params.append(window_start.isoformat())
+        
+        rollups = {}
+        db = await self._get_read_db()
+        async with db.execute(query, params) as cursor:
+            async for (payload,) in cursor:
+                state = json.loads(payload)
+                rollups[state["period_key"]] = state
+        
+        return rollups
+    
+    async def _store_rollups(
+        self,
+        record_type: str,
+        aggregation_period: str,
+        team_id: Optional[str],
+        rollups: List[Tuple[str, Dict[str, Any]]]
+    ):
+        """Persist closed-bucket aggregation states for reuse."""
+        rows = []
+        for period_key, state in rollups:
+            bucket_start, bucket_end = self._get_period_bounds(period_key, aggregation_period)
+            state["period_key"] = period_key
+            state["period_start"] = bucket_start.isoformat()
+            state["period_end"] = bucket_end.isoformat()
+            rows.append((
+                f"{self.ROLLUP_ID_PREFIX}{record_type}:{aggregation_period}:{team_id or '*'}:{period_key}",
+                record_type,
+                team_id or None,
+                aggregation_period,
+                state["period_start"],
+                state["period_end"],
+                json.dumps(state)
+            ))
+        
+        db = await self._get_write_db()
+        async with self._write_lock:
+            await db.executemany("""
+                INSERT OR REPLACE INTO aggregated_data
+                (id, record_type, team_id, aggregation_period, period_start, period_end, aggregated_data)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            await db.commit()
+        
+        horizon = max(row[5] for row in rows)
+        if horizon > self._rollup_horizon.get(record_type, ""):
+            self._rollup_horizon[record_type] = horizon
+    
+    @staticmethod
+    def _merge_bucket_state(target: Dict[str, Any], other: Dict[str, Any]):
+        """Merge two partial aggregation states for the same bucket."""
+        target["count"] += other["count"]
+        target["success_count"] += other["success_count"]
+        target["first_timestamp"] = max(target["first_timestamp"], other["first_timestamp"])
+        target["last_timestamp"] = min(target["last_timestamp"], other["last_timestamp"])
+        
+        for field, values in other["fields"].items():
+            current = target["fields"].setdefault(
+                field, {"count": 0, "sum": 0, "min": None, "max": None}
+            )
+            current["count"] += values["count"]
+            current["sum"] += values["sum"]
+            for key, pick in (("min", min), ("max", max)):
+                candidates = [v for v in (current[key], values[key]) if v is not None]
+                current[key] = pick(candidates) if candidates else None
+    
+    def _finalize_bucket_state(self, record_type: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a bucket state into the per-period output of _aggregate_period_records."""
+        count = state["count"]
+        
+        def field_stats(field: str) -> Tuple[float, Any, Any]:
+            values = state["fields"].get(field) or {"count": 0}
+            if not values["count"]:
+                return 0, 0, 0
+            return values["sum"] / values["count"], values["min"], values["max"]
+        
+        if record_type == 'hook_execution':
+            average, minimum, maximum = field_stats('execution_time_ms')
+            return {
+                "total_executions": count,
+                "successful_executions": state["success_count"],
+                "success_rate": state["success_count"] / count if count > 0 else 0,
+                "average_execution_time_ms": average,
+                "min_execution_time_ms": minimum,
+                "max_execution_time_ms": maximum
+            }
+        elif record_type == 'system_metrics':
+            cpu_average, _, cpu_max = field_stats('cpu_usage')
+            memory_average, _, memory_max = field_stats('memory_usage')
+            return {
+                "record_count": count,
+                "average_cpu_usage": cpu_average,
+                "max_cpu_usage": cpu_max,
+                "average_memory_usage": memory_average,
+                "max_memory_usage": memory_max
+            }
+        elif record_type == 'team_productivity':
+            average, minimum, maximum = field_stats('productivity_score')
+            return {
+                "record_count": count,
+                "average_productivity_score": average,
+                "max_productivity_score": maximum,
+                "min_productivity_score": minimum
+            }
+        else:
+            return {
+                "count": count,
+                "first_timestamp": state["first_timestamp"],
+                "last_timestamp": state["last_timestamp"]
+            }
+    
+    @staticmethod
+    def _as_utc(timestamp: datetime) -> datetime:
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.astimezone(timezone.utc)
+    
+    def _get_period_bounds(self, period_key: str, period: str) -> Tuple[datetime, datetime]:
+        """Get the UTC [start, end) range of a period key."""
+        if period == 'hourly':
+            start = datetime.strptime(period_key, '%Y-%m-%d %H:00')
+            end = start + timedelta(hours=1)
+        elif period == 'daily':
+            start = datetime.strptime(period_key, '%Y-%m-%d')
+            end = start + timedelta(days=1)
+        elif period == 'weekly':
+            start = datetime.strptime(period_key, '%Y-%m-%d')
+            end = start + timedelta(days=7)
+        else:
+            start = datetime.strptime(period_key, '%Y-%m')
+            end = (start + timedelta(days=32)).replace(day=1)
+        return start.replace(tzinfo=timezone.utc), end.replace(tzinfo=timezone.utc)
     
     async def _perform_aggregation(
         self,
@@ -488,7 +998,9 @@ class AnalyticsDataManager:
         """Verify data integrity and return status."""
         integrity_results = {}
         
-        async with aiosqlite.connect(self.db_path) as db:
+        await self.flush()
+        db = await self._get_write_db()
+        async with self._write_lock:
             # Check analytics_records table
             async with db.execute("SELECT COUNT(*) FROM analytics_records") as cursor:
                 count = (await cursor.fetchone())[0]
@@ -520,6 +1032,7 @@ class AnalyticsDataManager:
     async def _start_background_tasks(self):
         """Start background maintenance tasks."""
         self._running = True
+        self._flush_task = asyncio.create_task(self._flush_loop())
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
         self._aggregation_task = asyncio.create_task(self._aggregation_loop())
     
@@ -549,7 +1062,9 @@ class AnalyticsDataManager:
     
     async def _cleanup_expired_data(self):
         """Clean up expired data based on retention policies."""
-        async with aiosqlite.connect(self.db_path) as db:
+        await self.flush()
+        db = await self._get_write_db()
+        async with self._write_lock:
             for record_type, policy in self.retention_policies.items():
                 cutoff_date = datetime.now(timezone.utc) - timedelta(days=policy.retention_days)
                 
@@ -562,6 +1077,12 @@ class AnalyticsDataManager:
                 deleted_count = result.rowcount
                 if deleted_count > 0:
                     logger.info(f"Cleaned up {deleted_count} expired {record_type} records")
+                
+                # Rollups that include expired records no longer match raw data
+                await db.execute("""
+                    DELETE FROM aggregated_data
+                    WHERE substr(id, 1, ?) = ? AND record_type = ? AND period_start < ?
+                """, (len(self.ROLLUP_ID_PREFIX), self.ROLLUP_ID_PREFIX, record_type, cutoff_date.isoformat()))
             
             await db.commit()
     
@@ -606,7 +1127,8 @@ class AnalyticsDataManager:
         """Store aggregated data in the database."""
         aggregation_id = f"{record_type}_{aggregation_period}_{int(start_time.timestamp())}"
         
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self._get_write_db()
+        async with self._write_lock:
             await db.execute("""
                 INSERT OR REPLACE INTO aggregated_data
                 (id, record_type, aggregation_period, period_start, period_end, aggregated_data)
@@ -624,20 +1146,27 @@ class AnalyticsDataManager:
 
 # Global data manager instance
 _data_manager: Optional[AnalyticsDataManager] = None
+_data_manager_ready: Optional[asyncio.Future] = None
 
 
 async def get_analytics_data_manager() -> AnalyticsDataManager:
     """Get the global analytics data manager instance."""
-    global _data_manager
+    global _data_manager, _data_manager_ready
     if _data_manager is None:
         _data_manager = AnalyticsDataManager()
-        await _data_manager.initialize()
+        _data_manager_ready = asyncio.ensure_future(_data_manager.initialize())
+    # A cancelled caller must not abandon a half-opened connection, which
+    # would never be closed on shutdown
+    await asyncio.shield(_data_manager_ready)
     return _data_manager
 
 
 async def shutdown_analytics_data_manager():
     """Shutdown the global analytics data manager."""
-    global _data_manager
+    global _data_manager, _data_manager_ready
     if _data_manager:
+        if _data_manager_ready is not None:
+            await asyncio.gather(_data_manager_ready, return_exceptions=True)
         await _data_manager.shutdown()
-        _data_manager = None
\ No newline at end of file
+        _data_manager = None
+        _data_manager_ready = None
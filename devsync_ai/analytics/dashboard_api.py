@@ -23,6 +23,8 @@ from devsync_ai.analytics.productivity_analytics_engine import ProductivityAnaly
 from devsync_ai.analytics.intelligence_engine import IntelligenceEngine
 from devsync_ai.analytics.hook_optimization_engine import HookOptimizationEngine
 from devsync_ai.analytics.monitoring_dashboard import get_monitoring_dashboard
+from devsync_ai.analytics.real_time_monitoring import get_monitoring_system
+from devsync_ai.analytics.websocket_fanout import serialize
 from devsync_ai.hooks.hook_registry_manager import get_hook_registry_manager
 
 logger = logging.getLogger(__name__)
@@ -89,6 +91,36 @@ async def websocket_endpoint(websocket: WebSocket):
         dashboard.disconnect_websocket(websocket)
 
 
+@analytics_app.websocket("/ws/monitoring")
+async def monitoring_websocket_endpoint(websocket: WebSocket, delta: bool = Query(False)):
+    """
+    WebSocket endpoint for real-time monitoring updates.
+
+    Pass ``?delta=true`` to receive ``system_update_delta`` messages instead of
+    the full performance history on every update.
+    """
+    monitoring_system = await get_monitoring_system()
+    client = await monitoring_system.connect_websocket(websocket, delta_updates=delta)
+    if client is None:
+        return
+    
+    try:
+        while True:
+            # Keep connection alive; updates are pushed by the monitoring system
+            data = await websocket.receive_text()
+            message = json.loads(data)
+            
+            # Replies share the client's outbound queue with the pushed updates
+            if message.get("type") == "ping":
+                client.enqueue(serialize({"type": "pong"}))
+                
+    except WebSocketDisconnect:
+        await monitoring_system.disconnect_websocket(websocket)
+    except Exception as e:
+        logger.error(f"Monitoring WebSocket error: {e}")
+        await monitoring_system.disconnect_websocket(websocket)
+
+
 # System Metrics Endpoints
 @analytics_app.get("/api/metrics/system")
 async def get_system_metrics():
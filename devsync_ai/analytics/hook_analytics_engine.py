@@ -16,6 +16,7 @@ import statistics
 import json
 
 from devsync_ai.analytics.analytics_data_manager import get_analytics_data_manager, AnalyticsRecord
+from devsync_ai.analytics.hook_metrics_rollup import HookMetricRollup, HookMetricsRollupStore
 from devsync_ai.hooks.hook_registry_manager import get_hook_registry_manager
 from devsync_ai.core.agent_hooks import HookExecutionResult, HookStatus
 
@@ -56,6 +57,8 @@ class HookPerformanceMetrics:
     last_execution: Optional[datetime]
     executions_per_hour: float
     health_status: HealthStatus
+    p95_execution_time_ms: float = 0.0
+    p99_execution_time_ms: float = 0.0
 
 
 @dataclass
@@ -134,6 +137,11 @@ class HookAnalyticsEngine:
         self.performance_cache: Dict[str, HookPerformanceMetrics] = {}
         self.system_health_history: List[SystemHealthMetrics] = []
         
+        # Incremental per-minute rollups of hook executions
+        self.metric_rollups = HookMetricsRollupStore()
+        self._metric_rollups_backfilled = False
+        self._live_record_ids: set = set()  # executions added before the backfill
+        
         # Performance thresholds
         self.performance_thresholds = {
             'execution_time_warning_ms': 2000.0,
@@ -268,6 +276,9 @@ class HookAnalyticsEngine:
             
             # Store the record
             await data_manager.store_record(record)
+            self.metric_rollups.add_record(record)
+            if not self._metric_rollups_backfilled:
+                self._live_record_ids.add(record.id)
             
             # Update performance cache
             await self._update_performance_cache(execution_result)
@@ -304,63 +315,52 @@ class HookAnalyticsEngine:
         try:
             data_manager = await get_analytics_data_manager()
             
-            # Query execution records
-            records = await data_manager.query_records(
-                record_type="hook_execution",
-                start_time=time_range[0],
-                end_time=time_range[1]
-            )
+            # Merge rollup buckets, falling back to raw records for ranges
+            # the rollups do not cover
+            rollups = await self._get_metric_rollups(data_manager, time_range[0])
+            if rollups is None:
+                records = await data_manager.query_records(
+                    record_type="hook_execution",
+                    start_time=time_range[0],
+                    end_time=time_range[1]
+                )
+                rollups = HookMetricsRollupStore.from_records(
+                    (r for r in records if r.data.get('hook_id') == hook_id), time_range[0]
+                )
             
-            # Filter records for specific hook
-            hook_records = [r for r in records if r.data.get('hook_id') == hook_id]
+            rollup = self._merge_rollups(
+                rollups.query(time_range[0], time_range[1], hook_id=hook_id).values()
+            )
             
-            if not hook_records:
+            if not rollup.count:
                 return None
             
-            # Calculate metrics
-            total_executions = len(hook_records)
-            successful_executions = len([r for r in hook_records if r.data.get('success', False)])
-            failed_executions = total_executions - successful_executions
-            
-            execution_times = [r.data.get('execution_time_ms', 0) for r in hook_records]
-            average_execution_time = statistics.mean(execution_times) if execution_times else 0.0
-            min_execution_time = min(execution_times) if execution_times else 0.0
-            max_execution_time = max(execution_times) if execution_times else 0.0
-            
-            success_rate = successful_executions / total_executions if total_executions > 0 else 0.0
-            error_rate = 1.0 - success_rate
-            
             # Calculate executions per hour
             time_span_hours = (time_range[1] - time_range[0]).total_seconds() / 3600
-            executions_per_hour = total_executions / time_span_hours if time_span_hours > 0 else 0.0
-            
-            # Get last execution time
-            last_execution = max([r.timestamp for r in hook_records]) if hook_records else None
+            executions_per_hour = rollup.count / time_span_hours if time_span_hours > 0 else 0.0
             
             # Determine health status
             health_status = self._determine_hook_health_status(
-                success_rate, average_execution_time, executions_per_hour
+                rollup.success_rate, rollup.average_execution_time_ms, executions_per_hour
             )
             
-            # Get hook metadata
-            hook_type = hook_records[0].data.get('hook_type', 'unknown')
-            team_id = hook_records[0].team_id
-            
             metrics = HookPerformanceMetrics(
                 hook_id=hook_id,
-                hook_type=hook_type,
-                team_id=team_id,
-                total_executions=total_executions,
-                successful_executions=successful_executions,
-                failed_executions=failed_executions,
-                average_execution_time_ms=average_execution_time,
-                min_execution_time_ms=min_execution_time,
-                max_execution_time_ms=max_execution_time,
-                success_rate=success_rate,
-                error_rate=error_rate,
-                last_execution=last_execution,
+                hook_type=rollup.hook_type,
+                team_id=rollup.team_id,
+                total_executions=rollup.count,
+                successful_executions=rollup.success_count,
+                failed_executions=rollup.failed_count,
+                average_execution_time_ms=rollup.average_execution_time_ms,
+                min_execution_time_ms=rollup.min_execution_time_ms,
+                max_execution_time_ms=rollup.max_execution_time_ms,
+                success_rate=rollup.success_rate,
+                error_rate=1.0 - rollup.success_rate,
+                last_execution=rollup.last_execution,
                 executions_per_hour=executions_per_hour,
-                health_status=health_status
+                health_status=health_status,
+                p95_execution_time_ms=rollup.percentile(95),
+                p99_execution_time_ms=rollup.percentile(99)
             )
             
             # Cache the metrics
@@ -496,46 +496,63 @@ class HookAnalyticsEngine:
         try:
             data_manager = await get_analytics_data_manager()
             
-            # Get execution records
-            records = await data_manager.query_records(
-                record_type="hook_execution",
-                team_id=team_filter,
-                start_time=time_range[0],
-                end_time=time_range[1]
-            )
+            # Merge rollup buckets, falling back to raw records for ranges
+            # the rollups do not cover
+            records = None
+            rollups = await self._get_metric_rollups(data_manager, time_range[0])
+            if rollups is None:
+                records = await data_manager.query_records(
+                    record_type="hook_execution",
+                    team_id=team_filter,
+                    start_time=time_range[0],
+                    end_time=time_range[1]
+                )
+                
+                # Filter by hook type if specified
+                if hook_type_filter:
+                    records = [r for r in records if r.data.get('hook_type') == hook_type_filter]
+                
+                rollups = HookMetricsRollupStore.from_records(records, time_range[0])
             
-            # Filter by hook type if specified
-            if hook_type_filter:
-                records = [r for r in records if r.data.get('hook_type') == hook_type_filter]
+            series = rollups.query(
+                time_range[0], time_range[1], team_id=team_filter, hook_type=hook_type_filter
+            )
             
-            if not records:
+            if not series:
                 return {"error": "No data available for the specified criteria"}
             
             # Aggregate data by hook
-            hook_data = {}
-            for record in records:
-                hook_id = record.data.get('hook_id')
-                if hook_id not in hook_data:
-                    hook_data[hook_id] = []
-                hook_data[hook_id].append(record)
+            hook_data: Dict[str, List[HookMetricRollup]] = {}
+            for (hook_id, _), rollup in series.items():
+                hook_data.setdefault(hook_id, []).append(rollup)
             
             # Generate hook-level metrics
             hook_metrics = []
-            for hook_id, hook_records in hook_data.items():
-                metrics = await self._calculate_hook_metrics(hook_records)
+            for hook_id, hook_rollups in hook_data.items():
+                metrics = self._rollup_metrics(self._merge_rollups(hook_rollups))
                 metrics['hook_id'] = hook_id
                 hook_metrics.append(metrics)
             
             # Calculate overall statistics
-            total_executions = len(records)
-            successful_executions = len([r for r in records if r.data.get('success', False)])
-            overall_success_rate = successful_executions / total_executions if total_executions > 0 else 0.0
-            
-            execution_times = [r.data.get('execution_time_ms', 0) for r in records]
-            average_execution_time = statistics.mean(execution_times) if execution_times else 0.0
+            overall = self._merge_rollups(series.values())
             
             # Generate trends
-            trends = await self._calculate_performance_trends(records, time_range)
+            if records is not None:
+                trends = await self._calculate_performance_trends(records, time_range)
+            else:
+                mid_point = time_range[0] + (time_range[1] - time_range[0]) / 2
+                first_half = rollups.query(
+                    time_range[0], mid_point, team_id=team_filter, hook_type=hook_type_filter
+                )
+                second_half = rollups.query(
+                    mid_point + timedelta(minutes=1), time_range[1],
+                    team_id=team_filter, hook_type=hook_type_filter
+                )
+                trends = self._calculate_rollup_trends(
+                    self._merge_rollups(first_half.values()),
+                    self._merge_rollups(second_half.values()),
+                    time_range
+                )
             
             # Get top performers and underperformers
             sorted_hooks = sorted(hook_metrics, key=lambda x: x['success_rate'], reverse=True)
@@ -554,12 +571,14 @@ class HookAnalyticsEngine:
                 },
                 'summary': {
                     'total_hooks': len(hook_data),
-                    'total_executions': total_executions,
-                    'successful_executions': successful_executions,
-                    'overall_success_rate': overall_success_rate,
-                    'average_execution_time_ms': average_execution_time,
-                    'unique_teams': len(set(r.team_id for r in records)),
-                    'unique_hook_types': len(set(r.data.get('hook_type', 'unknown') for r in records))
+                    'total_executions': overall.count,
+                    'successful_executions': overall.success_count,
+                    'overall_success_rate': overall.success_rate,
+                    'average_execution_time_ms': overall.average_execution_time_ms,
+                    'p95_execution_time_ms': overall.percentile(95),
+                    'p99_execution_time_ms': overall.percentile(99),
+                    'unique_teams': len(set(team_id for _, team_id in series)),
+                    'unique_hook_types': len(set(r.hook_type for r in series.values()))
                 },
                 'hook_metrics': hook_metrics,
                 'performance_trends': trends,
@@ -827,47 +846,109 @@ class HookAnalyticsEngine:
         
         return HealthStatus.HEALTHY
     
-    async def _calculate_hook_metrics(self, records: List[AnalyticsRecord]) -> Dict[str, Any]:
-        """Calculate metrics for a set of hook records."""
-        if not records:
-            return {}
+    async def _get_metric_rollups(self, data_manager, start_time: datetime) -> Optional[HookMetricsRollupStore]:
+        """
+        Get the rollup store if it covers ``start_time``.
         
-        total_executions = len(records)
-        successful_executions = len([r for r in records if r.data.get('success', False)])
-        success_rate = successful_executions / total_executions
+        The store only sees executions recorded by this engine, so on first use
+        it is backfilled once from raw records for its retention window.
+        """
+        store = self.metric_rollups
+        if not store.covers(start_time) and not self._metric_rollups_backfilled:
+            await self._backfill_metric_rollups(data_manager)
+        
+        return store if store.covers(start_time) else None
+    
+    async def _backfill_metric_rollups(self, data_manager):
+        """Load stored executions for the retention window into the rollups."""
+        store = self.metric_rollups
+        backfill_start = datetime.now(timezone.utc) - store.retention
         
-        execution_times = [r.data.get('execution_time_ms', 0) for r in records]
-        avg_execution_time = statistics.mean(execution_times) if execution_times else 0.0
+        records = await data_manager.query_records(
+            record_type="hook_execution",
+            start_time=backfill_start
+        )
+        for record in records:
+            # Skip executions record_hook_execution already added
+            if record.id not in self._live_record_ids:
+                store.add_record(record)
         
+        store.covered_since = backfill_start
+        self._metric_rollups_backfilled = True
+        self._live_record_ids.clear()
+    
+    @staticmethod
+    def _merge_rollups(rollups) -> HookMetricRollup:
+        merged = HookMetricRollup()
+        for rollup in rollups:
+            merged.merge(rollup)
+        return merged
+    
+    def _rollup_metrics(self, rollup: HookMetricRollup) -> Dict[str, Any]:
+        """Calculate report metrics for a merged hook rollup."""
         return {
-            'total_executions': total_executions,
-            'successful_executions': successful_executions,
-            'success_rate': success_rate,
-            'average_execution_time_ms': avg_execution_time,
-            'hook_type': records[0].data.get('hook_type', 'unknown'),
-            'team_id': records[0].team_id
+            'total_executions': rollup.count,
+            'successful_executions': rollup.success_count,
+            'success_rate': rollup.success_rate,
+            'average_execution_time_ms': rollup.average_execution_time_ms,
+            'p95_execution_time_ms': rollup.percentile(95),
+            'p99_execution_time_ms': rollup.percentile(99),
+            'hook_type': rollup.hook_type,
+            'team_id': rollup.team_id
         }
     
+    async def _calculate_hook_metrics(self, records: List[AnalyticsRecord]) -> Dict[str, Any]:
+        """Calculate metrics for a set of hook records."""
+        if not records:
+            return {}
+        
+        rollup = HookMetricRollup()
+        for record in records:
+            rollup.add(
+                record.data.get('execution_time_ms', 0),
+                record.data.get('success', False),
+                record.timestamp,
+                record.data.get('hook_type', 'unknown'),
+                record.team_id
+            )
+        return self._rollup_metrics(rollup)
+    
     async def _calculate_performance_trends(
         self, 
         records: List[AnalyticsRecord], 
         time_range: Tuple[datetime, datetime]
     ) -> List[PerformanceTrend]:
         """Calculate performance trends from records."""
-        trends = []
-        
         # Split time range into two halves for comparison
         mid_point = time_range[0] + (time_range[1] - time_range[0]) / 2
         
-        first_half = [r for r in records if r.timestamp <= mid_point]
-        second_half = [r for r in records if r.timestamp > mid_point]
+        first_half = HookMetricRollup()
+        second_half = HookMetricRollup()
+        for record in records:
+            half = first_half if record.timestamp <= mid_point else second_half
+            half.add(
+                record.data.get('execution_time_ms', 0),
+                record.data.get('success', False),
+                record.timestamp
+            )
         
-        if not first_half or not second_half:
+        return self._calculate_rollup_trends(first_half, second_half, time_range)
+    
+    def _calculate_rollup_trends(
+        self,
+        first_half: HookMetricRollup,
+        second_half: HookMetricRollup,
+        time_range: Tuple[datetime, datetime]
+    ) -> List[PerformanceTrend]:
+        """Calculate performance trends from rollups of the two halves of a time range."""
+        trends = []
+        
+        if not first_half.count or not second_half.count:
             return trends
         
         # Calculate success rate trend
-        first_success_rate = len([r for r in first_half if r.data.get('success', False)]) / len(first_half)
-        second_success_rate = len([r for r in second_half if r.data.get('success', False)]) / len(second_half)
+        first_success_rate = first_half.success_rate
+        second_success_rate = second_half.success_rate
         
         success_rate_change = (second_success_rate - first_success_rate) / first_success_rate if first_success_rate > 0 else 0
         
@@ -883,8 +964,8 @@ class HookAnalyticsEngine:
         ))
         
         # Calculate execution time trend
-        first_avg_time = statistics.mean([r.data.get('execution_time_ms', 0) for r in first_half])
-        second_avg_time = statistics.mean([r.data.get('execution_time_ms', 0) for r in second_half])
+        first_avg_time = first_half.average_execution_time_ms
+        second_avg_time = second_half.average_execution_time_ms
         
         time_change = (second_avg_time - first_avg_time) / first_avg_time if first_avg_time > 0 else 0
         
@@ -963,9 +1044,14 @@ class HookAnalyticsEngine:
     
     async def _aggregate_performance_data(self):
         """Aggregate performance data for efficient reporting."""
-        # This would create pre-aggregated data for common queries
-        # to improve dashboard and reporting performance
-        pass
+        # Rollups are maintained as executions are recorded; backfill them
+        # once and expire buckets that fell out of the retention window
+        if not self._metric_rollups_backfilled:
+            await self._backfill_metric_rollups(await get_analytics_data_manager())
+        
+        removed = self.metric_rollups.prune()
+        if removed:
+            logger.debug(f"Pruned {removed} expired hook metric rollup buckets")
 
 
 # Global analytics engine instance
@@ -0,0 +1,328 @@
+"""
+Incremental rollups of hook execution metrics.
+
+Hook executions are folded into per-minute buckets keyed by
+``(hook_id, team_id, minute)`` as they are recorded, with hourly buckets
+maintained alongside so long ranges merge a few hundred buckets instead of
+scanning raw analytics records. Each bucket keeps count, success count,
+sum, min and max of the execution time, plus a mergeable DDSketch for
+percentiles.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from devsync_ai.analytics.analytics_data_manager import AnalyticsRecord
+
+
+SeriesKey = Tuple[str, str]  # (hook_id, team_id)
+
+
+def _to_minute(timestamp: datetime) -> int:
+    """Minutes since the epoch (naive timestamps are treated as UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() // 60)
+
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch with relative-error guarantees.
+
+    Values are counted in logarithmic bins, so two sketches merge by adding
+    bin counts and any quantile is within ``relative_accuracy`` of the true
+    value.
+    """
+
+    MIN_INDEXABLE_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value: float, count: int = 1):
+        """Add a (non-negative) value to the sketch."""
+        if value <= self.MIN_INDEXABLE_VALUE:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other: "QuantileSketch"):
+        """Merge another sketch with the same accuracy into this one."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile ``q`` (0-1)."""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        running = self.zero_count
+        if rank < running:
+            return 0.0
+
+        for key in sorted(self.bins):
+            running += self.bins[key]
+            if running > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(key): count for key, count in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data.get("relative_accuracy", 0.01))
+        sketch.bins = {int(key): count for key, count in data.get("bins", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        return sketch
+
+
+@dataclass
+class HookMetricRollup:
+    """Mergeable execution statistics for one bucket (or a merge of buckets)."""
+    count: int = 0
+    success_count: int = 0
+    total_execution_time_ms: float = 0.0
+    min_execution_time_ms: Optional[float] = None
+    max_execution_time_ms: Optional[float] = None
+    last_execution: Optional[datetime] = None
+    hook_type: str = 'unknown'
+    team_id: str = 'unknown'
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @property
+    def failed_count(self) -> int:
+        return self.count - self.success_count
+
+    @property
+    def success_rate(self) -> float:
+        return self.success_count / self.count if self.count > 0 else 0.0
+
+    @property
+    def average_execution_time_ms(self) -> float:
+        return self.total_execution_time_ms / self.count if self.count > 0 else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Approximate execution time percentile (e.g. 95 for p95)."""
+        return self.sketch.quantile(percent / 100)
+
+    def add(
+        self,
+        execution_time_ms: float,
+        success: bool,
+        timestamp: datetime,
+        hook_type: str = 'unknown',
+        team_id: str = 'unknown'
+    ):
+        """Fold a single execution into the rollup."""
+        self.count += 1
+        if success:
+            self.success_count += 1
+        self.total_execution_time_ms += execution_time_ms
+        if self.min_execution_time_ms is None or execution_time_ms < self.min_execution_time_ms:
+            self.min_execution_time_ms = execution_time_ms
+        if self.max_execution_time_ms is None or execution_time_ms > self.max_execution_time_ms:
+            self.max_execution_time_ms = execution_time_ms
+        self.sketch.add(execution_time_ms)
+
+        if self.last_execution is None or timestamp >= self.last_execution:
+            self.last_execution = timestamp
+            self.hook_type = hook_type
+            self.team_id = team_id
+
+    def merge(self, other: "HookMetricRollup"):
+        """Merge another rollup into this one."""
+        if other.count == 0:
+            return
+
+        self.count += other.count
+        self.success_count += other.success_count
+        self.total_execution_time_ms += other.total_execution_time_ms
+        if self.min_execution_time_ms is None or other.min_execution_time_ms < self.min_execution_time_ms:
+            self.min_execution_time_ms = other.min_execution_time_ms
+        if self.max_execution_time_ms is None or other.max_execution_time_ms > self.max_execution_time_ms:
+            self.max_execution_time_ms = other.max_execution_time_ms
+        self.sketch.merge(other.sketch)
+
+        if self.last_execution is None or other.last_execution >= self.last_execution:
+            self.last_execution = other.last_execution
+            self.hook_type = other.hook_type
+            self.team_id = other.team_id
+
+
+class HookMetricsRollupStore:
+    """
+    In-memory materialized rollups of hook executions.
+
+    Buckets are kept at minute resolution (for range edges) and hour
+    resolution (for the interior of long ranges). Queries are resolved at
+    minute granularity, so a range includes every execution in its first and
+    last minute.
+    """
+
+    def __init__(
+        self,
+        retention: timedelta = timedelta(days=8),
+        covered_since: Optional[datetime] = None
+    ):
+        """
+        Initialize the rollup store.
+
+        Args:
+            retention: How long buckets are kept
+            covered_since: Earliest time for which the store holds every
+                execution (defaults to now, i.e. nothing before creation)
+        """
+        self.retention = retention
+        self.covered_since = covered_since or datetime.now(timezone.utc)
+        self._minutes: Dict[SeriesKey, Dict[int, HookMetricRollup]] = {}
+        self._hours: Dict[SeriesKey, Dict[int, HookMetricRollup]] = {}
+
+    @property
+    def series_count(self) -> int:
+        return len(self._minutes)
+
+    def covers(self, start_time: datetime) -> bool:
+        """Whether rollups hold every execution from ``start_time`` onwards."""
+        if start_time.tzinfo is None:
+            start_time = start_time.replace(tzinfo=timezone.utc)
+        return start_time >= self.covered_since
+
+    def add(
+        self,
+        hook_id: str,
+        team_id: str,
+        hook_type: str,
+        execution_time_ms: float,
+        success: bool,
+        timestamp: datetime
+    ):
+        """Fold an execution into its minute and hour buckets."""
+        key = (hook_id, team_id)
+        minute = _to_minute(timestamp)
+
+        for buckets, bucket_key in ((self._minutes, minute), (self._hours, minute // 60)):
+            series = buckets.setdefault(key, {})
+            rollup = series.get(bucket_key)
+            if rollup is None:
+                rollup = series[bucket_key] = HookMetricRollup()
+            rollup.add(execution_time_ms, success, timestamp, hook_type, team_id)
+
+    def add_record(self, record: AnalyticsRecord):
+        """Fold a ``hook_execution`` analytics record into the store."""
+        self.add(
+            hook_id=record.data.get('hook_id'),
+            team_id=record.team_id,
+            hook_type=record.data.get('hook_type', 'unknown'),
+            execution_time_ms=record.data.get('execution_time_ms', 0),
+            success=record.data.get('success', False),
+            timestamp=record.timestamp
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[AnalyticsRecord], covered_since: datetime) -> "HookMetricsRollupStore":
+        """Build a store from raw records (used when rollups do not cover a range)."""
+        store = cls(covered_since=covered_since)
+        for record in records:
+            store.add_record(record)
+        return store
+
+    def query(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        hook_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+        hook_type: Optional[str] = None
+    ) -> Dict[SeriesKey, HookMetricRollup]:
+        """
+        Merge buckets in ``[start_time, end_time]`` per (hook_id, team_id).
+
+        Returns:
+            Merged rollups for series with at least one execution in range
+        """
+        start_minute = _to_minute(start_time)
+        end_minute = _to_minute(end_time)
+        if end_minute < start_minute:
+            return {}
+
+        # Whole hours inside the range come from hour buckets
+        first_hour = -(-start_minute // 60)
+        end_hour = (end_minute + 1) // 60
+        if first_hour < end_hour:
+            minute_ranges = [
+                (start_minute, first_hour * 60 - 1),
+                (end_hour * 60, end_minute),
+            ]
+        else:
+            minute_ranges = [(start_minute, end_minute)]
+
+        results: Dict[SeriesKey, HookMetricRollup] = {}
+        for key, minutes in self._minutes.items():
+            if hook_id is not None and key[0] != hook_id:
+                continue
+            if team_id and key[1] != team_id:
+                continue
+
+            merged = HookMetricRollup()
+            for low, high in minute_ranges:
+                self._merge_range(merged, minutes, low, high)
+            if first_hour < end_hour:
+                self._merge_range(merged, self._hours.get(key, {}), first_hour, end_hour - 1)
+
+            if merged.count and (not hook_type or merged.hook_type == hook_type):
+                results[key] = merged
+
+        return results
+
+    @staticmethod
+    def _merge_range(target: HookMetricRollup, buckets: Dict[int, HookMetricRollup], low: int, high: int):
+        if high < low:
+            return
+        if high - low + 1 > len(buckets):
+            for bucket_key, rollup in buckets.items():
+                if low <= bucket_key <= high:
+                    target.merge(rollup)
+        else:
+            for bucket_key in range(low, high + 1):
+                rollup = buckets.get(bucket_key)
+                if rollup is not None:
+                    target.merge(rollup)
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """Drop buckets older than the retention window; returns buckets removed."""
+        cutoff = now or datetime.now(timezone.utc)
+        cutoff_minute = _to_minute(cutoff - self.retention)
+        removed = 0
+
+        for buckets, cutoff_key in ((self._minutes, cutoff_minute), (self._hours, cutoff_minute // 60)):
+            for key in list(buckets):
+                series = buckets[key]
+                for bucket_key in [k for k in series if k < cutoff_key]:
+                    del series[bucket_key]
+                    removed += 1
+                if not series:
+                    del buckets[key]
+
+        self.covered_since = max(self.covered_since, cutoff - self.retention)
+        return removed
@@ -6,7 +6,6 @@ performance tracking for the hook system with WebSocket-based dashboards.
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Set, Callable
@@ -21,6 +20,9 @@ from collections import defaultdict, deque
 from fastapi import WebSocket, WebSocketDisconnect
 import websockets
 
+from devsync_ai.analytics.websocket_fanout import (
+    ClientConnection, SlowConsumerPolicy, SnapshotFrame, WebSocketFanout, serialize
+)
 from devsync_ai.analytics.monitoring_data_manager import (
     get_monitoring_data_manager,
     MonitoringDataManager,
@@ -110,9 +112,32 @@ class RealTimeMonitoringSystem:
     and dashboard data for WebSocket clients.
     """
     
-    def __init__(self):
-        """Initialize the real-time monitoring system."""
+    # Points of performance_history included in each full system_update
+    SYSTEM_UPDATE_HISTORY_POINTS = 60
+
+    def __init__(
+        self,
+        update_interval: float = 5.0,
+        max_queued_messages: int = 64,
+        slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.COALESCE_LATEST,
+        send_timeout: float = 30.0
+    ):
+        """
+        Initialize the real-time monitoring system.
+
+        Args:
+            update_interval: Seconds between monitoring ticks
+            max_queued_messages: Outbound messages queued per client before dropping
+            slow_consumer_policy: How a client that falls behind catches up
+            send_timeout: A send stalled for longer than this disconnects the client
+        """
         self.active_connections: Set[WebSocket] = set()
+        self.fanout = WebSocketFanout(
+            max_queue=max_queued_messages,
+            policy=slow_consumer_policy,
+            send_timeout=send_timeout,
+            on_disconnect=self.active_connections.discard
+        )
         self.event_subscribers: Dict[EventType, Set[Callable]] = defaultdict(set)
         self.recent_events: deque = deque(maxlen=1000)  # Keep last 1000 events
         
@@ -132,6 +157,14 @@ class RealTimeMonitoringSystem:
         self.monitoring_active = False
         self.monitoring_task: Optional[asyncio.Task] = None
         self.data_manager: Optional[MonitoringDataManager] = None
+        self.update_interval = update_interval
+        self.overrun_ticks = 0
+        
+        # system_update sequencing for delta encoding
+        self._update_seq = 0
+        self._history_appended = 0
+        self._history_broadcast = 0
+        self._last_webhook_metrics: Optional[Dict[str, Any]] = None
         
         # Initialize default alert rules
         self._initialize_default_alert_rules()
@@ -161,11 +194,7 @@ class RealTimeMonitoringSystem:
                 pass
         
         # Close all WebSocket connections
-        for connection in self.active_connections.copy():
-            try:
-                await connection.close()
-            except Exception:
-                pass
+        await self.fanout.close_all()
         
         logger.info("Real-time monitoring system shutdown")
     
@@ -255,7 +284,9 @@ class RealTimeMonitoringSystem:
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
     
     async def _monitoring_loop(self):
-        """Main monitoring loop."""
+        """Main monitoring loop, ticking every ``update_interval`` seconds."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         while self.monitoring_active:
             try:
                 # Collect system metrics
@@ -274,13 +305,20 @@ class RealTimeMonitoringSystem:
                 if datetime.now().minute % 10 == 0:  # Every 10 minutes
                     await self._cleanup_old_data()
                 
-                await asyncio.sleep(5)  # Update every 5 seconds
-                
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}", exc_info=True)
-                await asyncio.sleep(10)  # Wait longer on error
+                next_tick += self.update_interval  # Wait longer on error
+            
+            # Fixed-rate schedule: the time spent in the tick doesn't push back the next one
+            next_tick += self.update_interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                self.overrun_ticks += 1
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
     
     async def _collect_system_metrics(self):
         """Collect current system metrics."""
@@ -289,7 +327,8 @@ class RealTimeMonitoringSystem:
             self.current_system_health = await self.data_manager.get_system_health_metrics()
             
             # Add system resource metrics
-            cpu_usage = psutil.cpu_percent(interval=1)
+            # Non-blocking: usage since the previous call
+            cpu_usage = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
             self.current_system_health.cpu_usage = cpu_usage
@@ -306,6 +345,7 @@ class RealTimeMonitoringSystem:
                 'error_count': self.current_system_health.error_count_last_hour,
                 'health_status': self.current_system_health.health_status.value
             })
+            self._history_appended += 1
             
         except Exception as e:
             logger.error(f"Failed to collect system metrics: {e}", exc_info=True)
@@ -451,36 +491,68 @@ class RealTimeMonitoringSystem:
             logger.error(f"Failed to trigger alert: {e}", exc_info=True)
     
     async def _broadcast_system_update(self):
-        """Broadcast system update to all connected clients."""
-        if not self.active_connections or not self.current_system_health:
+        """
+        Broadcast system update to all connected clients.
+
+        Clients that asked for delta updates and received the previous update get
+        a ``system_update_delta`` carrying only the history points appended since
+        then; everyone else gets the full ``system_update``.
+        """
+        if not self.fanout.clients or not self.current_system_health:
             return
         
         try:
-            # Prepare system update data
+            seq = self._update_seq + 1
+            timestamp = datetime.now(timezone.utc).isoformat()
+            history_points = self.SYSTEM_UPDATE_HISTORY_POINTS
+            new_points = min(self._history_appended - self._history_broadcast, history_points)
+            history = list(self.performance_history)[-history_points:]
+            webhook_metrics = dict(self.webhook_performance_cache)
+            system_health = {
+                'timestamp': self.current_system_health.timestamp.isoformat(),
+                'total_hooks': self.current_system_health.total_hooks,
+                'active_hooks': self.current_system_health.active_hooks,
+                'total_executions': self.current_system_health.total_executions,
+                'overall_success_rate': self.current_system_health.overall_success_rate,
+                'avg_execution_time_ms': self.current_system_health.avg_execution_time_ms,
+                'executions_per_minute': self.current_system_health.executions_per_minute,
+                'error_count_last_hour': self.current_system_health.error_count_last_hour,
+                'health_status': self.current_system_health.health_status.value,
+                'alerts_count': self.current_system_health.alerts_count,
+                'cpu_usage': self.current_system_health.cpu_usage,
+                'memory_usage': self.current_system_health.memory_usage,
+                'queue_depth': self.current_system_health.queue_depth
+            }
+            
             update_data = {
                 'type': 'system_update',
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'system_health': {
-                    'timestamp': self.current_system_health.timestamp.isoformat(),
-                    'total_hooks': self.current_system_health.total_hooks,
-                    'active_hooks': self.current_system_health.active_hooks,
-                    'total_executions': self.current_system_health.total_executions,
-                    'overall_success_rate': self.current_system_health.overall_success_rate,
-                    'avg_execution_time_ms': self.current_system_health.avg_execution_time_ms,
-                    'executions_per_minute': self.current_system_health.executions_per_minute,
-                    'error_count_last_hour': self.current_system_health.error_count_last_hour,
-                    'health_status': self.current_system_health.health_status.value,
-                    'alerts_count': self.current_system_health.alerts_count,
-                    'cpu_usage': self.current_system_health.cpu_usage,
-                    'memory_usage': self.current_system_health.memory_usage,
-                    'queue_depth': self.current_system_health.queue_depth
-                },
-                'performance_history': list(self.performance_history)[-60:],  # Last 5 minutes
-                'webhook_metrics': dict(self.webhook_performance_cache),
+                'seq': seq,
+                'timestamp': timestamp,
+                'system_health': system_health,
+                'performance_history': history,  # Last 5 minutes
+                'webhook_metrics': webhook_metrics,
+                'active_alerts_count': len(self.active_alerts)
+            }
+            delta_data = {
+                'type': 'system_update_delta',
+                'seq': seq,
+                'base_seq': seq - 1,
+                'timestamp': timestamp,
+                'system_health': system_health,
+                'performance_history_append': history[len(history) - new_points:] if new_points else [],
+                'history_window': history_points,
                 'active_alerts_count': len(self.active_alerts)
             }
+            if webhook_metrics != self._last_webhook_metrics:
+                delta_data['webhook_metrics'] = webhook_metrics
             
-            await self._broadcast_to_connections(update_data)
+            self.fanout.broadcast_frame(
+                SnapshotFrame(seq=seq, full=update_data, delta=delta_data),
+                coalesce_key='system_update'
+            )
+            self._update_seq = seq
+            self._history_broadcast = self._history_appended
+            self._last_webhook_metrics = webhook_metrics
             
         except Exception as e:
             logger.error(f"Failed to broadcast system update: {e}", exc_info=True)
@@ -519,21 +591,13 @@ class RealTimeMonitoringSystem:
             logger.error(f"Failed to broadcast event: {e}", exc_info=True)
     
     async def _broadcast_to_connections(self, data: Dict[str, Any]):
-        """Broadcast data to all WebSocket connections."""
-        if not self.active_connections:
-            return
-        
-        message = json.dumps(data)
-        disconnected = set()
-        
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.add(connection)
-        
-        # Remove disconnected connections
-        self.active_connections -= disconnected
+        """
+        Broadcast data to all WebSocket connections.
+
+        The payload is serialized once and queued for each client's sender task,
+        so a slow client never holds up the others or the monitoring loop.
+        """
+        self.fanout.broadcast(data)
     
     async def _cleanup_old_data(self):
         """Clean up old data periodically."""
@@ -644,10 +708,24 @@ class RealTimeMonitoringSystem:
         except Exception as e:
             logger.error(f"Failed to record webhook processing: {e}", exc_info=True)
     
-    async def connect_websocket(self, websocket: WebSocket):
-        """Connect a new WebSocket client."""
+    async def connect_websocket(
+        self, websocket: WebSocket, delta_updates: bool = False
+    ) -> Optional[ClientConnection]:
+        """
+        Connect a new WebSocket client.
+
+        Args:
+            websocket: WebSocket to accept
+            delta_updates: Send ``system_update_delta`` messages instead of
+                repeating the full performance history every tick
+
+        Returns:
+            The client's outbound connection, None if connecting failed.
+            Replies to the client go through it rather than the socket.
+        """
         try:
             await websocket.accept()
+            client = self.fanout.add(websocket, delta_updates=delta_updates)
             self.active_connections.add(websocket)
             
             # Send initial data
@@ -672,21 +750,32 @@ class RealTimeMonitoringSystem:
                 ]
             }
             
-            await websocket.send_text(json.dumps(initial_data))
+            client.enqueue(serialize(initial_data))
             
             logger.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
+            return client
             
         except Exception as e:
             logger.error(f"Failed to connect WebSocket client: {e}")
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+            await self.fanout.remove(websocket)
+            self.active_connections.discard(websocket)
+            return None
     
     async def disconnect_websocket(self, websocket: WebSocket):
         """Disconnect a WebSocket client."""
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            await self.fanout.remove(websocket)
+            self.active_connections.discard(websocket)
             logger.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
     
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Outbound queue and slow consumer statistics for connected clients."""
+        return {
+            **self.fanout.get_stats(),
+            'update_interval': self.update_interval,
+            'overrun_ticks': self.overrun_ticks
+        }
+    
     def subscribe_to_events(self, event_type: EventType, callback: Callable):
         """Subscribe to real-time events."""
         self.event_subscribers[event_type].add(callback)
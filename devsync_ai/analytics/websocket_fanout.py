@@ -0,0 +1,301 @@
+"""
+Non-blocking WebSocket fan-out for monitoring dashboards.
+
+Each client gets a bounded outbound queue drained by its own sender task, so a
+slow or stalled client only delays itself. Broadcasts serialize a payload once
+and enqueue the same string for every client without awaiting any send.
+
+When a client's queue is full the oldest queued message is dropped. Messages
+broadcast with a coalesce key (periodic snapshots) replace an unsent message
+with the same key instead of queueing behind it, so a slow client skips
+straight to the latest snapshot.
+
+Snapshot frames can carry a delta against the previous frame. The sender
+chooses per client: the delta when the client received the previous frame,
+otherwise the full snapshot, which is serialized only if some client needs it.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Union
+
+from fastapi import WebSocket
+
+
+logger = logging.getLogger(__name__)
+
+
+class SlowConsumerPolicy(Enum):
+    """What to do with messages for a client whose queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    COALESCE_LATEST = "coalesce_latest"
+
+
+def json_default(value: Any) -> Any:
+    """JSON encoder fallback for dashboard payloads."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def serialize(data: Dict[str, Any]) -> str:
+    return json.dumps(data, default=json_default)
+
+
+@dataclass
+class SnapshotFrame:
+    """
+    A periodic snapshot with an optional delta against the previous frame.
+
+    ``full`` and ``delta`` may be dicts (serialized on first use, then shared)
+    or pre-serialized strings.
+    """
+    seq: int
+    full: Union[Dict[str, Any], str]
+    delta: Optional[Union[Dict[str, Any], str]] = None
+
+    def full_message(self) -> str:
+        if not isinstance(self.full, str):
+            self.full = serialize(self.full)
+        return self.full
+
+    def delta_message(self) -> str:
+        if not isinstance(self.delta, str):
+            self.delta = serialize(self.delta)
+        return self.delta
+
+
+@dataclass
+class _Outbound:
+    message: Union[str, SnapshotFrame]
+    coalesce_key: Optional[str] = None
+
+
+@dataclass
+class ConnectionStats:
+    sent: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    deltas_sent: int = 0
+
+
+class ClientConnection:
+    """A WebSocket client with a bounded outbound queue and its own sender task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int = 64,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.COALESCE_LATEST,
+        send_timeout: Optional[float] = 30.0,
+        delta_updates: bool = False,
+        on_close: Optional[Callable[["ClientConnection"], None]] = None
+    ):
+        """
+        Initialize the connection.
+
+        Args:
+            websocket: Accepted WebSocket
+            max_queue: Messages queued before the oldest is dropped
+            policy: Slow consumer policy
+            send_timeout: A send taking longer than this closes the connection
+            delta_updates: Whether the client understands snapshot deltas
+            on_close: Called once when the connection closes
+        """
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.delta_updates = delta_updates
+        self.on_close = on_close
+        self.stats = ConnectionStats()
+
+        self._queue: Deque[_Outbound] = deque()
+        self._by_key: Dict[str, _Outbound] = {}
+        self._has_messages = asyncio.Event()
+        self._last_seq: Optional[int] = None
+        self._closed = False
+        self._sender = asyncio.create_task(self._run_sender())
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def enqueue(self, message: Union[str, SnapshotFrame], coalesce_key: Optional[str] = None):
+        """Queue a message without waiting for the client."""
+        if self._closed:
+            return
+
+        if coalesce_key is not None and self.policy == SlowConsumerPolicy.COALESCE_LATEST:
+            pending = self._by_key.get(coalesce_key)
+            if pending is not None:
+                pending.message = message
+                self.stats.coalesced += 1
+                return
+
+        if len(self._queue) >= self.max_queue:
+            dropped = self._queue.popleft()
+            if dropped.coalesce_key is not None and self._by_key.get(dropped.coalesce_key) is dropped:
+                del self._by_key[dropped.coalesce_key]
+            self.stats.dropped += 1
+
+        outbound = _Outbound(message, coalesce_key)
+        self._queue.append(outbound)
+        if coalesce_key is not None:
+            self._by_key[coalesce_key] = outbound
+        self._has_messages.set()
+
+    def _render(self, message: Union[str, SnapshotFrame]) -> str:
+        if isinstance(message, str):
+            return message
+        use_delta = (
+            self.delta_updates
+            and message.delta is not None
+            and self._last_seq is not None
+            and self._last_seq == message.seq - 1
+        )
+        self._last_seq = message.seq
+        if use_delta:
+            self.stats.deltas_sent += 1
+            return message.delta_message()
+        return message.full_message()
+
+    async def _run_sender(self):
+        try:
+            while True:
+                while not self._queue:
+                    self._has_messages.clear()
+                    await self._has_messages.wait()
+
+                outbound = self._queue.popleft()
+                if outbound.coalesce_key is not None and self._by_key.get(outbound.coalesce_key) is outbound:
+                    del self._by_key[outbound.coalesce_key]
+
+                await asyncio.wait_for(self.websocket.send_text(self._render(outbound.message)), self.send_timeout)
+                self.stats.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"Closing WebSocket client after failed send: {e!r}")
+            self._finish()
+
+    def _finish(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._by_key.clear()
+        if self.on_close:
+            self.on_close(self)
+
+    async def close(self, close_socket: bool = True):
+        """Stop the sender and optionally close the socket."""
+        self._finish()
+        if not self._sender.done():
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+        if close_socket:
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._queue),
+            "sent": self.stats.sent,
+            "dropped": self.stats.dropped,
+            "coalesced": self.stats.coalesced,
+            "deltas_sent": self.stats.deltas_sent,
+            "delta_updates": self.delta_updates
+        }
+
+
+class WebSocketFanout:
+    """Set of ClientConnections sharing one serialization per broadcast."""
+
+    def __init__(
+        self,
+        max_queue: int = 64,
+        policy: SlowConsumerPolicy = SlowConsumerPolicy.COALESCE_LATEST,
+        send_timeout: Optional[float] = 30.0,
+        on_disconnect: Optional[Callable[[WebSocket], None]] = None
+    ):
+        self.max_queue = max_queue
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.on_disconnect = on_disconnect
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        self.disconnected_clients = 0
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def add(self, websocket: WebSocket, delta_updates: bool = False) -> ClientConnection:
+        client = ClientConnection(
+            websocket,
+            max_queue=self.max_queue,
+            policy=self.policy,
+            send_timeout=self.send_timeout,
+            delta_updates=delta_updates,
+            on_close=self._client_closed
+        )
+        self.clients[websocket] = client
+        return client
+
+    def _client_closed(self, client: ClientConnection):
+        if self.clients.get(client.websocket) is client:
+            del self.clients[client.websocket]
+            self.disconnected_clients += 1
+            if self.on_disconnect:
+                self.on_disconnect(client.websocket)
+
+    async def remove(self, websocket: WebSocket, close_socket: bool = False):
+        client = self.clients.get(websocket)
+        if client is not None:
+            await client.close(close_socket)
+
+    def broadcast(self, data: Union[Dict[str, Any], str], coalesce_key: Optional[str] = None):
+        """Serialize once and queue for every client; never waits on a client."""
+        if not self.clients:
+            return
+        message = data if isinstance(data, str) else serialize(data)
+        for client in list(self.clients.values()):
+            client.enqueue(message, coalesce_key)
+
+    def broadcast_frame(self, frame: SnapshotFrame, coalesce_key: str):
+        """Queue a snapshot frame; each client gets the delta or the full snapshot."""
+        for client in list(self.clients.values()):
+            client.enqueue(frame, coalesce_key)
+
+    async def close_all(self):
+        await asyncio.gather(
+            *(client.close() for client in list(self.clients.values())),
+            return_exceptions=True
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = [client.get_stats() for client in self.clients.values()]
+        return {
+            "connections": len(stats),
+            "queued_messages": sum(s["depth"] for s in stats),
+            "max_queue_depth": max((s["depth"] for s in stats), default=0),
+            "dropped_messages": sum(s["dropped"] for s in stats),
+            "coalesced_messages": sum(s["coalesced"] for s in stats),
+            "disconnected_clients": self.disconnected_clients,
+            "policy": self.policy.value
+        }
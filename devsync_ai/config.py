@@ -32,12 +32,25 @@ class Settings(BaseSettings):
     github_token: Optional[str] = Field(default=None, env="GITHUB_TOKEN")
     github_webhook_secret: Optional[str] = Field(default=None, env="GITHUB_WEBHOOK_SECRET")
     github_repository: str = Field(default="asakohayase/kiro-devsync-ai", env="GITHUB_REPOSITORY")
+    github_sdk_max_workers: int = Field(default=8, env="GITHUB_SDK_MAX_WORKERS")
+    github_pr_enrichment_concurrency: int = Field(default=4, env="GITHUB_PR_ENRICHMENT_CONCURRENCY")
+    # SQLite store of synced commits and open PRs; unset lists through PyGithub on every call
+    github_activity_store_path: Optional[str] = Field(default=None, env="GITHUB_ACTIVITY_STORE_PATH")
+    github_api_url: str = Field(default="https://api.github.com", env="GITHUB_API_URL")
 
     # JIRA settings
     jira_url: Optional[str] = Field(default=None, env="JIRA_URL")
     jira_username: Optional[str] = Field(default=None, env="JIRA_USERNAME")
     jira_token: Optional[str] = Field(default=None, env="JIRA_TOKEN")
     jira_project_key: str = Field(default="DP", env="JIRA_PROJECT_KEY")
+    jira_sdk_max_workers: int = Field(default=4, env="JIRA_SDK_MAX_WORKERS")
+    jira_webhook_secret: Optional[str] = Field(default=None, env="JIRA_WEBHOOK_SECRET")
+    # Journal /webhooks/jira payloads and acknowledge with 202 before processing
+    jira_webhook_ingestion_queue: bool = Field(default=False, env="JIRA_WEBHOOK_INGESTION_QUEUE")
+    jira_webhook_journal_path: str = Field(default="jira_webhook_journal.db", env="JIRA_WEBHOOK_JOURNAL_PATH")
+    jira_webhook_workers: int = Field(default=4, env="JIRA_WEBHOOK_WORKERS")
+    # Agent hook events run on lanes hashed by ticket key (0 runs them inline)
+    jira_hook_worker_lanes: int = Field(default=8, env="JIRA_HOOK_WORKER_LANES")
 
     # Slack settings
     slack_bot_token: Optional[str] = Field(default=None, env="SLACK_BOT_TOKEN")
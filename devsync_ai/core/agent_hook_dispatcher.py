@@ -11,7 +11,7 @@ import hmac
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 from fastapi import HTTPException
@@ -27,6 +27,7 @@ from .agent_hooks import (
     SignificanceLevel
 )
 from .hook_lifecycle_manager import HookLifecycleManager
+from .lane_executor import LaneExecutor, LaneExecutorStoppedError, LaneFullError
 
 
 logger = logging.getLogger(__name__)
@@ -207,7 +208,10 @@ class AgentHookDispatcher:
         hook_registry: HookRegistry,
         lifecycle_manager: HookLifecycleManager,
         webhook_secret: Optional[str] = None,
-        max_requests_per_minute: int = 100
+        max_requests_per_minute: int = 100,
+        worker_lanes: int = 0,
+        max_queue_per_lane: int = 100,
+        enqueue_timeout: float = 1.0
     ):
         """
         Initialize the dispatcher.
@@ -217,12 +221,26 @@ class AgentHookDispatcher:
             lifecycle_manager: Manager for hook execution lifecycle
             webhook_secret: Secret for webhook signature validation
             max_requests_per_minute: Rate limit for webhook requests
+            worker_lanes: Lanes events are hashed onto by ticket key; events for a
+                ticket run in order, other tickets in parallel. 0 processes inline.
+            max_queue_per_lane: Events queued per lane before callers wait
+            enqueue_timeout: Seconds to wait on a full lane before answering 503
         """
         self.hook_registry = hook_registry
         self.lifecycle_manager = lifecycle_manager
         self.security_validator = WebhookSecurityValidator(webhook_secret)
         self.rate_limiter = WebhookRateLimiter(max_requests_per_minute)
         
+        # Per-ticket ordered worker lanes
+        self.executor: Optional[LaneExecutor] = None
+        if worker_lanes > 0:
+            self.executor = LaneExecutor(
+                lanes=worker_lanes,
+                max_queue_per_lane=max_queue_per_lane,
+                enqueue_timeout=enqueue_timeout,
+                name="hook dispatch"
+            )
+        
         # Metrics tracking
         self._total_webhooks_received = 0
         self._total_webhooks_processed = 0
@@ -278,14 +296,30 @@ class AgentHookDispatcher:
                     detail=validation_result.error_message
                 )
             
-            # Process the event
-            processed_event = await self._process_webhook_event(webhook_data, validation_result.event_type)
-            
-            # Enrich the event with additional context
-            enriched_event = await self._enrich_event(processed_event)
-            
-            # Execute applicable hooks
-            execution_results = await self.lifecycle_manager.execute_hooks_for_event(enriched_event)
+            if self.executor is not None:
+                # Queue behind earlier events for the same ticket
+                ticket_key = webhook_data.get('issue', {}).get('key', 'UNKNOWN')
+                try:
+                    pending = await self.executor.submit(
+                        ticket_key,
+                        lambda: self._execute_event(webhook_data, validation_result.event_type)
+                    )
+                except LaneFullError as e:
+                    self._total_webhooks_failed += 1
+                    logger.warning(f"Hook dispatch backpressure for {ticket_key}: {e}")
+                    raise HTTPException(
+                        status_code=503,
+                        detail="Hook dispatch queue full",
+                        headers={"Retry-After": "1"}
+                    )
+                except LaneExecutorStoppedError:
+                    self._total_webhooks_failed += 1
+                    raise HTTPException(status_code=503, detail="Hook dispatcher is shutting down")
+                enriched_event, execution_results = await pending
+            else:
+                enriched_event, execution_results = await self._execute_event(
+                    webhook_data, validation_result.event_type
+                )
             
             # Calculate metrics
             processing_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
@@ -326,6 +360,28 @@ class AgentHookDispatcher:
                 errors=[str(e)]
             )
     
+    async def _execute_event(
+        self,
+        webhook_data: Dict[str, Any],
+        event_type: str
+    ) -> Tuple[EnrichedEvent, List[HookExecutionResult]]:
+        """Process, enrich and run hooks for a validated webhook."""
+        # Process the event
+        processed_event = await self._process_webhook_event(webhook_data, event_type)
+        
+        # Enrich the event with additional context
+        enriched_event = await self._enrich_event(processed_event)
+        
+        # Execute applicable hooks
+        execution_results = await self.lifecycle_manager.execute_hooks_for_event(enriched_event)
+        
+        return enriched_event, execution_results
+    
+    async def shutdown(self):
+        """Finish queued events and stop the worker lanes."""
+        if self.executor is not None:
+            await self.executor.stop()
+    
     async def _process_webhook_event(self, webhook_data: Dict[str, Any], event_type: str) -> ProcessedEvent:
         """
         Process raw webhook data into a ProcessedEvent.
@@ -524,7 +580,7 @@ class AgentHookDispatcher:
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get dispatcher metrics."""
-        return {
+        metrics = {
             'total_webhooks_received': self._total_webhooks_received,
             'total_webhooks_processed': self._total_webhooks_processed,
             'total_webhooks_failed': self._total_webhooks_failed,
@@ -537,6 +593,11 @@ class AgentHookDispatcher:
             'registered_hooks': len(self.hook_registry.get_all_hooks()),
             'enabled_hooks': len(self.hook_registry.get_enabled_hooks())
         }
+        
+        if self.executor is not None:
+            metrics['worker_lanes'] = self.executor.get_metrics()
+        
+        return metrics
     
     async def register_hook(self, hook: AgentHook) -> bool:
         """
@@ -588,10 +649,16 @@ class AgentHookDispatcher:
             total_hooks = len(self.hook_registry.get_all_hooks())
             enabled_hooks = len(self.hook_registry.get_enabled_hooks())
             
+            # Lanes at capacity are turning webhooks away
+            lanes_saturated = any(
+                lane['depth'] >= self.executor.max_queue_per_lane
+                for lane in metrics.get('worker_lanes', {}).get('per_lane', [])
+            )
+            
             status = "healthy"
             if not lifecycle_healthy:
                 status = "degraded"
-            elif enabled_hooks == 0:
+            elif enabled_hooks == 0 or lanes_saturated:
                 status = "warning"
             
             return {
@@ -605,7 +672,11 @@ class AgentHookDispatcher:
                     'security_validator': 'ok',
                     'rate_limiter': 'ok',
                     'hook_registry': 'ok',
-                    'lifecycle_manager': 'ok' if lifecycle_healthy else 'error'
+                    'lifecycle_manager': 'ok' if lifecycle_healthy else 'error',
+                    'worker_lanes': (
+                        'disabled' if self.executor is None
+                        else 'saturated' if lanes_saturated else 'ok'
+                    )
                 }
             }
             
@@ -0,0 +1,298 @@
+"""Asyncio-native message batching with a bounded queue and a background flusher."""
+
+import asyncio
+import bisect
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .message_batcher import BatchableMessage, MessageBatcher
+from .message_formatter import SlackMessage
+
+
+SlackSender = Callable[[str, SlackMessage], Awaitable[Any]]
+
+
+class QueueFullPolicy(Enum):
+    """What producers get when the batching queue is full."""
+    BLOCK = "block"              # Backpressure: wait for space (up to enqueue_timeout)
+    DROP_NEWEST = "drop_newest"  # Reject the incoming message
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued message
+
+
+@dataclass
+class AsyncBatcherConfig:
+    """Configuration for the async batching pipeline."""
+    queue_size: int = 1000
+    full_policy: QueueFullPolicy = QueueFullPolicy.BLOCK
+    enqueue_timeout_seconds: Optional[float] = 5.0
+    expiry_check_interval_seconds: float = 1.0
+    latency_buckets_ms: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (cumulative counts per upper bound, in ms)."""
+
+    def __init__(self, buckets_ms: Tuple[float, ...]):
+        self.bounds = sorted(buckets_ms)
+        self.counts = [0] * (len(self.bounds) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        value_ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, percent: float) -> float:
+        """Upper bound of the bucket containing the given percentile."""
+        if self.count == 0:
+            return 0.0
+        rank = percent / 100 * self.count
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            if running >= rank:
+                return float(bound)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {}
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            buckets[f"le_{bound:g}"] = running
+        buckets["le_inf"] = self.count
+
+        return {
+            'count': self.count,
+            'sum_ms': round(self.sum_ms, 3),
+            'avg_ms': round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'buckets': buckets
+        }
+
+
+@dataclass
+class _QueuedMessage:
+    message: BatchableMessage
+    channel_id: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class AsyncMessageBatcher:
+    """
+    Async front end for a MessageBatcher.
+
+    Producers only enqueue; a single flusher task feeds messages to the
+    wrapped batcher, renders batches that are ready and awaits ``sender``
+    for each. Messages are consumed and batches sent in FIFO order by one
+    task, so per-channel ordering is preserved. When the queue is full,
+    producers wait (``BLOCK``) or a message is dropped per ``full_policy``.
+    """
+
+    def __init__(
+        self,
+        sender: SlackSender,
+        batcher: Optional[MessageBatcher] = None,
+        config: Optional[AsyncBatcherConfig] = None
+    ):
+        """
+        Initialize the async batcher.
+
+        Args:
+            sender: Coroutine function called with (channel_id, message) for each batch
+            batcher: Batcher holding the grouping logic (defaults to a new MessageBatcher)
+            config: Queue and flusher configuration
+        """
+        self.sender = sender
+        self.batcher = batcher or MessageBatcher()
+        self.config = config or AsyncBatcherConfig()
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._accepting = False
+        # add_message calls in progress; stop() waits for blocked producers
+        self._producers = 0
+        self._producers_idle = asyncio.Event()
+        self._producers_idle.set()
+
+        self._stats = {
+            'enqueued': 0,
+            'dropped': 0,
+            'blocked_enqueues': 0,
+            'processed': 0,
+            'batches_sent': 0,
+            'send_errors': 0
+        }
+        self.queue_wait_histogram = LatencyHistogram(self.config.latency_buckets_ms)
+        self.flush_histogram = LatencyHistogram(self.config.latency_buckets_ms)
+
+    @property
+    def running(self) -> bool:
+        return self._flusher_task is not None and not self._flusher_task.done()
+
+    async def start(self) -> None:
+        """Start the flusher task."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._accepting = True
+        self._flusher_task = asyncio.create_task(self._flusher())
+        self.logger.info("AsyncMessageBatcher started")
+
+    async def stop(self, flush: bool = True) -> None:
+        """
+        Stop accepting messages, drain the queue and stop the flusher.
+
+        Args:
+            flush: Also flush and send every pending batch
+        """
+        if not self.running:
+            return
+
+        self._accepting = False
+        # A producer blocked on a full queue may still put after a join
+        await self._producers_idle.wait()
+        await self._queue.join()
+        self._flusher_task.cancel()
+        try:
+            await self._flusher_task
+        except asyncio.CancelledError:
+            pass
+        self._flusher_task = None
+
+        if flush:
+            await self._send_batches(self.batcher.flush_all_batches(), time.monotonic())
+        self.logger.info("AsyncMessageBatcher stopped")
+
+    async def add_message(self, message: BatchableMessage, channel_id: str = "default") -> bool:
+        """
+        Enqueue a message for batching.
+
+        Returns:
+            True if the message was queued, False if it was dropped
+        """
+        if not self._accepting:
+            raise RuntimeError("AsyncMessageBatcher is not running")
+
+        item = _QueuedMessage(message=message, channel_id=channel_id)
+        self._producers += 1
+        self._producers_idle.clear()
+        try:
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if not await self._handle_full_queue(item):
+                    self._stats['dropped'] += 1
+                    return False
+
+            self._stats['enqueued'] += 1
+            return True
+        finally:
+            self._producers -= 1
+            if not self._producers:
+                self._producers_idle.set()
+
+    async def _handle_full_queue(self, item: _QueuedMessage) -> bool:
+        """Apply the full-queue policy; returns whether ``item`` was queued."""
+        policy = self.config.full_policy
+
+        if policy == QueueFullPolicy.DROP_NEWEST:
+            return False
+
+        if policy == QueueFullPolicy.DROP_OLDEST:
+            dropped = self._queue.get_nowait()
+            self._queue.task_done()
+            self._stats['dropped'] += 1
+            self.logger.warning(f"Batch queue full, dropped oldest message {dropped.message.id}")
+            self._queue.put_nowait(item)
+            return True
+
+        self._stats['blocked_enqueues'] += 1
+        try:
+            await asyncio.wait_for(self._queue.put(item), timeout=self.config.enqueue_timeout_seconds)
+            return True
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Batch queue full for {self.config.enqueue_timeout_seconds}s, dropped message {item.message.id}")
+            return False
+
+    async def _flusher(self) -> None:
+        interval = self.config.expiry_check_interval_seconds
+        next_expiry_check = time.monotonic() + interval
+        # One pending get() is kept across wakeups so a timeout never loses an item
+        getter: Optional[asyncio.Future] = None
+
+        try:
+            while True:
+                if getter is None:
+                    getter = asyncio.ensure_future(self._queue.get())
+                done, _ = await asyncio.wait(
+                    {getter}, timeout=max(0.0, next_expiry_check - time.monotonic())
+                )
+
+                if getter in done:
+                    item, getter = getter.result(), None
+                    try:
+                        await self._process(item)
+                    finally:
+                        self._queue.task_done()
+
+                if time.monotonic() >= next_expiry_check:
+                    next_expiry_check = time.monotonic() + interval
+                    try:
+                        started = time.monotonic()
+                        await self._send_batches(self.batcher.flush_expired_batches(), started)
+                    except Exception as e:
+                        self.logger.error(f"Expired batch flush failed: {e}")
+        finally:
+            if getter is not None:
+                getter.cancel()
+
+    async def _process(self, item: _QueuedMessage) -> None:
+        started = time.monotonic()
+        self.queue_wait_histogram.observe(started - item.enqueued_at)
+        self._stats['processed'] += 1
+
+        try:
+            batched_message = self.batcher.add_message(item.message, item.channel_id)
+        except Exception as e:
+            self.logger.error(f"Failed to batch message {item.message.id}: {e}")
+            return
+
+        if batched_message:
+            await self._send_batches([batched_message], started, item.channel_id)
+
+    async def _send_batches(self, messages: List[SlackMessage], started: float,
+                            channel_id: Optional[str] = None) -> None:
+        for batched_message in messages:
+            target = channel_id or batched_message.metadata.get('channel_id', 'default')
+            try:
+                await self.sender(target, batched_message)
+                self._stats['batches_sent'] += 1
+            except Exception as e:
+                self._stats['send_errors'] += 1
+                self.logger.error(f"Failed to send batch to {target}: {e}")
+            self.flush_histogram.observe(time.monotonic() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue, throughput and latency statistics."""
+        return {
+            **self._stats,
+            'running': self.running,
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'queue_size': self.config.queue_size,
+            'full_policy': self.config.full_policy.value,
+            'queue_wait_latency': self.queue_wait_histogram.to_dict(),
+            'flush_latency': self.flush_histogram.to_dict(),
+            'batcher': self.batcher.get_batch_stats()
+        }
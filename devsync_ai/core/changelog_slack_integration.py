@@ -173,27 +173,39 @@ class ChangelogSlackIntegration:
             
             results["total_channels"] = len(target_channels)
             
-            # Distribute to each channel with channel-specific optimization
-            for channel_info in target_channels:
-                try:
-                    delivery_result = await self._distribute_to_channel(
+            # Distribute to channels concurrently; the Slack client shares one
+            # connection pool and rate-limit state across these requests
+            semaphore = asyncio.Semaphore(distribution_config.get("max_concurrency", 5))
+            
+            async def _deliver(channel_info: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._distribute_to_channel(
                         changelog_data, channel_info, distribution_config
                     )
-                    
-                    if delivery_result["success"]:
-                        results["successful_deliveries"] += 1
-                    else:
-                        results["failed_deliveries"] += 1
-                    
-                    results["delivery_details"].append(delivery_result)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to distribute to channel {channel_info.get('id')}: {e}")
+            
+            delivery_results = await asyncio.gather(
+                *(_deliver(channel_info) for channel_info in target_channels),
+                return_exceptions=True
+            )
+            
+            for channel_info, delivery_result in zip(target_channels, delivery_results):
+                if isinstance(delivery_result, Exception):
+                    self.logger.error(
+                        f"Failed to distribute to channel {channel_info.get('id')}: {delivery_result}"
+                    )
                     results["failed_deliveries"] += 1
                     results["errors"].append({
                         "channel": channel_info.get("id"),
-                        "error": str(e)
+                        "error": str(delivery_result)
                     })
+                    continue
+                
+                if delivery_result["success"]:
+                    results["successful_deliveries"] += 1
+                else:
+                    results["failed_deliveries"] += 1
+                
+                results["delivery_details"].append(delivery_result)
             
             # Initialize engagement tracking
             await self._initialize_engagement_tracking(results["delivery_details"])
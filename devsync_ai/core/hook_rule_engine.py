@@ -11,7 +11,7 @@ import re
 import yaml
 from datetime import datetime, timezone, time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -108,6 +108,35 @@ class TeamRuleSet:
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+@dataclass
+class CompiledRule:
+    """A hook rule compiled into a predicate over the event context."""
+    rule: HookRule
+    matches: Callable[[Dict[str, Any]], bool]
+    hook_types: frozenset
+
+
+@dataclass
+class RuleIndex:
+    """
+    Candidate rules keyed by the value of one indexed field.
+    
+    Rules are stored as positions in the team's priority-ordered rule list;
+    case-insensitive guards are keyed by their lowered values in ``folded``.
+    """
+    exact: Dict[Any, List[int]] = field(default_factory=dict)
+    folded: Dict[Any, List[int]] = field(default_factory=dict)
+
+
+@dataclass
+class CompiledTeamRules:
+    """Compiled rules of a team in evaluation (priority) order."""
+    source: TeamRuleSet
+    rules: List[CompiledRule]
+    indexes: Dict[str, RuleIndex] = field(default_factory=dict)
+    unindexed: List[int] = field(default_factory=list)
+
+
 @dataclass
 class RuleEvaluationResult:
     """Result of rule evaluation."""
@@ -171,6 +200,14 @@ class HookRuleEngine:
         'routing_hints.assignee'
     }
     
+    # Fields whose equality/in conditions are indexed for rule dispatch
+    INDEXED_FIELDS = (
+        'event.event_type',
+        'event.project_key',
+        'event.classification.category',
+        'ticket.issue_type.name'
+    )
+    
     # Time-based field patterns
     TIME_FIELDS = {
         'context.processed_at',
@@ -191,11 +228,17 @@ class HookRuleEngine:
         self._cache_timestamps: Dict[str, datetime] = {}
         self._cache_ttl = 300  # 5 minutes
         
+        # Rules compiled at load time, and field accessors shared across rules
+        self._compiled_rules: Dict[str, CompiledTeamRules] = {}
+        self._field_accessors: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        
         # Metrics tracking
         self._evaluations_count = 0
         self._cache_hits = 0
         self._cache_misses = 0
         self._validation_errors = 0
+        self._indexed_evaluations = 0
+        self._candidate_rules_evaluated = 0
         
         logger.info(f"HookRuleEngine initialized with config_dir: {self.config_dir}")
     
@@ -227,31 +270,35 @@ class HookRuleEngine:
                     errors=[f"No rules found or team disabled for team: {team_id}"]
                 )
             
-            # Filter rules by hook types if specified
-            applicable_rules = team_rules.rules
-            if hook_types:
-                applicable_rules = [
-                    rule for rule in team_rules.rules
-                    if any(hook_type in rule.hook_types for hook_type in hook_types)
-                ]
+            compiled_rules = self._get_compiled_rules(team_id, team_rules)
             
-            # Evaluate rules in priority order
-            applicable_rules.sort(key=lambda r: r.priority, reverse=True)
+            # Field values are read from a context built once per event
+            context = self._build_event_context(event)
             
+            hook_type_filter = set(hook_types) if hook_types else None
+            candidate_count = 0
             evaluation_errors = []
             
-            for rule in applicable_rules:
-                if not rule.enabled:
+            # Evaluate candidate rules in priority order
+            for position in self._get_candidate_positions(compiled_rules, context):
+                compiled = compiled_rules.rules[position]
+                
+                # Filter rules by hook types if specified
+                if hook_type_filter and hook_type_filter.isdisjoint(compiled.hook_types):
                     continue
                 
+                candidate_count += 1
+                rule = compiled.rule
+                
                 try:
-                    if await self._evaluate_rule_group(rule.conditions, event):
+                    if compiled.matches(context):
                         # Rule matched - prepare result
                         channels = self._determine_channels(rule, team_rules, event)
                         urgency_override = self._determine_urgency_override(rule, event)
                         
                         processing_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
                         self._evaluations_count += 1
+                        self._record_candidates(candidate_count)
                         
                         logger.debug(
                             f"Rule matched: {rule.rule_id} for event {event.event_id} "
@@ -269,7 +316,10 @@ class HookRuleEngine:
                                 'rule_priority': rule.priority,
                                 'rule_description': rule.description,
                                 'team_id': team_id,
-                                'evaluation_order': applicable_rules.index(rule)
+                                'evaluation_order': self._evaluation_order(
+                                    compiled_rules, position, hook_type_filter
+                                ),
+                                'candidate_rules': candidate_count
                             },
                             evaluation_time_ms=processing_time
                         )
@@ -283,10 +333,11 @@ class HookRuleEngine:
             # No rules matched
             processing_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
             self._evaluations_count += 1
+            self._record_candidates(candidate_count)
             
             return RuleEvaluationResult(
                 matched=False,
-                metadata={'evaluated_rules': len(applicable_rules)},
+                metadata={'evaluated_rules': candidate_count},
                 evaluation_time_ms=processing_time,
                 errors=evaluation_errors
             )
@@ -337,6 +388,7 @@ class HookRuleEngine:
             # Cache the result
             self._team_rules_cache[team_id] = team_rules
             self._cache_timestamps[team_id] = datetime.now(timezone.utc)
+            self._compiled_rules[team_id] = self._compile_team_rules(team_rules)
             
             logger.debug(f"Loaded {len(team_rules.rules)} rules for team: {team_id}")
             return team_rules
@@ -426,59 +478,447 @@ class HookRuleEngine:
         Returns:
             True if the rule group matches, False otherwise
         """
+        return self._compile_rule_group(rule_group)(self._build_event_context(event))
+    
+    async def _evaluate_condition(self, condition: RuleCondition, event: EnrichedEvent) -> bool:
+        """
+        Evaluate a single condition against an event.
+        
+        Args:
+            condition: The condition to evaluate
+            event: The event to evaluate against
+            
+        Returns:
+            True if the condition matches, False otherwise
+        """
+        return self._compile_condition(condition)(self._build_event_context(event))
+    
+    def _get_compiled_rules(self, team_id: str, team_rules: TeamRuleSet) -> CompiledTeamRules:
+        """Get compiled rules for a team, compiling them if the rule set changed."""
+        compiled = self._compiled_rules.get(team_id)
+        if compiled is None or compiled.source is not team_rules:
+            compiled = self._compile_team_rules(team_rules)
+            self._compiled_rules[team_id] = compiled
+        return compiled
+    
+    def _compile_team_rules(self, team_rules: TeamRuleSet) -> CompiledTeamRules:
+        """
+        Compile a team's rules into predicates, sorted by priority.
+        
+        Args:
+            team_rules: Team rule set
+            
+        Returns:
+            Compiled team rules
+        """
+        compiled = CompiledTeamRules(source=team_rules, rules=[])
+        
+        for rule in sorted(team_rules.rules, key=lambda r: r.priority, reverse=True):
+            guard = None
+            try:
+                matches = self._compile_rule_group(rule.conditions)
+                guard = self._find_index_guard(rule.conditions)
+            except Exception as e:
+                logger.error(f"Error compiling rule {rule.rule_id}: {e}")
+                
+                def matches(context: Dict[str, Any], error: Exception = e) -> bool:
+                    raise error
+            
+            position = len(compiled.rules)
+            compiled.rules.append(CompiledRule(
+                rule=rule,
+                matches=matches,
+                hook_types=frozenset(rule.hook_types)
+            ))
+            
+            # Disabled rules are never candidates
+            if not rule.enabled:
+                continue
+            
+            if guard is None:
+                compiled.unindexed.append(position)
+                continue
+            
+            field_path, keys, case_sensitive = guard
+            index = compiled.indexes.setdefault(field_path, RuleIndex())
+            buckets = index.exact if case_sensitive else index.folded
+            for key in keys:
+                positions = buckets.setdefault(key, [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+        
+        return compiled
+    
+    def _find_index_guard(self, rule_group: RuleGroup) -> Optional[Tuple[str, List[Any], bool]]:
+        """
+        Find a condition every match of the rule group must satisfy that can
+        be answered by an index lookup.
+        
+        Only equality/in conditions on ``INDEXED_FIELDS`` reached through AND
+        groups qualify; the one with the fewest values is chosen.
+        
+        Args:
+            rule_group: The rule's top-level condition group
+            
+        Returns:
+            Tuple of (field path, index keys, case sensitive), or None
+        """
+        if rule_group.logic != RuleLogic.AND:
+            return None
+        
+        best = None
+        
+        for condition in rule_group.conditions:
+            if isinstance(condition, RuleGroup):
+                guard = self._find_index_guard(condition)
+            elif (
+                isinstance(condition, RuleCondition)
+                and condition.field in self.INDEXED_FIELDS
+                and condition.operator in (RuleOperator.EQUALS, RuleOperator.IN)
+            ):
+                guard = self._index_keys(condition)
+            else:
+                guard = None
+            
+            if guard is not None and (best is None or len(guard[1]) < len(best[1])):
+                best = guard
+        
+        return best
+    
+    def _index_keys(self, condition: RuleCondition) -> Optional[Tuple[str, List[Any], bool]]:
+        """Index keys for an equality/in condition, or None if its values are not hashable."""
+        if condition.operator == RuleOperator.IN and isinstance(condition.value, list):
+            values = condition.value
+        else:
+            values = [condition.value]
+        
+        if not condition.case_sensitive:
+            values = [v.lower() if isinstance(v, str) else v for v in values]
+        
+        try:
+            keys = list(dict.fromkeys(values))
+        except TypeError:
+            return None
+        
+        return condition.field, keys, condition.case_sensitive
+    
+    def _get_candidate_positions(self, compiled_rules: CompiledTeamRules, context: Dict[str, Any]) -> List[int]:
+        """
+        Positions of rules that can match the event, in priority order.
+        
+        Args:
+            compiled_rules: Compiled team rules
+            context: Event context
+            
+        Returns:
+            Sorted positions of indexed rules whose guard matches, plus
+            rules without an indexable guard
+        """
+        if not compiled_rules.indexes:
+            return compiled_rules.unindexed
+        
+        candidates = list(compiled_rules.unindexed)
+        
+        for field_path, index in compiled_rules.indexes.items():
+            value = self._get_field_accessor(field_path)(context)
+            if value is None:
+                continue
+            
+            try:
+                candidates.extend(index.exact.get(value, ()))
+                if index.folded:
+                    folded_value = value.lower() if isinstance(value, str) else value
+                    candidates.extend(index.folded.get(folded_value, ()))
+            except TypeError:
+                # Unhashable values (lists, dicts) never equal an indexed key
+                continue
+        
+        return sorted(set(candidates))
+    
+    def _evaluation_order(
+        self,
+        compiled_rules: CompiledTeamRules,
+        position: int,
+        hook_type_filter: Optional[Set[str]]
+    ) -> int:
+        """Priority rank of a rule among rules applicable to the requested hook types."""
+        if not hook_type_filter:
+            return position
+        
+        return sum(
+            1 for compiled in compiled_rules.rules[:position]
+            if not hook_type_filter.isdisjoint(compiled.hook_types)
+        )
+    
+    def _record_candidates(self, candidate_count: int):
+        """Track how many rules were evaluated per event."""
+        self._indexed_evaluations += 1
+        self._candidate_rules_evaluated += candidate_count
+    
+    def _compile_rule_group(self, rule_group: RuleGroup) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile a rule group into a predicate over the event context.
+        
+        Args:
+            rule_group: The rule group to compile
+            
+        Returns:
+            Predicate returning True if the rule group matches
+        """
         if not rule_group.conditions:
-            return True  # Empty conditions always match
+            return lambda context: True  # Empty conditions always match
         
-        results = []
+        predicates = []
         
         for condition in rule_group.conditions:
             if isinstance(condition, RuleCondition):
-                result = await self._evaluate_condition(condition, event)
+                predicates.append(self._compile_condition(condition))
             elif isinstance(condition, RuleGroup):
-                result = await self._evaluate_rule_group(condition, event)
+                predicates.append(self._compile_rule_group(condition))
             else:
                 logger.warning(f"Unknown condition type: {type(condition)}")
-                result = False
-            
-            results.append(result)
+                predicates.append(lambda context: False)
         
         # Apply logic operator
         if rule_group.logic == RuleLogic.AND:
-            return all(results)
+            if len(predicates) == 1:
+                return predicates[0]
+            return lambda context: all(predicate(context) for predicate in predicates)
         elif rule_group.logic == RuleLogic.OR:
-            return any(results)
+            return lambda context: any(predicate(context) for predicate in predicates)
         elif rule_group.logic == RuleLogic.NOT:
             # NOT logic applies to the first condition only
-            return not results[0] if results else True
+            first = predicates[0]
+            return lambda context: not first(context)
         
-        return False
+        return lambda context: False
     
-    async def _evaluate_condition(self, condition: RuleCondition, event: EnrichedEvent) -> bool:
+    def _compile_condition(self, condition: RuleCondition) -> Callable[[Dict[str, Any]], bool]:
         """
-        Evaluate a single condition against an event.
+        Compile a single condition into a predicate over the event context.
         
         Args:
-            condition: The condition to evaluate
-            event: The event to evaluate against
+            condition: The condition to compile
             
         Returns:
-            True if the condition matches, False otherwise
+            Predicate returning True if the condition matches
         """
-        try:
-            # Extract field value from event
-            field_value = self._extract_field_value(condition.field, event)
-            
-            # Handle None values
+        extract = self._get_field_accessor(condition.field)
+        compare = self._compile_operator(condition.operator, condition.value, condition.case_sensitive)
+        operator = condition.operator
+        
+        # Missing values only satisfy negative operators
+        missing_result = operator in (RuleOperator.NOT_EQUALS, RuleOperator.NOT_IN, RuleOperator.NOT_CONTAINS)
+        
+        def evaluate(context: Dict[str, Any]) -> bool:
+            field_value = extract(context)
             if field_value is None:
-                return condition.operator in [RuleOperator.NOT_EQUALS, RuleOperator.NOT_IN, RuleOperator.NOT_CONTAINS]
+                return missing_result
             
-            # Apply operator
-            return self._apply_operator(condition.operator, field_value, condition.value, condition.case_sensitive)
+            try:
+                return compare(field_value)
+            except Exception as e:
+                logger.error(f"Error applying operator {operator}: {e}")
+                return False
+        
+        return evaluate
+    
+    def _compile_operator(
+        self,
+        operator: RuleOperator,
+        condition_value: Any,
+        case_sensitive: bool = True
+    ) -> Callable[[Any], bool]:
+        """
+        Compile an operator and condition value into a comparison function.
+        
+        Behaves like ``_apply_operator`` with the condition-side work (case
+        folding, list wrapping, regex compilation) done once.
+        
+        Args:
+            operator: The comparison operator
+            condition_value: Value from the condition
+            case_sensitive: Whether string comparisons should be case sensitive
             
-        except Exception as e:
-            logger.error(f"Error evaluating condition {condition.field}: {e}")
-            # Re-raise the exception to be caught at the rule level
-            raise
+        Returns:
+            Function taking the field value and returning the comparison result
+        """
+        # Case-insensitive comparisons fold string field values against a
+        # pre-lowered condition value
+        folded_value = None
+        if not case_sensitive:
+            if isinstance(condition_value, str):
+                folded_value = condition_value.lower()
+            elif isinstance(condition_value, list):
+                folded_value = [v.lower() if isinstance(v, str) else v for v in condition_value]
+        
+        if operator in (RuleOperator.IN, RuleOperator.NOT_IN):
+            def prepare(value):
+                return value if isinstance(value, list) else [value]
+        elif operator in (RuleOperator.CONTAINS, RuleOperator.NOT_CONTAINS,
+                          RuleOperator.STARTS_WITH, RuleOperator.ENDS_WITH):
+            def prepare(value):
+                return value, str(value)
+        elif operator == RuleOperator.REGEX:
+            def prepare(value):
+                try:
+                    return re.compile(str(value), re.IGNORECASE if not case_sensitive else 0)
+                except re.error as e:
+                    logger.error(f"Invalid regex in rule condition: {e}")
+                    return None
+        else:
+            def prepare(value):
+                return value
+        
+        plain = prepare(condition_value)
+        folded = prepare(folded_value) if folded_value is not None else None
+        compare = self._operator_function(operator)
+        
+        if folded is None:
+            return lambda field_value: compare(field_value, plain)
+        
+        def compare_folded(field_value: Any) -> bool:
+            if isinstance(field_value, str):
+                return compare(field_value.lower(), folded)
+            return compare(field_value, plain)
+        
+        return compare_folded
+    
+    def _operator_function(self, operator: RuleOperator) -> Callable[[Any, Any], bool]:
+        """Comparison function for an operator over (field value, prepared condition value)."""
+        if operator == RuleOperator.EQUALS:
+            return lambda field_value, value: field_value == value
+        
+        elif operator == RuleOperator.NOT_EQUALS:
+            return lambda field_value, value: field_value != value
+        
+        elif operator == RuleOperator.IN:
+            return lambda field_value, values: field_value in values
+        
+        elif operator == RuleOperator.NOT_IN:
+            return lambda field_value, values: field_value not in values
+        
+        elif operator == RuleOperator.CONTAINS:
+            def contains(field_value, value):
+                if isinstance(field_value, str):
+                    return value[1] in field_value
+                elif isinstance(field_value, list):
+                    return value[0] in field_value
+                return False
+            return contains
+        
+        elif operator == RuleOperator.NOT_CONTAINS:
+            def not_contains(field_value, value):
+                if isinstance(field_value, str):
+                    return value[1] not in field_value
+                elif isinstance(field_value, list):
+                    return value[0] not in field_value
+                return True
+            return not_contains
+        
+        elif operator == RuleOperator.STARTS_WITH:
+            return lambda field_value, value: isinstance(field_value, str) and field_value.startswith(value[1])
+        
+        elif operator == RuleOperator.ENDS_WITH:
+            return lambda field_value, value: isinstance(field_value, str) and field_value.endswith(value[1])
+        
+        elif operator == RuleOperator.REGEX:
+            return lambda field_value, pattern: (
+                pattern is not None and isinstance(field_value, str) and bool(pattern.search(field_value))
+            )
+        
+        elif operator == RuleOperator.GREATER_THAN:
+            return lambda field_value, value: self._numeric_compare(field_value, value, lambda a, b: a > b)
+        
+        elif operator == RuleOperator.LESS_THAN:
+            return lambda field_value, value: self._numeric_compare(field_value, value, lambda a, b: a < b)
+        
+        elif operator == RuleOperator.GREATER_EQUAL:
+            return lambda field_value, value: self._numeric_compare(field_value, value, lambda a, b: a >= b)
+        
+        elif operator == RuleOperator.LESS_EQUAL:
+            return lambda field_value, value: self._numeric_compare(field_value, value, lambda a, b: a <= b)
+        
+        return lambda field_value, value: False
+    
+    def _get_field_accessor(self, field_path: str) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Get a function reading a dot-notation field from the event context.
+        
+        The path is split once; accessors are shared by all conditions on the
+        same field.
+        
+        Args:
+            field_path: Dot-separated field path (e.g., 'ticket.status.name')
+            
+        Returns:
+            Function returning the field value or None if not found
+        """
+        accessor = self._field_accessors.get(field_path)
+        if accessor is not None:
+            return accessor
+        
+        parts = tuple((part, int(part) if part.isdigit() else None) for part in field_path.split('.'))
+        
+        def accessor(context: Dict[str, Any]) -> Any:
+            try:
+                current_value = context
+                for part, index in parts:
+                    if isinstance(current_value, dict):
+                        current_value = current_value.get(part)
+                    elif isinstance(current_value, list) and index is not None:
+                        current_value = current_value[index] if index < len(current_value) else None
+                    else:
+                        return None
+                    
+                    if current_value is None:
+                        break
+                
+                return current_value
+                
+            except Exception as e:
+                logger.error(f"Error extracting field {field_path}: {e}")
+                return None
+        
+        self._field_accessors[field_path] = accessor
+        return accessor
+    
+    def _build_event_context(self, event: EnrichedEvent) -> Dict[str, Any]:
+        """
+        Build the context object rule field paths are resolved against.
+        
+        Args:
+            event: The event to build the context for
+            
+        Returns:
+            Nested dictionary of event, ticket, stakeholder and routing data
+        """
+        classification = event.classification
+        
+        return {
+            'event': {
+                'event_id': event.event_id,
+                'event_type': event.event_type,
+                'timestamp': event.timestamp,
+                'ticket_key': event.ticket_key,
+                'project_key': event.project_key,
+                'classification': {
+                    'category': classification.category.value if classification else None,
+                    'urgency': classification.urgency.value if classification else None,
+                    'significance': classification.significance.value if classification else None,
+                    'keywords': classification.keywords if classification else [],
+                    'affected_teams': classification.affected_teams if classification else []
+                }
+            },
+            'ticket': event.ticket_details or {},
+            'stakeholders': {
+                'roles': [s.role for s in event.stakeholders],
+                'user_ids': [s.user_id for s in event.stakeholders],
+                'display_names': [s.display_name for s in event.stakeholders]
+            },
+            'context': event.context_data,
+            'routing_hints': classification.routing_hints if classification else {}
+        }
     
     def _extract_field_value(self, field_path: str, event: EnrichedEvent) -> Any:
         """
@@ -492,51 +932,12 @@ class HookRuleEngine:
             The extracted field value or None if not found
         """
         try:
-            # Build context object for field extraction
-            context = {
-                'event': {
-                    'event_id': event.event_id,
-                    'event_type': event.event_type,
-                    'timestamp': event.timestamp,
-                    'ticket_key': event.ticket_key,
-                    'project_key': event.project_key,
-                    'classification': {
-                        'category': event.classification.category.value if event.classification else None,
-                        'urgency': event.classification.urgency.value if event.classification else None,
-                        'significance': event.classification.significance.value if event.classification else None,
-                        'keywords': event.classification.keywords if event.classification else [],
-                        'affected_teams': event.classification.affected_teams if event.classification else []
-                    }
-                },
-                'ticket': event.ticket_details or {},
-                'stakeholders': {
-                    'roles': [s.role for s in event.stakeholders],
-                    'user_ids': [s.user_id for s in event.stakeholders],
-                    'display_names': [s.display_name for s in event.stakeholders]
-                },
-                'context': event.context_data,
-                'routing_hints': event.classification.routing_hints if event.classification else {}
-            }
-            
-            # Navigate through the field path
-            current_value = context
-            for part in field_path.split('.'):
-                if isinstance(current_value, dict):
-                    current_value = current_value.get(part)
-                elif isinstance(current_value, list) and part.isdigit():
-                    index = int(part)
-                    current_value = current_value[index] if 0 <= index < len(current_value) else None
-                else:
-                    return None
-                
-                if current_value is None:
-                    break
-            
-            return current_value
-            
+            context = self._build_event_context(event)
         except Exception as e:
             logger.error(f"Error extracting field {field_path}: {e}")
             return None
+        
+        return self._get_field_accessor(field_path)(context)
     
     def _apply_operator(
         self, 
@@ -957,9 +1358,11 @@ class HookRuleEngine:
         if team_id:
             self._team_rules_cache.pop(team_id, None)
             self._cache_timestamps.pop(team_id, None)
+            self._compiled_rules.pop(team_id, None)
         else:
             self._team_rules_cache.clear()
             self._cache_timestamps.clear()
+            self._compiled_rules.clear()
         
         logger.debug(f"Cleared rule cache for team: {team_id or 'all'}")
     
@@ -971,7 +1374,8 @@ class HookRuleEngine:
             'cache_misses': self._cache_misses,
             'cache_hit_rate': self._cache_hits / max(self._cache_hits + self._cache_misses, 1),
             'validation_errors': self._validation_errors,
-            'cached_teams': len(self._team_rules_cache)
+            'cached_teams': len(self._team_rules_cache),
+            'candidates_per_event': self._candidate_rules_evaluated / max(self._indexed_evaluations, 1)
         }
     
     def reset_metrics(self):
@@ -979,4 +1383,6 @@ class HookRuleEngine:
         self._evaluations_count = 0
         self._cache_hits = 0
         self._cache_misses = 0
-        self._validation_errors = 0
\ No newline at end of file
+        self._validation_errors = 0
+        self._indexed_evaluations = 0
+        self._candidate_rules_evaluated = 0
\ No newline at end of file
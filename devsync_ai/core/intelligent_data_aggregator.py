@@ -10,15 +10,16 @@ resolution, quality scoring, and intelligent caching strategies.
 import asyncio
 import logging
 import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
+from typing import Any, Deque, Dict, Hashable, List, Optional, Set, Tuple, Union, Callable
 from concurrent.futures import ThreadPoolExecutor
-import hashlib
-import json
 from abc import ABC, abstractmethod
 
+from .local_cache import EvictionPolicy, LocalCache, estimate_size
+
 # Optional imports for services - will be imported only when needed
 try:
     from ..services.github import GitHubService
@@ -81,6 +82,10 @@ class DataCollectionConfig:
     parallel_workers: int = 4
     cache_ttl_seconds: int = 1800  # 30 minutes
     enable_cache_warming: bool = True
+    cache_max_entries: int = 1000
+    cache_max_bytes: int = 32 * 1024 * 1024
+    cache_stale_while_revalidate_seconds: int = 300
+    cache_expiry_interval_seconds: float = 60.0
 
 
 @dataclass
@@ -152,114 +157,276 @@ class DataQualityError(DataCollectionError):
     pass
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convert request parameters into a hashable, order-independent key part."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class AccessHistory:
+    """Fixed-size ring buffer of inter-arrival times for one cache key."""
+    
+    __slots__ = ('intervals', 'last_access', 'count')
+    
+    def __init__(self, size: int = 16):
+        self.intervals: Deque[float] = deque(maxlen=size)
+        self.last_access: Optional[float] = None
+        self.count = 0
+    
+    def record(self, timestamp: float) -> None:
+        """Record an access at ``timestamp`` (seconds, monotonic)."""
+        if self.last_access is not None:
+            self.intervals.append(timestamp - self.last_access)
+        self.last_access = timestamp
+        self.count += 1
+    
+    @property
+    def average_interval(self) -> Optional[float]:
+        """Mean of the retained inter-arrival times, None before two accesses."""
+        if not self.intervals:
+            return None
+        return sum(self.intervals) / len(self.intervals)
+
+
 class CacheManager:
-    """Intelligent caching with TTL optimization and cache warming."""
+    """
+    Intelligent caching with TTL optimization and cache warming.
     
-    def __init__(self):
-        self._cache: Dict[str, Tuple[Any, datetime, int]] = {}
-        self._access_patterns: Dict[str, List[datetime]] = {}
-        self._warming_tasks: Set[str] = set()
+    Entries live in a bounded LocalCache (entry count and byte budget, LRU
+    eviction, timer-wheel expiry). Access history is a fixed-size ring
+    buffer per key, itself kept for a bounded number of keys, so memory does
+    not grow with traffic. With ``stale_while_revalidate`` set, expired
+    entries are kept that much longer and ``get_or_load`` serves them while
+    ``warm_cache`` refreshes them in the background.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = 32 * 1024 * 1024,
+        access_history_size: int = 16,
+        max_tracked_keys: Optional[int] = None,
+        stale_while_revalidate: int = 0,
+        expiry_resolution: float = 0.1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Memory budget in (estimated) bytes, None for no budget
+            access_history_size: Inter-arrival times kept per key
+            max_tracked_keys: Keys with access history (defaults to 2x max_entries)
+            stale_while_revalidate: Seconds an expired entry may still be served
+                by ``get_or_load`` while it is refreshed
+            expiry_resolution: Granularity of TTL expiry in seconds
+            clock: Monotonic clock (injectable for tests)
+        """
+        self._clock = clock
+        self.stale_while_revalidate = stale_while_revalidate
+        self.access_history_size = access_history_size
+        self.max_tracked_keys = max_tracked_keys or max_entries * 2
+        # Values are (data, fresh_until) tuples
+        self._cache = LocalCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            policy=EvictionPolicy.LRU,
+            sizeof=lambda entry: estimate_size(entry[0]),
+            timer_tick=expiry_resolution,
+            clock=clock
+        )
+        self._access_patterns: "OrderedDict[Hashable, AccessHistory]" = OrderedDict()
+        self._warming_tasks: Set[Hashable] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._expiry_task: Optional[asyncio.Task] = None
+    
+    def __len__(self) -> int:
+        return len(self._cache)
     
     def _generate_cache_key(self, source_type: DataSourceType, identifier: str, 
-                          params: Dict[str, Any]) -> str:
-        """Generate a unique cache key for the data request."""
-        key_data = {
-            'source_type': source_type.value,
-            'identifier': identifier,
-            'params': sorted(params.items()) if params else []
-        }
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+                          params: Dict[str, Any]) -> Hashable:
+        """Generate a unique, hashable cache key for the data request."""
+        return (source_type.value, identifier, _freeze(params) if params else ())
+    
+    def _record_access(self, cache_key: Hashable, timestamp: float) -> None:
+        """Add an access to the key's ring buffer, dropping the least recent key when full."""
+        history = self._access_patterns.get(cache_key)
+        if history is None:
+            history = self._access_patterns[cache_key] = AccessHistory(self.access_history_size)
+            if len(self._access_patterns) > self.max_tracked_keys:
+                self._access_patterns.popitem(last=False)
+        else:
+            self._access_patterns.move_to_end(cache_key)
+        history.record(timestamp)
     
     def get(self, source_type: DataSourceType, identifier: str, 
             params: Dict[str, Any] = None) -> Optional[Any]:
         """Retrieve data from cache if available and not expired."""
-        cache_key = self._generate_cache_key(source_type, identifier, params or {})
-        
-        if cache_key in self._cache:
-            data, timestamp, ttl = self._cache[cache_key]
-            if datetime.utcnow() - timestamp < timedelta(seconds=ttl):
-                # Track access pattern for optimization
-                if cache_key not in self._access_patterns:
-                    self._access_patterns[cache_key] = []
-                self._access_patterns[cache_key].append(datetime.utcnow())
-                
-                logger.debug(f"Cache hit for {source_type.value}:{identifier}")
-                return data
-            else:
-                # Expired, remove from cache
-                del self._cache[cache_key]
-                logger.debug(f"Cache expired for {source_type.value}:{identifier}")
+        cache_key = self._generate_cache_key(source_type, identifier, params)
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        data, fresh_until = entry
+        now = self._clock()
+        if now >= fresh_until:
+            # Stale copies are only served through get_or_load
+            logger.debug(f"Cache expired for {source_type.value}:{identifier}")
+            return None
         
-        return None
+        # Track access pattern for optimization
+        self._record_access(cache_key, now)
+        return data
     
     def set(self, source_type: DataSourceType, identifier: str, data: Any,
             ttl: int, params: Dict[str, Any] = None) -> None:
         """Store data in cache with TTL."""
-        cache_key = self._generate_cache_key(source_type, identifier, params or {})
-        self._cache[cache_key] = (data, datetime.utcnow(), ttl)
+        cache_key = self._generate_cache_key(source_type, identifier, params)
+        fresh_until = self._clock() + ttl
+        if not self._cache.put(cache_key, (data, fresh_until), ttl=ttl + self.stale_while_revalidate):
+            logger.debug(f"Data for {source_type.value}:{identifier} exceeds the cache byte budget")
+            return
         logger.debug(f"Cached data for {source_type.value}:{identifier} (TTL: {ttl}s)")
     
     def optimize_ttl(self, source_type: DataSourceType, identifier: str,
                      params: Dict[str, Any] = None) -> int:
         """Optimize TTL based on access patterns."""
-        cache_key = self._generate_cache_key(source_type, identifier, params or {})
+        cache_key = self._generate_cache_key(source_type, identifier, params)
         
-        if cache_key not in self._access_patterns:
+        history = self._access_patterns.get(cache_key)
+        avg_interval = history.average_interval if history else None
+        if avg_interval is None:
             return 1800  # Default 30 minutes
         
-        accesses = self._access_patterns[cache_key]
-        if len(accesses) < 2:
-            return 1800
-        
-        # Calculate average access interval
-        intervals = []
-        for i in range(1, len(accesses)):
-            interval = (accesses[i] - accesses[i-1]).total_seconds()
-            intervals.append(interval)
-        
-        avg_interval = sum(intervals) / len(intervals)
-        
         # Set TTL to 50% of average access interval, with bounds
         optimized_ttl = max(300, min(3600, int(avg_interval * 0.5)))
         
         logger.debug(f"Optimized TTL for {cache_key}: {optimized_ttl}s")
         return optimized_ttl
     
+    async def get_or_load(self, source_type: DataSourceType, identifier: str,
+                          data_collector: Callable, params: Dict[str, Any] = None) -> Any:
+        """
+        Return cached data, loading it with ``data_collector`` on a miss.
+        
+        A stale entry (expired but inside the stale-while-revalidate window)
+        is returned immediately while ``warm_cache`` refreshes it in the
+        background. Concurrent misses for the same key share one load.
+        """
+        cache_key = self._generate_cache_key(source_type, identifier, params)
+        entry = self._cache.get(cache_key)
+        
+        if entry is not None:
+            data, fresh_until = entry
+            now = self._clock()
+            self._record_access(cache_key, now)
+            if now >= fresh_until:
+                logger.debug(f"Serving stale data for {source_type.value}:{identifier}")
+                self._schedule_refresh(cache_key, source_type, identifier, data_collector, params)
+            return data
+        
+        async def load():
+            data = await data_collector()
+            ttl = self.optimize_ttl(source_type, identifier, params)
+            self.set(source_type, identifier, data, ttl, params)
+            return data
+        
+        data, _ = await self._cache.single_flight(cache_key, load)
+        return data
+    
+    def _schedule_refresh(self, cache_key: Hashable, source_type: DataSourceType, identifier: str,
+                          data_collector: Callable, params: Optional[Dict[str, Any]]) -> None:
+        if cache_key in self._warming_tasks:
+            return  # Already refreshing
+        
+        self._warming_tasks.add(cache_key)
+        task = asyncio.create_task(
+            self._refresh(cache_key, source_type, identifier, data_collector, params)
+        )
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
     async def warm_cache(self, source_type: DataSourceType, identifier: str,
                         data_collector: Callable, params: Dict[str, Any] = None) -> None:
         """Proactively warm cache for frequently accessed data."""
-        cache_key = self._generate_cache_key(source_type, identifier, params or {})
+        cache_key = self._generate_cache_key(source_type, identifier, params)
         
         if cache_key in self._warming_tasks:
             return  # Already warming
         
         self._warming_tasks.add(cache_key)
-        
+        await self._refresh(cache_key, source_type, identifier, data_collector, params)
+    
+    async def _refresh(self, cache_key: Hashable, source_type: DataSourceType, identifier: str,
+                       data_collector: Callable, params: Optional[Dict[str, Any]]) -> None:
         try:
             logger.debug(f"Warming cache for {source_type.value}:{identifier}")
             data = await data_collector()
             ttl = self.optimize_ttl(source_type, identifier, params)
             self.set(source_type, identifier, data, ttl, params)
         except Exception as e:
-            logger.warning(f"Cache warming failed for {cache_key}: {e}")
+            logger.warning(f"Cache warming failed for {source_type.value}:{identifier}: {e}")
         finally:
             self._warming_tasks.discard(cache_key)
     
     def clear_expired(self) -> int:
-        """Clear expired cache entries and return count of cleared items."""
-        now = datetime.utcnow()
-        expired_keys = []
-        
-        for key, (data, timestamp, ttl) in self._cache.items():
-            if now - timestamp >= timedelta(seconds=ttl):
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
+        """
+        Clear expired cache entries and return count of cleared items.
         
-        logger.debug(f"Cleared {len(expired_keys)} expired cache entries")
-        return len(expired_keys)
+        Entries still inside their stale-while-revalidate window are kept.
+        """
+        cleared = self._cache.purge_expired()
+        logger.debug(f"Cleared {cleared} expired cache entries")
+        return cleared
+    
+    def start_background_expiry(self, interval: float = 60.0) -> None:
+        """Start a task clearing expired entries every ``interval`` seconds."""
+        if self._expiry_task and not self._expiry_task.done():
+            return
+        self._expiry_task = asyncio.create_task(self._expiry_loop(interval))
+    
+    async def stop_background_expiry(self) -> None:
+        """Stop the background expiry task and pending refreshes."""
+        tasks = list(self._refresh_tasks)
+        if self._expiry_task:
+            tasks.append(self._expiry_task)
+            self._expiry_task = None
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _expiry_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.clear_expired()
+            except Exception as e:
+                logger.error(f"Background cache expiry failed: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, hit ratio and eviction counters."""
+        stats = self._cache.get_stats()
+        return {
+            'total_entries': stats['entries'],
+            'size_bytes': stats['size_bytes'],
+            'max_bytes': stats['max_bytes'],
+            'hit_ratio': stats['hit_ratio'],
+            'evictions': stats['evictions'],
+            'expirations': stats['expirations'],
+            'tracked_keys': len(self._access_patterns),
+            'refreshing': len(self._warming_tasks)
+        }
 
 
 class DataValidator:
@@ -621,7 +788,11 @@ class IntelligentDataAggregator:
     
     def __init__(self, config: DataCollectionConfig = None):
         self.config = config or DataCollectionConfig()
-        self.cache_manager = CacheManager()
+        self.cache_manager = CacheManager(
+            max_entries=self.config.cache_max_entries,
+            max_bytes=self.config.cache_max_bytes,
+            stale_while_revalidate=self.config.cache_stale_while_revalidate_seconds
+        )
         self.data_sources: Dict[str, DataSource] = {}
         self.executor = ThreadPoolExecutor(max_workers=self.config.parallel_workers)
         
@@ -763,16 +934,21 @@ class IntelligentDataAggregator:
         
         raise last_exception
     
-    async def _collect_github_data(self, data_source: DataSource, 
-                                 team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
+    async def _collect_github_data(self, data_source: DataSource,
+                                   team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
         """Collect GitHub data for the specified team and date range."""
-        github_service = data_source.service_instance
-        
-        # Check cache first
         cache_params = {'team_id': team_id, 'date_range': date_range}
-        cached_data = self.cache_manager.get(DataSourceType.GITHUB, data_source.identifier, cache_params)
-        if cached_data:
-            return cached_data
+        return await self.cache_manager.get_or_load(
+            DataSourceType.GITHUB,
+            data_source.identifier,
+            lambda: self._fetch_github_data(data_source, team_id, date_range),
+            cache_params
+        )
+    
+    async def _fetch_github_data(self, data_source: DataSource,
+                                 team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
+        """Fetch GitHub data for the specified team and date range from the source, bypassing the cache."""
+        github_service = data_source.service_instance
         
         # Collect fresh data
         start_date, end_date = date_range
@@ -791,22 +967,23 @@ class IntelligentDataAggregator:
             }
         }
         
-        # Cache the result
-        ttl = self.cache_manager.optimize_ttl(DataSourceType.GITHUB, data_source.identifier, cache_params)
-        self.cache_manager.set(DataSourceType.GITHUB, data_source.identifier, data, ttl, cache_params)
-        
         return data
     
     async def _collect_jira_data(self, data_source: DataSource,
-                               team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
+                                 team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
         """Collect JIRA data for the specified team and date range."""
-        jira_service = data_source.service_instance
-        
-        # Check cache first
         cache_params = {'team_id': team_id, 'date_range': date_range}
-        cached_data = self.cache_manager.get(DataSourceType.JIRA, data_source.identifier, cache_params)
-        if cached_data:
-            return cached_data
+        return await self.cache_manager.get_or_load(
+            DataSourceType.JIRA,
+            data_source.identifier,
+            lambda: self._fetch_jira_data(data_source, team_id, date_range),
+            cache_params
+        )
+    
+    async def _fetch_jira_data(self, data_source: DataSource,
+                               team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
+        """Fetch JIRA data for the specified team and date range from the source, bypassing the cache."""
+        jira_service = data_source.service_instance
         
         # Collect fresh data
         start_date, end_date = date_range
@@ -823,22 +1000,23 @@ class IntelligentDataAggregator:
             }
         }
         
-        # Cache the result
-        ttl = self.cache_manager.optimize_ttl(DataSourceType.JIRA, data_source.identifier, cache_params)
-        self.cache_manager.set(DataSourceType.JIRA, data_source.identifier, data, ttl, cache_params)
-        
         return data
     
     async def _collect_team_metrics(self, data_source: DataSource,
-                                  team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
+                                    team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
         """Collect team productivity metrics."""
-        team_analyzer = data_source.service_instance
-        
-        # Check cache first
         cache_params = {'team_id': team_id, 'date_range': date_range}
-        cached_data = self.cache_manager.get(DataSourceType.TEAM_METRICS, data_source.identifier, cache_params)
-        if cached_data:
-            return cached_data
+        return await self.cache_manager.get_or_load(
+            DataSourceType.TEAM_METRICS,
+            data_source.identifier,
+            lambda: self._fetch_team_metrics(data_source, team_id, date_range),
+            cache_params
+        )
+    
+    async def _fetch_team_metrics(self, data_source: DataSource,
+                                  team_id: str, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
+        """Fetch team productivity metrics from the source, bypassing the cache."""
+        team_analyzer = data_source.service_instance
         
         # Collect fresh data
         start_date, end_date = date_range
@@ -855,10 +1033,6 @@ class IntelligentDataAggregator:
             }
         }
         
-        # Cache the result
-        ttl = self.cache_manager.optimize_ttl(DataSourceType.TEAM_METRICS, data_source.identifier, cache_params)
-        self.cache_manager.set(DataSourceType.TEAM_METRICS, data_source.identifier, data, ttl, cache_params)
-        
         return data
     
     async def _collect_single_source(self, source_key: str, team_id: str,
@@ -1014,6 +1188,9 @@ class IntelligentDataAggregator:
         start_time = time.time()
         
         try:
+            if self.config.cache_expiry_interval_seconds > 0:
+                self.cache_manager.start_background_expiry(self.config.cache_expiry_interval_seconds)
+            
             # Warm cache for frequently accessed data
             if self.config.enable_cache_warming:
                 await self._warm_cache_for_team(team_id, date_range)
@@ -1147,15 +1324,17 @@ class IntelligentDataAggregator:
         for source_key, data_source in self.data_sources.items():
             cache_params = {'team_id': team_id, 'date_range': date_range}
             
-            # Create data collector function
+            # Warming fetches from the source; the cached collectors would hand
+            # back the cached (possibly stale) copy
             if data_source.source_type == DataSourceType.GITHUB:
-                collector = lambda: self._collect_github_data(data_source, team_id, date_range)
+                fetch = self._fetch_github_data
             elif data_source.source_type == DataSourceType.JIRA:
-                collector = lambda: self._collect_jira_data(data_source, team_id, date_range)
+                fetch = self._fetch_jira_data
             elif data_source.source_type == DataSourceType.TEAM_METRICS:
-                collector = lambda: self._collect_team_metrics(data_source, team_id, date_range)
+                fetch = self._fetch_team_metrics
             else:
                 continue
+            collector = lambda fetch=fetch, data_source=data_source: fetch(data_source, team_id, date_range)
             
             # Create warming task
             task = asyncio.create_task(
@@ -1178,8 +1357,8 @@ class IntelligentDataAggregator:
             'aggregator_status': 'healthy',
             'data_sources': {},
             'cache_stats': {
-                'total_entries': len(self.cache_manager._cache),
-                'expired_entries_cleared': self.cache_manager.clear_expired()
+                'expired_entries_cleared': self.cache_manager.clear_expired(),
+                **self.cache_manager.get_stats()
             },
             'timestamp': datetime.utcnow().isoformat()
         }
@@ -1209,7 +1388,8 @@ class IntelligentDataAggregator:
         """Cleanup resources and connections."""
         logger.info("Cleaning up IntelligentDataAggregator")
         
-        # Clear expired cache entries
+        # Stop background expiry and clear expired cache entries
+        await self.cache_manager.stop_background_expiry()
         self.cache_manager.clear_expired()
         
         # Shutdown thread pool executor
@@ -0,0 +1,261 @@
+"""
+Keyed lane executor: ordered per key, concurrent across keys.
+
+Work items are hashed by key onto a fixed number of lanes. Each lane is a
+bounded FIFO queue drained by one worker task, so items with the same key run
+one at a time in submission order while different keys proceed in parallel.
+A full lane makes ``submit`` wait, and give up with LaneFullError after
+``enqueue_timeout`` so callers can push back on their own producers.
+"""
+
+import asyncio
+import logging
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds of completions kept for the per-lane throughput figure
+THROUGHPUT_WINDOW_SECONDS = 60
+
+
+class LaneFullError(Exception):
+    """Raised when a lane stays full for longer than the enqueue timeout."""
+
+    def __init__(self, lane: int, depth: int):
+        super().__init__(f"Lane {lane} is full ({depth} queued)")
+        self.lane = lane
+        self.depth = depth
+
+
+class LaneExecutorStoppedError(Exception):
+    """Raised when work is submitted to an executor that has been stopped."""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} lanes are stopped")
+
+
+@dataclass
+class _Lane:
+    """Queue, worker and counters of one lane."""
+    index: int
+    # (enqueued_at, key, work, future), oldest first
+    items: Deque[Tuple[float, str, Callable[[], Awaitable[Any]], asyncio.Future]] = field(default_factory=deque)
+    has_items: asyncio.Event = field(default_factory=asyncio.Event)
+    # Submitters waiting for space, woken in arrival order
+    waiters: Deque[asyncio.Future] = field(default_factory=deque)
+    # Slots handed to woken waiters that have not enqueued yet
+    reserved: int = 0
+    active: bool = False
+    # [second, completions] buckets for throughput
+    completions: Deque[List[float]] = field(default_factory=lambda: deque(maxlen=THROUGHPUT_WINDOW_SECONDS))
+    worker: Optional[asyncio.Task] = None
+    processed: int = 0
+    failed: int = 0
+    rejected: int = 0
+
+
+class LaneExecutor:
+    """Runs coroutines on key-hashed lanes with bounded queues."""
+
+    def __init__(
+        self,
+        lanes: int = 8,
+        max_queue_per_lane: int = 100,
+        enqueue_timeout: Optional[float] = 1.0,
+        name: str = "lanes"
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            lanes: Number of lanes (maximum concurrency)
+            max_queue_per_lane: Items a lane holds before submit waits
+            enqueue_timeout: Seconds submit waits on a full lane; None waits indefinitely
+            name: Name used in logs
+        """
+        self.max_queue_per_lane = max_queue_per_lane
+        self.enqueue_timeout = enqueue_timeout
+        self.name = name
+        self._lane_count = lanes
+        self._lanes: List[_Lane] = []
+        self._running = False
+        self._stopped = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self):
+        """Start one worker per lane (requires a running event loop)."""
+        if self._running:
+            return
+        self._stopped = False
+        self._lanes = [_Lane(index=i) for i in range(self._lane_count)]
+        for lane in self._lanes:
+            lane.worker = asyncio.create_task(self._run_lane(lane))
+        self._running = True
+        logger.info(f"Started {self._lane_count} {self.name} lanes")
+
+    async def stop(self, drain_timeout: Optional[float] = 10.0):
+        """
+        Stop the workers, first letting queued items finish for up to
+        ``drain_timeout`` seconds. Items still queued after that are cancelled.
+        Later submits are rejected until ``start`` is called again.
+        """
+        self._stopped = True
+        if not self._running:
+            return
+        self._running = False
+
+        deadline = time.monotonic() + (drain_timeout or 0)
+        while any(lane.items or lane.active for lane in self._lanes) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        if any(lane.items or lane.active for lane in self._lanes):
+            logger.warning(f"{self.name} lanes did not drain within {drain_timeout}s")
+
+        for lane in self._lanes:
+            lane.worker.cancel()
+        await asyncio.gather(*(lane.worker for lane in self._lanes), return_exceptions=True)
+
+        for lane in self._lanes:
+            for _, _, _, future in lane.items:
+                future.cancel()
+            lane.items.clear()
+            for waiter in lane.waiters:
+                waiter.cancel()
+        logger.info(f"Stopped {self.name} lanes")
+
+    def lane_for(self, key: str) -> int:
+        """Lane index for a key; stable across processes."""
+        return zlib.crc32(key.encode()) % self._lane_count
+
+    async def submit(self, key: str, work: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """
+        Queue ``work`` on the lane for ``key``.
+
+        Returns once the item is queued; the returned future resolves with the
+        result of ``work()``. Submitters waiting on a full lane are served in
+        arrival order, so items for a key are never reordered.
+
+        Raises:
+            LaneFullError: The lane stayed full for ``enqueue_timeout`` seconds
+            LaneExecutorStoppedError: The executor was stopped
+        """
+        if self._stopped:
+            raise LaneExecutorStoppedError(self.name)
+        if not self._running:
+            self.start()
+
+        lane = self._lanes[self.lane_for(key)]
+        if lane.waiters or len(lane.items) + lane.reserved >= self.max_queue_per_lane:
+            await self._wait_for_space(lane)
+
+        future = asyncio.get_running_loop().create_future()
+        lane.items.append((time.monotonic(), key, work, future))
+        lane.has_items.set()
+        return future
+
+    async def _wait_for_space(self, lane: _Lane):
+        waiter = asyncio.get_running_loop().create_future()
+        lane.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.enqueue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # Woken as we gave up: hand the slot on
+                lane.reserved -= 1
+                self._wake_waiter(lane)
+            elif waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            lane.rejected += 1
+            raise LaneFullError(lane.index, len(lane.items))
+        lane.reserved -= 1
+
+    def _wake_waiter(self, lane: _Lane):
+        while lane.waiters:
+            waiter = lane.waiters.popleft()
+            if not waiter.done():
+                lane.reserved += 1
+                waiter.set_result(None)
+                return
+
+    async def run(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """Queue ``work`` on the lane for ``key`` and wait for its result."""
+        return await (await self.submit(key, work))
+
+    async def _run_lane(self, lane: _Lane):
+        while True:
+            while not lane.items:
+                lane.has_items.clear()
+                await lane.has_items.wait()
+
+            _, key, work, future = lane.items.popleft()
+            self._wake_waiter(lane)
+            if future.cancelled():
+                continue
+
+            lane.active = True
+            try:
+                result = await work()
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                lane.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+                    # Nobody may be waiting on the future; don't warn about it
+                    future.add_done_callback(_consume_exception)
+                logger.error(f"{self.name} lane {lane.index} item for {key} failed: {e}")
+            else:
+                lane.processed += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                lane.active = False
+            self._record_completion(lane)
+
+    @staticmethod
+    def _record_completion(lane: _Lane):
+        second = int(time.monotonic())
+        if lane.completions and lane.completions[-1][0] == second:
+            lane.completions[-1][1] += 1
+        else:
+            lane.completions.append([second, 1])
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Depth, age of the oldest queued item and throughput per lane."""
+        now = time.monotonic()
+        lanes = []
+        for lane in self._lanes:
+            recent = sum(count for second, count in lane.completions if second > now - THROUGHPUT_WINDOW_SECONDS)
+            lanes.append({
+                "lane": lane.index,
+                "depth": len(lane.items),
+                "oldest_age_seconds": round(now - lane.items[0][0], 3) if lane.items else 0.0,
+                "active": lane.active,
+                "processed": lane.processed,
+                "failed": lane.failed,
+                "rejected": lane.rejected,
+                "throughput_per_second": round(recent / THROUGHPUT_WINDOW_SECONDS, 3)
+            })
+
+        return {
+            "running": self._running,
+            "lanes": self._lane_count,
+            "max_queue_per_lane": self.max_queue_per_lane,
+            "total_depth": sum(lane["depth"] for lane in lanes),
+            "max_oldest_age_seconds": max((lane["oldest_age_seconds"] for lane in lanes), default=0.0),
+            "per_lane": lanes
+        }
+
+
+def _consume_exception(future: asyncio.Future):
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,504 @@
+"""
+In-process cache with O(1) operations, pluggable eviction and byte budgets.
+
+Entries are bounded both by count and by an estimated size in bytes.
+Eviction is delegated to a policy (LRU, LFU or TinyLFU admission in front
+of LRU); every policy keeps its bookkeeping in hash maps and linked
+ordered dicts, so get/put/evict never sort or scan the cache. TTLs are
+tracked in a hashed timer wheel that is advanced on access, and
+``single_flight`` collapses concurrent loads of the same key into one call.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class EvictionPolicy(Enum):
+    """Eviction policies supported by LocalCache."""
+    LRU = "lru"
+    LFU = "lfu"
+    TINY_LFU = "tiny_lfu"
+
+
+@dataclass
+class LocalCacheStats:
+    """Counters for a LocalCache instance."""
+    hits: int = 0
+    misses: int = 0
+    puts: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0
+    coalesced_loads: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _LRUPolicy:
+    """Least recently used: one ordered dict, oldest first."""
+
+    def __init__(self):
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def record_access(self, key: Hashable):
+        self._order.move_to_end(key)
+
+    def record_miss(self, key: Hashable):
+        pass
+
+    def insert(self, key: Hashable):
+        self._order[key] = None
+
+    def remove(self, key: Hashable):
+        self._order.pop(key, None)
+
+    def victim(self, exclude: Optional[Hashable] = None) -> Optional[Hashable]:
+        for key in self._order:
+            if key != exclude:
+                return key
+        return None
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        return True
+
+    def clear(self):
+        self._order.clear()
+
+
+class _LFUPolicy:
+    """Least frequently used with O(1) frequency buckets (oldest first within a bucket)."""
+
+    def __init__(self):
+        self._frequencies: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_frequency = 0
+
+    def _unlink(self, key: Hashable, frequency: int):
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+
+    def record_access(self, key: Hashable):
+        frequency = self._frequencies[key]
+        self._unlink(key, frequency)
+        if self._min_frequency == frequency and frequency not in self._buckets:
+            self._min_frequency = frequency + 1
+        self._frequencies[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def record_miss(self, key: Hashable):
+        pass
+
+    def insert(self, key: Hashable):
+        self._frequencies[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_frequency = 1
+
+    def remove(self, key: Hashable):
+        frequency = self._frequencies.pop(key, None)
+        if frequency is not None:
+            self._unlink(key, frequency)
+
+    def victim(self, exclude: Optional[Hashable] = None) -> Optional[Hashable]:
+        if not self._buckets:
+            return None
+        if self._min_frequency not in self._buckets:
+            # Only reached after removals emptied the lowest bucket
+            self._min_frequency = min(self._buckets)
+
+        for key in self._buckets[self._min_frequency]:
+            if key != exclude:
+                return key
+
+        # The excluded key is alone in the lowest bucket
+        higher = [frequency for frequency in self._buckets if frequency != self._min_frequency]
+        return next(iter(self._buckets[min(higher)])) if higher else None
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        return True
+
+    def clear(self):
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+class _FrequencySketch:
+    """Count-min sketch of access frequencies with periodic halving (aging)."""
+
+    DEPTH = 4
+    MAX_COUNT = 15
+    # Per-row seeds; row indexes come from the high bits of a multiplicative
+    # hash so keys whose hash() shares low bits still spread across rows
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    MASK_64 = (1 << 64) - 1
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(capacity, 16) * 2:
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [[0] * width for _ in range(self.DEPTH)]
+        self._additions = 0
+        self._sample_size = max(capacity, 16) * 10
+
+    def _indexes(self, key: Hashable) -> Iterator[Tuple[List[int], int]]:
+        key_hash = hash(key) & self.MASK_64
+        for seed, row in zip(self.SEEDS, self._rows):
+            mixed = ((key_hash ^ seed) * 0x9E3779B97F4A7C15) & self.MASK_64
+            yield row, (mixed >> 32) & self._mask
+
+    def increment(self, key: Hashable):
+        for row, index in self._indexes(key):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def estimate(self, key: Hashable) -> int:
+        return min(row[index] for row, index in self._indexes(key))
+
+    def _reset(self):
+        for row in self._rows:
+            row[:] = [count >> 1 for count in row]
+        self._additions //= 2
+
+
+class _TinyLFUPolicy(_LRUPolicy):
+    """LRU eviction with TinyLFU admission: a new key only replaces a more popular victim."""
+
+    def __init__(self, capacity: int):
+        super().__init__()
+        self._sketch = _FrequencySketch(capacity)
+
+    def record_access(self, key: Hashable):
+        super().record_access(key)
+        self._sketch.increment(key)
+
+    def insert(self, key: Hashable):
+        super().insert(key)
+        self._sketch.increment(key)
+
+    def record_miss(self, key: Hashable):
+        self._sketch.increment(key)
+
+    def admit(self, candidate: Hashable, victim: Hashable) -> bool:
+        return self._sketch.estimate(candidate) > self._sketch.estimate(victim)
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel for TTL expiry.
+
+    Deadlines are rounded up to ``tick`` seconds and hashed into ``slots``
+    buckets; advancing the wheel only visits buckets for ticks that have
+    passed, so expiry costs O(expired entries) instead of a full scan.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 512, now: float = 0.0):
+        self.tick = tick
+        self.slots = slots
+        self._buckets: List[Dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._current_tick = int(now // tick)
+
+    def schedule(self, key: Hashable, deadline: float) -> int:
+        """Schedule ``key`` to expire at ``deadline``; returns the deadline tick."""
+        deadline_tick = max(-int(-deadline // self.tick), self._current_tick + 1)
+        self._buckets[deadline_tick % self.slots][key] = deadline_tick
+        return deadline_tick
+
+    def cancel(self, key: Hashable, deadline_tick: int):
+        """Remove a scheduled key (``deadline_tick`` as returned by ``schedule``)."""
+        self._buckets[deadline_tick % self.slots].pop(key, None)
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Move the wheel to ``now`` and return keys whose deadline has passed."""
+        target_tick = int(now // self.tick)
+        if target_tick <= self._current_tick:
+            return []
+
+        expired = []
+        first_tick = self._current_tick + 1
+        # A long pause visits every bucket once rather than every missed tick
+        ticks = range(first_tick, min(target_tick, first_tick + self.slots - 1) + 1)
+        for tick in ticks:
+            bucket = self._buckets[tick % self.slots]
+            if not bucket:
+                continue
+            due = [key for key, deadline_tick in bucket.items() if deadline_tick <= target_tick]
+            for key in due:
+                del bucket[key]
+            expired.extend(due)
+
+        self._current_tick = target_tick
+        return expired
+
+    def clear(self):
+        for bucket in self._buckets:
+            bucket.clear()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size_bytes: int
+    expires_at: Optional[float] = None
+    deadline_tick: Optional[int] = None
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate size of a value as its JSON encoding in bytes."""
+    try:
+        return len(json.dumps(value, default=str).encode())
+    except (TypeError, ValueError):
+        return len(repr(value).encode())
+
+
+class LocalCache:
+    """
+    Bounded in-process cache with O(1) get/put.
+
+    ``get``/``put`` update statistics and the eviction policy. Mapping-style
+    access (``cache[key]``, ``in``, ``len``) reads entries without counting
+    as an access.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+        policy: Union[EvictionPolicy, str] = EvictionPolicy.LRU,
+        sizeof: Callable[[Any], int] = estimate_size,
+        timer_tick: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        on_remove: Optional[Callable[[Hashable, Any], None]] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Memory budget in (estimated) bytes, None for no budget
+            policy: Eviction policy
+            sizeof: Function estimating an entry's size in bytes
+            timer_tick: Resolution of TTL expiry in seconds
+            clock: Monotonic clock (injectable for tests)
+            on_remove: Called with (key, value) whenever an entry leaves the
+                cache (eviction, expiry, deletion, replacement or clear)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = EvictionPolicy(policy)
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._size_bytes = 0
+        self._policy = self._create_policy(self.policy)
+        self._timers = TimerWheel(tick=timer_tick, now=clock())
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.on_remove = on_remove
+        self.stats = LocalCacheStats()
+
+    def _create_policy(self, policy: EvictionPolicy):
+        if policy == EvictionPolicy.LFU:
+            return _LFUPolicy()
+        if policy == EvictionPolicy.TINY_LFU:
+            return _TinyLFUPolicy(self.max_entries)
+        return _LRUPolicy()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._entries[key].value
+
+    def keys(self) -> List[Hashable]:
+        return list(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` on a miss."""
+        self._expire()
+        entry = self._entries.get(key)
+
+        if entry is not None and entry.expires_at is not None and self._clock() >= entry.expires_at:
+            self._remove(key)
+            self.stats.expirations += 1
+            entry = None
+
+        if entry is None:
+            self.stats.misses += 1
+            self._policy.record_miss(key)
+            return default
+
+        self.stats.hits += 1
+        self._policy.record_access(key)
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        size_bytes: Optional[int] = None
+    ) -> bool:
+        """
+        Store a value, evicting entries as needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (None for no expiry)
+            size_bytes: Entry size; estimated with ``sizeof`` when omitted
+
+        Returns:
+            False if the entry was not admitted (too large or rejected by TinyLFU)
+        """
+        self._expire()
+        size = self._sizeof(value) if size_bytes is None else size_bytes
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.stats.rejections += 1
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+        elif len(self._entries) >= self.max_entries:
+            victim = self._policy.victim()
+            if victim is not None and not self._policy.admit(key, victim):
+                self.stats.rejections += 1
+                return False
+
+        entry = _Entry(value=value, size_bytes=size)
+        if ttl is not None:
+            entry.expires_at = self._clock() + ttl
+            entry.deadline_tick = self._timers.schedule(key, entry.expires_at)
+
+        self._entries[key] = entry
+        self._size_bytes += size
+        self._policy.insert(key)
+        self.stats.puts += 1
+
+        self._evict_over_budget(key)
+        return True
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove ``key``; returns whether it was present."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def purge_expired(self) -> int:
+        """Drop entries whose TTL has passed; returns how many were removed."""
+        before = self.stats.expirations
+        self._expire()
+        return self.stats.expirations - before
+
+    def clear(self):
+        if self.on_remove:
+            for key, entry in self._entries.items():
+                self.on_remove(key, entry.value)
+        self._entries.clear()
+        self._policy.clear()
+        self._timers.clear()
+        self._size_bytes = 0
+
+    async def single_flight(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run ``loader`` once for concurrent callers using the same key.
+
+        Returns:
+            Tuple of (loader result, whether the result was shared from
+            another caller's in-flight load)
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats.coalesced_loads += 1
+            return await asyncio.shield(inflight), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn when there are none
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._inflight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit ratio, eviction counters and memory usage."""
+        stats = self.stats
+        return {
+            "policy": self.policy.value,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "size_bytes": self._size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_ratio": round(stats.hit_ratio, 4),
+            "puts": stats.puts,
+            "evictions": stats.evictions,
+            "expirations": stats.expirations,
+            "rejections": stats.rejections,
+            "coalesced_loads": stats.coalesced_loads,
+            "inflight_loads": len(self._inflight)
+        }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size_bytes
+        self._policy.remove(key)
+        if entry.deadline_tick is not None:
+            self._timers.cancel(key, entry.deadline_tick)
+        if self.on_remove:
+            self.on_remove(key, entry.value)
+
+    def _expire(self):
+        for key in self._timers.advance(self._clock()):
+            if key in self._entries:
+                entry = self._entries.pop(key)
+                self._size_bytes -= entry.size_bytes
+                self._policy.remove(key)
+                self.stats.expirations += 1
+                if self.on_remove:
+                    self.on_remove(key, entry.value)
+
+    def _evict_over_budget(self, protected: Hashable):
+        # The entry just stored is never its own victim
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._size_bytes > self.max_bytes
+        ):
+            victim = self._policy.victim(exclude=protected)
+            if victim is None:
+                break
+            self._remove(victim)
+            self.stats.evictions += 1
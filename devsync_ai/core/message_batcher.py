@@ -9,6 +9,7 @@ from enum import Enum
 from collections import defaultdict
 import logging
 
+from .local_cache import TimerWheel
 from .message_formatter import SlackMessage, TemplateConfig
 from .interactive_elements import InteractiveElementBuilder, default_interactive_builder
 from .formatter_factory import MessageType
@@ -122,6 +123,13 @@ class BatchGroup:
         stats['authors'] = list(stats['authors'])
         return stats
     
+    def flush_deadline(self, max_age_minutes: int = 5) -> datetime:
+        """Earliest time at which ``should_flush`` becomes true by age or expiry."""
+        deadline = self.created_at + timedelta(minutes=max_age_minutes)
+        if self.expires_at and self.expires_at < deadline:
+            return self.expires_at
+        return deadline
+    
     def should_flush(self, max_age_minutes: int = 5, max_size: int = 5) -> bool:
         """Check if batch should be flushed."""
         if len(self.messages) >= max_size:
@@ -285,6 +293,15 @@ class MessageBatcher:
         # Channel-specific statistics
         self._channel_stats: Dict[str, ChannelStats] = {}
         
+        # Flush deadlines of active groups, keyed by (channel_id, storage_key),
+        # so expiry sweeps only visit groups that are due
+        self._expiry_wheel = TimerWheel(tick=1.0, slots=1024, now=time.time())
+        self._group_deadline_ticks: Dict[Tuple[str, str], int] = {}
+        
+        # Maintained incrementally instead of walking every group
+        self._active_batches = 0
+        self._pending_messages = 0
+        
         # Enhanced global batch statistics
         self._stats = {
             'batches_created': 0,
@@ -328,6 +345,8 @@ class MessageBatcher:
         # Find or create appropriate batch group for the channel
         batch_group = self._find_or_create_batch_group(message, channel_id)
         batch_group.add_message(message)
+        self._pending_messages += 1
+        self._schedule_group_expiry(batch_group, channel_id)
         
         # Update statistics
         self._stats['messages_batched'] += 1
@@ -369,36 +388,61 @@ class MessageBatcher:
         return batched_messages
     
     def flush_expired_batches(self) -> List[SlackMessage]:
-        """Flush only expired batch groups across all channels."""
+        """
+        Flush only expired batch groups across all channels.
+        
+        Groups are indexed by flush deadline in a timer wheel, so a sweep
+        only visits groups whose deadline has passed (deadlines are rounded
+        up to the wheel's one-second tick).
+        """
         batched_messages = []
-        current_time = datetime.now()
         
-        for channel_id in list(self._channel_batch_groups.keys()):
-            channel_groups = self._channel_batch_groups[channel_id]
-            for group_id in list(channel_groups.keys()):
-                batch_group = channel_groups[group_id]
-                if batch_group.should_flush(self.config.max_batch_age_minutes, self.config.max_batch_size):
-                    batched_message = self._flush_batch_group(batch_group, channel_id)
-                    if batched_message:
-                        batched_messages.append(batched_message)
+        for group_ref in self._expiry_wheel.advance(time.time()):
+            self._group_deadline_ticks.pop(group_ref, None)
+            channel_id, storage_key = group_ref
+            channel_groups = self._channel_batch_groups.get(channel_id)
+            batch_group = channel_groups.get(storage_key) if channel_groups else None
+            if batch_group is None:
+                continue
+            
+            if batch_group.should_flush(self.config.max_batch_age_minutes, self.config.max_batch_size):
+                batched_message = self._flush_batch_group(batch_group, channel_id)
+                if batched_message:
+                    batched_messages.append(batched_message)
+            
+            # Still active (deadline moved or the flush failed): keep it indexed
+            if channel_groups.get(storage_key) is batch_group:
+                self._schedule_group_expiry(batch_group, channel_id)
         
         return batched_messages
     
     def get_batch_stats(self) -> Dict[str, Any]:
         """Get batching statistics."""
-        # Calculate active batches and pending messages from channel-specific data
-        active_batches = sum(len(channel_groups) for channel_groups in self._channel_batch_groups.values())
-        pending_messages = 0
-        for channel_groups in self._channel_batch_groups.values():
-            for group in channel_groups.values():
-                pending_messages += len(group.messages)
-        
         return {
             **self._stats,
-            'active_batches': active_batches,
-            'pending_messages': pending_messages
+            'active_batches': self._active_batches,
+            'pending_messages': self._pending_messages
         }
     
+    def _schedule_group_expiry(self, batch_group: BatchGroup, channel_id: str) -> None:
+        """(Re)index a group under its current flush deadline."""
+        storage_key = batch_group.metadata.get('storage_key')
+        if not storage_key:
+            return
+        
+        group_ref = (channel_id, storage_key)
+        deadline = batch_group.flush_deadline(self.config.max_batch_age_minutes).timestamp()
+        previous_tick = self._group_deadline_ticks.get(group_ref)
+        if previous_tick is not None:
+            self._expiry_wheel.cancel(group_ref, previous_tick)
+        self._group_deadline_ticks[group_ref] = self._expiry_wheel.schedule(group_ref, deadline)
+    
+    def _unschedule_group_expiry(self, channel_id: str, storage_key: str) -> None:
+        group_ref = (channel_id, storage_key)
+        deadline_tick = self._group_deadline_ticks.pop(group_ref, None)
+        if deadline_tick is not None:
+            self._expiry_wheel.cancel(group_ref, deadline_tick)
+    
     def get_channel_stats(self, channel_id: str) -> Optional[ChannelStats]:
         """Get statistics for specific channel."""
         if channel_id not in self._channel_stats:
@@ -553,11 +597,8 @@ class MessageBatcher:
         # Determine batch type based on content
         batch_type = self._determine_batch_type(message)
         
-        # Calculate total batches across all channels for unique ID
-        total_batches = sum(len(channel_groups) for channel_groups in self._channel_batch_groups.values())
-        
         # Generate unique group ID
-        group_id = f"{batch_type.value}_{int(time.time())}_{total_batches}"
+        group_id = f"{batch_type.value}_{int(time.time())}_{self._active_batches}"
         
         # Use the primary strategy to determine the storage key
         primary_strategy = self.config.strategies[0] if self.config.strategies else BatchStrategy.TIME_BASED
@@ -576,7 +617,13 @@ class MessageBatcher:
         )
         
         # Store in channel-specific dictionary using the strategy-based group key
+        replaced_group = self._channel_batch_groups[channel_id].get(group_key)
+        if replaced_group is not None:
+            self._active_batches -= 1
+            self._pending_messages -= len(replaced_group.messages)
         self._channel_batch_groups[channel_id][group_key] = batch_group
+        self._active_batches += 1
+        self._schedule_group_expiry(batch_group, channel_id)
         self._stats['batches_created'] += 1
         
         # Update channel statistics
@@ -626,6 +673,9 @@ class MessageBatcher:
                 if storage_key in self._channel_batch_groups[channel_id]:
                     try:
                         del self._channel_batch_groups[channel_id][storage_key]
+                        self._active_batches -= 1
+                        self._pending_messages -= message_count
+                        self._unschedule_group_expiry(channel_id, storage_key)
                         cleanup_successful = True
                         self.logger.debug(f"Successfully removed batch group {batch_id} from channel {channel_id}")
                     except KeyError as e:
@@ -723,6 +773,9 @@ class MessageBatcher:
                     
                     # Re-add the batch group if we removed it but failed to create the message
                     self._channel_batch_groups[channel_id][storage_key] = batch_group
+                    self._active_batches += 1
+                    self._pending_messages += original_message_count
+                    self._schedule_group_expiry(batch_group, channel_id)
                     self.logger.info(f"Restored batch group {batch_id} to channel {channel_id} after flush failure")
                     
             except Exception as recovery_error:
@@ -769,6 +822,7 @@ class MessageBatcher:
                 'batch_type': batch_group.batch_type.value,
                 'message_count': len(batch_group.messages),
                 'batch_id': batch_group.id,
+                'channel_id': batch_group.channel_id,
                 'created_at': batch_group.created_at.isoformat(),
                 'is_batched': True
             }
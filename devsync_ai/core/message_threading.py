@@ -2,7 +2,7 @@
 
 import time
 import hashlib
-from typing import Dict, List, Any, Optional, Tuple, Set, Callable
+from typing import AbstractSet, Dict, List, Any, Optional, Tuple, Set, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -12,6 +12,12 @@ import logging
 from .message_formatter import SlackMessage
 
 
+# Weights of the components of _calculate_content_similarity
+TEXT_SIMILARITY_WEIGHT = 0.4
+METADATA_SIMILARITY_WEIGHT = 0.3
+BLOCK_SIMILARITY_WEIGHT = 0.3
+
+
 class ThreadingStrategy(Enum):
     """Strategies for message threading."""
     CONTENT_BASED = "content_based"  # Thread by content similarity
@@ -70,6 +76,7 @@ class ThreadingConfig:
     auto_thread_similar_content: bool = True
     thread_similarity_threshold: float = 0.8
     temporal_window_minutes: int = 30
+    max_tokens_per_thread: int = 256  # Most recent distinct words kept per thread for similarity
     enable_cross_channel_threading: bool = False
     strategies: List[ThreadingStrategy] = field(default_factory=lambda: [
         ThreadingStrategy.ENTITY_BASED,
@@ -101,6 +108,14 @@ class MessageThreadingManager:
         # Content similarity tracking
         self._content_vectors: Dict[str, Dict[str, Any]] = defaultdict(dict)  # channel -> thread_id -> content_info
         
+        # Inverted indexes so similarity lookups only score threads sharing a word or metadata key
+        self._token_index: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))  # channel -> token -> thread_ids
+        self._metadata_key_index: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))  # channel -> key -> thread_ids
+        self._content_sequence = 0  # Creation order of content vectors, used to keep tie-breaking stable
+        
+        # Parent message timestamp to thread mapping
+        self._thread_ts_index: Dict[str, Dict[str, str]] = defaultdict(dict)  # channel -> parent_ts -> thread_id
+        
         # Threading statistics
         self._stats = {
             'threads_created': 0,
@@ -159,6 +174,7 @@ class MessageThreadingManager:
         
         # Store thread context
         self._channel_threads[channel_id][thread_id] = context
+        self._thread_ts_index[channel_id].setdefault(parent_ts, thread_id)
         
         # Update entity mapping if applicable
         if entity_id and entity_type:
@@ -278,8 +294,9 @@ class MessageThreadingManager:
         
         best_match_thread = None
         best_similarity = 0.0
+        threshold = self.config.thread_similarity_threshold
         
-        for thread_id, content_info in self._content_vectors[channel_id].items():
+        for thread_id, content_info in self._candidate_content_vectors(channel_id, message_content, threshold):
             if thread_id not in self._channel_threads[channel_id]:
                 continue
             
@@ -288,7 +305,7 @@ class MessageThreadingManager:
                 continue
             
             similarity = self._calculate_content_similarity(message_content, content_info)
-            if similarity > best_similarity and similarity >= self.config.thread_similarity_threshold:
+            if similarity > best_similarity and similarity >= threshold:
                 best_similarity = similarity
                 best_match_thread = context
         
@@ -347,8 +364,9 @@ class MessageThreadingManager:
             return []
         
         related_threads = []
+        threshold = 0.5  # Lower threshold for related threads
         
-        for thread_id, content_info in self._content_vectors[channel_id].items():
+        for thread_id, content_info in self._candidate_content_vectors(channel_id, message_content, threshold):
             if thread_id not in self._channel_threads[channel_id]:
                 continue
             
@@ -357,13 +375,42 @@ class MessageThreadingManager:
                 continue
             
             similarity = self._calculate_content_similarity(message_content, content_info)
-            if similarity >= 0.5:  # Lower threshold for related threads
+            if similarity >= threshold:
                 related_threads.append((context, similarity))
         
         # Sort by similarity and return top results
         related_threads.sort(key=lambda x: x[1], reverse=True)
         return [context for context, _ in related_threads[:max_results]]
     
+    def _candidate_content_vectors(self, 
+                                   channel_id: str, 
+                                   message_content: Dict[str, Any], 
+                                   threshold: float) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Get the content vectors that can reach the similarity threshold, in creation order.
+        
+        A thread sharing no word scores at most the metadata and block weights, and one
+        sharing neither a word nor a metadata key at most the block weight, so above those
+        bounds only threads found through the inverted indexes need to be scored.
+        """
+        vectors = self._content_vectors[channel_id]
+        if threshold <= BLOCK_SIMILARITY_WEIGHT:
+            return list(vectors.items())
+        
+        candidate_ids: Set[str] = set()
+        token_index = self._token_index[channel_id]
+        for token in self._content_tokens(message_content):
+            candidate_ids.update(token_index.get(token, ()))
+        
+        if threshold <= METADATA_SIMILARITY_WEIGHT + BLOCK_SIMILARITY_WEIGHT:
+            metadata_key_index = self._metadata_key_index[channel_id]
+            for key in message_content.get('metadata_keys', []):
+                candidate_ids.update(metadata_key_index.get(key, ()))
+        
+        candidates = [(thread_id, vectors[thread_id]) for thread_id in candidate_ids if thread_id in vectors]
+        candidates.sort(key=lambda item: item[1]['sequence'])
+        return candidates
+    
     def _extract_entity_info(self, message: SlackMessage) -> Tuple[Optional[str], Optional[str]]:
         """Extract entity ID and type from message."""
         if not message.metadata:
@@ -408,8 +455,10 @@ class MessageThreadingManager:
     
     def _extract_message_content(self, message: SlackMessage) -> Dict[str, Any]:
         """Extract content features for similarity comparison."""
+        text = message.text or ''
         content = {
-            'text': message.text or '',
+            'text': text,
+            'tokens': dict.fromkeys(text.lower().split()),
             'blocks': len(message.blocks) if message.blocks else 0,
             'metadata_keys': list(message.metadata.keys()) if message.metadata else []
         }
@@ -430,14 +479,14 @@ class MessageThreadingManager:
         similarity = 0.0
         
         # Text similarity (simple word overlap)
-        text1 = content1.get('text', '').lower().split()
-        text2 = content2.get('text', '').lower().split()
+        text1 = self._content_tokens(content1)
+        text2 = self._content_tokens(content2)
         
         if text1 and text2:
-            common_words = set(text1) & set(text2)
-            total_words = set(text1) | set(text2)
+            common_words = text1 & text2
+            total_words = text1 | text2
             if total_words:
-                similarity += 0.4 * (len(common_words) / len(total_words))
+                similarity += TEXT_SIMILARITY_WEIGHT * (len(common_words) / len(total_words))
         
         # Metadata key similarity
         keys1 = set(content1.get('metadata_keys', []))
@@ -447,7 +496,7 @@ class MessageThreadingManager:
             common_keys = keys1 & keys2
             total_keys = keys1 | keys2
             if total_keys:
-                similarity += 0.3 * (len(common_keys) / len(total_keys))
+                similarity += METADATA_SIMILARITY_WEIGHT * (len(common_keys) / len(total_keys))
         
         # Block structure similarity
         blocks1 = content1.get('blocks', 0)
@@ -456,10 +505,18 @@ class MessageThreadingManager:
         if blocks1 > 0 or blocks2 > 0:
             max_blocks = max(blocks1, blocks2)
             min_blocks = min(blocks1, blocks2)
-            similarity += 0.3 * (min_blocks / max_blocks if max_blocks > 0 else 0)
+            similarity += BLOCK_SIMILARITY_WEIGHT * (min_blocks / max_blocks if max_blocks > 0 else 0)
         
         return min(similarity, 1.0)
     
+    @staticmethod
+    def _content_tokens(content: Dict[str, Any]) -> AbstractSet[str]:
+        """Get the lowercased word set of a content dictionary."""
+        tokens = content.get('tokens')
+        if tokens is None:
+            return set(content.get('text', '').lower().split())
+        return tokens.keys()
+    
     def _extract_workflow_stage(self, message: SlackMessage) -> Optional[str]:
         """Extract workflow stage from message."""
         if not message.metadata:
@@ -501,34 +558,72 @@ class MessageThreadingManager:
         return stage in related_stages.get(context_stage, [])
     
     def _update_content_vectors(self, message: SlackMessage, channel_id: str, thread_id: str) -> None:
-        """Update content vectors for similarity matching."""
+        """Update content vectors and inverted indexes for similarity matching."""
         content = self._extract_message_content(message)
-        
-        if thread_id in self._content_vectors[channel_id]:
-            # Merge with existing content
-            existing = self._content_vectors[channel_id][thread_id]
-            
-            # Combine text
-            existing_text = existing.get('text', '')
-            new_text = content.get('text', '')
-            content['text'] = f"{existing_text} {new_text}".strip()
-            
-            # Combine metadata keys
-            existing_keys = set(existing.get('metadata_keys', []))
-            new_keys = set(content.get('metadata_keys', []))
-            content['metadata_keys'] = list(existing_keys | new_keys)
-            
-            # Update block count
-            content['blocks'] = existing.get('blocks', 0) + content.get('blocks', 0)
-        
-        self._content_vectors[channel_id][thread_id] = content
+        vectors = self._content_vectors[channel_id]
+        token_index = self._token_index[channel_id]
+        
+        existing = vectors.get(thread_id)
+        if existing is None:
+            self._content_sequence += 1
+            existing = {
+                'tokens': {},
+                'metadata_keys': set(),
+                'blocks': 0,
+                'sequence': self._content_sequence
+            }
+            vectors[thread_id] = existing
+        
+        # Keep the most recently seen distinct words, bounded per thread
+        tokens = existing['tokens']
+        for token in content['tokens']:
+            if token in tokens:
+                del tokens[token]
+            else:
+                token_index[token].add(thread_id)
+            tokens[token] = None
+        
+        while len(tokens) > self.config.max_tokens_per_thread:
+            oldest = next(iter(tokens))
+            del tokens[oldest]
+            self._unindex(token_index, oldest, thread_id)
+        
+        # Combine metadata keys
+        for key in content['metadata_keys']:
+            if key not in existing['metadata_keys']:
+                existing['metadata_keys'].add(key)
+                self._metadata_key_index[channel_id][key].add(thread_id)
+        
+        # Update block count
+        existing['blocks'] += content['blocks']
+    
+    def _remove_content_vector(self, channel_id: str, thread_id: str) -> None:
+        """Remove a thread's content vector and its inverted index entries."""
+        content = self._content_vectors[channel_id].pop(thread_id, None)
+        if content is None:
+            return
+        
+        for token in content['tokens']:
+            self._unindex(self._token_index[channel_id], token, thread_id)
+        for key in content['metadata_keys']:
+            self._unindex(self._metadata_key_index[channel_id], key, thread_id)
+    
+    @staticmethod
+    def _unindex(index: Dict[str, Set[str]], term: str, thread_id: str) -> None:
+        """Remove a thread from an inverted index posting, dropping empty postings."""
+        thread_ids = index.get(term)
+        if thread_ids is None:
+            return
+        thread_ids.discard(thread_id)
+        if not thread_ids:
+            del index[term]
     
     def _find_thread_context(self, channel_id: str, thread_ts: str) -> Optional[ThreadContext]:
         """Find thread context by thread timestamp."""
-        for context in self._channel_threads[channel_id].values():
-            if context.parent_message_ts == thread_ts:
-                return context
-        return None
+        thread_id = self._thread_ts_index[channel_id].get(thread_ts)
+        if thread_id is None:
+            return None
+        return self._channel_threads[channel_id].get(thread_id)
     
     def _generate_thread_id(self, message: SlackMessage, channel_id: str, parent_ts: str) -> str:
         """Generate unique thread ID."""
@@ -549,16 +644,25 @@ class MessageThreadingManager:
                 expired_threads.append(thread_id)
         
         for thread_id in expired_threads:
-            del self._channel_threads[channel_id][thread_id]
+            context = self._channel_threads[channel_id].pop(thread_id)
             
             # Clean up content vectors
-            if thread_id in self._content_vectors[channel_id]:
-                del self._content_vectors[channel_id][thread_id]
+            self._remove_content_vector(channel_id, thread_id)
             
             # Clean up entity mappings
-            for entity_key, mapped_thread_id in list(self._entity_threads[channel_id].items()):
-                if mapped_thread_id == thread_id:
+            if context.entity_id and context.entity_type:
+                entity_key = f"{context.entity_type}:{context.entity_id}"
+                if self._entity_threads[channel_id].get(entity_key) == thread_id:
                     del self._entity_threads[channel_id][entity_key]
+            
+            # Clean up timestamp mapping, falling back to another thread sharing the timestamp
+            ts_index = self._thread_ts_index[channel_id]
+            if ts_index.get(context.parent_message_ts) == thread_id:
+                del ts_index[context.parent_message_ts]
+                for other_id, other in self._channel_threads[channel_id].items():
+                    if other.parent_message_ts == context.parent_message_ts:
+                        ts_index[context.parent_message_ts] = other_id
+                        break
         
         if expired_threads:
             self._stats['threads_expired'] += len(expired_threads)
@@ -573,7 +677,8 @@ class MessageThreadingManager:
             'active_threads': active_threads,
             'active_channels': len(self._channel_threads),
             'total_entities_tracked': sum(len(entities) for entities in self._entity_threads.values()),
-            'content_vectors_stored': sum(len(vectors) for vectors in self._content_vectors.values())
+            'content_vectors_stored': sum(len(vectors) for vectors in self._content_vectors.values()),
+            'indexed_tokens': sum(len(tokens) for tokens in self._token_index.values())
         }
     
     def get_channel_threads(self, channel_id: str) -> List[ThreadContext]:
@@ -6,14 +6,20 @@ import asyncio
 import hashlib
 import json
 import logging
+import re
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import redis
 from contextlib import asynccontextmanager
 
 from ..database.connection import get_database_connection
+from .local_cache import EvictionPolicy, LocalCache
+
+# Tables referenced by a query, used to tag its cached result
+TABLE_REFERENCE_PATTERN = re.compile(r'\b(?:FROM|JOIN|UPDATE|INTO)\s+([A-Za-z_][\w.]*)', re.IGNORECASE)
 
 
 class CacheStrategy(Enum):
@@ -44,6 +50,7 @@ class CacheEntry:
     expires_at: Optional[datetime]
     hit_count: int = 0
     size_bytes: int = 0
+    tags: Tuple[str, ...] = ()
 
 
 class QueryOptimizer:
@@ -51,12 +58,45 @@ class QueryOptimizer:
     Database query optimizer with intelligent caching and performance monitoring.
     """
     
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        plan_sample_first_n: int = 5,
+        plan_sample_rate: int = 100,
+        slow_query_threshold: float = 1.0,
+        slow_query_log_size: int = 100,
+        local_cache: Optional[LocalCache] = None,
+        local_cache_max_entries: int = 1000,
+        local_cache_max_bytes: int = 64 * 1024 * 1024,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LFU,
+        plan_tracking_max_signatures: int = 1000
+    ):
         self.logger = logging.getLogger(__name__)
         self.redis_client = None
-        self.local_cache: Dict[str, CacheEntry] = {}
+        # Values are CacheEntry objects; LocalCache bounds entries and bytes
+        self.local_cache = local_cache or LocalCache(
+            max_entries=local_cache_max_entries,
+            max_bytes=local_cache_max_bytes,
+            policy=eviction_policy
+        )
+        # Reverse index from tag ("team:<id>", "table:<name>") to local cache
+        # keys; entries leaving the cache are untagged through on_remove
+        self._tag_index: Dict[str, Set[str]] = {}
+        self.local_cache.on_remove = self._untag_entry
         self.query_stats: Dict[str, Dict[str, Any]] = {}
         
+        # Query plan sampling: EXPLAIN ANALYZE re-executes the query, so plans
+        # are captured for the first N executions of a signature, then 1 in K
+        self.plan_sample_first_n = plan_sample_first_n
+        self.plan_sample_rate = plan_sample_rate
+        self.slow_query_threshold = slow_query_threshold  # seconds
+        # Execution counts and plans per signature are LRU-bounded; a
+        # signature evicted from tracking restarts its sampling
+        self.plan_cache = LocalCache(max_entries=plan_tracking_max_signatures, max_bytes=None)
+        self.slow_query_log: deque = deque(maxlen=slow_query_log_size)
+        self._plan_executions = LocalCache(max_entries=plan_tracking_max_signatures, max_bytes=None)
+        self._plan_captures = 0
+        
         # Cache TTL settings (in seconds)
         self.cache_ttl = {
             CacheStrategy.SHORT_TERM: 300,      # 5 minutes
@@ -78,10 +118,16 @@ class QueryOptimizer:
         query: str,
         params: List[Any] = None,
         cache_strategy: CacheStrategy = CacheStrategy.MEDIUM_TERM,
-        cache_key_suffix: str = ""
+        cache_key_suffix: str = "",
+        team_id: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute a database query with optimization and caching.
+        
+        Cached results are tagged with ``team:<team_id>``, ``table:<name>``
+        for every table the query references, and any extra ``tags``, so
+        ``invalidate_tags``/``invalidate_cache`` can drop them precisely.
         """
         params = params or []
         
@@ -94,24 +140,59 @@ class QueryOptimizer:
             if cached_result is not None:
                 await self._update_query_stats(query, "cache_hit", 0)
                 return cached_result
+            
+            # Concurrent misses on the same key share one database query
+            entry_tags = self._build_tags(query, team_id, tags)
+            result, shared = await self.local_cache.single_flight(
+                cache_key,
+                lambda: self._execute_query(query, params, cache_key, cache_strategy, entry_tags)
+            )
+            if shared:
+                await self._update_query_stats(query, "cache_hit", 0)
+            return result
+        
+        return await self._execute_query(query, params, cache_key, cache_strategy)
+    
+    async def _execute_query(
+        self,
+        query: str,
+        params: List[Any],
+        cache_key: str,
+        cache_strategy: CacheStrategy,
+        tags: Tuple[str, ...] = ()
+    ) -> List[Dict[str, Any]]:
+        """Run a query against the database, capturing plans and stats."""
+        query_signature = self._get_query_signature(query)
         
         # Execute query with performance monitoring
         start_time = datetime.utcnow()
         
         try:
             async with get_database_connection() as conn:
-                # Get query plan for optimization insights
-                plan = await self._analyze_query_plan(conn, query, params)
+                # Get query plan for optimization insights (sampled per signature)
+                plan = None
+                if self._should_capture_plan(query_signature):
+                    plan = await self._capture_query_plan(conn, query_signature, query, params)
                 
                 # Execute the actual query
+                query_start = datetime.utcnow()
                 rows = await conn.fetch(query, *params)
                 result = [dict(row) for row in rows]
                 
                 execution_time = (datetime.utcnow() - start_time).total_seconds()
+                query_time = (datetime.utcnow() - query_start).total_seconds()
+                
+                # Slow queries always get a plan (estimate only, the query already ran)
+                if query_time >= self.slow_query_threshold:
+                    if plan is None:
+                        plan = await self._capture_query_plan(
+                            conn, query_signature, query, params, analyze=False
+                        )
+                    self._log_slow_query(query_signature, query_time, len(params), plan)
                 
                 # Cache the result if strategy allows
                 if cache_strategy != CacheStrategy.NO_CACHE:
-                    await self._store_in_cache(cache_key, result, cache_strategy)
+                    await self._store_in_cache(cache_key, result, cache_strategy, tags)
                 
                 # Update statistics
                 await self._update_query_stats(query, "cache_miss", execution_time, plan)
@@ -146,12 +227,11 @@ class QueryOptimizer:
                     return json.loads(cached_data)
             
             # Fall back to local cache
-            if cache_key in self.local_cache:
-                entry = self.local_cache[cache_key]
-                
+            entry = self.local_cache.get(cache_key)
+            if entry is not None:
                 # Check if entry has expired
                 if entry.expires_at and datetime.utcnow() > entry.expires_at:
-                    del self.local_cache[cache_key]
+                    self.local_cache.delete(cache_key)
                     return None
                 
                 # Update hit count
@@ -168,7 +248,8 @@ class QueryOptimizer:
         self,
         cache_key: str,
         data: List[Dict[str, Any]],
-        strategy: CacheStrategy
+        strategy: CacheStrategy,
+        tags: Tuple[str, ...] = ()
     ):
         """Store data in cache with appropriate TTL."""
         try:
@@ -182,6 +263,7 @@ class QueryOptimizer:
                     ttl,
                     json.dumps(data, default=str)
                 )
+                await self._mirror_tags_to_redis(cache_key, tags)
             
             # Store in local cache
             data_size = len(json.dumps(data, default=str).encode())
@@ -189,57 +271,149 @@ class QueryOptimizer:
                 data=data,
                 created_at=datetime.utcnow(),
                 expires_at=expires_at,
-                size_bytes=data_size
+                size_bytes=data_size,
+                tags=tags
             )
             
-            self.local_cache[cache_key] = entry
-            
-            # Prevent local cache from growing too large
-            await self._cleanup_local_cache()
+            # The local cache evicts by policy to stay within its entry and byte budgets
+            if self.local_cache.put(cache_key, entry, ttl=ttl, size_bytes=data_size):
+                for tag in tags:
+                    self._tag_index.setdefault(tag, set()).add(cache_key)
             
         except Exception as e:
             self.logger.error(f"Error storing in cache: {e}")
     
-    async def _cleanup_local_cache(self, max_entries: int = 1000):
-        """Clean up local cache to prevent memory issues."""
-        if len(self.local_cache) <= max_entries:
+    def _build_tags(
+        self,
+        query: str,
+        team_id: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None
+    ) -> Tuple[str, ...]:
+        """Tags for a cached query result: team, referenced tables and extras."""
+        entry_tags = {f"table:{table.lower()}" for table in TABLE_REFERENCE_PATTERN.findall(query)}
+        if team_id:
+            entry_tags.add(f"team:{team_id}")
+        if tags:
+            entry_tags.update(tags)
+        return tuple(sorted(entry_tags))
+    
+    def _untag_entry(self, cache_key: str, entry: CacheEntry):
+        """Remove a local cache entry from the tag index (LocalCache on_remove hook)."""
+        for tag in getattr(entry, "tags", ()):
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._tag_index[tag]
+    
+    async def _mirror_tags_to_redis(self, cache_key: str, tags: Tuple[str, ...]):
+        """Add a Redis key to the Redis set of each of its tags."""
+        # Tag sets outlive any entry they reference; stale members are
+        # harmless since deleting an expired key is a no-op
+        if not tags:
             return
+        tag_ttl = self.cache_ttl[CacheStrategy.LONG_TERM]
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for tag in tags:
+            tag_key = f"tag:{tag}"
+            pipeline.sadd(tag_key, cache_key)
+            pipeline.expire(tag_key, tag_ttl)
+        await pipeline.execute()
+    
+    async def _cleanup_local_cache(self):
+        """Drop expired local cache entries (size limits are enforced on every store)."""
+        removed = self.local_cache.purge_expired()
+        if removed:
+            self.logger.debug(f"Removed {removed} expired local cache entries")
+    
+    def _should_capture_plan(self, query_signature: str) -> bool:
+        """Decide whether this execution of a query signature captures its plan."""
+        executions = self._plan_executions.get(query_signature, 0) + 1
+        self._plan_executions.put(query_signature, executions, size_bytes=0)
         
-        # Remove expired entries first
-        current_time = datetime.utcnow()
-        expired_keys = [
-            key for key, entry in self.local_cache.items()
-            if entry.expires_at and current_time > entry.expires_at
-        ]
+        if executions <= self.plan_sample_first_n:
+            return True
+        
+        return (
+            self.plan_sample_rate > 0
+            and (executions - self.plan_sample_first_n) % self.plan_sample_rate == 0
+        )
+    
+    async def _capture_query_plan(
+        self,
+        conn,
+        query_signature: str,
+        query: str,
+        params: List[Any],
+        analyze: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Capture a query plan and cache it for the query signature."""
+        plan = await self._analyze_query_plan(conn, query, params, analyze=analyze)
         
-        for key in expired_keys:
-            del self.local_cache[key]
+        if plan:
+            self._plan_captures += 1
+            self.plan_cache.put(query_signature, {
+                **plan,
+                "analyzed": analyze,
+                "captured_at": datetime.utcnow().isoformat()
+            })
         
-        # If still too many entries, remove least recently used
-        if len(self.local_cache) > max_entries:
-            # Sort by hit count (ascending) and creation time
-            sorted_entries = sorted(
-                self.local_cache.items(),
-                key=lambda x: (x[1].hit_count, x[1].created_at)
-            )
-            
-            # Remove oldest, least used entries
-            entries_to_remove = len(self.local_cache) - max_entries
-            for key, _ in sorted_entries[:entries_to_remove]:
-                del self.local_cache[key]
+        return plan
+    
+    def _log_slow_query(
+        self,
+        query_signature: str,
+        execution_time: float,
+        param_count: int,
+        plan: Optional[Dict[str, Any]]
+    ):
+        """Record a query that exceeded the slow query threshold."""
+        self.slow_query_log.append({
+            "query_signature": query_signature,
+            "execution_time": round(execution_time, 3),
+            "param_count": param_count,
+            "timestamp": datetime.utcnow().isoformat(),
+            "plan": plan or self.plan_cache.get(query_signature)
+        })
+        self.logger.warning(
+            f"Slow query ({execution_time:.3f}s): {query_signature[:100]}"
+        )
+    
+    def invalidate_query_plans(self, table: Optional[str] = None):
+        """
+        Drop cached plans after a schema change.
+        
+        Plans of signatures referencing ``table`` (or all plans) are removed
+        and their sampling restarts, so the next executions capture fresh
+        plans.
+        """
+        if table is None:
+            self.plan_cache.clear()
+            self._plan_executions.clear()
+            return
+        
+        table = table.lower()
+        for tracking in (self._plan_executions, self.plan_cache):
+            for signature in [sig for sig in tracking.keys() if table in sig.lower()]:
+                tracking.delete(signature)
     
     async def _analyze_query_plan(
         self,
         conn,
         query: str,
-        params: List[Any]
+        params: List[Any],
+        analyze: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Analyze query execution plan for optimization insights."""
         try:
-            # Get query plan
-            explain_query = f"EXPLAIN (FORMAT JSON, ANALYZE, BUFFERS) {query}"
+            # Get query plan (ANALYZE executes the query)
+            options = "FORMAT JSON, ANALYZE, BUFFERS" if analyze else "FORMAT JSON"
+            explain_query = f"EXPLAIN ({options}) {query}"
             plan_result = await conn.fetchval(explain_query, *params)
             
+            if isinstance(plan_result, str):
+                plan_result = json.loads(plan_result)
+            
             if plan_result:
                 plan_data = plan_result[0] if isinstance(plan_result, list) else plan_result
                 
@@ -314,8 +488,44 @@ class QueryOptimizer:
         
         return signature[:200]  # Limit length
     
-    async def invalidate_cache(self, pattern: str = None, team_id: str = None):
-        """Invalidate cache entries matching the pattern."""
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Invalidate every cache entry carrying any of ``tags``.
+        
+        Cost is proportional to the number of tagged entries, not the cache
+        size. Returns the number of local and Redis entries removed.
+        """
+        removed = 0
+        
+        for tag in tags:
+            for cache_key in list(self._tag_index.get(tag, ())):
+                if self.local_cache.delete(cache_key):
+                    removed += 1
+            self._tag_index.pop(tag, None)
+        
+        if self.redis_client:
+            tag_keys = [f"tag:{tag}" for tag in tags]
+            members = set()
+            for tag_key in tag_keys:
+                members.update(await self.redis_client.smembers(tag_key))
+            if members:
+                removed += await self.redis_client.delete(*members)
+            await self.redis_client.delete(*tag_keys)
+        
+        return removed
+    
+    async def invalidate_cache(
+        self,
+        pattern: str = None,
+        team_id: str = None,
+        table: Optional[str] = None
+    ):
+        """
+        Invalidate cache entries for a team, a table, or matching a key pattern.
+        
+        ``team_id`` and ``table`` go through the tag index; ``pattern``
+        scans cache keys.
+        """
         try:
             if pattern:
                 # Invalidate Redis cache
@@ -330,23 +540,26 @@ class QueryOptimizer:
                     if pattern in key
                 ]
                 for key in keys_to_remove:
-                    del self.local_cache[key]
+                    self.local_cache.delete(key)
             
+            tags = []
             if team_id:
-                # Invalidate team-specific cache entries
-                team_pattern = f"team:{team_id}"
-                await self.invalidate_cache(team_pattern)
+                tags.append(f"team:{team_id}")
+            if table:
+                tags.append(f"table:{table.lower()}")
+            if tags:
+                removed = await self.invalidate_tags(*tags)
+                self.logger.info(f"Invalidated {removed} cache entries tagged {', '.join(tags)}")
             
-            self.logger.info(f"Cache invalidated for pattern: {pattern}")
+            if pattern:
+                self.logger.info(f"Cache invalidated for pattern: {pattern}")
             
         except Exception as e:
             self.logger.error(f"Error invalidating cache: {e}")
     
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics."""
-        total_entries = len(self.local_cache)
-        total_size = sum(entry.size_bytes for entry in self.local_cache.values())
-        total_hits = sum(entry.hit_count for entry in self.local_cache.values())
+        local_stats = self.local_cache.get_stats()
         
         # Calculate hit rates from query stats
         total_cache_hits = sum(stats["cache_hits"] for stats in self.query_stats.values())
@@ -357,9 +570,16 @@ class QueryOptimizer:
         
         return {
             "local_cache": {
-                "entries": total_entries,
-                "size_mb": round(total_size / (1024 * 1024), 2),
-                "total_hits": total_hits
+                "entries": local_stats["entries"],
+                "size_mb": round(local_stats["size_bytes"] / (1024 * 1024), 2),
+                "total_hits": local_stats["hits"],
+                "hit_ratio": local_stats["hit_ratio"],
+                "evictions": local_stats["evictions"],
+                "expirations": local_stats["expirations"],
+                "rejections": local_stats["rejections"],
+                "coalesced_loads": local_stats["coalesced_loads"],
+                "policy": local_stats["policy"],
+                "tags": len(self._tag_index)
             },
             "overall_performance": {
                 "hit_rate_percent": round(hit_rate, 2),
@@ -367,7 +587,19 @@ class QueryOptimizer:
                 "cache_hits": total_cache_hits,
                 "cache_misses": total_cache_misses
             },
-            "query_performance": self._get_top_queries()
+            "query_performance": self._get_top_queries(),
+            "query_plans": {
+                "cached_plans": len(self.plan_cache),
+                "plan_captures": self._plan_captures,
+                "tracked_signatures": len(self._plan_executions),
+                "sample_first_n": self.plan_sample_first_n,
+                "sample_rate": self.plan_sample_rate
+            },
+            "slow_queries": {
+                "threshold_seconds": self.slow_query_threshold,
+                "count": len(self.slow_query_log),
+                "recent": list(self.slow_query_log)
+            }
         }
     
     def _get_top_queries(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -448,6 +680,9 @@ class QueryOptimizer:
                         self.logger.info(f"Created index: {index_sql.split('idx_')[1].split()[0]}")
                     except Exception as e:
                         self.logger.warning(f"Could not create index: {e}")
+            
+            # New indexes change query plans
+            self.invalidate_query_plans()
                         
         except Exception as e:
             self.logger.error(f"Error creating database indexes: {e}")
@@ -0,0 +1,419 @@
+"""
+Compact rate limit state with O(1) memory per key.
+
+Each limited key holds a fixed-size state: a theoretical arrival time for
+GCRA (the token bucket equivalent), a window index with two counters for the
+approximate sliding window, a window index with one counter for fixed
+windows, or the last request time for minimum-interval limiting. Every state
+records when it becomes equivalent to a fresh key, so idle keys can be
+dropped without changing any decision.
+
+The local backend keeps state in sharded, recency-ordered dicts and evicts
+expired keys incrementally. The Redis backend runs the same algorithms in a
+Lua script so limits can be shared across worker processes; Redis expires
+idle keys itself.
+"""
+
+import logging
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tolerance for float comparisons at exact limit boundaries
+EPSILON = 1e-9
+
+
+class LimitAlgorithm(Enum):
+    """Algorithms supported by the rate limit backends."""
+    GCRA = "gcra"
+    SLIDING_WINDOW = "sliding_window"
+    FIXED_WINDOW = "fixed_window"
+    MIN_INTERVAL = "min_interval"
+
+
+@dataclass(frozen=True)
+class LimitCheck:
+    """
+    One rate limit check.
+
+    ``period`` is the emission interval for GCRA, the window size for the
+    window algorithms and the minimum spacing for MIN_INTERVAL. ``limit`` is
+    the burst capacity for GCRA and the request limit for the windows.
+    """
+    algorithm: LimitAlgorithm
+    key: Tuple[str, str]
+    period: float
+    limit: float = 0.0
+    cost: float = 1.0
+
+
+@dataclass
+class LimitDecision:
+    """Outcome of a LimitCheck."""
+    allowed: bool
+    remaining: Optional[int] = None
+    retry_after: Optional[float] = None
+    reset_time: Optional[float] = None
+
+
+def evaluate(check: LimitCheck, state: Any, now: float) -> Tuple[LimitDecision, Any, float]:
+    """
+    Apply a check to a key's state.
+
+    Args:
+        check: The check to apply
+        state: Current state of the key, None if the key is fresh
+        now: Current time in seconds
+
+    Returns:
+        The decision, the new state (None if unchanged) and the time at which
+        the new state becomes equivalent to a fresh key
+    """
+    period = check.period
+
+    if check.algorithm == LimitAlgorithm.GCRA:
+        tat = max(state if state is not None else now, now)
+        new_tat = tat + check.cost * period
+        if new_tat - now <= check.limit * period + EPSILON:
+            return LimitDecision(
+                allowed=True,
+                remaining=math.floor(check.limit - (new_tat - now) / period + EPSILON),
+                reset_time=new_tat
+            ), new_tat, new_tat
+        return LimitDecision(
+            allowed=False,
+            remaining=0,
+            retry_after=new_tat - check.limit * period - now,
+            reset_time=new_tat - check.limit * period
+        ), None, 0.0
+
+    if check.algorithm == LimitAlgorithm.SLIDING_WINDOW:
+        index = math.floor(now / period)
+        window_start = index * period
+        previous, current = 0.0, 0.0
+        if state is not None:
+            if state[0] == index:
+                previous, current = state[1], state[2]
+            elif state[0] == index - 1:
+                previous = state[2]
+
+        estimate = previous * (1 - (now - window_start) / period) + current
+        if estimate + check.cost <= check.limit + EPSILON:
+            return LimitDecision(
+                allowed=True,
+                remaining=max(0, math.floor(check.limit - estimate - check.cost + EPSILON)),
+                reset_time=window_start + period
+            ), (index, previous, current + check.cost), window_start + 2 * period
+        return LimitDecision(
+            allowed=False,
+            remaining=0,
+            retry_after=_sliding_window_retry_after(check, window_start, previous, current, now),
+            reset_time=window_start + period
+        ), None, 0.0
+
+    if check.algorithm == LimitAlgorithm.FIXED_WINDOW:
+        index = math.floor(now / period)
+        reset_time = (index + 1) * period
+        count = state[1] if state is not None and state[0] == index else 0.0
+        if count + check.cost <= check.limit + EPSILON:
+            count += check.cost
+            return LimitDecision(
+                allowed=True,
+                remaining=max(0, math.floor(check.limit - count + EPSILON)),
+                reset_time=reset_time
+            ), (index, count), reset_time
+        return LimitDecision(
+            allowed=False,
+            remaining=0,
+            retry_after=reset_time - now,
+            reset_time=reset_time
+        ), None, 0.0
+
+    # MIN_INTERVAL
+    if state is None or now - state >= period:
+        return LimitDecision(allowed=True), now, now + period
+    retry_after = period - (now - state)
+    return LimitDecision(allowed=False, retry_after=retry_after, reset_time=now + retry_after), None, 0.0
+
+
+def _sliding_window_retry_after(check: LimitCheck, window_start: float, previous: float,
+                                current: float, now: float) -> float:
+    """Time until the weighted count leaves room for ``check.cost``."""
+    period = check.period
+    room = check.limit - check.cost
+    if room < 0:
+        return float('inf')
+    if current <= room and previous > 0:
+        # Wait for the previous window's weight to decay
+        return max(0.0, window_start + period * (1 - (room - current) / previous) - now)
+    # Wait for the next window, then for the current count's weight to decay
+    return max(0.0, window_start + period * (2 - room / current) - now)
+
+
+class ShardedStateStore:
+    """
+    Rate limit state split over recency-ordered shards.
+
+    Entries are kept per shard in least-recently-updated order. Writes evict
+    a few expired entries from the head of their shard, ``sweep`` walks one
+    whole shard per call, and a per-shard key cap bounds memory under churn
+    of keys that are still active.
+    """
+
+    def __init__(self, shards: int = 16, max_keys_per_shard: int = 10000, evictions_per_write: int = 4):
+        """
+        Initialize the store.
+
+        Args:
+            shards: Number of shards
+            max_keys_per_shard: Least recently updated keys beyond this are dropped
+            evictions_per_write: Expired entries dropped from a shard's head per write
+        """
+        self.max_keys_per_shard = max_keys_per_shard
+        self.evictions_per_write = evictions_per_write
+        self._shards: List["OrderedDict[Hashable, Tuple[float, Any]]"] = [OrderedDict() for _ in range(shards)]
+        self._next_sweep = 0
+        self._stats = {'expired': 0, 'evicted': 0}
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def _shard(self, key: Hashable) -> "OrderedDict[Hashable, Tuple[float, Any]]":
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: Hashable, now: float) -> Any:
+        """Return the state of ``key``, or None if it is absent or expired."""
+        shard = self._shard(key)
+        entry = shard.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del shard[key]
+            self._stats['expired'] += 1
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, state: Any, expires_at: float, now: float) -> None:
+        """Store the state of ``key`` until ``expires_at``."""
+        shard = self._shard(key)
+        shard[key] = (expires_at, state)
+        shard.move_to_end(key)
+
+        for _ in range(self.evictions_per_write):
+            head_key, (head_expires_at, _) = next(iter(shard.items()))
+            if head_expires_at > now:
+                break
+            del shard[head_key]
+            self._stats['expired'] += 1
+
+        while len(shard) > self.max_keys_per_shard:
+            shard.popitem(last=False)
+            self._stats['evicted'] += 1
+
+    def sweep(self, now: float) -> int:
+        """Drop expired entries from the next shard; returns how many."""
+        shard = self._shards[self._next_sweep]
+        self._next_sweep = (self._next_sweep + 1) % len(self._shards)
+
+        expired = [key for key, (expires_at, _) in shard.items() if expires_at <= now]
+        for key in expired:
+            del shard[key]
+        self._stats['expired'] += len(expired)
+        return len(expired)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """All (key, state) pairs, most recently updated last within each shard."""
+        return [(key, state) for shard in self._shards for key, (_, state) in shard.items()]
+
+    def get_stats(self) -> Dict[str, Any]:
+        sizes = [len(shard) for shard in self._shards]
+        return {
+            'tracked_keys': sum(sizes),
+            'shards': len(sizes),
+            'largest_shard': max(sizes),
+            'expired_keys': self._stats['expired'],
+            'evicted_keys': self._stats['evicted']
+        }
+
+
+class LocalRateLimitBackend:
+    """In-process backend over a ShardedStateStore."""
+
+    def __init__(self, store: Optional[ShardedStateStore] = None):
+        self.store = store if store is not None else ShardedStateStore()
+
+    async def acquire(self, checks: Sequence[LimitCheck], now: float) -> List[LimitDecision]:
+        """Apply checks in order; state is updated without yielding to the event loop."""
+        decisions = []
+        for check in checks:
+            key = (check.algorithm, check.key)
+            decision, state, expires_at = evaluate(check, self.store.get(key, now), now)
+            if state is not None:
+                self.store.put(key, state, expires_at, now)
+            decisions.append(decision)
+        return decisions
+
+    def sweep(self, now: float) -> int:
+        return self.store.sweep(now)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'backend': 'local', **self.store.get_stats()}
+
+
+# KEYS[1]: state key. ARGV: algorithm, now, period, limit, cost.
+# Returns {allowed, remaining, retry_after, reset_time} with '' for None;
+# numbers are formatted as strings because Redis truncates Lua numbers.
+_LUA_ACQUIRE = """
+local key = KEYS[1]
+local algorithm = ARGV[1]
+local now = tonumber(ARGV[2])
+local period = tonumber(ARGV[3])
+local limit = tonumber(ARGV[4])
+local cost = tonumber(ARGV[5])
+local eps = 1e-9
+
+local function num(value)
+    return string.format('%.6f', value)
+end
+
+local function ttl_ms(expires_at)
+    return math.max(1, math.ceil((expires_at - now) * 1000))
+end
+
+if algorithm == 'gcra' then
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then tat = now end
+    local new_tat = tat + cost * period
+    if new_tat - now <= limit * period + eps then
+        redis.call('SET', key, num(new_tat), 'PX', ttl_ms(new_tat))
+        return {1, tostring(math.floor(limit - (new_tat - now) / period + eps)), '', num(new_tat)}
+    end
+    return {0, '0', num(new_tat - limit * period - now), num(new_tat - limit * period)}
+end
+
+if algorithm == 'sliding_window' then
+    local index = math.floor(now / period)
+    local window_start = index * period
+    local state = redis.call('HMGET', key, 'index', 'previous', 'current')
+    local stored_index = tonumber(state[1])
+    local previous, current = 0, 0
+    if stored_index == index then
+        previous, current = tonumber(state[2]), tonumber(state[3])
+    elseif stored_index == index - 1 then
+        previous = tonumber(state[3])
+    end
+
+    local estimate = previous * (1 - (now - window_start) / period) + current
+    if estimate + cost <= limit + eps then
+        redis.call('HSET', key, 'index', index, 'previous', num(previous), 'current', num(current + cost))
+        redis.call('PEXPIRE', key, ttl_ms(window_start + 2 * period))
+        local remaining = math.max(0, math.floor(limit - estimate - cost + eps))
+        return {1, tostring(remaining), '', num(window_start + period)}
+    end
+
+    local room = limit - cost
+    local retry_after
+    if room < 0 then
+        retry_after = 'inf'
+    elseif current <= room and previous > 0 then
+        retry_after = num(math.max(0, window_start + period * (1 - (room - current) / previous) - now))
+    else
+        retry_after = num(math.max(0, window_start + period * (2 - room / current) - now))
+    end
+    return {0, '0', retry_after, num(window_start + period)}
+end
+
+if algorithm == 'fixed_window' then
+    local index = math.floor(now / period)
+    local reset_time = (index + 1) * period
+    local state = redis.call('HMGET', key, 'index', 'count')
+    local count = 0
+    if tonumber(state[1]) == index then count = tonumber(state[2]) end
+    if count + cost <= limit + eps then
+        count = count + cost
+        redis.call('HSET', key, 'index', index, 'count', num(count))
+        redis.call('PEXPIRE', key, ttl_ms(reset_time))
+        return {1, tostring(math.max(0, math.floor(limit - count + eps))), '', num(reset_time)}
+    end
+    return {0, '0', num(reset_time - now), num(reset_time)}
+end
+
+local last = tonumber(redis.call('GET', key))
+if last == nil or now - last >= period then
+    redis.call('SET', key, num(now), 'PX', ttl_ms(now + period))
+    return {1, '', '', ''}
+end
+local retry_after = period - (now - last)
+return {0, '', num(retry_after), num(now + retry_after)}
+"""
+
+
+class RedisRateLimitBackend:
+    """
+    Backend keeping rate limit state in Redis, shared by every process using it.
+
+    Checks run in a Lua script, so each one is atomic; a batch is sent as one
+    pipeline. Callers should pass a clock shared by all workers (wall time).
+    """
+
+    def __init__(self, redis_client: Any, key_prefix: str = "ratelimit:"):
+        """
+        Initialize the backend.
+
+        Args:
+            redis_client: redis.asyncio client
+            key_prefix: Prefix for state keys
+        """
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._script = redis_client.register_script(_LUA_ACQUIRE)
+
+    @classmethod
+    def from_url(cls, redis_url: str, key_prefix: str = "ratelimit:") -> "RedisRateLimitBackend":
+        import redis.asyncio as aioredis
+        return cls(aioredis.from_url(redis_url), key_prefix)
+
+    def _redis_key(self, check: LimitCheck) -> str:
+        rule_name, client_id = check.key
+        return f"{self.key_prefix}{check.algorithm.value}:{rule_name}:{client_id}"
+
+    async def acquire(self, checks: Sequence[LimitCheck], now: float) -> List[LimitDecision]:
+        """Apply checks in order in one round trip."""
+        if not checks:
+            return []
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for check in checks:
+            await self._script(
+                keys=[self._redis_key(check)],
+                args=[check.algorithm.value, repr(now), repr(check.period), repr(check.limit), repr(check.cost)],
+                client=pipeline
+            )
+        replies = await pipeline.execute()
+
+        return [
+            LimitDecision(
+                allowed=bool(int(allowed)),
+                remaining=_optional(remaining, int),
+                retry_after=_optional(retry_after, float),
+                reset_time=_optional(reset_time, float)
+            )
+            for allowed, remaining, retry_after, reset_time in replies
+        ]
+
+    def sweep(self, now: float) -> int:
+        # Idle keys expire in Redis
+        return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'backend': 'redis', 'key_prefix': self.key_prefix}
+
+
+def _optional(value: Any, convert) -> Any:
+    if isinstance(value, bytes):
+        value = value.decode()
+    return convert(value) if value != '' else None
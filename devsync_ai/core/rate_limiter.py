@@ -6,13 +6,20 @@ import asyncio
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
-from collections import defaultdict, deque
+from collections import OrderedDict, deque
 
 from ..analytics.performance_monitor import performance_monitor, MetricType
+from .rate_limit_store import (
+    LimitAlgorithm,
+    LimitCheck,
+    LimitDecision,
+    LocalRateLimitBackend,
+    RedisRateLimitBackend,
+)
 
 
 class RateLimitStrategy(Enum):
@@ -47,15 +54,6 @@ class RateLimitRule:
     })
 
 
-@dataclass
-class RateLimitBucket:
-    """Token bucket for rate limiting."""
-    capacity: int
-    tokens: float
-    last_refill: float
-    refill_rate: float  # tokens per second
-
-
 @dataclass
 class RequestContext:
     """Context information for a rate-limited request."""
@@ -83,34 +81,50 @@ class IntelligentRateLimiter:
     Intelligent rate limiter with adaptive throttling and priority queuing.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        backend: Optional[Union[LocalRateLimitBackend, RedisRateLimitBackend]] = None,
+        max_queued_requests: int = 1000,
+        max_tracked_stats: int = 1000,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            backend: Where per-client limit state lives; defaults to an in-process
+                sharded store. Use RedisRateLimitBackend to share limits across workers.
+            max_queued_requests: Throttled requests kept per priority queue
+            max_tracked_stats: Endpoint/client entries kept in the request and
+                adaptive statistics
+            clock: Time source in seconds
+        """
         self.logger = logging.getLogger(__name__)
+        self.clock = clock
         
-        # Rate limiting buckets per client/endpoint
-        self.buckets: Dict[str, RateLimitBucket] = {}
+        # Per rule/client limit state, O(1) per key with idle keys evicted
+        self.backend = backend or LocalRateLimitBackend()
         
-        # Sliding window counters
-        self.sliding_windows: Dict[str, deque] = defaultdict(lambda: deque())
-        
-        # Priority queues for throttled requests
+        # Priority queues for throttled requests, oldest dropped when full
         self.priority_queues: Dict[RequestPriority, deque] = {
-            priority: deque() for priority in RequestPriority
+            priority: deque(maxlen=max_queued_requests) for priority in RequestPriority
         }
         
         # Rate limiting rules
         self.rules: Dict[str, RateLimitRule] = {}
         
-        # Adaptive rate limiting state
-        self.adaptive_state: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        # Adaptive rate limiting state, least recently used dropped first
+        self.max_tracked_stats = max_tracked_stats
+        self.adaptive_state: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         
-        # Request statistics
-        self.request_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+        # Request statistics per endpoint/client, least recently used dropped
+        # first; overall totals are kept separately so eviction doesn't lose them
+        self.request_stats: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.request_totals = {
             "total_requests": 0,
             "allowed_requests": 0,
-            "throttled_requests": 0,
-            "avg_response_time": 0.0,
-            "error_rate": 0.0
-        })
+            "throttled_requests": 0
+        }
         
         # Background task for processing throttled requests
         self._processor_task: Optional[asyncio.Task] = None
@@ -202,17 +216,30 @@ class IntelligentRateLimiter:
         """
         Check if a request should be rate limited.
         """
+        now = self.clock()
         request_ctx = RequestContext(
-            request_id=f"{client_id}_{endpoint}_{int(time.time() * 1000)}",
+            request_id=f"{client_id}_{endpoint}_{int(now * 1000)}",
             client_id=client_id,
             endpoint=endpoint,
             priority=priority,
             team_id=team_id,
+            timestamp=now,
             metadata=metadata or {}
         )
         
+        result = await self._evaluate(request_ctx)
+        
+        # If throttled, add to priority queue
+        if not result.allowed:
+            self.priority_queues[priority].append(request_ctx)
+            self.logger.debug(f"Request {request_ctx.request_id} throttled, added to {priority.name} queue")
+        
+        return result
+    
+    async def _evaluate(self, request_ctx: RequestContext) -> RateLimitResult:
+        """Apply the matching rule to a request and record it, without queueing it."""
         # Find applicable rule
-        rule = self._find_applicable_rule(endpoint)
+        rule = self._find_applicable_rule(request_ctx.endpoint)
         if not rule:
             return RateLimitResult(allowed=True)
         
@@ -229,15 +256,91 @@ class IntelligentRateLimiter:
             result = RateLimitResult(allowed=True)
         
         # Update statistics
-        await self._update_request_stats(request_ctx, result)
-        
-        # If throttled, add to priority queue
-        if not result.allowed:
-            self.priority_queues[priority].append(request_ctx)
-            self.logger.debug(f"Request {request_ctx.request_id} throttled, added to {priority.name} queue")
+        self._count_request(request_ctx, result)
+        await performance_monitor.record_metric(
+            MetricType.THROUGHPUT,
+            1.0,
+            team_id=request_ctx.team_id,
+            metadata={
+                "endpoint": request_ctx.endpoint,
+                "client_id": request_ctx.client_id,
+                "priority": request_ctx.priority.name,
+                "allowed": result.allowed
+            }
+        )
         
         return result
     
+    async def check_many(
+        self,
+        requests: Sequence[Tuple[str, str]],
+        priority: RequestPriority = RequestPriority.NORMAL,
+        team_id: Optional[str] = None
+    ) -> List[RateLimitResult]:
+        """
+        Check a batch of (client_id, endpoint) requests.
+        
+        Requests are checked in order with the same outcome as calling
+        check_rate_limit for each, but the backend is consulted in one round
+        trip, system health is fetched at most once and a single throughput
+        metric is recorded for the batch.
+        """
+        now = self.clock()
+        contexts = [
+            RequestContext(
+                request_id=f"{client_id}_{endpoint}_{int(now * 1000)}",
+                client_id=client_id,
+                endpoint=endpoint,
+                priority=priority,
+                team_id=team_id,
+                timestamp=now
+            )
+            for client_id, endpoint in requests
+        ]
+        rules = [self._find_applicable_rule(ctx.endpoint) for ctx in contexts]
+        
+        system_status = None
+        if any(rule and rule.strategy == RateLimitStrategy.ADAPTIVE for rule in rules):
+            system_status = (await performance_monitor.get_system_health()).status
+        
+        # Requests that need the backend keep their position via pending
+        results: List[Optional[RateLimitResult]] = []
+        checks: List[LimitCheck] = []
+        pending: List[Tuple[int, RateLimitRule]] = []
+        for ctx, rule in zip(contexts, rules):
+            limit = self._limit_check(ctx, rule, rule.strategy, system_status) if rule else RateLimitResult(allowed=True)
+            if isinstance(limit, LimitCheck):
+                pending.append((len(results), rule))
+                checks.append(limit)
+                results.append(None)
+            else:
+                results.append(limit)
+        
+        decisions = await self.backend.acquire(checks, now)
+        for (index, rule), decision in zip(pending, decisions):
+            results[index] = self._to_result(decision, rule.strategy, system_status)
+        
+        for ctx, rule, result in zip(contexts, rules, results):
+            self._count_request(ctx, result)
+            if rule and rule.strategy == RateLimitStrategy.ADAPTIVE:
+                self._record_adaptive(ctx, rule, system_status, result)
+            if not result.allowed:
+                self.priority_queues[priority].append(ctx)
+        
+        if contexts:
+            await performance_monitor.record_metric(
+                MetricType.THROUGHPUT,
+                float(len(contexts)),
+                team_id=team_id,
+                metadata={
+                    "batch_size": len(contexts),
+                    "priority": priority.name,
+                    "allowed": sum(1 for result in results if result.allowed)
+                }
+            )
+        
+        return results
+    
     def _find_applicable_rule(self, endpoint: str) -> Optional[RateLimitRule]:
         """Find the most specific rule that applies to the endpoint."""
         # Direct match first
@@ -252,97 +355,137 @@ class IntelligentRateLimiter:
         # Default rule if no specific match
         return self.rules.get("default")
     
-    async def _check_token_bucket(
+    def _limit_check(
         self,
         request_ctx: RequestContext,
-        rule: RateLimitRule
-    ) -> RateLimitResult:
-        """Check rate limit using token bucket algorithm."""
-        bucket_key = f"{rule.name}_{request_ctx.client_id}"
-        current_time = time.time()
-        
-        # Get or create bucket
-        if bucket_key not in self.buckets:
-            self.buckets[bucket_key] = RateLimitBucket(
-                capacity=rule.burst_capacity,
-                tokens=rule.burst_capacity,
-                last_refill=current_time,
-                refill_rate=rule.requests_per_second
+        rule: RateLimitRule,
+        strategy: RateLimitStrategy,
+        system_status: Optional[str] = None
+    ) -> Union[LimitCheck, RateLimitResult]:
+        """Translate a rule into a backend check, or a result when none is needed."""
+        key = (rule.name, request_ctx.client_id)
+        
+        if strategy == RateLimitStrategy.TOKEN_BUCKET:
+            # GCRA: a bucket of burst_capacity tokens refilled at requests_per_second,
+            # tracked as one theoretical arrival time instead of a token count
+            priority_multiplier = rule.priority_multiplier.get(request_ctx.priority, 1.0)
+            return LimitCheck(
+                LimitAlgorithm.GCRA,
+                key,
+                period=1.0 / rule.requests_per_second,
+                limit=rule.burst_capacity,
+                cost=1.0 / priority_multiplier
             )
         
-        bucket = self.buckets[bucket_key]
-        
-        # Refill tokens based on time elapsed
-        time_elapsed = current_time - bucket.last_refill
-        tokens_to_add = time_elapsed * bucket.refill_rate
-        bucket.tokens = min(bucket.capacity, bucket.tokens + tokens_to_add)
-        bucket.last_refill = current_time
-        
-        # Apply priority multiplier
-        priority_multiplier = rule.priority_multiplier.get(request_ctx.priority, 1.0)
-        tokens_needed = 1.0 / priority_multiplier
-        
-        # Check if request can be allowed
-        if bucket.tokens >= tokens_needed:
-            bucket.tokens -= tokens_needed
-            return RateLimitResult(
-                allowed=True,
-                remaining_quota=int(bucket.tokens),
-                reset_time=current_time + (bucket.capacity - bucket.tokens) / bucket.refill_rate
+        if strategy in (RateLimitStrategy.SLIDING_WINDOW, RateLimitStrategy.FIXED_WINDOW):
+            # Apply priority multiplier to determine effective limit
+            priority_multiplier = rule.priority_multiplier.get(request_ctx.priority, 1.0)
+            effective_limit = int(rule.requests_per_second * rule.window_size_seconds * priority_multiplier)
+            algorithm = (
+                LimitAlgorithm.SLIDING_WINDOW if strategy == RateLimitStrategy.SLIDING_WINDOW
+                else LimitAlgorithm.FIXED_WINDOW
             )
+            return LimitCheck(algorithm, key, period=rule.window_size_seconds, limit=effective_limit)
+        
+        if strategy == RateLimitStrategy.ADAPTIVE:
+            adjusted_rate = self._adaptive_rate(rule, request_ctx.priority, system_status)
+            if adjusted_rate <= 0:
+                return RateLimitResult(
+                    allowed=False,
+                    retry_after=float('inf'),
+                    reason=f"Adaptive rate limit (system: {system_status})"
+                )
+            # Minimum interval between requests
+            return LimitCheck(LimitAlgorithm.MIN_INTERVAL, key, period=1.0 / adjusted_rate)
+        
+        return RateLimitResult(allowed=True)
+    
+    def _adaptive_rate(
+        self,
+        rule: RateLimitRule,
+        priority: RequestPriority,
+        system_status: Optional[str]
+    ) -> float:
+        """Adjust a rule's rate based on system health."""
+        base_rate = rule.requests_per_second
+        
+        if system_status == "critical":
+            return base_rate * 0.2  # Reduce to 20% of normal rate
+        if system_status == "degraded":
+            return base_rate * 0.5  # Reduce to 50% of normal rate
+        
+        # Healthy system - potentially increase rate for high priority requests
+        priority_boost = {
+            RequestPriority.LOW: 0.8,
+            RequestPriority.NORMAL: 1.0,
+            RequestPriority.HIGH: 1.2,
+            RequestPriority.CRITICAL: 1.5
+        }.get(priority, 1.0)
+        
+        return base_rate * priority_boost
+    
+    def _to_result(
+        self,
+        decision: LimitDecision,
+        strategy: RateLimitStrategy,
+        system_status: Optional[str] = None
+    ) -> RateLimitResult:
+        """Convert a backend decision into a RateLimitResult."""
+        if decision.allowed:
+            reason = None
+        elif strategy == RateLimitStrategy.TOKEN_BUCKET:
+            reason = "Token bucket exhausted"
+        elif strategy == RateLimitStrategy.SLIDING_WINDOW:
+            reason = "Sliding window limit exceeded"
+        elif strategy == RateLimitStrategy.FIXED_WINDOW:
+            reason = "Fixed window limit exceeded"
         else:
-            # Calculate retry after time
-            tokens_needed_for_request = tokens_needed - bucket.tokens
-            retry_after = tokens_needed_for_request / bucket.refill_rate
-            
-            return RateLimitResult(
-                allowed=False,
-                retry_after=retry_after,
-                remaining_quota=0,
-                reset_time=current_time + retry_after,
-                reason="Token bucket exhausted"
-            )
+            reason = f"Adaptive rate limit (system: {system_status})"
+        
+        return RateLimitResult(
+            allowed=decision.allowed,
+            retry_after=decision.retry_after,
+            remaining_quota=decision.remaining,
+            reset_time=decision.reset_time,
+            reason=reason
+        )
+    
+    async def _apply_limit(
+        self,
+        request_ctx: RequestContext,
+        rule: RateLimitRule,
+        strategy: RateLimitStrategy,
+        system_status: Optional[str] = None
+    ) -> RateLimitResult:
+        """Check one request against the backend."""
+        limit = self._limit_check(request_ctx, rule, strategy, system_status)
+        if isinstance(limit, RateLimitResult):
+            return limit
+        
+        decision = (await self.backend.acquire([limit], self.clock()))[0]
+        return self._to_result(decision, strategy, system_status)
+    
+    async def _check_token_bucket(
+        self,
+        request_ctx: RequestContext,
+        rule: RateLimitRule
+    ) -> RateLimitResult:
+        """Check rate limit using token bucket algorithm (as GCRA)."""
+        return await self._apply_limit(request_ctx, rule, RateLimitStrategy.TOKEN_BUCKET)
     
     async def _check_sliding_window(
         self,
         request_ctx: RequestContext,
         rule: RateLimitRule
     ) -> RateLimitResult:
-        """Check rate limit using sliding window algorithm."""
-        window_key = f"{rule.name}_{request_ctx.client_id}"
-        current_time = time.time()
-        window_start = current_time - rule.window_size_seconds
-        
-        # Get window for this client/endpoint
-        window = self.sliding_windows[window_key]
-        
-        # Remove old entries
-        while window and window[0] < window_start:
-            window.popleft()
-        
-        # Apply priority multiplier to determine effective limit
-        priority_multiplier = rule.priority_multiplier.get(request_ctx.priority, 1.0)
-        effective_limit = int(rule.requests_per_second * rule.window_size_seconds * priority_multiplier)
-        
-        # Check if within limit
-        if len(window) < effective_limit:
-            window.append(current_time)
-            return RateLimitResult(
-                allowed=True,
-                remaining_quota=effective_limit - len(window),
-                reset_time=window[0] + rule.window_size_seconds if window else current_time
-            )
-        else:
-            # Calculate retry after time (when oldest request will expire)
-            retry_after = window[0] + rule.window_size_seconds - current_time
-            
-            return RateLimitResult(
-                allowed=False,
-                retry_after=max(0, retry_after),
-                remaining_quota=0,
-                reset_time=window[0] + rule.window_size_seconds,
-                reason="Sliding window limit exceeded"
-            )
+        """
+        Check rate limit using a sliding window counter.
+        
+        The previous window's count is weighted by its overlap with the
+        sliding window, so each client needs two counters rather than a
+        timestamp per request.
+        """
+        return await self._apply_limit(request_ctx, rule, RateLimitStrategy.SLIDING_WINDOW)
     
     async def _check_fixed_window(
         self,
@@ -350,36 +493,7 @@ class IntelligentRateLimiter:
         rule: RateLimitRule
     ) -> RateLimitResult:
         """Check rate limit using fixed window algorithm."""
-        current_time = time.time()
-        window_start = int(current_time // rule.window_size_seconds) * rule.window_size_seconds
-        window_key = f"{rule.name}_{request_ctx.client_id}_{window_start}"
-        
-        # Get current window count
-        if window_key not in self.request_stats:
-            self.request_stats[window_key] = {"count": 0}
-        
-        current_count = self.request_stats[window_key]["count"]
-        
-        # Apply priority multiplier
-        priority_multiplier = rule.priority_multiplier.get(request_ctx.priority, 1.0)
-        effective_limit = int(rule.requests_per_second * rule.window_size_seconds * priority_multiplier)
-        
-        if current_count < effective_limit:
-            self.request_stats[window_key]["count"] += 1
-            return RateLimitResult(
-                allowed=True,
-                remaining_quota=effective_limit - current_count - 1,
-                reset_time=window_start + rule.window_size_seconds
-            )
-        else:
-            retry_after = window_start + rule.window_size_seconds - current_time
-            return RateLimitResult(
-                allowed=False,
-                retry_after=retry_after,
-                remaining_quota=0,
-                reset_time=window_start + rule.window_size_seconds,
-                reason="Fixed window limit exceeded"
-            )
+        return await self._apply_limit(request_ctx, rule, RateLimitStrategy.FIXED_WINDOW)
     
     async def _check_adaptive(
         self,
@@ -387,119 +501,64 @@ class IntelligentRateLimiter:
         rule: RateLimitRule
     ) -> RateLimitResult:
         """Check rate limit using adaptive algorithm based on system performance."""
-        adaptive_key = f"{rule.name}_{request_ctx.client_id}"
-        
-        # Get current system performance metrics
         system_health = await performance_monitor.get_system_health()
-        
-        # Adjust rate limit based on system health
-        base_rate = rule.requests_per_second
-        
-        if system_health.status == "critical":
-            adjusted_rate = base_rate * 0.2  # Reduce to 20% of normal rate
-        elif system_health.status == "degraded":
-            adjusted_rate = base_rate * 0.5  # Reduce to 50% of normal rate
-        else:
-            # Healthy system - potentially increase rate for high priority requests
-            priority_boost = {
-                RequestPriority.LOW: 0.8,
-                RequestPriority.NORMAL: 1.0,
-                RequestPriority.HIGH: 1.2,
-                RequestPriority.CRITICAL: 1.5
-            }.get(request_ctx.priority, 1.0)
-            
-            adjusted_rate = base_rate * priority_boost
-        
-        # Store adaptive state
-        if adaptive_key not in self.adaptive_state:
-            self.adaptive_state[adaptive_key] = {
-                "last_request": 0,
-                "current_rate": adjusted_rate
-            }
-        
-        state = self.adaptive_state[adaptive_key]
-        current_time = time.time()
-        
-        # Calculate minimum interval between requests
-        min_interval = 1.0 / adjusted_rate if adjusted_rate > 0 else float('inf')
-        time_since_last = current_time - state["last_request"]
-        
-        if time_since_last >= min_interval:
-            state["last_request"] = current_time
-            state["current_rate"] = adjusted_rate
-            
-            return RateLimitResult(
-                allowed=True,
-                remaining_quota=None,  # Adaptive doesn't have fixed quota
-                reset_time=None
-            )
+        result = await self._apply_limit(request_ctx, rule, RateLimitStrategy.ADAPTIVE, system_health.status)
+        self._record_adaptive(request_ctx, rule, system_health.status, result)
+        return result
+    
+    def _tracked_entry(
+        self,
+        table: "OrderedDict[str, Dict[str, Any]]",
+        key: str,
+        initial: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Get or create a statistics entry, evicting the least recently used."""
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = initial()
+            if len(table) > self.max_tracked_stats:
+                table.popitem(last=False)
         else:
-            retry_after = min_interval - time_since_last
-            return RateLimitResult(
-                allowed=False,
-                retry_after=retry_after,
-                remaining_quota=None,
-                reset_time=current_time + retry_after,
-                reason=f"Adaptive rate limit (system: {system_health.status})"
-            )
+            table.move_to_end(key)
+        return entry
     
-    async def _update_request_stats(self, request_ctx: RequestContext, result: RateLimitResult):
+    def _count_request(self, request_ctx: RequestContext, result: RateLimitResult):
         """Update request statistics for monitoring."""
         stats_key = f"{request_ctx.endpoint}_{request_ctx.client_id}"
-        stats = self.request_stats[stats_key]
-        
-        stats["total_requests"] += 1
-        
-        if result.allowed:
-            stats["allowed_requests"] += 1
-        else:
-            stats["throttled_requests"] += 1
+        stats = self._tracked_entry(self.request_stats, stats_key, lambda: {
+            "total_requests": 0,
+            "allowed_requests": 0,
+            "throttled_requests": 0,
+            "avg_response_time": 0.0,
+            "error_rate": 0.0
+        })
         
-        # Record metrics
-        await performance_monitor.record_metric(
-            MetricType.THROUGHPUT,
-            1.0,
-            team_id=request_ctx.team_id,
-            metadata={
-                "endpoint": request_ctx.endpoint,
-                "client_id": request_ctx.client_id,
-                "priority": request_ctx.priority.name,
-                "allowed": result.allowed
-            }
+        outcome = "allowed_requests" if result.allowed else "throttled_requests"
+        for counters in (stats, self.request_totals):
+            counters["total_requests"] += 1
+            counters[outcome] += 1
+    
+    def _record_adaptive(
+        self,
+        request_ctx: RequestContext,
+        rule: RateLimitRule,
+        system_status: Optional[str],
+        result: RateLimitResult
+    ):
+        """Remember the adjusted rate and last allowed request per rule/client."""
+        if not result.allowed:
+            return
+        state = self._tracked_entry(
+            self.adaptive_state, f"{rule.name}_{request_ctx.client_id}", dict
         )
+        state["last_request"] = self.clock()
+        state["current_rate"] = self._adaptive_rate(rule, request_ctx.priority, system_status)
     
     async def _process_throttled_requests(self):
         """Background task to process throttled requests when capacity becomes available."""
         try:
             while True:
-                # Process requests by priority (highest first)
-                for priority in sorted(RequestPriority, key=lambda p: p.value, reverse=True):
-                    queue = self.priority_queues[priority]
-                    
-                    # Process up to 10 requests per iteration
-                    processed = 0
-                    while queue and processed < 10:
-                        request_ctx = queue.popleft()
-                        
-                        # Re-check rate limit
-                        result = await self.check_rate_limit(
-                            request_ctx.client_id,
-                            request_ctx.endpoint,
-                            request_ctx.priority,
-                            request_ctx.team_id,
-                            request_ctx.metadata
-                        )
-                        
-                        if result.allowed:
-                            # Request can now proceed - notify waiting coroutine
-                            self.logger.debug(f"Throttled request {request_ctx.request_id} now allowed")
-                        else:
-                            # Still throttled - put back in queue
-                            queue.appendleft(request_ctx)
-                            break
-                        
-                        processed += 1
-                
+                await self._process_throttled_once()
                 await asyncio.sleep(1)  # Check every second
                 
         except asyncio.CancelledError:
@@ -509,11 +568,37 @@ class IntelligentRateLimiter:
             self.logger.error(f"Error in throttled request processor: {e}")
             await asyncio.sleep(5)
     
+    async def _process_throttled_once(self):
+        """Re-check queued requests once, highest priority first."""
+        for priority in sorted(RequestPriority, key=lambda p: p.value, reverse=True):
+            queue = self.priority_queues[priority]
+            
+            # Process up to 10 requests per iteration
+            processed = 0
+            while queue and processed < 10:
+                request_ctx = queue.popleft()
+                
+                # Re-check without queueing a second copy
+                result = await self._evaluate(request_ctx)
+                
+                if result.allowed:
+                    # Request can now proceed - notify waiting coroutine
+                    self.logger.debug(f"Throttled request {request_ctx.request_id} now allowed")
+                else:
+                    # Still throttled - keep its place at the front
+                    queue.appendleft(request_ctx)
+                    break
+                
+                processed += 1
+        
+        # Drop idle limit state one shard at a time
+        self.backend.sweep(self.clock())
+    
     def get_rate_limit_stats(self) -> Dict[str, Any]:
         """Get comprehensive rate limiting statistics."""
-        total_requests = sum(stats["total_requests"] for stats in self.request_stats.values())
-        total_allowed = sum(stats["allowed_requests"] for stats in self.request_stats.values())
-        total_throttled = sum(stats["throttled_requests"] for stats in self.request_stats.values())
+        total_requests = self.request_totals["total_requests"]
+        total_allowed = self.request_totals["allowed_requests"]
+        total_throttled = self.request_totals["throttled_requests"]
         
         throttle_rate = (total_throttled / total_requests * 100) if total_requests > 0 else 0
         
@@ -522,15 +607,6 @@ class IntelligentRateLimiter:
         for priority, queue in self.priority_queues.items():
             queue_stats[priority.name] = len(queue)
         
-        # Bucket statistics
-        bucket_stats = {}
-        for bucket_key, bucket in self.buckets.items():
-            bucket_stats[bucket_key] = {
-                "tokens": round(bucket.tokens, 2),
-                "capacity": bucket.capacity,
-                "utilization_percent": round((1 - bucket.tokens / bucket.capacity) * 100, 2)
-            }
-        
         return {
             "overall": {
                 "total_requests": total_requests,
@@ -539,7 +615,7 @@ class IntelligentRateLimiter:
                 "throttle_rate_percent": round(throttle_rate, 2)
             },
             "queues": queue_stats,
-            "buckets": bucket_stats,
+            "buckets": self.backend.get_stats(),
             "rules": {
                 name: {
                     "requests_per_second": rule.requests_per_second,
@@ -551,7 +627,7 @@ class IntelligentRateLimiter:
             "adaptive_state": {
                 key: {
                     "current_rate": round(state.get("current_rate", 0), 2),
-                    "last_request_ago": round(time.time() - state.get("last_request", 0), 2)
+                    "last_request_ago": round(self.clock() - state.get("last_request", 0), 2)
                 }
                 for key, state in self.adaptive_state.items()
             }
@@ -2,11 +2,14 @@
 
 import re
 import html
-from typing import Dict, List, Any, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Any, Match, Optional, Pattern, Tuple, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import hashlib
 
+from .local_cache import LocalCache
+
 
 class ContentType(Enum):
     """Types of detected content."""
@@ -34,6 +37,8 @@ class ProcessingConfig:
     sanitize_html: bool = True
     preserve_formatting: bool = True
     show_more_threshold: int = 300
+    cache_size: int = 256  # Processed texts kept in the LRU cache, 0 disables it
+    cache_max_bytes: int = 16 * 1024 * 1024
 
 
 @dataclass
@@ -58,6 +63,51 @@ class ProcessingResult:
     processing_time_ms: float = 0.0
 
 
+# Alternatives of the single-pass scanner, in priority order: (feature enabling
+# it, name, class of its first character, pattern for the rest). The combined
+# pattern starts with the union of the first-character classes so the regex
+# engine can skip ahead to candidate positions; each alternative then checks
+# its own first character with a lookbehind. The name selects the handler in
+# TextProcessor._render.
+_SCANNER_RULES: List[Tuple[str, str, str, str]] = [
+    ('markdown', 'code_block', '`', r'``(?P<code_block_language>\w+)?\n?(?P<code_block_code>(?s:.*?))```'),
+    ('markdown', 'inline_code', '`', r'[^`]+`'),
+    ('markdown', 'bullet', r'\n', r'\s*[-*+]\s+(?=.)'),
+    ('markdown', 'bold', r'\*', r'\*(?P<bold_text>.*?)\*\*'),
+    ('markdown', 'italic', r'\*', r'(?<!\*\*)(?P<italic_text>[^*\n]+?)\*(?!\*)'),
+    ('markdown', 'link', r'\[', r'(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)'),
+    ('github', 'github_pr', 'Pp', r'(?i:r|ull request)\s*#(?P<github_pr_number>\d+)'),
+    ('github', 'github_issue', '#', r'(?P<github_issue_number>\d+)(?!\d)'),
+    ('jira', 'jira_ticket', 'A-Z', r'(?<!\w[A-Z])[A-Z0-9]+-\d+\b'),
+    ('github', 'commit_hash', '0-9a-fA-F', r'(?<!\w[0-9a-fA-F])[0-9a-fA-F]{6,39}\b'),
+    ('linking', 'user_mention', '@', r'(?P<user_mention_name>[a-zA-Z0-9._-]+)'),
+    ('linking', 'url', 'h', r'ttps?://[^\s<>"{}|\\^`\[\]]+'),
+]
+
+# The first-line case of the bullet rule, which otherwise starts at a newline
+_LEADING_BULLET = re.compile(r'\s*[-*+]\s+(?=.)')
+
+_DETECTION_ORDER = {
+    content_type: index for index, content_type in enumerate([
+        ContentType.GITHUB_ISSUE,
+        ContentType.GITHUB_PR,
+        ContentType.JIRA_TICKET,
+        ContentType.COMMIT_HASH,
+        ContentType.USER_MENTION,
+        ContentType.URL
+    ])
+}
+
+
+@lru_cache(maxsize=None)
+def _scanner_pattern(features: Tuple[str, ...]) -> Pattern[str]:
+    """Compile the scanner alternation for a set of enabled features."""
+    rules = [rule for rule in _SCANNER_RULES if rule[0] in features]
+    first_characters = ''.join(dict.fromkeys(first for _, _, first, _ in rules))
+    alternatives = '|'.join(f'(?<=[{first}])(?P<{name}>{rest})' for _, name, first, rest in rules)
+    return re.compile(f'[{first_characters}](?:{alternatives})')
+
+
 class TextProcessor:
     """Advanced text processor for Slack message formatting."""
     
@@ -118,6 +168,11 @@ class TextProcessor:
         self._compiled_patterns = {
             name: pattern for name, pattern in self.PATTERNS.items()
         }
+        
+        # LRU cache of processing results keyed on config and text hash
+        self._cache: Optional[LocalCache] = None
+        if self.config.cache_size > 0:
+            self._cache = LocalCache(max_entries=self.config.cache_size, max_bytes=self.config.cache_max_bytes)
     
     def process_text(self, text: str, context: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """Process text with all enhancements."""
@@ -127,24 +182,36 @@ class TextProcessor:
         import time
         start_time = time.time()
         
+        # Repeated texts (e.g. the same PR body in several notifications) are served from cache
+        cache_key = None
+        if self._cache is not None:
+            cache_key = (
+                tuple(vars(self.config).values()),
+                hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return replace(
+                    cached,
+                    detected_content=list(cached.detected_content),
+                    processing_time_ms=(time.time() - start_time) * 1000
+                )
+        
         original_text = text
         processed_text = text
-        detected_content = []
         
         # Step 1: Sanitize HTML if enabled
         if self.config.sanitize_html:
             processed_text = html.escape(processed_text)
         
-        # Step 2: Detect and process content
-        if self.config.enable_auto_linking:
-            processed_text, content_detections = self._detect_and_link_content(processed_text, context)
-            detected_content.extend(content_detections)
-        
-        # Step 3: Convert markdown to Slack formatting
-        if self.config.enable_markdown_conversion:
-            processed_text = self._convert_markdown_to_slack(processed_text)
+        # Step 2: Detect and link content and convert markdown in one pass
+        processed_text, detected_content = self._scan(
+            processed_text,
+            linking=self.config.enable_auto_linking,
+            markdown=self.config.enable_markdown_conversion
+        )
         
-        # Step 4: Handle truncation
+        # Step 3: Handle truncation
         truncated = False
         show_more_available = False
         if len(processed_text) > self.config.max_length:
@@ -152,11 +219,11 @@ class TextProcessor:
                 processed_text, self.config.max_length
             )
         
-        # Step 5: Calculate metrics
+        # Step 4: Calculate metrics
         word_count = len(processed_text.split())
         processing_time = (time.time() - start_time) * 1000
         
-        return ProcessingResult(
+        result = ProcessingResult(
             processed_text=processed_text,
             original_text=original_text,
             detected_content=detected_content,
@@ -165,155 +232,207 @@ class TextProcessor:
             word_count=word_count,
             processing_time_ms=processing_time
         )
+        
+        if cache_key is not None:
+            self._cache.put(
+                cache_key,
+                replace(result, detected_content=list(detected_content)),
+                size_bytes=2 * (len(original_text) + len(processed_text))
+            )
+        
+        return result
     
     def _detect_and_link_content(self, text: str, context: Optional[Dict[str, Any]] = None) -> Tuple[str, List[DetectedContent]]:
         """Detect and auto-link various content types."""
-        detected_content = []
-        processed_text = text
-        
-        # GitHub issues and PRs
-        if self.config.github_repo:
-            processed_text, github_detections = self._process_github_references(processed_text)
-            detected_content.extend(github_detections)
-        
-        # JIRA tickets
-        if self.config.jira_base_url:
-            processed_text, jira_detections = self._process_jira_tickets(processed_text)
-            detected_content.extend(jira_detections)
-        
-        # Commit hashes
-        if self.config.github_repo:
-            processed_text, commit_detections = self._process_commit_hashes(processed_text)
-            detected_content.extend(commit_detections)
-        
-        # User mentions
-        processed_text, mention_detections = self._process_user_mentions(processed_text)
-        detected_content.extend(mention_detections)
-        
-        # URLs (process last to avoid conflicts)
-        processed_text, url_detections = self._process_urls(processed_text)
-        detected_content.extend(url_detections)
-        
-        return processed_text, detected_content
+        return self._scan(text, linking=True, markdown=False)
     
-    def _process_github_references(self, text: str) -> Tuple[str, List[DetectedContent]]:
-        """Process GitHub issue and PR references."""
-        detected_content = []
-        
-        # GitHub issues (#123)
-        def replace_issue(match):
-            issue_num = match.group(1)
-            url = f"https://github.com/{self.config.github_repo}/issues/{issue_num}"
-            link_text = f"<{url}|#{issue_num}>"
-            
-            detected_content.append(DetectedContent(
-                content_type=ContentType.GITHUB_ISSUE,
-                original_text=match.group(0),
-                replacement_text=link_text,
-                url=url,
-                metadata={'issue_number': issue_num}
-            ))
-            return link_text
-        
-        text = self.PATTERNS['github_issue'].sub(replace_issue, text)
-        
-        # GitHub PRs (PR #456)
-        def replace_pr(match):
-            pr_num = match.group(1)
-            url = f"https://github.com/{self.config.github_repo}/pull/{pr_num}"
-            link_text = f"<{url}|PR #{pr_num}>"
-            
-            detected_content.append(DetectedContent(
-                content_type=ContentType.GITHUB_PR,
-                original_text=match.group(0),
-                replacement_text=link_text,
-                url=url,
-                metadata={'pr_number': pr_num}
-            ))
-            return link_text
-        
-        text = self.PATTERNS['github_pr'].sub(replace_pr, text)
-        
-        return text, detected_content
+    def _convert_markdown_to_slack(self, text: str) -> str:
+        """Convert markdown formatting to Slack formatting."""
+        processed_text, _ = self._scan(text, linking=False, markdown=True)
+        return processed_text
     
-    def _process_jira_tickets(self, text: str) -> Tuple[str, List[DetectedContent]]:
-        """Process JIRA ticket references."""
-        detected_content = []
-        
-        def replace_jira(match):
-            ticket_key = match.group(1)
-            url = f"{self.config.jira_base_url}/browse/{ticket_key}"
-            link_text = f"<{url}|{ticket_key}>"
+    def _scan(self, text: str, linking: bool, markdown: bool) -> Tuple[str, List[DetectedContent]]:
+        """
+        Link references and convert markdown in a single left-to-right pass.
+        
+        All enabled patterns are combined into one alternation; the leftmost
+        match wins, and on ties the earlier alternative in ``_SCANNER_RULES``. Each span of text is therefore linked at most once,
+        and code spans and blocks are left untouched.
+        """
+        features = tuple(
+            name for name, enabled in (
+                ('markdown', markdown),
+                ('github', linking and bool(self.config.github_repo)),
+                ('jira', linking and bool(self.config.jira_base_url)),
+                ('linking', linking)
+            ) if enabled
+        )
+        if not features:
+            return text, []
+        
+        parts: List[str] = []
+        detected_content: List[DetectedContent] = []
+        start = 0
+        if markdown:
+            leading_bullet = _LEADING_BULLET.match(text)
+            if leading_bullet:
+                parts.append("• ")
+                start = leading_bullet.end()
+        self._render(_scanner_pattern(features), text, start, len(text), parts, detected_content, in_bold=False)
+        
+        # Report detections grouped by type, in text order within each type
+        detected_content.sort(key=lambda item: _DETECTION_ORDER[item.content_type])
+        return ''.join(parts), detected_content
+    
+    def _render(self, 
+                pattern: Pattern[str], 
+                text: str, 
+                start: int, 
+                end: int, 
+                parts: List[str], 
+                detected_content: List[DetectedContent], 
+                in_bold: bool) -> None:
+        """Append the processed form of ``text[start:end]`` to ``parts``."""
+        position = start
+        for match in pattern.finditer(text, start, end):
+            kind = match.lastgroup
+            parts.append(text[position:match.start()])
+            position = match.end()
             
-            detected_content.append(DetectedContent(
-                content_type=ContentType.JIRA_TICKET,
-                original_text=match.group(0),
-                replacement_text=link_text,
-                url=url,
-                metadata={'ticket_key': ticket_key}
-            ))
-            return link_text
-        
-        text = self.PATTERNS['jira_ticket'].sub(replace_jira, text)
-        return text, detected_content
+            if kind == 'code_block':
+                parts.append(self._format_code_block(match.group('code_block_language'), match.group('code_block_code')))
+            elif kind == 'inline_code':
+                parts.append(match.group(0))
+            elif kind == 'bullet':
+                parts.append("\n• ")
+            elif kind in ('bold', 'italic'):
+                # Bold text keeps nested single asterisks as they are
+                marker = "*" if kind == 'bold' or in_bold else "_"
+                parts.append(marker)
+                self._render(pattern, text, match.start(kind + '_text'), match.end(kind + '_text'),
+                             parts, detected_content, in_bold=True if kind == 'bold' else in_bold)
+                parts.append(marker)
+            elif kind == 'link':
+                parts.append(self._link_markdown(match, detected_content))
+            else:
+                parts.append(getattr(self, f'_link_{kind}')(match, detected_content))
+        parts.append(text[position:end])
     
-    def _process_commit_hashes(self, text: str) -> Tuple[str, List[DetectedContent]]:
-        """Process commit hash references."""
-        detected_content = []
-        
-        def replace_commit(match):
-            commit_hash = match.group(1)
-            # Only process if it looks like a real commit hash (7+ chars, hex)
-            if len(commit_hash) >= 7 and all(c in '0123456789abcdefABCDEF' for c in commit_hash):
-                url = f"https://github.com/{self.config.github_repo}/commit/{commit_hash}"
-                short_hash = commit_hash[:7]
-                link_text = f"<{url}|{short_hash}>"
-                
-                detected_content.append(DetectedContent(
-                    content_type=ContentType.COMMIT_HASH,
-                    original_text=match.group(0),
-                    replacement_text=link_text,
-                    url=url,
-                    metadata={'commit_hash': commit_hash, 'short_hash': short_hash}
-                ))
-                return link_text
-            return match.group(0)
-        
-        text = self.PATTERNS['commit_hash'].sub(replace_commit, text)
-        return text, detected_content
+    def _format_code_block(self, language: Optional[str], code: str) -> str:
+        """Format a fenced code block, detecting its language if not specified."""
+        language = language or ""
+        code = code.strip()
+        
+        # Detect language if not specified
+        if not language:
+            language = self._detect_code_language(code)
+        
+        # Format as Slack code block
+        if language:
+            return f"```{language}\n{code}\n```"
+        else:
+            return f"```\n{code}\n```"
     
-    def _process_user_mentions(self, text: str) -> Tuple[str, List[DetectedContent]]:
-        """Process user mentions."""
-        detected_content = []
-        
-        def replace_mention(match):
-            username = match.group(1)
-            slack_mention = f"<@{username}>"
-            
-            detected_content.append(DetectedContent(
-                content_type=ContentType.USER_MENTION,
-                original_text=match.group(0),
-                replacement_text=slack_mention,
-                metadata={'username': username}
-            ))
-            return slack_mention
-        
-        text = self.PATTERNS['user_mention'].sub(replace_mention, text)
-        return text, detected_content
+    def _link_github_pr(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Link a GitHub PR reference (PR #456)."""
+        pr_num = match.group('github_pr_number')
+        url = f"https://github.com/{self.config.github_repo}/pull/{pr_num}"
+        link_text = f"<{url}|PR #{pr_num}>"
+        
+        detected_content.append(DetectedContent(
+            content_type=ContentType.GITHUB_PR,
+            original_text=match.group(0),
+            replacement_text=link_text,
+            url=url,
+            metadata={'pr_number': pr_num}
+        ))
+        return link_text
     
-    def _process_urls(self, text: str) -> Tuple[str, List[DetectedContent]]:
-        """Process URL references."""
-        detected_content = []
-        
-        def replace_url(match):
-            url = match.group(0)
-            # Create a display name from the URL
-            display_name = url.replace('https://', '').replace('http://', '')
-            if len(display_name) > 50:
-                display_name = display_name[:47] + "..."
-            
-            link_text = f"<{url}|{display_name}>"
-            
+    def _link_github_issue(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Link a GitHub issue reference (#123)."""
+        issue_num = match.group('github_issue_number')
+        url = f"https://github.com/{self.config.github_repo}/issues/{issue_num}"
+        link_text = f"<{url}|#{issue_num}>"
+        
+        detected_content.append(DetectedContent(
+            content_type=ContentType.GITHUB_ISSUE,
+            original_text=match.group(0),
+            replacement_text=link_text,
+            url=url,
+            metadata={'issue_number': issue_num}
+        ))
+        return link_text
+    
+    def _link_jira_ticket(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Link a JIRA ticket key."""
+        ticket_key = match.group(0)
+        url = f"{self.config.jira_base_url}/browse/{ticket_key}"
+        link_text = f"<{url}|{ticket_key}>"
+        
+        detected_content.append(DetectedContent(
+            content_type=ContentType.JIRA_TICKET,
+            original_text=match.group(0),
+            replacement_text=link_text,
+            url=url,
+            metadata={'ticket_key': ticket_key}
+        ))
+        return link_text
+    
+    def _link_commit_hash(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Link a commit hash (7-40 hex characters)."""
+        commit_hash = match.group(0)
+        url = f"https://github.com/{self.config.github_repo}/commit/{commit_hash}"
+        short_hash = commit_hash[:7]
+        link_text = f"<{url}|{short_hash}>"
+        
+        detected_content.append(DetectedContent(
+            content_type=ContentType.COMMIT_HASH,
+            original_text=match.group(0),
+            replacement_text=link_text,
+            url=url,
+            metadata={'commit_hash': commit_hash, 'short_hash': short_hash}
+        ))
+        return link_text
+    
+    def _link_user_mention(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Convert a user mention to a Slack mention."""
+        username = match.group('user_mention_name')
+        slack_mention = f"<@{username}>"
+        
+        detected_content.append(DetectedContent(
+            content_type=ContentType.USER_MENTION,
+            original_text=match.group(0),
+            replacement_text=slack_mention,
+            metadata={'username': username}
+        ))
+        return slack_mention
+    
+    def _link_url(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Link a bare URL with a shortened display name."""
+        url = match.group(0)
+        # Create a display name from the URL
+        display_name = url.replace('https://', '').replace('http://', '')
+        if len(display_name) > 50:
+            display_name = display_name[:47] + "..."
+        
+        link_text = f"<{url}|{display_name}>"
+        
+        detected_content.append(DetectedContent(
+            content_type=ContentType.URL,
+            original_text=match.group(0),
+            replacement_text=link_text,
+            url=url,
+            metadata={'display_name': display_name}
+        ))
+        return link_text
+    
+    def _link_markdown(self, match: Match[str], detected_content: List[DetectedContent]) -> str:
+        """Convert a markdown link to a Slack link."""
+        url = match.group('link_url')
+        display_name = match.group('link_text')
+        link_text = f"<{url}|{display_name}>"
+        
+        if self.config.enable_auto_linking:
             detected_content.append(DetectedContent(
                 content_type=ContentType.URL,
                 original_text=match.group(0),
@@ -321,71 +440,7 @@ class TextProcessor:
                 url=url,
                 metadata={'display_name': display_name}
             ))
-            return link_text
-        
-        text = self.PATTERNS['url'].sub(replace_url, text)
-        return text, detected_content
-    
-    def _convert_markdown_to_slack(self, text: str) -> str:
-        """Convert markdown formatting to Slack formatting."""
-        
-        # Code blocks (must be processed first)
-        def replace_code_block(match):
-            language = match.group(1) or ""
-            code = match.group(2).strip()
-            
-            # Detect language if not specified
-            if not language:
-                language = self._detect_code_language(code)
-            
-            # Format as Slack code block
-            if language:
-                return f"```{language}\n{code}\n```"
-            else:
-                return f"```\n{code}\n```"
-        
-        text = self.PATTERNS['code_block'].sub(replace_code_block, text)
-        
-        # Inline code
-        text = self.PATTERNS['code'].sub(r'`\1`', text)
-        
-        # Process bold and italic with temporary placeholders to avoid conflicts
-        # First, replace bold with a placeholder
-        bold_placeholder = "___BOLD_PLACEHOLDER___"
-        bold_matches = []
-        
-        def replace_bold(match):
-            bold_matches.append(match.group(1))
-            return f"{bold_placeholder}{len(bold_matches)-1}{bold_placeholder}"
-        
-        text = self.PATTERNS['bold'].sub(replace_bold, text)
-        
-        # Then process italic
-        text = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'_\1_', text)
-        
-        # Finally, restore bold formatting
-        for i, bold_text in enumerate(bold_matches):
-            text = text.replace(f"{bold_placeholder}{i}{bold_placeholder}", f"*{bold_text}*")
-        
-        # Links
-        text = self.PATTERNS['link'].sub(r'<\2|\1>', text)
-        
-        # Process lists
-        text = self._convert_lists_to_slack(text)
-        
-        return text
-    
-    def _convert_lists_to_slack(self, text: str) -> str:
-        """Convert markdown lists to Slack-friendly format."""
-        
-        # Bullet lists
-        def replace_bullet(match):
-            return f"• {match.group(1)}"
-        
-        text = self.PATTERNS['bullet_list'].sub(replace_bullet, text)
-        
-        # Numbered lists (keep as is, Slack handles them well)
-        return text
+        return link_text
     
     def _detect_code_language(self, code: str) -> str:
         """Detect programming language from code content."""
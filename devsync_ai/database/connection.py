@@ -3,20 +3,206 @@ Full-featured Supabase database connection using HTTP API.
 
 This module provides a complete Supabase client implementation using direct HTTP requests
 to the PostgREST API, avoiding dependency issues with the official Supabase Python client.
+
+Code that needs direct SQL (query optimizer, capacity planner, benchmarks) uses
+``get_database_connection``, which hands out connections from a managed asyncpg
+pool when ``DATABASE_URL`` points at Postgres. Everything else keeps using the
+PostgREST ``SupabaseClient``.
 """
 
 import os
+import time
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
 import httpx
 
+try:
+    import asyncpg
+except ImportError:  # Optional: only needed for direct SQL access
+    asyncpg = None
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PoolConfig:
+    """Connection pool settings for the shared PostgREST HTTP client."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """Build pool settings from SUPABASE_POOL_* environment variables."""
+        defaults = cls()
+        return cls(
+            max_connections=int(
+                os.getenv("SUPABASE_POOL_MAX_CONNECTIONS", defaults.max_connections)
+            ),
+            max_keepalive_connections=int(
+                os.getenv("SUPABASE_POOL_MAX_KEEPALIVE", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry=float(
+                os.getenv("SUPABASE_POOL_KEEPALIVE_EXPIRY", defaults.keepalive_expiry)
+            ),
+            timeout=float(os.getenv("SUPABASE_POOL_TIMEOUT", defaults.timeout)),
+            http2=os.getenv("SUPABASE_POOL_HTTP2", "true").lower() in ("1", "true", "yes"),
+        )
+
+
+@dataclass
+class OperationStats:
+    """Latency statistics for a single client operation."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    def record(self, elapsed_ms: float, failed: bool) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if failed:
+            self.errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "last_ms": round(self.last_ms, 3),
+        }
+
+
+@dataclass
+class PostgresPoolConfig:
+    """Settings for the asyncpg pool behind ``get_database_connection``."""
+
+    dsn: Optional[str] = None
+    min_size: int = 2
+    max_size: int = 10
+    statement_cache_size: int = 256
+    max_cached_statement_lifetime: float = 300.0
+    max_inactive_connection_lifetime: float = 300.0
+    command_timeout: float = 30.0
+    acquire_timeout: float = 10.0
+    drain_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> "PostgresPoolConfig":
+        """Build pool settings from DATABASE_URL and DATABASE_POOL_* environment variables.
+
+        Only ``postgres://``/``postgresql://`` URLs enable the pool; any other
+        DATABASE_URL (e.g. SQLite) leaves ``dsn`` unset.
+        """
+        defaults = cls()
+        dsn = os.getenv("DATABASE_URL")
+        if dsn and not dsn.startswith(("postgres://", "postgresql://")):
+            dsn = None
+
+        return cls(
+            dsn=dsn,
+            min_size=int(os.getenv("DATABASE_POOL_MIN_SIZE", defaults.min_size)),
+            max_size=int(os.getenv("DATABASE_POOL_MAX_SIZE", defaults.max_size)),
+            statement_cache_size=int(
+                os.getenv("DATABASE_POOL_STATEMENT_CACHE_SIZE", defaults.statement_cache_size)
+            ),
+            max_cached_statement_lifetime=float(
+                os.getenv(
+                    "DATABASE_POOL_STATEMENT_LIFETIME", defaults.max_cached_statement_lifetime
+                )
+            ),
+            max_inactive_connection_lifetime=float(
+                os.getenv(
+                    "DATABASE_POOL_MAX_INACTIVE_LIFETIME",
+                    defaults.max_inactive_connection_lifetime,
+                )
+            ),
+            command_timeout=float(
+                os.getenv("DATABASE_POOL_COMMAND_TIMEOUT", defaults.command_timeout)
+            ),
+            acquire_timeout=float(
+                os.getenv("DATABASE_POOL_ACQUIRE_TIMEOUT", defaults.acquire_timeout)
+            ),
+            drain_timeout=float(os.getenv("DATABASE_POOL_DRAIN_TIMEOUT", defaults.drain_timeout)),
+        )
+
+
+@dataclass
+class PoolStats:
+    """Acquire and health statistics for the asyncpg pool."""
+
+    acquisitions: int = 0
+    acquire_timeouts: int = 0
+    acquire_errors: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    in_use: int = 0
+    max_in_use: int = 0
+    health_checks: int = 0
+    health_check_failures: int = 0
+    last_health_check_ok: Optional[bool] = None
+
+    @property
+    def avg_wait_ms(self) -> float:
+        return self.total_wait_ms / self.acquisitions if self.acquisitions else 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "acquisitions": self.acquisitions,
+            "acquire_timeouts": self.acquire_timeouts,
+            "acquire_errors": self.acquire_errors,
+            "avg_wait_ms": round(self.avg_wait_ms, 3),
+            "max_wait_ms": round(self.max_wait_ms, 3),
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "health_checks": self.health_checks,
+            "health_check_failures": self.health_check_failures,
+            "last_health_check_ok": self.last_health_check_ok,
+        }
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx needs the optional ``h2`` package."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class SupabaseClient:
-    """Full-featured Supabase client using direct HTTP requests with PostgREST API."""
+    """Full-featured Supabase client using direct HTTP requests with PostgREST API.
+
+    All requests share one long-lived ``httpx.AsyncClient`` so keep-alive
+    connections are reused across calls instead of paying TCP/TLS setup on
+    every round trip. Call :meth:`close` (or :func:`close_database`) on
+    shutdown to release the pool.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_config: Optional[PoolConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.base_url = os.getenv("SUPABASE_URL")
         self.api_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
@@ -30,25 +216,81 @@ class SupabaseClient:
             "Prefer": "return=representation",
         }
 
+        self.pool_config = pool_config or PoolConfig.from_env()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self._stats: Dict[str, OperationStats] = {}
+
+    async def connect(self) -> httpx.AsyncClient:
+        """Create the shared HTTP client if it does not exist yet."""
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+
+        async with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                config = self.pool_config
+                http2 = config.http2 and _http2_available()
+                if config.http2 and not http2:
+                    logger.warning("h2 package not installed, falling back to HTTP/1.1")
+
+                self._client = httpx.AsyncClient(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=config.max_connections,
+                        max_keepalive_connections=config.max_keepalive_connections,
+                        keepalive_expiry=config.keepalive_expiry,
+                    ),
+                    timeout=config.timeout,
+                    transport=self._transport,
+                )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, operation: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared client and record its latency."""
+        client = await self.connect()
+        start = time.perf_counter()
+        failed = True
+        try:
+            response = await client.request(method, url, **kwargs)
+            failed = response.status_code >= 400
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._stats.setdefault(operation, OperationStats()).record(elapsed_ms, failed)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-operation call counts and latency (milliseconds)."""
+        return {operation: stats.to_dict() for operation, stats in self._stats.items()}
+
+    def reset_metrics(self) -> None:
+        """Clear collected latency statistics."""
+        self._stats.clear()
+
     async def insert(
         self, table: str, data: Union[Dict[str, Any], List[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """Insert data into a table."""
         url = f"{self.base_url}/rest/v1/{table}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=self.headers, json=data, timeout=30.0)
+        try:
+            response = await self._request("insert", "POST", url, headers=self.headers, json=data)
 
-                if response.status_code in [200, 201]:
-                    return response.json()
-                else:
-                    logger.error(f"Insert failed: {response.status_code} - {response.text}")
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            if response.status_code in [200, 201]:
+                return response.json()
+            else:
+                logger.error(f"Insert failed: {response.status_code} - {response.text}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            except Exception as e:
-                logger.error(f"Insert error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Insert error: {e}")
+            raise
 
     async def select(
         self,
@@ -114,19 +356,18 @@ class SupabaseClient:
         if range_start is not None and range_end is not None:
             headers["Range"] = f"{range_start}-{range_end}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers, params=params, timeout=30.0)
+        try:
+            response = await self._request("select", "GET", url, headers=headers, params=params)
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Select failed: {response.status_code} - {response.text}")
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Select failed: {response.status_code} - {response.text}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            except Exception as e:
-                logger.error(f"Select error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Select error: {e}")
+            raise
 
     async def update(
         self, table: str, data: Dict[str, Any], filters: Dict[str, Any]
@@ -142,21 +383,20 @@ class SupabaseClient:
             else:
                 params[key] = f"eq.{value}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.patch(
-                    url, headers=self.headers, params=params, json=data, timeout=30.0
-                )
+        try:
+            response = await self._request(
+                "update", "PATCH", url, headers=self.headers, params=params, json=data
+            )
 
-                if response.status_code in [200, 204]:
-                    return response.json() if response.content else []
-                else:
-                    logger.error(f"Update failed: {response.status_code} - {response.text}")
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            if response.status_code in [200, 204]:
+                return response.json() if response.content else []
+            else:
+                logger.error(f"Update failed: {response.status_code} - {response.text}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            except Exception as e:
-                logger.error(f"Update error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Update error: {e}")
+            raise
 
     async def delete(self, table: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Delete data from a table."""
@@ -170,21 +410,20 @@ class SupabaseClient:
             else:
                 params[key] = f"eq.{value}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.delete(
-                    url, headers=self.headers, params=params, timeout=30.0
-                )
+        try:
+            response = await self._request(
+                "delete", "DELETE", url, headers=self.headers, params=params
+            )
 
-                if response.status_code in [200, 204]:
-                    return response.json() if response.content else []
-                else:
-                    logger.error(f"Delete failed: {response.status_code} - {response.text}")
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            if response.status_code in [200, 204]:
+                return response.json() if response.content else []
+            else:
+                logger.error(f"Delete failed: {response.status_code} - {response.text}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            except Exception as e:
-                logger.error(f"Delete error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Delete error: {e}")
+            raise
 
     async def upsert(
         self, table: str, data: Union[Dict[str, Any], List[Dict[str, Any]]], on_conflict: str = None
@@ -193,24 +432,28 @@ class SupabaseClient:
         url = f"{self.base_url}/rest/v1/{table}"
         headers = self.headers.copy()
 
+        params = {}
+
         if on_conflict:
             headers["Prefer"] = f"resolution=merge-duplicates,return=representation"
+            params["on_conflict"] = on_conflict
         else:
             headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(url, headers=headers, json=data, timeout=30.0)
+        try:
+            response = await self._request(
+                "upsert", "POST", url, headers=headers, params=params, json=data
+            )
 
-                if response.status_code in [200, 201]:
-                    return response.json()
-                else:
-                    logger.error(f"Upsert failed: {response.status_code} - {response.text}")
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            if response.status_code in [200, 201]:
+                return response.json()
+            else:
+                logger.error(f"Upsert failed: {response.status_code} - {response.text}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            except Exception as e:
-                logger.error(f"Upsert error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Upsert error: {e}")
+            raise
 
     async def count(self, table: str, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count rows in a table."""
@@ -228,44 +471,42 @@ class SupabaseClient:
                 else:
                     params[key] = f"eq.{value}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.head(url, headers=headers, params=params, timeout=30.0)
-
-                if response.status_code == 200:
-                    content_range = response.headers.get("content-range", "")
-                    if content_range:
-                        # Parse "0-24/25" format
-                        total = content_range.split("/")[-1]
-                        return int(total) if total != "*" else 0
-                    return 0
-                else:
-                    logger.error(f"Count failed: {response.status_code}")
-                    raise Exception(f"HTTP {response.status_code}")
+        try:
+            response = await self._request("count", "HEAD", url, headers=headers, params=params)
+
+            if response.status_code == 200:
+                content_range = response.headers.get("content-range", "")
+                if content_range:
+                    # Parse "0-24/25" format
+                    total = content_range.split("/")[-1]
+                    return int(total) if total != "*" else 0
+                return 0
+            else:
+                logger.error(f"Count failed: {response.status_code}")
+                raise Exception(f"HTTP {response.status_code}")
 
-            except Exception as e:
-                logger.error(f"Count error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"Count error: {e}")
+            raise
 
     async def execute_rpc(self, function_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Execute a stored procedure/function."""
         url = f"{self.base_url}/rest/v1/rpc/{function_name}"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url, headers=self.headers, json=params or {}, timeout=30.0
-                )
+        try:
+            response = await self._request(
+                "rpc", "POST", url, headers=self.headers, json=params or {}
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"RPC failed: {response.status_code} - {response.text}")
-                    raise Exception(f"HTTP {response.status_code}: {response.text}")
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"RPC failed: {response.status_code} - {response.text}")
+                raise Exception(f"HTTP {response.status_code}: {response.text}")
 
-            except Exception as e:
-                logger.error(f"RPC error: {e}")
-                raise
+        except Exception as e:
+            logger.error(f"RPC error: {e}")
+            raise
 
     async def health_check(self) -> bool:
         """Check if database connection is healthy."""
@@ -280,8 +521,161 @@ class SupabaseClient:
             return False
 
 
+class PostgresPool:
+    """Managed asyncpg connection pool for direct SQL access.
+
+    The pool is created on first use. Connections are handed out through
+    :meth:`acquire`, which enforces the acquire timeout and records wait
+    times. :meth:`close` stops new acquires, waits for borrowed connections
+    to be returned (up to ``drain_timeout``) and then closes the pool,
+    terminating whatever is still in use.
+    """
+
+    def __init__(
+        self,
+        config: Optional[PostgresPoolConfig] = None,
+        pool_factory: Optional[Callable[..., Awaitable[Any]]] = None,
+    ):
+        self.config = config or PostgresPoolConfig.from_env()
+        self._pool_factory = pool_factory
+        self._pool: Optional[Any] = None
+        self._pool_lock = asyncio.Lock()
+        self._draining = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._stats = PoolStats()
+
+    @property
+    def configured(self) -> bool:
+        """Whether a pool can be created (a DSN or a custom factory is set)."""
+        return self._pool_factory is not None or (asyncpg is not None and bool(self.config.dsn))
+
+    async def connect(self) -> Any:
+        """Create the asyncpg pool if it does not exist yet."""
+        if self._pool is not None:
+            return self._pool
+
+        async with self._pool_lock:
+            if self._draining:
+                raise RuntimeError("Database pool is closed")
+
+            if self._pool is None:
+                factory = self._pool_factory
+                if factory is None:
+                    if asyncpg is None:
+                        raise RuntimeError(
+                            "asyncpg is not installed; install devsync-ai[postgres] for direct SQL access"
+                        )
+                    if not self.config.dsn:
+                        raise ValueError(
+                            "DATABASE_URL must be a postgresql:// DSN for direct SQL access"
+                        )
+                    factory = asyncpg.create_pool
+
+                config = self.config
+                self._pool = await factory(
+                    dsn=config.dsn,
+                    min_size=config.min_size,
+                    max_size=config.max_size,
+                    statement_cache_size=config.statement_cache_size,
+                    max_cached_statement_lifetime=config.max_cached_statement_lifetime,
+                    max_inactive_connection_lifetime=config.max_inactive_connection_lifetime,
+                    command_timeout=config.command_timeout,
+                )
+                logger.info(
+                    f"Postgres pool created (min={config.min_size}, max={config.max_size})"
+                )
+        return self._pool
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Borrow a connection from the pool for the duration of the block."""
+        if self._draining:
+            raise RuntimeError("Database pool is shutting down")
+
+        pool = await self.connect()
+        start = time.perf_counter()
+        try:
+            connection = await pool.acquire(timeout=self.config.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._stats.acquire_timeouts += 1
+            self._stats.record_wait((time.perf_counter() - start) * 1000)
+            logger.warning(
+                f"Timed out after {self.config.acquire_timeout}s waiting for a database connection"
+            )
+            raise
+        except Exception:
+            self._stats.acquire_errors += 1
+            raise
+
+        stats = self._stats
+        stats.acquisitions += 1
+        stats.record_wait((time.perf_counter() - start) * 1000)
+        stats.in_use += 1
+        stats.max_in_use = max(stats.max_in_use, stats.in_use)
+        self._idle.clear()
+
+        try:
+            yield connection
+        finally:
+            try:
+                await pool.release(connection)
+            finally:
+                stats.in_use -= 1
+                if stats.in_use == 0:
+                    self._idle.set()
+
+    async def health_check(self) -> bool:
+        """Run ``SELECT 1`` on a pooled connection."""
+        self._stats.health_checks += 1
+        try:
+            async with self.acquire() as connection:
+                healthy = await connection.fetchval("SELECT 1") == 1
+        except Exception as e:
+            logger.error(f"Postgres pool health check failed: {e}")
+            healthy = False
+
+        if not healthy:
+            self._stats.health_check_failures += 1
+        self._stats.last_health_check_ok = healthy
+        return healthy
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool size and acquire statistics."""
+        metrics = self._stats.to_dict()
+        metrics["draining"] = self._draining
+        if self._pool is not None:
+            metrics["size"] = self._pool.get_size()
+            metrics["idle"] = self._pool.get_idle_size()
+            metrics["min_size"] = self.config.min_size
+            metrics["max_size"] = self.config.max_size
+        return metrics
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """Stop handing out connections, drain borrowed ones and close the pool."""
+        self._draining = True
+        pool = self._pool
+        if pool is None:
+            return
+
+        timeout = self.config.drain_timeout if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{self._stats.in_use} database connections still in use after {timeout}s, "
+                "terminating pool"
+            )
+            pool.terminate()
+        else:
+            await pool.close()
+        finally:
+            self._pool = None
+
+
 # Global database connection instance
 _db_client: Optional[SupabaseClient] = None
+_postgres_pool: Optional[PostgresPool] = None
 
 
 async def get_database() -> SupabaseClient:
@@ -292,8 +686,32 @@ async def get_database() -> SupabaseClient:
     return _db_client
 
 
+def get_postgres_pool() -> PostgresPool:
+    """Get the global asyncpg pool wrapper (the pool itself is created on first use)."""
+    global _postgres_pool
+    if _postgres_pool is None:
+        _postgres_pool = PostgresPool()
+    return _postgres_pool
+
+
+@asynccontextmanager
+async def get_database_connection() -> AsyncIterator[Any]:
+    """Acquire a pooled asyncpg connection for direct SQL.
+
+    Raises ``ValueError`` when DATABASE_URL is not a Postgres DSN and
+    ``RuntimeError`` when asyncpg is not installed; PostgREST access through
+    :func:`get_database` does not depend on either.
+    """
+    async with get_postgres_pool().acquire() as connection:
+        yield connection
+
+
 async def close_database():
-    """Close the global database connection."""
-    global _db_client
+    """Close the global database connections, draining the Postgres pool."""
+    global _db_client, _postgres_pool
     if _db_client:
+        await _db_client.close()
         _db_client = None
+    if _postgres_pool:
+        await _postgres_pool.close()
+        _postgres_pool = None
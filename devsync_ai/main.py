@@ -135,8 +135,42 @@ def setup_event_handlers(app: FastAPI) -> None:
             logger.error(f"❌ Configuration error: {e}")
             raise
         
+        # Open the pooled database client up front so the first request
+        # doesn't pay connection setup
+        try:
+            from devsync_ai.database.connection import get_database
+
+            db = await get_database()
+            await db.connect()
+            logger.info("✅ Database connection pool initialized")
+        except ValueError as e:
+            logger.warning(f"⚠️  Database connection pool not initialized: {e}")
+
+        # Direct-SQL callers share an asyncpg pool when DATABASE_URL is Postgres
+        try:
+            from devsync_ai.database.connection import get_postgres_pool
+
+            postgres_pool = get_postgres_pool()
+            if postgres_pool.configured:
+                await postgres_pool.connect()
+                logger.info("✅ Postgres connection pool initialized")
+        except Exception as e:
+            logger.warning(f"⚠️  Postgres connection pool not initialized: {e}")
+
         logger.info("🎯 Using webhook-driven architecture for real-time updates")
 
+        # Acknowledge JIRA webhooks once journaled and process them in the background
+        if settings.jira_webhook_ingestion_queue:
+            from devsync_ai.webhooks.jira_ingestion_queue import start_jira_ingestion_queue
+            from devsync_ai.webhooks.routes import process_queued_jira_webhook
+
+            await start_jira_ingestion_queue(
+                process_queued_jira_webhook,
+                db_path=settings.jira_webhook_journal_path,
+                workers=settings.jira_webhook_workers
+            )
+            logger.info("✅ JIRA webhook ingestion queue started")
+
         # NOTE: JIRA sync scheduler removed - using GitHub webhooks for real-time updates
         # Manual JIRA refresh available via /jira/refresh endpoint for debugging only
 
@@ -145,6 +179,21 @@ def setup_event_handlers(app: FastAPI) -> None:
         """Clean up resources on shutdown."""
         logger.info(f"Shutting down {settings.app_name}")
 
+        from devsync_ai.analytics.analytics_data_manager import shutdown_analytics_data_manager
+        from devsync_ai.database.connection import close_database
+        from devsync_ai.services.sdk_executor import shutdown_sdk_executors
+        from devsync_ai.services.slack import close_slack_clients
+        from devsync_ai.webhooks.jira_ingestion_queue import shutdown_jira_ingestion_queue
+
+        # Unfinished JIRA webhooks stay journaled and are replayed on next start
+        await shutdown_jira_ingestion_queue()
+
+        # Flushes queued analytics writes before closing the connections
+        await shutdown_analytics_data_manager()
+        await close_database()
+        await close_slack_clients()
+        shutdown_sdk_executors()
+
 
 # Create the application instance
 app = create_app()
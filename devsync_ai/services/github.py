@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -12,12 +12,15 @@ from collections import defaultdict, Counter
 
 import httpx
 from github import Github, GithubException, RateLimitExceededException
+from github.Consts import DEFAULT_PER_PAGE
 from github.PullRequest import PullRequest as GithubPR
 from github.Repository import Repository
 from github.Commit import Commit as GithubCommit
 
 from ..config import settings
 from ..models.core import PullRequest, PRStatus
+from .github_store import GitHubActivityStore, GitHubActivitySync, parse_timestamp
+from .sdk_executor import get_sdk_executor
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,94 @@ class RateLimitInfo:
     reset_time: datetime
 
 
+class RateLimitBucket:
+    """Token-bucket view of the GitHub core rate limit.
+
+    The bucket is filled from ``X-RateLimit-*`` headers of ordinary API
+    responses (or an explicit ``/rate_limit`` call), drained locally by one
+    token per request, and refilled to ``limit`` once ``reset_time`` passes.
+    It is shared by every GitHubService using the same token.
+    """
+
+    # Re-read /rate_limit when the cached state is older than this
+    STALE_AFTER = timedelta(minutes=5)
+    # ...or when fewer tokens than this are left, at most once per interval
+    REFRESH_THRESHOLD = 100
+    LOW_REFRESH_INTERVAL = timedelta(seconds=30)
+    # Wait for the reset once fewer tokens than this are left
+    MIN_REMAINING = 10
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_time: Optional[datetime] = None
+        self.updated_at: Optional[datetime] = None
+        self.stats: Dict[str, int] = {
+            "rate_limit_checks": 0,
+            "rate_limit_checks_saved": 0,
+            "header_updates": 0,
+        }
+
+    def update(self, limit: int, remaining: int, reset_time: datetime) -> None:
+        self.limit = limit
+        self.remaining = remaining
+        # PyGithub reports UTC-aware times; naive values are taken as local time
+        self.reset_time = reset_time.astimezone(timezone.utc)
+        self.updated_at = datetime.now(timezone.utc)
+
+    def clear(self) -> None:
+        self.limit = self.remaining = self.reset_time = self.updated_at = None
+
+    def _refill(self, now: datetime) -> None:
+        if self.reset_time is not None and now >= self.reset_time and self.limit is not None:
+            self.remaining = self.limit
+            self.reset_time = now + timedelta(hours=1)
+
+    def consume(self, tokens: int = 1) -> None:
+        """Account for requests made before fresh headers are read."""
+        if self.remaining is not None:
+            self._refill(datetime.now(timezone.utc))
+            self.remaining = max(0, self.remaining - tokens)
+
+    def needs_refresh(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.now(timezone.utc)
+        if self.updated_at is None or self.remaining is None:
+            return True
+        if now - self.updated_at > self.STALE_AFTER:
+            return True
+        self._refill(now)
+        return (
+            self.remaining < self.REFRESH_THRESHOLD
+            and now - self.updated_at > self.LOW_REFRESH_INTERVAL
+        )
+
+    def wait_time(self, now: Optional[datetime] = None) -> float:
+        """Seconds to wait before the next request, 0 if tokens are available."""
+        now = now or datetime.now(timezone.utc)
+        if self.remaining is None or self.reset_time is None:
+            return 0.0
+        self._refill(now)
+        if self.remaining >= self.MIN_REMAINING:
+            return 0.0
+        return max(0.0, (self.reset_time - now).total_seconds())
+
+    def snapshot(self) -> Optional[RateLimitInfo]:
+        if self.limit is None or self.remaining is None or self.reset_time is None:
+            return None
+        return RateLimitInfo(limit=self.limit, remaining=self.remaining, reset_time=self.reset_time)
+
+
+_rate_limit_buckets: Dict[str, RateLimitBucket] = {}
+
+
+def get_rate_limit_bucket(token: Optional[str]) -> RateLimitBucket:
+    """Shared rate-limit bucket for a GitHub token."""
+    key = token or ""
+    if key not in _rate_limit_buckets:
+        _rate_limit_buckets[key] = RateLimitBucket()
+    return _rate_limit_buckets[key]
+
+
 @dataclass
 class CommitInfo:
     """Information about a commit for changelog generation."""
@@ -100,6 +191,7 @@ class EnrichedPullRequest:
     review_metrics: Dict[str, Any]
     collaboration_score: float
     merge_time_prediction: Optional[timedelta] = None
+    api_requests: int = 0
 
 
 @dataclass
@@ -203,13 +295,31 @@ class GitHubAPIError(Exception):
 class GitHubService:
     """Service for interacting with GitHub API."""
 
-    def __init__(self, token: Optional[str] = None, allowed_repository: Optional[str] = None):
-        """Initialize GitHub service with authentication token."""
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        allowed_repository: Optional[str] = None,
+        activity_sync: Optional[GitHubActivitySync] = None,
+    ):
+        """Initialize GitHub service with authentication token.
+
+        Commits and open PRs are read from ``activity_sync``'s local store when
+        given, or when ``GITHUB_ACTIVITY_STORE_PATH`` is set.
+        """
         self.token = token or settings.github_token
         self.allowed_repository = allowed_repository or settings.github_repository
         self._github_client = None
-        self._rate_limit_info: Optional[RateLimitInfo] = None
+        self._rate_limit_bucket = get_rate_limit_bucket(self.token)
         self._changelog_analyzer = None
+        self._sdk_executor = get_sdk_executor("github", settings.github_sdk_max_workers)
+        self._activity_sync = activity_sync
+        if self._activity_sync is None and settings.github_activity_store_path:
+            self._activity_sync = GitHubActivitySync(
+                GitHubActivityStore(settings.github_activity_store_path),
+                token=self.token,
+                api_url=settings.github_api_url,
+                on_rate_limit=self._rate_limit_bucket.update,
+            )
 
     @property
     def github_client(self) -> Github:
@@ -235,11 +345,56 @@ class GitHubService:
         """Get PR summary for the default configured repository."""
         return await self.get_pr_summary_with_analysis(self.allowed_repository)
 
+    @property
+    def _rate_limit_info(self) -> Optional[RateLimitInfo]:
+        """Latest known rate limit state from the shared bucket."""
+        return self._rate_limit_bucket.snapshot()
+
+    @_rate_limit_info.setter
+    def _rate_limit_info(self, info: RateLimitInfo) -> None:
+        self._rate_limit_bucket.update(info.limit, info.remaining, info.reset_time)
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Rate limit bucket state and counters for saved /rate_limit calls."""
+        info = self._rate_limit_info
+        return {
+            **self._rate_limit_bucket.stats,
+            "limit": info.limit if info else None,
+            "remaining": info.remaining if info else None,
+            "reset_time": info.reset_time.isoformat() if info else None,
+        }
+
+    def _update_rate_limit_from_headers(self) -> None:
+        """Refresh the bucket from the X-RateLimit headers PyGithub already parsed.
+
+        Reads the requester's cached values directly; the public
+        ``Github.rate_limiting`` property would issue a /rate_limit request
+        when no headers have been seen yet.
+        """
+        requester = getattr(self._github_client, "_Github__requester", None)
+        rate_limiting = getattr(requester, "rate_limiting", None)
+        reset_epoch = getattr(requester, "rate_limiting_resettime", None)
+
+        if not isinstance(rate_limiting, tuple) or not isinstance(reset_epoch, int):
+            return
+
+        remaining, limit = rate_limiting
+        if limit < 0 or reset_epoch <= 0:
+            return
+
+        self._rate_limit_bucket.update(limit, remaining, datetime.fromtimestamp(reset_epoch, timezone.utc))
+        self._rate_limit_bucket.stats["header_updates"] += 1
+
+    async def _run_blocking(self, func, *args, **kwargs) -> Any:
+        """Run a blocking PyGithub call (or lazy attribute access) off the event loop."""
+        return await self._sdk_executor.run(func, *args, **kwargs)
+
     async def check_rate_limit(self) -> RateLimitInfo:
         """Check current rate limit status."""
         try:
-            rate_limit = self.github_client.get_rate_limit()
+            rate_limit = await self._run_blocking(self.github_client.get_rate_limit)
             core_limit = rate_limit.core
+            self._rate_limit_bucket.stats["rate_limit_checks"] += 1
 
             self._rate_limit_info = RateLimitInfo(
                 limit=core_limit.limit, remaining=core_limit.remaining, reset_time=core_limit.reset
@@ -256,11 +411,17 @@ class GitHubService:
 
     async def _handle_rate_limit(self) -> None:
         """Handle rate limit by waiting if necessary."""
-        if self._rate_limit_info and self._rate_limit_info.remaining < 10:
-            wait_time = (self._rate_limit_info.reset_time - datetime.now()).total_seconds()
-            if wait_time > 0:
-                logger.warning(f"Rate limit low, waiting {wait_time} seconds")
-                await asyncio.sleep(wait_time)
+        wait_time = self._rate_limit_bucket.wait_time()
+        if wait_time > 0:
+            logger.warning(f"Rate limit low, waiting {wait_time} seconds")
+            await asyncio.sleep(wait_time)
+
+    async def _ensure_rate_limit_state(self) -> None:
+        """Call /rate_limit only when the cached bucket is stale or running low."""
+        if self._rate_limit_bucket.needs_refresh():
+            await self.check_rate_limit()
+        else:
+            self._rate_limit_bucket.stats["rate_limit_checks_saved"] += 1
 
     async def _execute_with_retry(self, func, *args, max_retries: int = 3, **kwargs) -> Any:
         """Execute GitHub API call with retry logic and rate limit handling."""
@@ -268,16 +429,19 @@ class GitHubService:
 
         for attempt in range(max_retries):
             try:
-                # Check rate limit before making request
-                await self.check_rate_limit()
+                # Check cached rate limit state before making request
+                await self._ensure_rate_limit_state()
                 await self._handle_rate_limit()
 
-                # Execute the function
-                result = func(*args, **kwargs)
+                # Execute the function on the SDK thread pool
+                self._rate_limit_bucket.consume()
+                result = await self._run_blocking(func, *args, **kwargs)
+                self._update_rate_limit_from_headers()
                 return result
 
             except RateLimitExceededException as e:
                 logger.warning(f"Rate limit exceeded, attempt {attempt + 1}/{max_retries}")
+                self._update_rate_limit_from_headers()
                 if attempt == max_retries - 1:
                     raise GitHubAPIError(
                         "Rate limit exceeded after retries", status_code=403, retry_after=3600
@@ -331,14 +495,19 @@ class GitHubService:
             user = await self._execute_with_retry(self.github_client.get_user)
             rate_limit = await self.check_rate_limit()
 
-            return {
-                "authenticated": True,
-                "user": {
+            # AuthenticatedUser attributes are fetched lazily on first access
+            user_info = await self._run_blocking(
+                lambda: {
                     "login": user.login,
                     "name": user.name,
                     "email": user.email,
                     "id": user.id,
-                },
+                }
+            )
+
+            return {
+                "authenticated": True,
+                "user": user_info,
                 "rate_limit": {
                     "limit": rate_limit.limit,
                     "remaining": rate_limit.remaining,
@@ -391,20 +560,53 @@ class GitHubService:
             labels=labels,
         )
 
+    def _convert_pr_payload_to_model(self, payload: Dict[str, Any], repository: str) -> PullRequest:
+        """Convert a stored GitHub REST PR payload to our PullRequest model."""
+        requested_reviewers = payload.get("requested_reviewers") or []
+        requested_teams = payload.get("requested_teams") or []
+
+        if payload.get("draft"):
+            status = PRStatus.DRAFT
+        elif payload.get("state") == "closed":
+            status = PRStatus.MERGED if payload.get("merged_at") else PRStatus.CLOSED
+        elif requested_reviewers or requested_teams:
+            status = PRStatus.READY_FOR_REVIEW
+        else:
+            status = PRStatus.OPEN
+
+        return PullRequest(
+            id=str(payload["number"]),
+            repository=repository,
+            title=payload["title"],
+            author=(payload.get("user") or {}).get("login", "unknown"),
+            status=status,
+            # List payloads omit mergeable; None means unknown, False means conflicts
+            merge_conflicts=payload.get("mergeable") is False,
+            created_at=parse_timestamp(payload["created_at"]),
+            updated_at=parse_timestamp(payload["updated_at"]),
+            reviewers=[reviewer["login"] for reviewer in requested_reviewers]
+            + [team["name"] for team in requested_teams],
+            labels=[label["name"] for label in payload.get("labels") or []],
+        )
+
     async def get_open_pull_requests(self, repository: str) -> List[PullRequest]:
         """Get all open pull requests for a repository."""
         self._validate_repository_access(repository)
+        if self._activity_sync is not None:
+            return await self._get_open_pull_requests_from_store(repository)
         try:
             repo = await self.get_repository(repository)
 
             # Get open PRs
             github_prs = await self._execute_with_retry(lambda: list(repo.get_pulls(state="open")))
 
-            # Convert to our model
+            # Convert to our model (PyGithub may lazily fetch missing attributes)
             pull_requests = []
             for github_pr in github_prs:
                 try:
-                    pr = self._convert_github_pr_to_model(github_pr, repository)
+                    pr = await self._run_blocking(
+                        self._convert_github_pr_to_model, github_pr, repository
+                    )
                     pull_requests.append(pr)
                 except Exception as e:
                     logger.error(f"Failed to convert PR #{github_pr.number}: {e}")
@@ -418,6 +620,26 @@ class GitHubService:
         except Exception as e:
             raise GitHubAPIError(f"Failed to get open PRs for {repository}: {e}")
 
+    async def _get_open_pull_requests_from_store(self, repository: str) -> List[PullRequest]:
+        try:
+            payloads = await self._activity_sync.get_open_pull_requests(repository)
+        except httpx.HTTPStatusError as e:
+            raise GitHubAPIError(
+                f"Failed to sync open PRs for {repository}: {e}", status_code=e.response.status_code
+            )
+        except Exception as e:
+            raise GitHubAPIError(f"Failed to get open PRs for {repository}: {e}")
+
+        pull_requests = []
+        for payload in payloads:
+            try:
+                pull_requests.append(self._convert_pr_payload_to_model(payload, repository))
+            except Exception as e:
+                logger.error(f"Failed to convert PR #{payload.get('number')}: {e}")
+
+        logger.info(f"Retrieved {len(pull_requests)} open PRs from {repository} (local store)")
+        return pull_requests
+
     async def check_merge_conflicts(self, repository: str, pr_number: int) -> bool:
         """Check if a specific PR has merge conflicts."""
         self._validate_repository_access(repository)
@@ -425,18 +647,20 @@ class GitHubService:
             repo = await self.get_repository(repository)
             pr = await self._execute_with_retry(repo.get_pull, pr_number)
 
-            # GitHub's mergeable field: True = no conflicts, False = conflicts, None = unknown
-            if pr.mergeable is None:
-                # If mergeable status is unknown, we need to trigger a merge check
-                # This happens by accessing the mergeable_state property
-                mergeable_state = pr.mergeable_state
-                logger.debug(f"PR #{pr_number} mergeable_state: {mergeable_state}")
+            def _read_mergeable():
+                # GitHub's mergeable field: True = no conflicts, False = conflicts, None = unknown
+                if pr.mergeable is None:
+                    # If mergeable status is unknown, we need to trigger a merge check
+                    # This happens by accessing the mergeable_state property
+                    mergeable_state = pr.mergeable_state
+                    logger.debug(f"PR #{pr_number} mergeable_state: {mergeable_state}")
 
                 # After accessing mergeable_state, mergeable should be updated
                 # If it's still None, assume no conflicts for now
                 return pr.mergeable is False
 
-            return pr.mergeable is False
+            # Attribute access can trigger PyGithub requests, so keep it in the pool
+            return await self._run_blocking(_read_mergeable)
 
         except GitHubAPIError:
             raise
@@ -452,7 +676,7 @@ class GitHubService:
             repo = await self.get_repository(repository)
             github_pr = await self._execute_with_retry(repo.get_pull, pr_number)
 
-            return self._convert_github_pr_to_model(github_pr, repository)
+            return await self._run_blocking(self._convert_github_pr_to_model, github_pr, repository)
 
         except GitHubAPIError as e:
             if e.status_code == 404:
@@ -655,6 +879,8 @@ class GitHubService:
     ) -> List[CommitInfo]:
         """Get commits from repository since a specific date."""
         self._validate_repository_access(repository)
+        if self._activity_sync is not None:
+            return await self._get_commits_from_store(repository, since_date, until_date)
         try:
             repo = await self.get_repository(repository)
 
@@ -671,19 +897,13 @@ class GitHubService:
             commit_infos = []
             for commit in commits:
                 try:
-                    parsed = self._parse_commit_message(commit.commit.message)
-
-                    commit_info = CommitInfo(
-                        sha=commit.sha,
-                        message=commit.commit.message,
-                        author=commit.commit.author.name if commit.commit.author else "Unknown",
-                        date=commit.commit.author.date if commit.commit.author else datetime.now(),
-                        category=parsed["type"],
-                        description=parsed["description"],
-                        breaking_change=parsed["breaking_change"],
-                        pr_number=parsed["pr_number"],
-                    )
-                    commit_infos.append(commit_info)
+                    author = commit.commit.author
+                    commit_infos.append(self._build_commit_info(
+                        commit.sha,
+                        commit.commit.message,
+                        author.name if author else None,
+                        author.date if author else None,
+                    ))
                 except Exception as e:
                     logger.error(f"Failed to parse commit {commit.sha}: {e}")
                     continue
@@ -698,6 +918,47 @@ class GitHubService:
         except Exception as e:
             raise GitHubAPIError(f"Failed to get commits for {repository}: {e}")
 
+    async def _get_commits_from_store(
+        self, repository: str, since_date: datetime, until_date: Optional[datetime]
+    ) -> List[CommitInfo]:
+        try:
+            rows = await self._activity_sync.get_commits(repository, since_date, until_date)
+        except httpx.HTTPStatusError as e:
+            raise GitHubAPIError(
+                f"Failed to sync commits for {repository}: {e}", status_code=e.response.status_code
+            )
+        except Exception as e:
+            raise GitHubAPIError(f"Failed to get commits for {repository}: {e}")
+
+        commit_infos = []
+        for row in rows:
+            try:
+                commit_infos.append(self._build_commit_info(
+                    row["sha"], row["message"], row["author_name"], row["authored_at"]
+                ))
+            except Exception as e:
+                logger.error(f"Failed to parse commit {row['sha']}: {e}")
+
+        logger.info(
+            f"Retrieved {len(commit_infos)} commits from {repository} since {since_date} (local store)"
+        )
+        return commit_infos
+
+    def _build_commit_info(
+        self, sha: str, message: str, author: Optional[str], date: Optional[datetime]
+    ) -> CommitInfo:
+        parsed = self._parse_commit_message(message)
+        return CommitInfo(
+            sha=sha,
+            message=message,
+            author=author or "Unknown",
+            date=date or datetime.now(),
+            category=parsed["type"],
+            description=parsed["description"],
+            breaking_change=parsed["breaking_change"],
+            pr_number=parsed["pr_number"],
+        )
+
     async def get_commits_between_tags(
         self, repository: str, from_tag: str, to_tag: str
     ) -> List[CommitInfo]:
@@ -984,15 +1245,79 @@ class GitHubService:
         if self._github_client:
             # PyGithub doesn't have explicit cleanup, but we can clear the reference
             self._github_client = None
+        if self._activity_sync is not None:
+            await self._activity_sync.close()
         logger.debug("GitHub service closed")
 
 
+class PRFetchContext:
+    """GitHub data for one pull request, fetched at most once and shared.
+
+    The pull request and its files are loaded on first use; concurrent callers
+    wait for the same load. ``api_requests`` counts the requests made, one per
+    page fetched from a paginated list.
+    """
+
+    def __init__(
+        self,
+        github_service: GitHubService,
+        repository: Repository,
+        pr_number: Any,
+        per_page: int = DEFAULT_PER_PAGE,
+    ):
+        self.github_service = github_service
+        self.repository = repository
+        self.pr_number = pr_number
+        self.per_page = per_page
+        self.api_requests = 0
+        self._loads: Dict[str, asyncio.Future] = {}
+
+    async def pull(self) -> GithubPR:
+        return await self._load("pull", lambda: self.repository.get_pull(int(self.pr_number)))
+
+    async def files(self) -> List[Any]:
+        github_pr = await self.pull()
+        return await self._load("files", github_pr.get_files, paginated=True)
+
+    async def _load(self, name: str, fetch, paginated: bool = False) -> Any:
+        load = self._loads.get(name)
+        if load is None:
+            load = self._loads[name] = asyncio.ensure_future(self._fetch(fetch, paginated))
+        return await load
+
+    async def _fetch(self, fetch, paginated: bool) -> Any:
+        if not paginated:
+            result = await self.github_service._execute_with_retry(fetch)
+            self.api_requests += 1
+            return result
+
+        pages = fetch()
+        items: List[Any] = []
+        page_number = 0
+        while True:
+            # One request per page; a short page is the last one
+            page = await self.github_service._execute_with_retry(pages.get_page, page_number)
+            self.api_requests += 1
+            items.extend(page)
+            if len(page) < self.per_page:
+                return items
+            page_number += 1
+
+
 class GitHubChangelogAnalyzer:
     """Advanced GitHub activity intelligence engine for changelog generation."""
 
-    def __init__(self, github_service: GitHubService):
-        """Initialize with a GitHub service instance."""
+    def __init__(self, github_service: GitHubService, max_concurrent_enrichments: Optional[int] = None):
+        """Initialize with a GitHub service instance.
+
+        Args:
+            github_service: Service used for GitHub API calls
+            max_concurrent_enrichments: Pull requests enriched at the same time
+        """
         self.github_service = github_service
+        self.max_concurrent_enrichments = (
+            max_concurrent_enrichments or settings.github_pr_enrichment_concurrency
+        )
         self.logger = logging.getLogger(__name__)
 
     async def analyze_weekly_activity(self, repo: str, date_range: DateRange) -> GitHubWeeklyData:
@@ -1010,19 +1335,7 @@ class GitHubChangelogAnalyzer:
             categorized_commits = await self.categorize_commits(commits)
             
             # Analyze pull requests with impact scoring
-            enriched_prs = []
-            for pr in prs:
-                impact_score = await self.calculate_pr_impact_score(pr)
-                review_metrics = await self._analyze_pr_review_metrics(repo, pr)
-                collaboration_score = await self._calculate_collaboration_score(pr)
-                
-                enriched_pr = EnrichedPullRequest(
-                    pr=pr,
-                    impact_score=impact_score,
-                    review_metrics=review_metrics,
-                    collaboration_score=collaboration_score
-                )
-                enriched_prs.append(enriched_pr)
+            enriched_prs = await self._enrich_pull_requests(repo, prs)
             
             # Analyze contributor activity
             contributors = await self.analyze_contributor_activity(
@@ -1053,7 +1366,10 @@ class GitHubChangelogAnalyzer:
                     },
                     "repository": repo,
                     "total_commits": len(commits),
-                    "total_prs": len(prs)
+                    "total_prs": len(prs),
+                    "pr_api_requests": {
+                        enriched.pr.id: enriched.api_requests for enriched in enriched_prs
+                    }
                 }
             )
             
@@ -1114,14 +1430,56 @@ class GitHubChangelogAnalyzer:
             self.logger.error(f"Failed to categorize commits: {e}")
             raise GitHubAPIError(f"Commit categorization failed: {e}")
 
-    async def calculate_pr_impact_score(self, pr: PullRequest) -> ImpactScore:
-        """Calculate PR impact score based on complexity, files changed, and review metrics."""
+    async def _enrich_pull_requests(self, repo: str, prs: List[PullRequest]) -> List[EnrichedPullRequest]:
+        """Enrich pull requests concurrently, at most ``max_concurrent_enrichments`` at a time."""
+        if not prs:
+            return []
+
+        try:
+            repository = await self.github_service.get_repository(repo)
+        except Exception as e:
+            self.logger.warning(f"Failed to load repository {repo} for PR enrichment: {e}")
+            repository = None
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_enrichments)
+
+        async def enrich(pr: PullRequest) -> EnrichedPullRequest:
+            async with semaphore:
+                context = (
+                    PRFetchContext(self.github_service, repository, pr.id)
+                    if repository is not None else None
+                )
+                impact_score = await self.calculate_pr_impact_score(pr, context)
+                review_metrics = await self._analyze_pr_review_metrics(repo, pr)
+                collaboration_score = await self._calculate_collaboration_score(pr)
+
+                return EnrichedPullRequest(
+                    pr=pr,
+                    impact_score=impact_score,
+                    review_metrics=review_metrics,
+                    collaboration_score=collaboration_score,
+                    api_requests=context.api_requests if context else 0
+                )
+
+        enriched_prs = await asyncio.gather(*(enrich(pr) for pr in prs))
+        self.logger.debug(
+            f"Enriched {len(prs)} PRs with {sum(e.api_requests for e in enriched_prs)} API requests"
+        )
+        return list(enriched_prs)
+
+    async def calculate_pr_impact_score(
+        self, pr: PullRequest, context: Optional[PRFetchContext] = None
+    ) -> ImpactScore:
+        """Calculate PR impact score based on complexity, files changed, and review metrics.
+
+        Pass a ``context`` to share fetched PR data with other enrichment steps.
+        """
         try:
             # Get PR details from GitHub API
-            repo = await self.github_service.get_repository(pr.repository)
-            github_pr = await self.github_service._execute_with_retry(
-                repo.get_pull, int(pr.id)
-            )
+            if context is None:
+                repo = await self.github_service.get_repository(pr.repository)
+                context = PRFetchContext(self.github_service, repo, pr.id)
+            github_pr = await context.pull()
             
             # Calculate complexity metrics
             files_changed = github_pr.changed_files
@@ -1141,14 +1499,21 @@ class GitHubChangelogAnalyzer:
             else:
                 risk_level = RiskLevel.LOW
             
+            # Changed files are fetched once for the analyses below
+            try:
+                files = await context.files()
+            except Exception as e:
+                self.logger.warning(f"Failed to fetch files for PR #{pr.id}: {e}")
+                files = None
+            
             # Analyze affected systems (based on file paths)
-            affected_systems = await self._identify_affected_systems(github_pr)
+            affected_systems = await self._identify_affected_systems(files)
             
             # Calculate test coverage impact (simplified)
-            test_coverage_impact = await self._calculate_test_coverage_impact(github_pr)
+            test_coverage_impact = await self._calculate_test_coverage_impact(files, files_changed)
             
             # Detect performance impact
-            performance_impact = await self._detect_pr_performance_impact(github_pr)
+            performance_impact = await self._detect_pr_performance_impact(files)
             
             impact_score = ImpactScore(
                 complexity_score=complexity_score,
@@ -1426,10 +1791,9 @@ class GitHubChangelogAnalyzer:
         # Simplified - would analyze co-authored commits, PR reviews, etc.
         return []
 
-    async def _identify_affected_systems(self, github_pr) -> List[str]:
+    async def _identify_affected_systems(self, files: List[Any]) -> List[str]:
         """Identify affected systems based on changed files."""
         try:
-            files = github_pr.get_files()
             systems = set()
             
             for file in files:
@@ -1450,22 +1814,19 @@ class GitHubChangelogAnalyzer:
         except Exception:
             return ["unknown"]
 
-    async def _calculate_test_coverage_impact(self, github_pr) -> float:
+    async def _calculate_test_coverage_impact(self, files: List[Any], total_files: int) -> float:
         """Calculate test coverage impact."""
         try:
-            files = github_pr.get_files()
             test_files = sum(1 for f in files if "test" in f.filename.lower())
-            total_files = github_pr.changed_files
             
             return (test_files / max(1, total_files)) * 100
             
         except Exception:
             return 0.0
 
-    async def _detect_pr_performance_impact(self, github_pr) -> Optional[PerformanceImpact]:
+    async def _detect_pr_performance_impact(self, files: List[Any]) -> Optional[PerformanceImpact]:
         """Detect performance impact of a PR."""
         try:
-            files = github_pr.get_files()
             performance_indicators = []
             
             for file in files:
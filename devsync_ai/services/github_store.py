@@ -0,0 +1,445 @@
+"""Local store of GitHub commits and open pull requests with incremental sync.
+
+Changelog and weekly runs used to re-list every commit and open PR through
+PyGithub on each call. ``GitHubActivitySync`` keeps a SQLite copy per
+repository instead and refreshes it with as few full listings as possible:
+
+- Page one of the commit listing is requested with ``If-None-Match``, so an
+  unchanged branch costs a single 304. When the branch moved, the commits
+  since the stored head (the high-watermark) are taken from that page if they
+  form a straight line down to it, and from the compare API otherwise, so
+  commits brought in by a merge are not missed. Without a usable head the
+  listing is paged down to the oldest date the store covers.
+- Open pull requests are re-listed page by page with each page's ETag. A 304
+  keeps the stored page, so only pages that changed are downloaded.
+
+304 responses don't count against the GitHub rate limit. Analysis code reads
+from the store after syncing.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import aiosqlite
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+# Largest page size the GitHub REST API allows
+PAGE_SIZE = 100
+
+COMMITS = "commits"
+OPEN_PULL_REQUESTS = "open_pulls"
+
+
+def to_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC, as PyGithub does for ``since``/``until``."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_timestamp(value: datetime) -> str:
+    """ISO-8601 UTC timestamp; sorts lexicographically in SQLite."""
+    return to_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _next_link(response: httpx.Response) -> Optional[str]:
+    next_page = response.links.get("next")
+    return next_page.get("url") if next_page else None
+
+
+def _linear_commits_since(page: List[Dict[str, Any]], head: str) -> Optional[List[Dict[str, Any]]]:
+    """Commits of ``page`` above ``head`` if they form a single-parent chain down to it.
+
+    Returns None when the chain is broken, has a merge, or leaves the page.
+    """
+    commits: List[Dict[str, Any]] = []
+    expected = page[0]["sha"]
+    for item in page:
+        if item["sha"] != expected:
+            return None
+        if item["sha"] == head:
+            return commits
+        parents = item.get("parents") or []
+        if len(parents) != 1:
+            return None
+        commits.append(item)
+        expected = parents[0]["sha"]
+    return None
+
+
+class GitHubActivityStore:
+    """SQLite tables of commits, open pull requests and sync state per repository."""
+
+    def __init__(self, db_path: str = "github_activity.db"):
+        self.db_path = db_path
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def open(self):
+        connection = aiosqlite.connect(self.db_path)
+        # The connection must not keep the interpreter alive at exit
+        getattr(connection, "_thread", connection).daemon = True
+        self._db = await connection
+
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS github_commits (
+                repository TEXT NOT NULL,
+                sha TEXT NOT NULL,
+                message TEXT NOT NULL,
+                author_name TEXT,
+                authored_at TEXT,
+                committed_at TEXT NOT NULL,
+                PRIMARY KEY (repository, sha)
+            );
+            CREATE INDEX IF NOT EXISTS idx_github_commits_committed
+                ON github_commits (repository, committed_at);
+            CREATE TABLE IF NOT EXISTS github_pull_requests (
+                repository TEXT NOT NULL,
+                number INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at TEXT,
+                PRIMARY KEY (repository, number)
+            );
+            CREATE TABLE IF NOT EXISTS github_sync_state (
+                repository TEXT NOT NULL,
+                resource TEXT NOT NULL,
+                state TEXT NOT NULL,
+                synced_at TEXT NOT NULL,
+                PRIMARY KEY (repository, resource)
+            );
+        """)
+        await self._db.commit()
+
+    async def close(self):
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def get_sync_state(self, repository: str, resource: str) -> Dict[str, Any]:
+        async with self._db.execute(
+            "SELECT state FROM github_sync_state WHERE repository = ? AND resource = ?",
+            (repository, resource)
+        ) as cursor:
+            row = await cursor.fetchone()
+        return json.loads(row[0]) if row else {}
+
+    async def save_sync_state(self, repository: str, resource: str, state: Dict[str, Any]):
+        async with self._lock:
+            await self._db.execute("""
+                INSERT INTO github_sync_state (repository, resource, state, synced_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (repository, resource)
+                DO UPDATE SET state = excluded.state, synced_at = excluded.synced_at
+            """, (repository, resource, json.dumps(state), format_timestamp(datetime.now(timezone.utc))))
+            await self._db.commit()
+
+    async def upsert_commits(self, repository: str, commits: List[Dict[str, Any]]):
+        """Store commits from the GitHub commits API."""
+        if not commits:
+            return
+        rows = []
+        for item in commits:
+            commit = item["commit"]
+            author = commit.get("author") or {}
+            committer = commit.get("committer") or author
+            rows.append((
+                repository,
+                item["sha"],
+                commit.get("message", ""),
+                author.get("name"),
+                author.get("date"),
+                committer.get("date") or author.get("date"),
+            ))
+        async with self._lock:
+            await self._db.executemany("""
+                INSERT OR REPLACE INTO github_commits
+                    (repository, sha, message, author_name, authored_at, committed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            await self._db.commit()
+
+    async def get_commits(
+        self, repository: str, since: datetime, until: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Stored commits committed in ``[since, until]``, newest first."""
+        query = """
+            SELECT sha, message, author_name, authored_at, committed_at FROM github_commits
+            WHERE repository = ? AND committed_at >= ?
+        """
+        params: List[Any] = [repository, format_timestamp(since)]
+        if until is not None:
+            query += " AND committed_at <= ?"
+            params.append(format_timestamp(until))
+        query += " ORDER BY committed_at DESC"
+
+        async with self._db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+        return [
+            {
+                "sha": sha,
+                "message": message,
+                "author_name": author_name,
+                "authored_at": parse_timestamp(authored_at),
+                "committed_at": parse_timestamp(committed_at),
+            }
+            for sha, message, author_name, authored_at, committed_at in rows
+        ]
+
+    async def replace_open_pull_requests(
+        self, repository: str, changed: List[Dict[str, Any]], open_numbers: List[int]
+    ):
+        """Store changed PR payloads and drop PRs that are no longer open."""
+        async with self._lock:
+            await self._db.executemany("""
+                INSERT OR REPLACE INTO github_pull_requests (repository, number, payload, updated_at)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (repository, payload["number"], json.dumps(payload), payload.get("updated_at"))
+                for payload in changed
+            ])
+            placeholders = ", ".join("?" for _ in open_numbers)
+            await self._db.execute(
+                "DELETE FROM github_pull_requests WHERE repository = ?"
+                + (f" AND number NOT IN ({placeholders})" if open_numbers else ""),
+                (repository, *open_numbers)
+            )
+            await self._db.commit()
+
+    async def get_open_pull_requests(self, repository: str) -> List[Dict[str, Any]]:
+        """Stored open PR payloads, newest first."""
+        async with self._db.execute(
+            "SELECT payload FROM github_pull_requests WHERE repository = ? ORDER BY number DESC",
+            (repository,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+class GitHubActivitySync:
+    """Keeps a GitHubActivityStore up to date using conditional REST requests."""
+
+    def __init__(
+        self,
+        store: GitHubActivityStore,
+        token: Optional[str] = None,
+        api_url: str = GITHUB_API_URL,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        on_rate_limit: Optional[Callable[[int, int, datetime], None]] = None,
+    ):
+        """
+        Args:
+            store: Store to sync into
+            token: GitHub token
+            api_url: REST API base URL
+            transport: httpx transport, for tests
+            on_rate_limit: Called with (limit, remaining, reset_time) from response headers
+        """
+        self.store = store
+        self.on_rate_limit = on_rate_limit
+        headers = {"Accept": "application/vnd.github+json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        self._client = httpx.AsyncClient(
+            base_url=api_url, headers=headers, transport=transport, timeout=30.0
+        )
+        self._opened = False
+        self._open_lock = asyncio.Lock()
+        self._sync_locks: Dict[tuple, asyncio.Lock] = {}
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "not_modified": 0,
+            "listed_pages": 0,
+        }
+
+    async def open(self):
+        async with self._open_lock:
+            if not self._opened:
+                await self.store.open()
+                self._opened = True
+
+    async def close(self):
+        await self._client.aclose()
+        if self._opened:
+            await self.store.close()
+            self._opened = False
+
+    def _sync_lock(self, repository: str, resource: str) -> asyncio.Lock:
+        return self._sync_locks.setdefault((repository, resource), asyncio.Lock())
+
+    async def _get(
+        self, url: str, params: Optional[Dict[str, Any]] = None, etag: Optional[str] = None
+    ) -> Optional[httpx.Response]:
+        """GET a list page; None means 304 Not Modified."""
+        headers = {"If-None-Match": etag} if etag else {}
+        response = await self._client.get(url, params=params, headers=headers)
+        self.stats["requests"] += 1
+        self._record_rate_limit(response)
+
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+            return None
+        response.raise_for_status()
+        self.stats["listed_pages"] += 1
+        return response
+
+    def _record_rate_limit(self, response: httpx.Response):
+        if self.on_rate_limit is None:
+            return
+        try:
+            limit = int(response.headers["x-ratelimit-limit"])
+            remaining = int(response.headers["x-ratelimit-remaining"])
+            reset = int(response.headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        self.on_rate_limit(limit, remaining, datetime.fromtimestamp(reset, timezone.utc))
+
+    async def sync_commits(self, repository: str, since: datetime):
+        """Bring stored commits up to date, covering at least back to ``since``."""
+        await self.open()
+        async with self._sync_lock(repository, COMMITS):
+            state = await self.store.get_sync_state(repository, COMMITS)
+            url = f"/repos/{repository}/commits"
+            since_ts = format_timestamp(since)
+            covered_from = state.get("covered_from")
+
+            if covered_from is not None and since_ts < covered_from:
+                # Backfill the older range once; newer commits are already stored
+                older = await self._list_all(url, {"since": since_ts, "until": covered_from, "per_page": PAGE_SIZE})
+                await self.store.upsert_commits(repository, older)
+                covered_from = since_ts
+
+            floor = covered_from or since_ts
+            first = await self._get(url, {"per_page": PAGE_SIZE}, etag=state.get("etag") if covered_from else None)
+            if first is None:
+                if covered_from != state.get("covered_from"):
+                    await self.store.save_sync_state(repository, COMMITS, {**state, "covered_from": covered_from})
+                return
+
+            first_page = first.json()
+            head = state.get("head")
+            new_commits = None
+            if head is not None and first_page:
+                new_commits = _linear_commits_since(first_page, head)
+                if new_commits is None:
+                    new_commits = await self._compare_commits(repository, head, first_page[0]["sha"])
+            if new_commits is None:
+                new_commits = await self._list_down_to(first, floor)
+
+            await self.store.upsert_commits(repository, new_commits)
+            await self.store.save_sync_state(repository, COMMITS, {
+                "etag": first.headers.get("etag"),
+                "head": first_page[0]["sha"] if first_page else state.get("head"),
+                "covered_from": floor,
+            })
+            logger.debug(f"Synced {len(new_commits)} new commits for {repository}")
+
+    async def _compare_commits(
+        self, repository: str, base: str, head: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Commits reachable from ``head`` but not ``base``; None if ``base`` is no longer an ancestor."""
+        try:
+            response = await self._get(
+                f"/repos/{repository}/compare/{base}...{head}", {"per_page": PAGE_SIZE}
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+        commits: List[Dict[str, Any]] = []
+        while response is not None:
+            comparison = response.json()
+            if comparison.get("status") not in ("ahead", "identical"):
+                # History was rewritten past the stored head
+                return None
+            commits.extend(comparison.get("commits", []))
+            next_url = _next_link(response)
+            response = await self._get(next_url) if next_url else None
+        return commits
+
+    async def _list_down_to(self, first: httpx.Response, floor: str) -> List[Dict[str, Any]]:
+        """Page a commit listing until commits are older than ``floor``."""
+        commits: List[Dict[str, Any]] = []
+        response: Optional[httpx.Response] = first
+        while response is not None:
+            for item in response.json():
+                committer = item["commit"].get("committer") or item["commit"].get("author") or {}
+                if (committer.get("date") or "") < floor:
+                    return commits
+                commits.append(item)
+            next_url = _next_link(response)
+            response = await self._get(next_url) if next_url else None
+        return commits
+
+    async def sync_open_pull_requests(self, repository: str):
+        """Bring stored open PRs up to date, downloading only pages that changed."""
+        await self.open()
+        async with self._sync_lock(repository, OPEN_PULL_REQUESTS):
+            state = await self.store.get_sync_state(repository, OPEN_PULL_REQUESTS)
+            cached_pages = state.get("pages", [])
+
+            url: Optional[str] = f"/repos/{repository}/pulls"
+            params: Optional[Dict[str, Any]] = {"state": "open", "per_page": PAGE_SIZE}
+            pages = []
+            changed: List[Dict[str, Any]] = []
+            listed = False
+            while url:
+                cached = cached_pages[len(pages)] if len(pages) < len(cached_pages) else None
+                response = await self._get(url, params, etag=cached["etag"] if cached else None)
+                if response is None:
+                    page = cached
+                else:
+                    listed = True
+                    payloads = response.json()
+                    changed.extend(payloads)
+                    page = {
+                        "etag": response.headers.get("etag"),
+                        "numbers": [payload["number"] for payload in payloads],
+                        "next": _next_link(response),
+                    }
+                pages.append(page)
+                url, params = page["next"], None
+
+            # A listed page may have dropped PRs even when it returned none
+            if listed or len(pages) != len(cached_pages):
+                open_numbers = [number for page in pages for number in page["numbers"]]
+                await self.store.replace_open_pull_requests(repository, changed, open_numbers)
+                await self.store.save_sync_state(repository, OPEN_PULL_REQUESTS, {"pages": pages})
+
+    async def _list_all(self, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        response = await self._get(url, params)
+        while response is not None:
+            items.extend(response.json())
+            next_url = _next_link(response)
+            response = await self._get(next_url) if next_url else None
+        return items
+
+    async def get_commits(
+        self, repository: str, since: datetime, until: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Sync, then read commits committed in ``[since, until]`` from the store."""
+        await self.sync_commits(repository, since)
+        return await self.store.get_commits(repository, since, until)
+
+    async def get_open_pull_requests(self, repository: str) -> List[Dict[str, Any]]:
+        """Sync, then read open PR payloads from the store."""
+        await self.sync_open_pull_requests(repository)
+        return await self.store.get_open_pull_requests(repository)
+
+    def get_stats(self) -> Dict[str, int]:
+        return dict(self.stats)
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import statistics
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Union
+from typing import List, Dict, Optional, Any, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -26,10 +26,14 @@ from jira.resources import Issue, Sprint, Project
 from ..config import settings
 from ..models.core import JiraTicket
 from .github import DateRange
+from .sdk_executor import get_sdk_executor
 
 
 logger = logging.getLogger(__name__)
 
+# Tickets per upsert request when storing synced tickets
+DEFAULT_TICKET_BATCH_SIZE = 100
+
 
 # Enums for changelog analytics
 class TrendDirection(str, Enum):
@@ -197,6 +201,7 @@ class JiraService:
         self.token = token or settings.jira_token
         self._jira_client = None
         self._changelog_analyzer = None
+        self._sdk_executor = get_sdk_executor("jira", settings.jira_sdk_max_workers)
 
         if not all([self.server_url, self.username, self.token]):
             logger.warning(
@@ -235,8 +240,8 @@ class JiraService:
 
         for attempt in range(max_retries):
             try:
-                # Execute the function
-                result = func(*args, **kwargs)
+                # Execute the function on the SDK thread pool
+                result = await self._sdk_executor.run(func, *args, **kwargs)
                 return result
 
             except JIRAError as e:
@@ -674,77 +679,158 @@ class JiraService:
         except Exception as e:
             raise JiraAPIError(f"Failed to sync tickets: {e}")
 
-    async def store_tickets_in_database(self, tickets: List[JiraTicket]) -> Dict[str, Any]:
-        """Store or update JIRA tickets in the database."""
+    @staticmethod
+    def _ticket_to_db_row(ticket: JiraTicket) -> Dict[str, Any]:
+        """Prepare ticket data for the jira_tickets table."""
+        return {
+            "key": ticket.key,
+            "summary": ticket.summary,
+            "status": ticket.status,
+            "assignee": ticket.assignee,
+            "priority": ticket.priority,
+            "story_points": ticket.story_points,
+            "sprint": ticket.sprint,
+            "blocked": ticket.blocked,
+            "last_updated": ticket.last_updated.isoformat(),
+            "data": {
+                "time_in_status_days": ticket.time_in_status.days,
+                "time_in_status_seconds": ticket.time_in_status.total_seconds(),
+            },
+        }
+
+    async def store_tickets_in_database(
+        self,
+        tickets: List[JiraTicket],
+        batch_size: Optional[int] = DEFAULT_TICKET_BATCH_SIZE,
+        max_chunk_retries: int = 2,
+    ) -> Dict[str, Any]:
+        """
+        Store or update JIRA tickets in the database.
+
+        Args:
+            tickets: Tickets to persist
+            batch_size: Tickets per upsert request; ``None`` stores tickets one
+                at a time with a select followed by an insert or update
+            max_chunk_retries: Retries for a failed chunk before its tickets
+                are reported as errors
+
+        Returns:
+            Summary with upserted (written) and error counts. Stored (inserted)
+            and updated counts are only known per ticket; they are None when
+            tickets are upserted in chunks, since the upsert doesn't tell them apart.
+        """
         try:
             from ..database.connection import get_database
 
             db = await get_database()
-            stored_count = 0
-            updated_count = 0
-            errors = []
 
-            for ticket in tickets:
-                try:
-                    # Prepare ticket data for database
-                    ticket_data = {
-                        "key": ticket.key,
-                        "summary": ticket.summary,
-                        "status": ticket.status,
-                        "assignee": ticket.assignee,
-                        "priority": ticket.priority,
-                        "story_points": ticket.story_points,
-                        "sprint": ticket.sprint,
-                        "blocked": ticket.blocked,
-                        "last_updated": ticket.last_updated.isoformat(),
-                        "data": {
-                            "time_in_status_days": ticket.time_in_status.days,
-                            "time_in_status_seconds": ticket.time_in_status.total_seconds(),
-                        },
-                    }
-
-                    # Check if ticket already exists
-                    existing = await db.select(
-                        table="jira_tickets",
-                        filters={"key": ticket.key},
-                        select_fields="key",
-                    )
-
-                    if existing:
-                        # Update existing ticket
-                        result = await db.update(
-                            table="jira_tickets",
-                            data=ticket_data,
-                            filters={"key": ticket.key},
-                        )
-                        updated_count += 1
-                    else:
-                        # Insert new ticket
-                        result = await db.insert(table="jira_tickets", data=ticket_data)
-                        stored_count += 1
-
-                except Exception as e:
-                    errors.append(f"Error processing {ticket.key}: {str(e)}")
-                    logger.error(f"Error storing ticket {ticket.key}: {e}")
+            if batch_size:
+                upserted_count, errors = await self._store_ticket_chunks(
+                    db, tickets, batch_size, max_chunk_retries
+                )
+                stored_count = updated_count = None
+                logger.info(
+                    f"Database storage complete: {upserted_count} upserted, {len(errors)} errors"
+                )
+            else:
+                stored_count, updated_count, errors = await self._store_tickets_individually(
+                    db, tickets
+                )
+                upserted_count = stored_count + updated_count
+                logger.info(
+                    f"Database storage complete: {stored_count} stored, "
+                    f"{updated_count} updated, {len(errors)} errors"
+                )
 
             summary = {
                 "total_processed": len(tickets),
+                "upserted_count": upserted_count,
                 "stored_count": stored_count,
                 "updated_count": updated_count,
                 "error_count": len(errors),
                 "errors": errors,
             }
-
-            logger.info(
-                f"Database storage complete: {stored_count} stored, "
-                f"{updated_count} updated, {len(errors)} errors"
-            )
             return summary
 
         except Exception as e:
             logger.error(f"Failed to store tickets in database: {e}")
             raise JiraAPIError(f"Database storage failed: {e}")
 
+    async def _store_tickets_individually(
+        self, db, tickets: List[JiraTicket]
+    ) -> Tuple[int, int, List[str]]:
+        """Store tickets one by one (two round trips per ticket)."""
+        stored_count = 0
+        updated_count = 0
+        errors = []
+
+        for ticket in tickets:
+            try:
+                ticket_data = self._ticket_to_db_row(ticket)
+
+                # Check if ticket already exists
+                existing = await db.select(
+                    table="jira_tickets",
+                    filters={"key": ticket.key},
+                    select_fields="key",
+                )
+
+                if existing:
+                    # Update existing ticket
+                    await db.update(
+                        table="jira_tickets",
+                        data=ticket_data,
+                        filters={"key": ticket.key},
+                    )
+                    updated_count += 1
+                else:
+                    # Insert new ticket
+                    await db.insert(table="jira_tickets", data=ticket_data)
+                    stored_count += 1
+
+            except Exception as e:
+                errors.append(f"Error processing {ticket.key}: {str(e)}")
+                logger.error(f"Error storing ticket {ticket.key}: {e}")
+
+        return stored_count, updated_count, errors
+
+    async def _store_ticket_chunks(
+        self, db, tickets: List[JiraTicket], batch_size: int, max_chunk_retries: int
+    ) -> Tuple[int, List[str]]:
+        """Upsert tickets in chunks, retrying only the chunks that fail (one request per chunk)."""
+        upserted_count = 0
+        errors = []
+
+        for chunk_start in range(0, len(tickets), batch_size):
+            chunk = tickets[chunk_start : chunk_start + batch_size]
+
+            try:
+                rows = [self._ticket_to_db_row(ticket) for ticket in chunk]
+            except Exception as e:
+                errors.append(f"Error preparing chunk at {chunk_start}: {str(e)}")
+                logger.error(f"Error preparing ticket chunk at {chunk_start}: {e}")
+                continue
+
+            keys = [row["key"] for row in rows]
+
+            for attempt in range(max_chunk_retries + 1):
+                try:
+                    result = await db.upsert(table="jira_tickets", data=rows, on_conflict="key")
+                    upserted_count += len(result) if result else len(keys)
+                    break
+
+                except Exception as e:
+                    logger.error(
+                        f"Ticket chunk at {chunk_start} failed on attempt "
+                        f"{attempt + 1}/{max_chunk_retries + 1}: {e}"
+                    )
+                    if attempt == max_chunk_retries:
+                        errors.extend(f"Error processing {key}: {str(e)}" for key in keys)
+                    else:
+                        await asyncio.sleep(0.5 * 2**attempt)
+
+        return upserted_count, errors
+
     async def get_assignee_tickets(self, assignee: str) -> List[JiraTicket]:
         """Get active tickets for a specific assignee."""
         try:
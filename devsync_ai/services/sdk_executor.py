@@ -0,0 +1,161 @@
+"""Bounded thread pools for blocking third-party SDK calls.
+
+PyGithub and jira-python are synchronous: every attribute access or method
+call may perform an HTTP request. Running them directly inside ``async def``
+blocks the event loop, so services dispatch them through a dedicated
+executor per service instead. Each executor caps concurrent SDK calls for
+its service and tracks how many calls are waiting for a worker.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Workers per executor when the service doesn't configure a valid cap
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class SDKExecutorStats:
+    """Counters for a single SDK executor."""
+
+    max_workers: int
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    active: int = 0
+    completed: int = 0
+    failed: int = 0
+    total_wait_ms: float = 0.0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        finished = self.completed + self.failed
+        return self.total_wait_ms / finished if finished else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "active": self.active,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.avg_wait_ms, 3),
+        }
+
+
+class SDKExecutor:
+    """Runs blocking SDK calls on a bounded, dedicated thread pool."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}_sdk"
+        )
+        self._lock = threading.Lock()
+        self._stats = SDKExecutorStats(max_workers=max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls submitted but still waiting for a free worker."""
+        return self._stats.queue_depth
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._stats.to_dict()
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` in the pool and await its result."""
+        submitted_at = time.perf_counter()
+
+        with self._lock:
+            self._stats.queue_depth += 1
+            self._stats.max_queue_depth = max(
+                self._stats.max_queue_depth, self._stats.queue_depth
+            )
+
+        started = False
+
+        def _call():
+            nonlocal started
+            with self._lock:
+                started = True
+                self._stats.queue_depth -= 1
+                self._stats.active += 1
+                self._stats.total_wait_ms += (time.perf_counter() - submitted_at) * 1000
+            failed = True
+            try:
+                result = func(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                with self._lock:
+                    self._stats.active -= 1
+                    if failed:
+                        self._stats.failed += 1
+                    else:
+                        self._stats.completed += 1
+
+        def _on_done(future):
+            # Cancelled before a worker picked it up (shutdown or caller cancelled)
+            if future.cancelled():
+                with self._lock:
+                    if not started:
+                        self._stats.queue_depth -= 1
+
+        try:
+            future = self._executor.submit(_call)
+        except RuntimeError:
+            with self._lock:
+                self._stats.queue_depth -= 1
+            raise
+        future.add_done_callback(_on_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_executors: Dict[str, SDKExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_sdk_executor(name: str, max_workers: Optional[int] = None) -> SDKExecutor:
+    """Get the shared executor for a service, creating it on first use.
+
+    The concurrency cap is fixed by the first caller; later calls with a
+    different ``max_workers`` reuse the existing pool. Anything but a positive
+    integer falls back to the default of 4 workers.
+    """
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+        max_workers = DEFAULT_MAX_WORKERS
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = SDKExecutor(name, max_workers)
+            _executors[name] = executor
+            logger.debug(f"Created {name} SDK executor with {executor.max_workers} workers")
+        return executor
+
+
+def get_sdk_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every SDK executor, keyed by service name."""
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {executor.name: executor.get_stats() for executor in executors}
+
+
+def shutdown_sdk_executors(wait: bool = False) -> None:
+    """Shut down all SDK executors (used on application shutdown)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
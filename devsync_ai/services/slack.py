@@ -6,7 +6,10 @@ Provides Slack integration with proper error handling and async support.
 import logging
 import json
 import os
-from typing import Dict, List, Optional, Any, Union
+import time
+import weakref
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import aiohttp
 import asyncio
@@ -17,6 +20,9 @@ from devsync_ai.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Clients holding an open pooled session, closed together on shutdown
+_open_clients: "weakref.WeakSet[AsyncSlackClient]" = weakref.WeakSet()
+
 
 class SlackClientError(Exception):
     """Base exception for Slack client errors."""
@@ -43,12 +49,36 @@ class AsyncSlackClient:
     
     BASE_URL = "https://slack.com/api"
     
+    # Requests per minute allowed by Slack's rate tiers
+    TIER_LIMITS = {1: 1, 2: 20, 3: 50, 4: 100}
+    METHOD_TIERS = {
+        "auth.test": 4,
+        "conversations.history": 3,
+        "conversations.list": 2,
+        "conversations.info": 3,
+        "conversations.join": 3,
+        "conversations.leave": 3,
+        "conversations.invite": 3,
+        "chat.update": 3,
+        "chat.delete": 3,
+        "files.upload": 2,
+        "users.info": 4,
+        "users.list": 2,
+        "reactions.add": 3,
+    }
+    DEFAULT_TIER = 3
+    # chat.postMessage is limited per channel (about one message per second)
+    POST_MESSAGE_PER_MINUTE = 60
+    
     def __init__(
         self,
         token: str,
         timeout: int = 30,
         max_retries: int = 3,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 20,
+        base_url: Optional[str] = None
     ):
         """
         Initialize the Slack client.
@@ -58,11 +88,18 @@ class AsyncSlackClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             logger: Optional logger instance
+            connection_limit: Maximum pooled connections
+            connection_limit_per_host: Maximum pooled connections per host
+            base_url: Override for the Slack API base URL
         """
         self.token = token
         self.timeout = timeout
         self.max_retries = max_retries
         self.logger = logger or logging.getLogger(__name__)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
         
         # Default headers
         self.headers = {
@@ -70,6 +107,90 @@ class AsyncSlackClient:
             "Content-Type": "application/json; charset=utf-8",
             "User-Agent": "DevSyncAI-SlackClient/1.0"
         }
+        
+        # Pooled session, created lazily on first request
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Rate limiting shared by every in-flight request of this client
+        self._rate_windows: Dict[Tuple[str, ...], Deque[float]] = defaultdict(deque)
+        self._rate_lock = asyncio.Lock()
+        self._blocked_until = 0.0
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            _open_clients.add(self)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        _open_clients.discard(self)
+    
+    async def __aenter__(self) -> "AsyncSlackClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    def _rate_key(self, endpoint: str, data: Optional[Dict[str, Any]]) -> Tuple[str, ...]:
+        if endpoint == "chat.postMessage" and data and data.get("channel"):
+            return (endpoint, str(data["channel"]))
+        return (endpoint,)
+    
+    def _rate_limit_for(self, endpoint: str) -> int:
+        if endpoint == "chat.postMessage":
+            return self.POST_MESSAGE_PER_MINUTE
+        return self.TIER_LIMITS[self.METHOD_TIERS.get(endpoint, self.DEFAULT_TIER)]
+    
+    async def _acquire_rate_slot(self, endpoint: str, data: Optional[Dict[str, Any]]) -> None:
+        """Wait for the method's tier window and any active ``retry_after``."""
+        key = self._rate_key(endpoint, data)
+        limit = self._rate_limit_for(endpoint)
+        
+        while True:
+            async with self._rate_lock:
+                now = time.monotonic()
+                window = self._rate_windows[key]
+                while window and now - window[0] >= 60:
+                    window.popleft()
+                
+                if now < self._blocked_until:
+                    wait_time = self._blocked_until - now
+                elif len(window) >= limit:
+                    wait_time = 60 - (now - window[0])
+                else:
+                    window.append(now)
+                    return
+            
+            self.logger.debug(f"Rate limit slot for {endpoint} busy, waiting {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+    
+    def _block_for(self, retry_after: float) -> None:
+        """Pause all requests of this client until ``retry_after`` has passed."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+    
+    def get_rate_limit_status(self) -> Dict[str, Any]:
+        """Current rate-limit pause and per-method request counts in the last minute."""
+        now = time.monotonic()
+        return {
+            "blocked_for": max(0.0, self._blocked_until - now),
+            "recent_requests": {
+                "/".join(key): sum(1 for ts in window if now - ts < 60)
+                for key, window in self._rate_windows.items()
+            },
+        }
     
     async def _make_request(
         self,
@@ -100,50 +221,56 @@ class AsyncSlackClient:
             try:
                 self.logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
                 
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
+                await self._acquire_rate_slot(endpoint, data)
+                session = await self._get_session()
+                retry_after_header = None
                 
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    if files:
-                        # For file uploads, use multipart form data
-                        form_data = aiohttp.FormData()
-                        if data:
-                            for key, value in data.items():
-                                form_data.add_field(key, str(value))
-                        
-                        for key, file_data in files.items():
-                            if isinstance(file_data, tuple):
-                                filename, content = file_data
-                                form_data.add_field(key, content, filename=filename)
-                            else:
-                                form_data.add_field(key, file_data)
-                        
-                        headers = {"Authorization": f"Bearer {self.token}"}
-                        async with session.request(
-                            method=method,
-                            url=url,
-                            data=form_data,
-                            headers=headers
-                        ) as response:
-                            result = await response.json()
-                    else:
-                        async with session.request(
-                            method=method,
-                            url=url,
-                            json=data,
-                            headers=self.headers
-                        ) as response:
-                            result = await response.json()
+                if files:
+                    # For file uploads, use multipart form data
+                    form_data = aiohttp.FormData()
+                    if data:
+                        for key, value in data.items():
+                            form_data.add_field(key, str(value))
+                    
+                    for key, file_data in files.items():
+                        if isinstance(file_data, tuple):
+                            filename, content = file_data
+                            form_data.add_field(key, content, filename=filename)
+                        else:
+                            form_data.add_field(key, file_data)
+                    
+                    headers = {"Authorization": f"Bearer {self.token}"}
+                    async with session.request(
+                        method=method,
+                        url=url,
+                        data=form_data,
+                        headers=headers
+                    ) as response:
+                        retry_after_header = response.headers.get("Retry-After")
+                        result = await response.json(content_type=None)
+                else:
+                    async with session.request(
+                        method=method,
+                        url=url,
+                        json=data,
+                        headers=self.headers
+                    ) as response:
+                        retry_after_header = response.headers.get("Retry-After")
+                        result = await response.json(content_type=None)
                 
                 if not result.get("ok", False):
                     error = result.get("error", "Unknown error")
                     self.logger.error(f"Slack API error: {error}")
                     
-                    # Retry on rate limit
-                    if error == "rate_limited" and attempt < self.max_retries:
-                        retry_after = result.get("retry_after", 1)
-                        self.logger.info(f"Rate limited, retrying after {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
+                    # Retry on rate limit, pausing every request of this client
+                    if error == "rate_limited":
+                        retry_after = float(
+                            result.get("retry_after") or retry_after_header or 1
+                        )
+                        self._block_for(retry_after)
+                        if attempt < self.max_retries:
+                            self.logger.info(f"Rate limited, retrying after {retry_after}s")
+                            continue
                     
                     raise SlackAPIError(error, result)
                 
@@ -520,6 +647,58 @@ class AsyncSlackClient:
             API response containing auth information
         """
         return await self._make_request("GET", "auth.test")
+    
+    async def send_many(
+        self,
+        messages: List[Dict[str, Any]],
+        max_concurrency: int = 10,
+        return_exceptions: bool = True
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Send several messages concurrently over the pooled session.
+        
+        Every request still goes through the per-method rate tiers, and a
+        ``retry_after`` from any response pauses all in-flight requests.
+        
+        Args:
+            messages: Keyword arguments for send_message, one dict per message
+            max_concurrency: Maximum number of requests in flight at once
+            return_exceptions: Return errors in the result list instead of raising
+            
+        Returns:
+            API responses (or exceptions) in the same order as ``messages``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _send(message: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.send_message(**message)
+        
+        return await asyncio.gather(
+            *(_send(message) for message in messages),
+            return_exceptions=return_exceptions
+        )
+
+
+_slack_clients: Dict[str, AsyncSlackClient] = {}
+
+
+def get_slack_client(token: str) -> AsyncSlackClient:
+    """Shared Slack client for a bot token.
+
+    Every SlackService for the token uses the same pooled session and the same
+    per-tier rate windows and ``Retry-After`` pause.
+    """
+    if token not in _slack_clients:
+        _slack_clients[token] = AsyncSlackClient(token)
+    return _slack_clients[token]
+
+
+async def close_slack_clients() -> None:
+    """Close the pooled sessions of every Slack client (used on application shutdown)."""
+    clients = list(_open_clients)
+    _slack_clients.clear()
+    await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
 
 
 class SlackService:
@@ -535,7 +714,7 @@ class SlackService:
         self._changelog_integration = None
         
         if self.token:
-            self.client = AsyncSlackClient(self.token)
+            self.client = get_slack_client(self.token)
             logger.info("✅ Slack service initialized")
         else:
             logger.warning("⚠️ Slack bot token not found - Slack features disabled")
@@ -0,0 +1,428 @@
+"""
+Durable accept-and-ack ingestion queue for JIRA webhooks.
+
+The endpoint appends the raw payload to a SQLite journal (WAL mode, synchronous
+commits) and acknowledges with 202 straight away, so JIRA never retries
+because processing was slow. A pool of workers drains the journal:
+
+- Delivery is at-least-once. An entry is marked done only after its handler
+  returns; entries left in flight by a crash are replayed on the next start.
+- JIRA retries are deduplicated on the webhook identifier header, falling back
+  to the event, issue and timestamp in the payload. Completed entries are kept
+  for ``retention_seconds`` so late retries are still recognized.
+- Entries for the same issue are processed one at a time in arrival order.
+- Failed entries are retried with exponential backoff and dead-lettered after
+  ``max_attempts``. Handlers record the steps they finished in the entry's
+  ``completed_steps`` so a retry only repeats the steps that failed, and raise
+  PermanentWebhookError for failures that no retry can fix.
+
+The journal belongs to a single process; give each worker process its own path.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import aiosqlite
+
+
+logger = logging.getLogger(__name__)
+
+# Header JIRA sets to the same value on every retry of a delivery
+WEBHOOK_ID_HEADER = "x-atlassian-webhook-identifier"
+
+# Headers kept in the journal for the handler
+JOURNALED_HEADERS = ("content-type", "user-agent", WEBHOOK_ID_HEADER, "x-hub-signature")
+
+# Called with (webhook_data, headers, completed_steps); see JournalEntry.completed_steps
+JiraWebhookHandler = Callable[[Dict[str, Any], Dict[str, str], Set[str]], Awaitable[Any]]
+
+
+class PermanentWebhookError(Exception):
+    """Raised by a handler when retrying the webhook cannot succeed; the entry is dead-lettered."""
+    pass
+
+
+@dataclass
+class JournalEntry:
+    """A webhook claimed from the journal."""
+    entry_id: int
+    idempotency_key: str
+    payload: Dict[str, Any]
+    headers: Dict[str, str]
+    received_at: float
+    attempts: int
+    # Steps finished by earlier attempts; the handler adds the ones it finishes
+    completed_steps: Set[str] = field(default_factory=set)
+
+
+def idempotency_key_for(webhook_data: Dict[str, Any], headers: Dict[str, str], raw_payload: bytes) -> str:
+    """Derive the key identifying a webhook delivery across JIRA retries."""
+    webhook_id = headers.get(WEBHOOK_ID_HEADER)
+    if webhook_id:
+        return f"id:{webhook_id}"
+
+    timestamp = webhook_data.get("timestamp")
+    if timestamp is not None:
+        issue_key = webhook_data.get("issue", {}).get("key", "")
+        return f"event:{webhook_data.get('webhookEvent', 'unknown')}:{issue_key}:{timestamp}"
+
+    return f"sha256:{hashlib.sha256(raw_payload).hexdigest()}"
+
+
+class WebhookJournal:
+    """Append-only SQLite journal of received webhooks."""
+
+    def __init__(self, db_path: str = "jira_webhook_journal.db"):
+        self.db_path = db_path
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def open(self):
+        """Open the journal and requeue entries left in flight by a previous run."""
+        self._db = await aiosqlite.connect(self.db_path)
+
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        # Acknowledged webhooks must survive power loss, not just a process crash
+        await self._db.execute("PRAGMA synchronous=FULL")
+        await self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS jira_webhook_journal (
+                entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                ordering_key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                headers TEXT NOT NULL,
+                received_at REAL NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                completed_at REAL,
+                last_error TEXT,
+                completed_steps TEXT NOT NULL DEFAULT '[]'
+            );
+            CREATE INDEX IF NOT EXISTS idx_jira_webhook_journal_status
+                ON jira_webhook_journal (status, entry_id);
+            CREATE INDEX IF NOT EXISTS idx_jira_webhook_journal_ordering
+                ON jira_webhook_journal (ordering_key, status, entry_id);
+        """)
+
+        # Journals created before steps were recorded
+        cursor = await self._db.execute("PRAGMA table_info(jira_webhook_journal)")
+        if "completed_steps" not in {row[1] for row in await cursor.fetchall()}:
+            await self._db.execute(
+                "ALTER TABLE jira_webhook_journal ADD COLUMN completed_steps TEXT NOT NULL DEFAULT '[]'"
+            )
+
+        cursor = await self._db.execute(
+            "UPDATE jira_webhook_journal SET status = 'pending' WHERE status = 'processing'"
+        )
+        if cursor.rowcount:
+            logger.warning(f"Replaying {cursor.rowcount} JIRA webhooks left in flight")
+        await self._db.commit()
+
+    async def close(self):
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def append(
+        self,
+        idempotency_key: str,
+        ordering_key: str,
+        raw_payload: bytes,
+        headers: Dict[str, str]
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Persist a webhook.
+
+        Returns:
+            The entry id and False, or (None, True) if the delivery was
+            already journaled
+        """
+        now = time.time()
+        async with self._lock:
+            cursor = await self._db.execute("""
+                INSERT OR IGNORE INTO jira_webhook_journal
+                    (idempotency_key, ordering_key, payload, headers, received_at, available_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (idempotency_key, ordering_key, raw_payload.decode(), json.dumps(headers), now, now))
+            await self._db.commit()
+
+        if cursor.rowcount == 0:
+            return None, True
+        return cursor.lastrowid, False
+
+    async def claim(self) -> Optional[JournalEntry]:
+        """
+        Claim the oldest entry that is due and has no earlier unfinished entry
+        for the same issue.
+        """
+        async with self._lock:
+            cursor = await self._db.execute("""
+                SELECT entry_id, idempotency_key, payload, headers, received_at, attempts, completed_steps
+                FROM jira_webhook_journal AS entry
+                WHERE status = 'pending' AND available_at <= ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM jira_webhook_journal AS earlier
+                      WHERE earlier.ordering_key = entry.ordering_key
+                        AND earlier.status IN ('pending', 'processing')
+                        AND earlier.entry_id < entry.entry_id
+                  )
+                ORDER BY entry_id
+                LIMIT 1
+            """, (time.time(),))
+            row = await cursor.fetchone()
+            if row is None:
+                return None
+
+            await self._db.execute(
+                "UPDATE jira_webhook_journal SET status = 'processing', attempts = attempts + 1 WHERE entry_id = ?",
+                (row[0],)
+            )
+            await self._db.commit()
+
+        return JournalEntry(
+            entry_id=row[0],
+            idempotency_key=row[1],
+            payload=json.loads(row[2]),
+            headers=json.loads(row[3]),
+            received_at=row[4],
+            attempts=row[5] + 1,
+            completed_steps=set(json.loads(row[6]))
+        )
+
+    async def complete(self, entry_id: int):
+        """Mark an entry as processed."""
+        async with self._lock:
+            await self._db.execute(
+                "UPDATE jira_webhook_journal SET status = 'done', completed_at = ?, last_error = NULL WHERE entry_id = ?",
+                (time.time(), entry_id)
+            )
+            await self._db.commit()
+
+    async def fail(
+        self,
+        entry_id: int,
+        error: str,
+        retry_delay: Optional[float],
+        completed_steps: Set[str] = frozenset()
+    ):
+        """
+        Schedule an entry for retry after ``retry_delay``, or dead-letter it if None.
+        ``completed_steps`` are skipped by the retry.
+        """
+        steps = json.dumps(sorted(completed_steps))
+        async with self._lock:
+            if retry_delay is None:
+                await self._db.execute("""
+                    UPDATE jira_webhook_journal SET status = 'failed', completed_at = ?, last_error = ?,
+                        completed_steps = ?
+                    WHERE entry_id = ?
+                """, (time.time(), error, steps, entry_id))
+            else:
+                await self._db.execute("""
+                    UPDATE jira_webhook_journal SET status = 'pending', available_at = ?, last_error = ?,
+                        completed_steps = ?
+                    WHERE entry_id = ?
+                """, (time.time() + retry_delay, error, steps, entry_id))
+            await self._db.commit()
+
+    async def purge(self, older_than_seconds: float) -> int:
+        """Delete finished entries completed more than ``older_than_seconds`` ago."""
+        async with self._lock:
+            cursor = await self._db.execute(
+                "DELETE FROM jira_webhook_journal WHERE status IN ('done', 'failed') AND completed_at < ?",
+                (time.time() - older_than_seconds,)
+            )
+            await self._db.commit()
+        return cursor.rowcount
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Entry counts by status and the age of the oldest unfinished entry."""
+        cursor = await self._db.execute(
+            "SELECT status, COUNT(*), MIN(received_at) FROM jira_webhook_journal GROUP BY status"
+        )
+        rows = await cursor.fetchall()
+        counts = {status: count for status, count, _ in rows}
+        oldest = min(
+            (received_at for status, _, received_at in rows if status in ("pending", "processing")),
+            default=None
+        )
+        return {
+            "depth": counts.get("pending", 0) + counts.get("processing", 0),
+            "in_flight": counts.get("processing", 0),
+            "dead_lettered": counts.get("failed", 0),
+            "lag_seconds": round(time.time() - oldest, 3) if oldest is not None else 0.0
+        }
+
+
+class JiraIngestionQueue:
+    """Journal-backed queue with a pool of workers running a webhook handler."""
+
+    def __init__(
+        self,
+        handler: JiraWebhookHandler,
+        db_path: str = "jira_webhook_journal.db",
+        workers: int = 4,
+        max_attempts: int = 5,
+        retry_base_delay: float = 2.0,
+        retention_seconds: float = 86400.0,
+        poll_interval: float = 1.0
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            handler: Coroutine processing (webhook_data, headers, completed_steps);
+                raising retries the entry, PermanentWebhookError dead-letters it
+            db_path: Path of the SQLite journal
+            workers: Number of concurrent workers
+            max_attempts: Attempts before an entry is dead-lettered
+            retry_base_delay: First retry delay in seconds, doubled per attempt
+            retention_seconds: How long finished entries are kept for deduplication
+            poll_interval: Seconds idle workers wait before looking for due retries
+        """
+        self.handler = handler
+        self.journal = WebhookJournal(db_path)
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retention_seconds = retention_seconds
+        self.poll_interval = poll_interval
+
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+        self.stats = {"accepted": 0, "duplicates": 0, "processed": 0, "retried": 0, "dead_lettered": 0}
+
+    async def start(self):
+        """Open the journal, replay unfinished entries and start the workers."""
+        if self._running:
+            return
+        await self.journal.open()
+        self._running = True
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._purge_loop()))
+        self._wakeup.set()
+        logger.info(f"JIRA ingestion queue started with {self.workers} workers")
+
+    async def stop(self):
+        """Stop the workers; entries still in flight are replayed on the next start."""
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.journal.close()
+        logger.info("JIRA ingestion queue stopped")
+
+    async def enqueue(self, raw_payload: bytes, webhook_data: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Persist a verified webhook for processing.
+
+        Returns:
+            Acknowledgement details; ``duplicate`` is True for JIRA retries of a
+            delivery that was already accepted
+        """
+        headers = {name.lower(): value for name, value in headers.items() if name.lower() in JOURNALED_HEADERS}
+        idempotency_key = idempotency_key_for(webhook_data, headers, raw_payload)
+        ordering_key = webhook_data.get("issue", {}).get("key") or idempotency_key
+
+        entry_id, duplicate = await self.journal.append(idempotency_key, ordering_key, raw_payload, headers)
+        if duplicate:
+            self.stats["duplicates"] += 1
+        else:
+            self.stats["accepted"] += 1
+            self._wakeup.set()
+
+        return {"entry_id": entry_id, "idempotency_key": idempotency_key, "duplicate": duplicate}
+
+    async def _worker(self):
+        while self._running:
+            self._wakeup.clear()
+            try:
+                entry = await self.journal.claim()
+            except Exception as e:
+                logger.error(f"Error claiming JIRA webhook from journal: {e}")
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            if entry is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # Claiming may have unblocked entries for other issues
+            self._wakeup.set()
+            await self._process(entry)
+
+    async def _process(self, entry: JournalEntry):
+        try:
+            await self.handler(entry.payload, entry.headers, entry.completed_steps)
+        except Exception as e:
+            if isinstance(e, PermanentWebhookError) or entry.attempts >= self.max_attempts:
+                logger.error(f"JIRA webhook {entry.idempotency_key} dead-lettered after {entry.attempts} attempts: {e}")
+                await self.journal.fail(entry.entry_id, str(e), None, entry.completed_steps)
+                self.stats["dead_lettered"] += 1
+            else:
+                retry_delay = self.retry_base_delay * 2 ** (entry.attempts - 1)
+                logger.warning(f"JIRA webhook {entry.idempotency_key} failed, retrying in {retry_delay:.1f}s: {e}")
+                await self.journal.fail(entry.entry_id, str(e), retry_delay, entry.completed_steps)
+                self.stats["retried"] += 1
+        else:
+            await self.journal.complete(entry.entry_id)
+            self.stats["processed"] += 1
+        # Completing an entry unblocks the next one for its issue
+        self._wakeup.set()
+
+    async def _purge_loop(self):
+        while self._running:
+            await asyncio.sleep(min(self.retention_seconds, 3600))
+            try:
+                purged = await self.journal.purge(self.retention_seconds)
+                if purged:
+                    logger.debug(f"Purged {purged} finished JIRA webhooks from the journal")
+            except Exception as e:
+                logger.error(f"Error purging JIRA webhook journal: {e}")
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and lag plus counters since start."""
+        return {
+            **await self.journal.get_stats(),
+            "workers": self.workers,
+            "running": self._running,
+            **self.stats
+        }
+
+
+# Global ingestion queue (created on startup when enabled)
+_ingestion_queue: Optional[JiraIngestionQueue] = None
+
+
+def get_jira_ingestion_queue() -> Optional[JiraIngestionQueue]:
+    """Get the running ingestion queue, or None if webhooks are processed inline."""
+    return _ingestion_queue
+
+
+async def start_jira_ingestion_queue(handler: JiraWebhookHandler, **kwargs) -> JiraIngestionQueue:
+    """Create and start the global ingestion queue."""
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        queue = JiraIngestionQueue(handler, **kwargs)
+        await queue.start()
+        _ingestion_queue = queue
+    return _ingestion_queue
+
+
+async def shutdown_jira_ingestion_queue():
+    """Stop the global ingestion queue."""
+    global _ingestion_queue
+    if _ingestion_queue:
+        await _ingestion_queue.stop()
+        _ingestion_queue = None
@@ -63,7 +63,8 @@ async def initialize_dispatcher():
             hook_registry=hook_registry,
             lifecycle_manager=lifecycle_manager,
             webhook_secret=webhook_secret,
-            max_requests_per_minute=max_requests_per_minute
+            max_requests_per_minute=max_requests_per_minute,
+            worker_lanes=settings.jira_hook_worker_lanes
         )
         
         # Initialize hook registry with all JIRA Agent Hooks
@@ -83,10 +84,11 @@ async def shutdown_dispatcher():
     
     if _dispatcher is not None:
         try:
-            # Shutdown hook registry first
-            await shutdown_hook_registry()
+            # Finish events already queued while their hooks are still registered
+            await _dispatcher.shutdown()
             
-            # Then shutdown dispatcher
+            # Then shutdown the hook registry
+            await shutdown_hook_registry()
             await _dispatcher.lifecycle_manager.stop()
             _dispatcher = None
             logger.info("Agent Hook Dispatcher and Registry shutdown successfully")
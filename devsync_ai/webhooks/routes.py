@@ -1,7 +1,8 @@
 """Webhook routes for external service integrations."""
 
 from fastapi import APIRouter, Request, HTTPException, Header, Form
-from typing import Dict, Any, Optional
+from fastapi.responses import JSONResponse
+from typing import Dict, Any, List, Optional, Set, Tuple
 import hmac
 import hashlib
 import logging
@@ -13,6 +14,9 @@ from devsync_ai.config import settings
 from devsync_ai.webhooks.jira_webhook_handler import jira_webhook_router, initialize_dispatcher, shutdown_dispatcher
 from devsync_ai.webhooks.jira_assignment_webhook_handler import jira_assignment_router, initialize_assignment_hook, shutdown_assignment_hook
 from devsync_ai.webhooks.secure_webhook_handler import secure_webhook_handler
+from devsync_ai.webhooks.jira_ingestion_queue import (
+    JiraIngestionQueue, PermanentWebhookError, get_jira_ingestion_queue
+)
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,18 @@ def verify_github_signature(payload: bytes, signature: str) -> bool:
     return hmac.compare_digest(f"sha256={expected_signature}", signature)
 
 
+def verify_jira_signature(payload: bytes, signature: str) -> bool:
+    """Verify JIRA webhook signature (X-Hub-Signature)."""
+    if not signature.startswith("sha256="):
+        return False
+
+    expected_signature = hmac.new(
+        settings.jira_webhook_secret.encode(), payload, hashlib.sha256
+    ).hexdigest()
+
+    return hmac.compare_digest(f"sha256={expected_signature}", signature)
+
+
 def verify_slack_signature(payload: bytes, timestamp: str, signature: str) -> bool:
     """Verify Slack webhook signature."""
     if not timestamp or not signature:
@@ -378,6 +394,18 @@ async def webhook_health_check():
         }
         status["status"] = "degraded"
     
+    # JIRA ingestion queue depth and lag
+    ingestion_queue = get_jira_ingestion_queue()
+    if ingestion_queue is not None:
+        try:
+            status["jira_ingestion"] = await ingestion_queue.get_stats()
+        except Exception as e:
+            status["jira_ingestion"] = {
+                "status": "error",
+                "error": str(e)
+            }
+            status["status"] = "degraded"
+    
     return status
 
 
@@ -664,7 +692,7 @@ async def process_jira_ticket_update(payload: Dict[str, Any]) -> Dict[str, Any]:
 
         if not ticket_key:
             logger.warning("JIRA webhook missing ticket key")
-            return {"message": "Missing ticket key", "status": "error"}
+            return {"message": "Missing ticket key", "status": "error", "retryable": False}
 
         # Get JIRA service to convert issue data
         jira_service = JiraService()
@@ -765,9 +793,171 @@ async def detect_and_store_blockers(tickets: list) -> None:
         logger.error(f"Error in blocker detection: {e}", exc_info=True)
 
 
+class JiraWebhookProcessingError(Exception):
+    """Raised when a step of processing a queued JIRA webhook failed."""
+    pass
+
+
+class PermanentJiraWebhookError(JiraWebhookProcessingError, PermanentWebhookError):
+    """Raised when the only failed steps are ones a retry cannot fix."""
+    pass
+
+
+# Assignment processor errors caused by the webhook itself
+PERMANENT_ASSIGNMENT_ERRORS = {"security_validation_failed"}
+
+
+async def process_jira_webhook_event(
+    webhook_data: Dict[str, Any],
+    headers: Dict[str, str],
+    strict: bool = False,
+    completed_steps: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run assignment analysis, notifications and ticket updates for a JIRA webhook.
+    
+    Args:
+        webhook_data: Parsed webhook payload
+        headers: Request headers
+        strict: Raise JiraWebhookProcessingError if any step failed instead of
+            reporting it in the result, so the ingestion queue retries the entry
+        completed_steps: Steps finished by an earlier attempt, which are
+            skipped; steps that succeed are added to it
+    """
+    completed_steps = set() if completed_steps is None else completed_steps
+    # (description, permanent) per failed step
+    failures: List[Tuple[str, bool]] = []
+    
+    # Extract basic webhook info
+    webhook_event = webhook_data.get("webhookEvent", "unknown")
+    issue_key = webhook_data.get("issue", {}).get("key", "unknown")
+    team_id = webhook_data.get("issue", {}).get("fields", {}).get("project", {}).get("key", "default")
+    
+    logger.info(f"📋 JIRA webhook event: {webhook_event} for {issue_key}")
+    
+    async def notify():
+        # Send through enhanced notification system
+        if "notification" in completed_steps:
+            return
+        try:
+            if await send_enhanced_notification(f"jira:{webhook_event}", webhook_data, team_id):
+                completed_steps.add("notification")
+            else:
+                failures.append(("enhanced notification", False))
+        except Exception as e:
+            logger.warning(f"Enhanced notification failed: {e}")
+            failures.append((f"enhanced notification: {e}", False))
+    
+    def raise_for_failures():
+        if not strict or not failures:
+            return
+        message = f"JIRA webhook for {issue_key} failed: {'; '.join(failure for failure, _ in failures)}"
+        if all(permanent for _, permanent in failures):
+            raise PermanentJiraWebhookError(message)
+        raise JiraWebhookProcessingError(message)
+    
+    # Check if this is an assignment change
+    from devsync_ai.webhooks.jira_assignment_webhook_processor import jira_assignment_processor
+    
+    if jira_assignment_processor._is_assignment_change(webhook_data):
+        logger.info(f"🎯 Assignment change detected for {issue_key}")
+        
+        if "assignment" in completed_steps:
+            assignment_result = {"success": True, "message": "Processed by an earlier attempt"}
+        else:
+            # Process assignment change
+            assignment_result = await jira_assignment_processor.process_webhook(webhook_data, headers)
+        
+        if assignment_result.get("success"):
+            logger.info(f"✅ Assignment change processed successfully for {issue_key}")
+            completed_steps.add("assignment")
+        else:
+            error = assignment_result.get("error")
+            logger.error(f"❌ Assignment change processing failed for {issue_key}: {error}")
+            failures.append((f"assignment processing: {error}", error in PERMANENT_ASSIGNMENT_ERRORS))
+        
+        # Also send through enhanced notification system
+        await notify()
+        raise_for_failures()
+        
+        return {
+            "message": f"JIRA assignment change processed for {issue_key}",
+            "webhook_event": webhook_event,
+            "issue_key": issue_key,
+            "assignment_processing": assignment_result,
+            "status": "success" if assignment_result.get("success") else "partial_success"
+        }
+    
+    # Handle other JIRA webhook events
+    logger.info(f"📋 Processing general JIRA webhook: {webhook_event}")
+    
+    await notify()
+    
+    # Process other JIRA events (existing logic)
+    if webhook_event == "jira:issue_updated" and "ticket_update" not in completed_steps:
+        # Handle general issue updates
+        update_result = await process_jira_ticket_update(webhook_data)
+        if update_result.get("status") == "error":
+            failures.append((f"ticket update: {update_result.get('message')}", not update_result.get("retryable", True)))
+        else:
+            completed_steps.add("ticket_update")
+    
+    raise_for_failures()
+    
+    return {
+        "message": f"JIRA webhook processed for {issue_key}",
+        "webhook_event": webhook_event,
+        "issue_key": issue_key,
+        "status": "success"
+    }
+
+
+async def process_queued_jira_webhook(
+    webhook_data: Dict[str, Any], headers: Dict[str, str], completed_steps: Set[str]
+) -> Dict[str, Any]:
+    """Ingestion queue handler: failed steps raise, so the entry is retried without repeating finished steps."""
+    return await process_jira_webhook_event(webhook_data, headers, strict=True, completed_steps=completed_steps)
+
+
+async def accept_jira_webhook(request: Request, ingestion_queue: JiraIngestionQueue) -> JSONResponse:
+    """Verify and journal a JIRA webhook, acknowledging it before processing."""
+    raw_payload = await request.body()
+    
+    if settings.jira_webhook_secret and not verify_jira_signature(
+        raw_payload, request.headers.get("X-Hub-Signature", "")
+    ):
+        raise HTTPException(status_code=401, detail="Invalid signature")
+    
+    try:
+        webhook_data = json.loads(raw_payload.decode())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON payload: {e}")
+    if not isinstance(webhook_data, dict):
+        raise HTTPException(status_code=400, detail="JIRA webhook payload must be a JSON object")
+    
+    try:
+        receipt = await ingestion_queue.enqueue(raw_payload, webhook_data, dict(request.headers))
+    except Exception as e:
+        # Not journaled: let JIRA retry the delivery
+        logger.error(f"❌ Failed to journal JIRA webhook: {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="JIRA webhook could not be queued")
+    
+    return JSONResponse(status_code=202, content={
+        "message": "JIRA webhook accepted",
+        "webhook_event": webhook_data.get("webhookEvent", "unknown"),
+        "issue_key": webhook_data.get("issue", {}).get("key", "unknown"),
+        "status": "duplicate" if receipt["duplicate"] else "accepted",
+        "idempotency_key": receipt["idempotency_key"]
+    })
+
+
 @webhook_router.post("/jira")
 async def jira_webhook(request: Request) -> Dict[str, Any]:
     """Handle JIRA webhook events for enhanced notifications and assignment analysis."""
+    ingestion_queue = get_jira_ingestion_queue()
+    if ingestion_queue is not None:
+        return await accept_jira_webhook(request, ingestion_queue)
+    
     try:
         logger.info("🚀 Received JIRA webhook")
         
@@ -779,65 +969,7 @@ async def jira_webhook(request: Request) -> Dict[str, Any]:
             webhook_data = json.loads(raw_payload.decode())
             logger.info("✅ Successfully parsed JIRA webhook payload")
             
-            # Extract basic webhook info
-            webhook_event = webhook_data.get("webhookEvent", "unknown")
-            issue_key = webhook_data.get("issue", {}).get("key", "unknown")
-            
-            logger.info(f"📋 JIRA webhook event: {webhook_event} for {issue_key}")
-            
-            # Check if this is an assignment change
-            from devsync_ai.webhooks.jira_assignment_webhook_processor import jira_assignment_processor
-            
-            if jira_assignment_processor._is_assignment_change(webhook_data):
-                logger.info(f"🎯 Assignment change detected for {issue_key}")
-                
-                # Process assignment change
-                assignment_result = await jira_assignment_processor.process_webhook(
-                    webhook_data, dict(request.headers)
-                )
-                
-                if assignment_result.get("success"):
-                    logger.info(f"✅ Assignment change processed successfully for {issue_key}")
-                else:
-                    logger.error(f"❌ Assignment change processing failed for {issue_key}: {assignment_result.get('error')}")
-                
-                # Also send through enhanced notification system
-                try:
-                    team_id = webhook_data.get("issue", {}).get("fields", {}).get("project", {}).get("key", "default")
-                    await send_enhanced_notification(f"jira:{webhook_event}", webhook_data, team_id)
-                except Exception as e:
-                    logger.warning(f"Enhanced notification failed: {e}")
-                
-                return {
-                    "message": f"JIRA assignment change processed for {issue_key}",
-                    "webhook_event": webhook_event,
-                    "issue_key": issue_key,
-                    "assignment_processing": assignment_result,
-                    "status": "success" if assignment_result.get("success") else "partial_success"
-                }
-            
-            # Handle other JIRA webhook events
-            else:
-                logger.info(f"📋 Processing general JIRA webhook: {webhook_event}")
-                
-                # Send through enhanced notification system
-                try:
-                    team_id = webhook_data.get("issue", {}).get("fields", {}).get("project", {}).get("key", "default")
-                    await send_enhanced_notification(f"jira:{webhook_event}", webhook_data, team_id)
-                except Exception as e:
-                    logger.warning(f"Enhanced notification failed: {e}")
-                
-                # Process other JIRA events (existing logic)
-                if webhook_event == "jira:issue_updated":
-                    # Handle general issue updates
-                    await process_jira_ticket_update(webhook_data)
-                
-                return {
-                    "message": f"JIRA webhook processed for {issue_key}",
-                    "webhook_event": webhook_event,
-                    "issue_key": issue_key,
-                    "status": "success"
-                }
+            return await process_jira_webhook_event(webhook_data, dict(request.headers))
             
         except json.JSONDecodeError as e:
             logger.error(f"❌ Failed to parse JIRA webhook JSON: {e}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for AnalyticsDataManager record storage.
+
+Stores records one at a time through ``store_record`` (the path used by
+the hook analytics engine) and reports sustained throughput, comparing a
+connection-per-write baseline with the long-lived WAL connection and
+write-behind queue.
+
+Usage:
+    python scripts/benchmark_analytics_storage.py --records 20000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+import aiosqlite
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from devsync_ai.analytics.analytics_data_manager import AnalyticsDataManager, AnalyticsRecord
+
+
+def build_records(count: int) -> List[AnalyticsRecord]:
+    """Create synthetic hook execution records."""
+    now = datetime.now(timezone.utc)
+    return [
+        AnalyticsRecord(
+            id=f"bench-{i}",
+            timestamp=now,
+            record_type="hook_execution",
+            team_id=f"team-{i % 5}",
+            data={"hook_id": f"hook-{i % 20}", "execution_time_ms": i % 500, "success": i % 10 != 0},
+            metadata={"source": "benchmark"},
+        )
+        for i in range(count)
+    ]
+
+
+async def run_connection_per_write(db_path: str, records: List[AnalyticsRecord]) -> float:
+    """Previous behaviour: open a connection and commit for every record."""
+    manager = AnalyticsDataManager(db_path=db_path)
+    await manager._create_tables()
+    await manager.shutdown()
+
+    start = time.perf_counter()
+    for record in records:
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute(AnalyticsDataManager.INSERT_RECORD_SQL, (
+                record.id, record.timestamp.isoformat(), record.record_type,
+                record.team_id, json.dumps(record.data), json.dumps(record.metadata)
+            ))
+            await db.commit()
+    return time.perf_counter() - start
+
+
+async def run_write_behind(db_path: str, records: List[AnalyticsRecord]) -> float:
+    """Long-lived WAL connection with the write-behind queue."""
+    manager = AnalyticsDataManager(db_path=db_path)
+    await manager.initialize()
+
+    start = time.perf_counter()
+    for record in records:
+        await manager.store_record(record)
+    await manager.flush()
+    elapsed = time.perf_counter() - start
+
+    await manager.shutdown()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark analytics record storage")
+    parser.add_argument("--records", type=int, default=20000, help="Records to store")
+    parser.add_argument("--baseline-records", type=int, default=1000,
+                        help="Records for the connection-per-write baseline")
+    parser.add_argument("--target", type=float, default=10000, help="Target records/s")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_records = build_records(args.baseline_records)
+        baseline = await run_connection_per_write(f"{tmp}/baseline.db", baseline_records)
+        write_behind = await run_write_behind(f"{tmp}/write_behind.db", build_records(args.records))
+
+    baseline_rate = args.baseline_records / baseline
+    write_behind_rate = args.records / write_behind
+
+    print("\n📊 Analytics storage throughput")
+    print(f"{'mode':<26}{'records':>10}{'seconds':>10}{'records/s':>12}")
+    print(f"{'connection per write':<26}{args.baseline_records:>10}{baseline:>10.3f}{baseline_rate:>12.0f}")
+    print(f"{'write-behind (WAL)':<26}{args.records:>10}{write_behind:>10.3f}{write_behind_rate:>12.0f}")
+
+    status = "✅" if write_behind_rate >= args.target else "❌"
+    print(f"\n{status} Target {args.target:.0f} records/s, "
+          f"speedup {write_behind_rate / baseline_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
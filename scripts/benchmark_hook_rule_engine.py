@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark for HookRuleEngine rule evaluation.
+
+Loads synthetic rule sets for many teams and evaluates a stream of events
+(each event against one team, round-robin), comparing the previous
+interpreter — rules re-sorted per event and the event context rebuilt for
+every condition — with rules compiled at load time.
+
+Usage:
+    python scripts/benchmark_hook_rule_engine.py --teams 100 --rules 50 --events 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+import yaml
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from devsync_ai.core.agent_hooks import (
+    EnrichedEvent,
+    EventCategory,
+    EventClassification,
+    SignificanceLevel,
+    Stakeholder,
+    UrgencyLevel,
+)
+from devsync_ai.core.hook_rule_engine import (
+    HookRuleEngine,
+    RuleGroup,
+    RuleLogic,
+    RuleOperator,
+    TeamRuleSet,
+)
+
+PRIORITIES = ['Low', 'Medium', 'High', 'Critical']
+ISSUE_TYPES = ['Bug', 'Story', 'Task', 'Epic']
+STATUSES = ['To Do', 'In Progress', 'In Review', 'Done']
+
+
+def build_team_config(team_index: int, rule_count: int) -> dict:
+    """Create a team configuration with a mix of operators and nesting."""
+    rules = []
+    for i in range(rule_count):
+        priority = PRIORITIES[(team_index + i) % len(PRIORITIES)]
+        rules.append({
+            'rule_id': f'rule_{i}',
+            'name': f'Rule {i}',
+            'hook_types': ['StatusChangeHook', 'AssignmentHook'][: 1 + i % 2],
+            'enabled': True,
+            'priority': i % 7,
+            'conditions': {
+                'logic': 'and',
+                'conditions': [
+                    {'field': 'ticket.priority.name', 'operator': 'in',
+                     'value': [priority, 'Critical'], 'case_sensitive': False},
+                    {'field': 'ticket.summary', 'operator': 'regex',
+                     'value': f'(payment|checkout|team{team_index})-{i % 10}', 'case_sensitive': False},
+                    {
+                        'logic': 'or',
+                        'conditions': [
+                            {'field': 'event.classification.urgency', 'operator': 'equals', 'value': 'critical'},
+                            {'field': 'ticket.labels', 'operator': 'contains', 'value': f'label-{i % 5}'},
+                            {'field': 'stakeholders.roles', 'operator': 'contains', 'value': 'reviewer'},
+                        ]
+                    },
+                ]
+            },
+            'metadata': {'channels': [f'#team-{team_index}-{i}']}
+        })
+
+    return {
+        'team_id': f'team{team_index}',
+        'team_name': f'Team {team_index}',
+        'enabled': True,
+        'rules': rules,
+    }
+
+
+def build_events(count: int) -> List[EnrichedEvent]:
+    """Create synthetic enriched events."""
+    now = datetime.now(timezone.utc)
+    events = []
+    for i in range(count):
+        ticket_details = {
+            'key': f'PROJ-{i}',
+            'summary': f'Issue in payment-{i % 13} flow',
+            'status': {'name': STATUSES[i % len(STATUSES)]},
+            'priority': {'name': PRIORITIES[i % len(PRIORITIES)]},
+            'issue_type': {'name': ISSUE_TYPES[i % len(ISSUE_TYPES)]},
+            'labels': [f'label-{i % 7}', 'backend'],
+        }
+        events.append(EnrichedEvent(
+            event_id=f'event-{i}',
+            event_type='jira:issue_updated',
+            timestamp=now,
+            jira_event_data={'fields': ticket_details},
+            ticket_key=f'PROJ-{i}',
+            project_key='PROJ',
+            raw_payload={},
+            ticket_details=ticket_details,
+            stakeholders=[Stakeholder(user_id=f'user{i % 9}', display_name='User', role='assignee')],
+            classification=EventClassification(
+                category=EventCategory.STATUS_CHANGE,
+                urgency=UrgencyLevel.HIGH if i % 3 else UrgencyLevel.CRITICAL,
+                significance=SignificanceLevel.MODERATE,
+                affected_teams=['engineering'],
+                routing_hints={},
+                keywords=['payment'],
+            ),
+            context_data={},
+        ))
+    return events
+
+
+def interpret_condition(engine: HookRuleEngine, condition, event: EnrichedEvent) -> bool:
+    """Previous evaluation: context rebuilt and path split for every condition."""
+    if isinstance(condition, RuleGroup):
+        results = [interpret_condition(engine, c, event) for c in condition.conditions]
+        if not results:
+            return True
+        if condition.logic == RuleLogic.AND:
+            return all(results)
+        if condition.logic == RuleLogic.OR:
+            return any(results)
+        return not results[0]
+
+    value = engine._build_event_context(event)
+    for part in condition.field.split('.'):
+        value = value.get(part) if isinstance(value, dict) else None
+        if value is None:
+            return condition.operator in (
+                RuleOperator.NOT_EQUALS, RuleOperator.NOT_IN, RuleOperator.NOT_CONTAINS
+            )
+    return engine._apply_operator(condition.operator, value, condition.value, condition.case_sensitive)
+
+
+def run_interpreted(engine: HookRuleEngine, team_rules: List[TeamRuleSet], events: List[EnrichedEvent]) -> tuple:
+    matches = 0
+    start = time.perf_counter()
+    for i, event in enumerate(events):
+        rules = sorted(team_rules[i % len(team_rules)].rules, key=lambda r: r.priority, reverse=True)
+        for rule in rules:
+            if rule.enabled and interpret_condition(engine, rule.conditions, event):
+                matches += 1
+                break
+    return time.perf_counter() - start, matches
+
+
+async def run_compiled(engine: HookRuleEngine, team_ids: List[str], events: List[EnrichedEvent]) -> tuple:
+    matches = 0
+    start = time.perf_counter()
+    for i, event in enumerate(events):
+        result = await engine.evaluate_rules(event, team_ids[i % len(team_ids)])
+        matches += result.matched
+    return time.perf_counter() - start, matches
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark hook rule evaluation")
+    parser.add_argument("--teams", type=int, default=100, help="Teams with rule sets")
+    parser.add_argument("--rules", type=int, default=50, help="Rules per team")
+    parser.add_argument("--events", type=int, default=10000, help="Events to evaluate")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for team_index in range(args.teams):
+            with open(Path(tmp) / f'team_team{team_index}_hooks.yaml', 'w') as f:
+                yaml.dump(build_team_config(team_index, args.rules), f)
+
+        engine = HookRuleEngine(config_dir=tmp)
+        team_ids = [f'team{i}' for i in range(args.teams)]
+
+        load_start = time.perf_counter()
+        team_rules = [await engine.load_team_rules(team_id) for team_id in team_ids]
+        load_time = time.perf_counter() - load_start
+
+        events = build_events(args.events)
+        interpreted, interpreted_matches = run_interpreted(engine, team_rules, events)
+        compiled, compiled_matches = await run_compiled(engine, team_ids, events)
+
+    assert interpreted_matches == compiled_matches, "compiled and interpreted results differ"
+
+    print(f"\n📊 Hook rule evaluation ({args.teams} teams × {args.rules} rules, {args.events} events)")
+    print(f"Rule loading (YAML parse + compile): {load_time:.3f}s")
+    print(f"{'mode':<14}{'seconds':>10}{'events/s':>12}{'matched':>10}")
+    print(f"{'interpreted':<14}{interpreted:>10.3f}{args.events / interpreted:>12.0f}{interpreted_matches:>10}")
+    print(f"{'compiled':<14}{compiled:>10.3f}{args.events / compiled:>12.0f}{compiled_matches:>10}")
+    print(f"\n✅ Speedup {interpreted / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
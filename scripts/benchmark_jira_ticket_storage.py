@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark for JiraService.store_tickets_in_database.
+
+Compares the per-ticket storage path (select + insert/update per ticket)
+with the chunked upsert path against a local PostgREST stub that adds a
+fixed per-request latency, so the difference in round trips is visible
+without a real Supabase project.
+
+Usage:
+    python scripts/benchmark_jira_ticket_storage.py --tickets 500 --batch-size 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "benchmark-key")
+
+from devsync_ai.database.connection import SupabaseClient
+from devsync_ai.models.core import JiraTicket
+from devsync_ai.services.jira import JiraService
+
+
+class PostgRESTStub:
+    """In-memory jira_tickets table served over HTTP/1.1 with keep-alive."""
+
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.rows: Dict[str, Dict] = {}
+        self.requests = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    def reset(self) -> None:
+        self.rows.clear()
+        self.requests = 0
+
+    def _dispatch(self, method: str, target: str, body: bytes) -> List[Dict]:
+        query = parse_qs(urlsplit(target).query)
+        key_filter = query.get("key", [""])[0]
+
+        if method == "GET":
+            if key_filter.startswith("in.("):
+                keys = key_filter[4:-1].split(",")
+            else:
+                keys = [key_filter[3:]]
+            return [{"key": key} for key in keys if key in self.rows]
+
+        if method == "PATCH":
+            key = key_filter[3:]
+            self.rows[key].update(json.loads(body))
+            return [self.rows[key]]
+
+        # POST: insert or upsert
+        payload = json.loads(body)
+        rows = payload if isinstance(payload, list) else [payload]
+        for row in rows:
+            self.rows[row["key"]] = row
+        return rows
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode().split("\r\n")
+                method, target, _ = lines[0].split(" ", 2)
+                length = 0
+                for line in lines[1:]:
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                body = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                payload = json.dumps(self._dispatch(method, target, body)).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+def build_tickets(count: int) -> List[JiraTicket]:
+    """Create synthetic tickets for the benchmark."""
+    return [
+        JiraTicket(
+            key=f"DP-{i}",
+            summary=f"Benchmark ticket {i}",
+            status="In Progress",
+            assignee=f"user{i % 7}",
+            priority="Medium",
+            story_points=i % 8,
+            sprint="Sprint 1",
+            blocked=False,
+            last_updated=datetime.now(),
+            time_in_status=timedelta(hours=i),
+        )
+        for i in range(count)
+    ]
+
+
+async def run_mode(service: JiraService, db: SupabaseClient, stub: PostgRESTStub,
+                   tickets: List[JiraTicket], batch_size) -> Dict:
+    """Store tickets twice (fresh inserts, then updates) and time each pass."""
+    stub.reset()
+    results = {}
+
+    async def _get_db():
+        return db
+
+    with patch("devsync_ai.database.connection.get_database", _get_db):
+        for phase in ("insert", "update"):
+            requests_before = stub.requests
+            start = time.perf_counter()
+            summary = await service.store_tickets_in_database(tickets, batch_size=batch_size)
+            results[phase] = {
+                "seconds": round(time.perf_counter() - start, 3),
+                "requests": stub.requests - requests_before,
+                "written": summary["upserted_count"],
+                "errors": summary["error_count"],
+            }
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JIRA ticket storage modes")
+    parser.add_argument("--tickets", type=int, default=500, help="Number of tickets")
+    parser.add_argument("--batch-size", type=int, default=100, help="Tickets per upsert chunk")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Stub latency per request")
+    args = parser.parse_args()
+
+    stub = PostgRESTStub(args.latency_ms)
+    base_url = await stub.start()
+    os.environ["SUPABASE_URL"] = base_url
+
+    db = SupabaseClient()
+    service = JiraService(server_url="https://benchmark.invalid", username="bench", token="bench")
+    tickets = build_tickets(args.tickets)
+
+    try:
+        per_ticket = await run_mode(service, db, stub, tickets, batch_size=None)
+        chunked = await run_mode(service, db, stub, tickets, batch_size=args.batch_size)
+    finally:
+        await db.close()
+        await stub.stop()
+
+    print(f"\n📊 Storing {args.tickets} tickets ({args.latency_ms}ms stub latency)")
+    print(f"{'mode':<22}{'phase':<8}{'seconds':>10}{'requests':>10}{'written':>9}")
+    for label, results in (("per-ticket", per_ticket), (f"chunked ({args.batch_size})", chunked)):
+        for phase, r in results.items():
+            print(
+                f"{label:<22}{phase:<8}{r['seconds']:>10}{r['requests']:>10}{r['written']:>9}"
+            )
+
+    speedup = per_ticket["insert"]["seconds"] / max(chunked["insert"]["seconds"], 1e-9)
+    print(f"\n🚀 Chunked upsert speedup (insert pass): {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark for TextProcessor.process_text on large PR descriptions.
+
+Generates roughly 1 MB of PR bodies (summaries, bullet lists, code blocks,
+issue/JIRA/commit references, mentions and URLs) and times the single-pass
+scanner against the previous implementation, which ran one ``re.sub`` pass
+per reference type and per markdown construct. The cached path is timed by
+processing the same texts a second time.
+
+Usage:
+    python scripts/benchmark_text_processor.py --megabytes 1
+"""
+
+import argparse
+import html
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from devsync_ai.core.text_processor import ContentType, DetectedContent, ProcessingConfig, TextProcessor
+
+WORDS = (
+    "refactor auth token refresh session retry backoff cache invalidation "
+    "migration endpoint handler webhook payload schema validation timeout "
+    "database index query latency regression fix flaky test coverage"
+).split()
+
+REFERENCES = [
+    "#{n}", "fixes #{n}", "DEV-{n}", "OPS-{n}", "@alice", "@bob.dev",
+    "commit {sha}", "https://ci.example.com/runs/{n}", "**{word}**", "*{word}*", "`{word}()`"
+]
+
+
+def generate_pr_body(rng: random.Random) -> str:
+    """Create a PR description with the structure of a typical one."""
+    def sentence() -> str:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(6, 16))]
+        for _ in range(rng.randint(0, 2)):
+            words.insert(rng.randrange(len(words)), rng.choice(REFERENCES).format(
+                n=rng.randint(1, 9999),
+                sha="%010x" % rng.getrandbits(40),
+                word=rng.choice(WORDS)
+            ))
+        return " ".join(words)[:1].upper() + " ".join(words)[1:] + "."
+
+    lines = ["## Summary", "", " ".join(sentence() for _ in range(rng.randint(2, 5))), "", "## Changes"]
+    lines += [f"- {sentence()}" for _ in range(rng.randint(2, 6))]
+    if rng.random() < 0.4:
+        lines += ["", "```python", "def handler(event):", "    return process(event['payload'])", "```"]
+    lines += ["", "## Testing", f"1. {sentence()}", f"2. {sentence()}"]
+    return "\n".join(lines)
+
+
+def generate_corpus(megabytes: float, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    corpus, size = [], 0
+    while size < megabytes * 1024 * 1024:
+        body = generate_pr_body(rng)
+        corpus.append(body)
+        size += len(body)
+    return corpus
+
+
+class MultiPassTextProcessor(TextProcessor):
+    """Previous implementation: one regex pass per content type and markdown construct."""
+
+    def process_text(self, text, context=None):
+        detected_content = []
+        processed_text = html.escape(text)
+        processed_text = self._legacy_link(processed_text, detected_content)
+        processed_text = self._legacy_markdown(processed_text)
+        if len(processed_text) > self.config.max_length:
+            processed_text, _, _ = self._smart_truncate(processed_text, self.config.max_length)
+        return processed_text, detected_content
+
+    def _legacy_link(self, text, detected_content):
+        repo = self.config.github_repo
+
+        def linker(content_type, url_for, label_for):
+            def replace(match):
+                url = url_for(match)
+                link_text = f"<{url}|{label_for(match)}>"
+                detected_content.append(DetectedContent(
+                    content_type=content_type,
+                    original_text=match.group(0),
+                    replacement_text=link_text,
+                    url=url
+                ))
+                return link_text
+            return replace
+
+        text = self.PATTERNS['github_issue'].sub(linker(
+            ContentType.GITHUB_ISSUE, lambda m: f"https://github.com/{repo}/issues/{m.group(1)}",
+            lambda m: f"#{m.group(1)}"), text)
+        text = self.PATTERNS['github_pr'].sub(linker(
+            ContentType.GITHUB_PR, lambda m: f"https://github.com/{repo}/pull/{m.group(1)}",
+            lambda m: f"PR #{m.group(1)}"), text)
+        text = self.PATTERNS['jira_ticket'].sub(linker(
+            ContentType.JIRA_TICKET, lambda m: f"{self.config.jira_base_url}/browse/{m.group(1)}",
+            lambda m: m.group(1)), text)
+        text = self.PATTERNS['commit_hash'].sub(linker(
+            ContentType.COMMIT_HASH, lambda m: f"https://github.com/{repo}/commit/{m.group(1)}",
+            lambda m: m.group(1)[:7]), text)
+        text = self.PATTERNS['user_mention'].sub(lambda m: f"<@{m.group(1)}>", text)
+        return self.PATTERNS['url'].sub(linker(
+            ContentType.URL, lambda m: m.group(0),
+            lambda m: m.group(0).replace('https://', '').replace('http://', '')[:50]), text)
+
+    def _legacy_markdown(self, text):
+        text = self.PATTERNS['code_block'].sub(
+            lambda m: f"```{m.group(1) or self._detect_code_language(m.group(2).strip())}\n{m.group(2).strip()}\n```", text)
+        text = self.PATTERNS['code'].sub(r'`\1`', text)
+        bold_matches = []
+
+        def replace_bold(match):
+            bold_matches.append(match.group(1))
+            return f"___BOLD_PLACEHOLDER___{len(bold_matches) - 1}___BOLD_PLACEHOLDER___"
+
+        text = self.PATTERNS['bold'].sub(replace_bold, text)
+        text = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'_\1_', text)
+        for i, bold_text in enumerate(bold_matches):
+            text = text.replace(f"___BOLD_PLACEHOLDER___{i}___BOLD_PLACEHOLDER___", f"*{bold_text}*")
+        text = self.PATTERNS['link'].sub(r'<\2|\1>', text)
+        return self.PATTERNS['bullet_list'].sub(lambda m: f"• {m.group(1)}", text)
+
+
+def measure(process, corpus: list) -> float:
+    start = time.perf_counter()
+    for body in corpus:
+        process(body)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TextProcessor on PR bodies")
+    parser.add_argument("--megabytes", type=float, default=1.0, help="Size of the generated corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode (best is reported)")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.megabytes)
+    total_bytes = sum(len(body) for body in corpus)
+    config = dict(
+        github_repo="company/awesome-project",
+        jira_base_url="https://jira.company.com",
+        max_length=10 ** 9
+    )
+
+    legacy = MultiPassTextProcessor(ProcessingConfig(cache_size=0, **config))
+    single_pass = TextProcessor(ProcessingConfig(cache_size=0, **config))
+    cached = TextProcessor(ProcessingConfig(cache_size=len(corpus), cache_max_bytes=10 * total_bytes, **config))
+    measure(cached.process_text, corpus)  # Warm the cache
+
+    results = {
+        "multi-pass": min(measure(legacy.process_text, corpus) for _ in range(args.repeat)),
+        "single pass": min(measure(single_pass.process_text, corpus) for _ in range(args.repeat)),
+        "cached": min(measure(cached.process_text, corpus) for _ in range(args.repeat)),
+    }
+
+    print(f"\n📊 TextProcessor.process_text ({len(corpus)} PR bodies, {total_bytes / 1024 / 1024:.2f} MB)")
+    print(f"{'mode':<14}{'ms total':>10}{'MB/s':>10}")
+    for name, elapsed in results.items():
+        print(f"{name:<14}{elapsed * 1000:>10.1f}{total_bytes / 1024 / 1024 / elapsed:>10.1f}")
+
+    print(f"\n✅ Single pass {results['multi-pass'] / results['single pass']:.1f}x, "
+          f"cached {results['multi-pass'] / results['cached']:.0f}x faster than multi-pass")
+
+
+if __name__ == "__main__":
+    main()
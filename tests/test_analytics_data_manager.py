@@ -0,0 +1,230 @@
+"""Tests for AnalyticsDataManager connection reuse and write-behind storage."""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from devsync_ai.analytics.analytics_data_manager import AnalyticsDataManager, AnalyticsRecord
+
+
+def _record(i: int, team_id: str = "team-a") -> AnalyticsRecord:
+    return AnalyticsRecord(
+        id=f"rec-{i}",
+        timestamp=datetime.now(timezone.utc) - timedelta(seconds=i),
+        record_type="hook_execution",
+        team_id=team_id,
+        data={"hook_id": f"hook-{i % 3}", "execution_time_ms": i, "success": True},
+        metadata={},
+    )
+
+
+@pytest_asyncio.fixture
+async def data_manager(tmp_path):
+    manager = AnalyticsDataManager(
+        db_path=str(tmp_path / "analytics.db"), write_batch_size=50, flush_interval=0.05
+    )
+    await manager.initialize()
+    yield manager
+    await manager.shutdown()
+
+
+class TestAnalyticsDataManagerStorage:
+    """Test cases for the write-behind storage path."""
+
+    @pytest.mark.asyncio
+    async def test_wal_mode_and_connection_reuse(self, data_manager):
+        """Test writes share one WAL-mode connection and reads use another."""
+        write_db = await data_manager._get_write_db()
+        for i in range(5):
+            await data_manager.store_record(_record(i))
+        await data_manager.query_records(record_type="hook_execution")
+
+        async with write_db.execute("PRAGMA journal_mode") as cursor:
+            assert (await cursor.fetchone())[0] == "wal"
+        assert await data_manager._get_write_db() is write_db
+        assert await data_manager._get_read_db() is not write_db
+
+    @pytest.mark.asyncio
+    async def test_records_are_coalesced_into_batches(self, data_manager):
+        """Test queued records are written in batch-sized transactions."""
+        ids = await data_manager.store_batch_records([_record(i) for i in range(120)])
+        await data_manager.flush()
+
+        assert ids == [f"rec-{i}" for i in range(120)]
+        assert data_manager.pending_writes == 0
+        assert data_manager.write_stats["records_written"] == 120
+        assert data_manager.write_stats["transactions"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_query_sees_queued_writes(self, data_manager):
+        """Test reads flush pending writes first."""
+        await data_manager.store_record(_record(1, team_id="team-b"))
+
+        records = await data_manager.query_records(team_id="team-b")
+
+        assert [record.id for record in records] == ["rec-1"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_pending_writes(self, tmp_path):
+        """Test records still queued at shutdown are persisted."""
+        db_path = str(tmp_path / "shutdown.db")
+        manager = AnalyticsDataManager(db_path=db_path, flush_interval=60)
+        await manager.initialize()
+        await manager.store_batch_records([_record(i) for i in range(10)])
+        assert manager.pending_writes == 10
+
+        await manager.shutdown()
+
+        async with aiosqlite.connect(db_path) as db:
+            async with db.execute("SELECT COUNT(*) FROM analytics_records") as cursor:
+                assert (await cursor.fetchone())[0] == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_the_batch(self, tmp_path):
+        """Test records from a failed transaction are written by the next flush."""
+        db_path = str(tmp_path / "retry.db")
+        manager = AnalyticsDataManager(db_path=db_path, flush_interval=60, write_batch_size=4)
+        await manager.initialize()
+        try:
+            await manager.store_batch_records([_record(i) for i in range(10)])
+            write_db = await manager._get_write_db()
+
+            failing = AsyncMock(side_effect=sqlite3.OperationalError("disk I/O error"))
+            with patch.object(write_db, "executemany", failing):
+                with pytest.raises(sqlite3.OperationalError):
+                    await manager.flush()
+            assert manager.pending_writes == 10
+
+            assert await manager.flush() == 10
+            assert manager.pending_writes == 0
+        finally:
+            await manager.shutdown()
+
+        async with aiosqlite.connect(db_path) as db:
+            async with db.execute("SELECT COUNT(*) FROM analytics_records") as cursor:
+                assert (await cursor.fetchone())[0] == 10
+
+    @pytest.mark.asyncio
+    async def test_full_queue_without_flusher_writes_through(self, tmp_path):
+        """Test a batch larger than the queue does not block without a flusher."""
+        manager = AnalyticsDataManager(db_path=str(tmp_path / "full.db"), max_pending_writes=10)
+        await manager._create_tables()
+        try:
+            await asyncio.wait_for(manager.store_batch_records([_record(i) for i in range(25)]), 5)
+            assert len(await manager.query_records()) == 25
+        finally:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database_writes_through(self):
+        """Test an in-memory database without background tasks stores immediately."""
+        manager = AnalyticsDataManager(db_path=":memory:")
+        await manager._create_tables()
+
+        await manager.store_record(_record(7))
+
+        assert manager.pending_writes == 0
+        assert await manager._get_read_db() is await manager._get_write_db()
+        assert len(await manager.query_records()) == 1
+        await manager.shutdown()
+
+
+def _generated_dataset(now: datetime, days: int = 90):
+    """Records of every aggregated type spread over the last ``days`` days."""
+    records = []
+    for i in range(days * 24 // 5):
+        timestamp = now - timedelta(hours=i * 5, minutes=i % 60, seconds=i % 7)
+        team_id = f"team-{i % 3}"
+        records.append(AnalyticsRecord(
+            id=f"hook-{i}", timestamp=timestamp, record_type="hook_execution", team_id=team_id,
+            data={"success": i % 4 != 0, "execution_time_ms": (i * 37) % 900 + 0.5}, metadata={}
+        ))
+        system_data = {"cpu_usage": (i * 13) % 100}
+        if i % 5:
+            system_data["memory_usage"] = (i * 7) % 64
+        records.append(AnalyticsRecord(
+            id=f"sys-{i}", timestamp=timestamp, record_type="system_metrics", team_id=team_id,
+            data=system_data, metadata={}
+        ))
+        records.append(AnalyticsRecord(
+            id=f"prod-{i}", timestamp=timestamp, record_type="user_engagement", team_id=team_id,
+            data={"sessions": i}, metadata={}
+        ))
+    return records
+
+
+def _assert_matches_python(actual, expected):
+    assert actual.keys() == expected.keys()
+    assert actual["aggregated_data"].keys() == expected["aggregated_data"].keys()
+    for period_key, values in expected["aggregated_data"].items():
+        assert actual["aggregated_data"][period_key] == pytest.approx(values), period_key
+
+
+class TestAnalyticsDataManagerAggregation:
+    """SQL aggregation must match the Python aggregation."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("period", ["hourly", "daily", "weekly", "monthly"])
+    @pytest.mark.parametrize("record_type", ["hook_execution", "system_metrics", "user_engagement"])
+    async def test_sql_aggregation_matches_python(self, data_manager, period, record_type):
+        """Test results match with and without reused rollups."""
+        now = datetime.now(timezone.utc)
+        await data_manager.store_batch_records(_generated_dataset(now))
+
+        for team_id, start_time in ((None, None), ("team-1", now - timedelta(days=30, minutes=17))):
+            records = await data_manager.query_records(
+                record_type=record_type, team_id=team_id, start_time=start_time
+            )
+            expected = await data_manager._perform_aggregation(records, period)
+
+            for _ in range(2):  # second pass reads closed buckets from rollups
+                data_manager.aggregation_cache.clear()
+                actual = await data_manager.aggregate_data(
+                    record_type, period, team_id=team_id, start_time=start_time, end_time=now
+                )
+                _assert_matches_python(actual, expected)
+
+    @pytest.mark.asyncio
+    async def test_closed_buckets_are_rolled_up(self, data_manager):
+        """Test closed buckets are stored in aggregated_data and reused."""
+        now = datetime.now(timezone.utc)
+        await data_manager.store_batch_records(_generated_dataset(now, days=10))
+
+        result = await data_manager.aggregate_data("hook_execution", "daily")
+        db = await data_manager._get_read_db()
+        async with db.execute(
+            "SELECT COUNT(*) FROM aggregated_data WHERE id LIKE 'rollup:%'"
+        ) as cursor:
+            rollup_count = (await cursor.fetchone())[0]
+
+        assert rollup_count == result["period_count"] - 1  # every day except today
+
+        data_manager.aggregation_cache.clear()
+        rollups = await data_manager._load_rollups(
+            "hook_execution", "daily", None, None, None, datetime.now(timezone.utc)
+        )
+        assert len(rollups) == rollup_count
+
+    @pytest.mark.asyncio
+    async def test_late_records_invalidate_rollups(self, data_manager):
+        """Test a record written into a closed bucket is reflected in the next query."""
+        now = datetime.now(timezone.utc)
+        await data_manager.store_batch_records(_generated_dataset(now, days=5))
+        before = await data_manager.aggregate_data("hook_execution", "daily")
+
+        late = _record(0)
+        late.id = "late"
+        late.timestamp = now - timedelta(days=3)
+        await data_manager.store_record(late)
+        data_manager.aggregation_cache.clear()
+        after = await data_manager.aggregate_data("hook_execution", "daily")
+
+        assert after["record_count"] == before["record_count"] + 1
+        day = late.timestamp.strftime('%Y-%m-%d')
+        assert (after["aggregated_data"][day]["total_executions"]
+                == before["aggregated_data"][day]["total_executions"] + 1)
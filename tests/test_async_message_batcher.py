@@ -0,0 +1,186 @@
+"""Tests for the async batching pipeline."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from devsync_ai.core.async_message_batcher import (
+    AsyncBatcherConfig,
+    AsyncMessageBatcher,
+    LatencyHistogram,
+    QueueFullPolicy,
+)
+from devsync_ai.core.message_batcher import BatchableMessage, BatchConfig, ContentType, MessageBatcher
+from devsync_ai.core.message_formatter import SlackMessage
+
+
+def make_message(message_id: str) -> BatchableMessage:
+    return BatchableMessage(
+        id=message_id,
+        content_type=ContentType.PR_UPDATE,
+        timestamp=datetime.now(),
+        author="alice",
+        data={"repository": "repo"}
+    )
+
+
+def make_batcher(max_batch_size: int) -> MessageBatcher:
+    """Batcher whose rendered batches list their message ids as text."""
+    batcher = MessageBatcher(BatchConfig(max_batch_size=max_batch_size))
+    batcher._create_batched_message = lambda group: SlackMessage(
+        blocks=[],
+        text=",".join(message.id for message in group.messages),
+        metadata={'channel_id': group.channel_id}
+    )
+    return batcher
+
+
+class RecordingSender:
+    """Sender recording (channel_id, text); optionally held until released."""
+
+    def __init__(self, hold: bool = False):
+        self.sent = []
+        self.called = asyncio.Event()
+        self.release = asyncio.Event()
+        if not hold:
+            self.release.set()
+
+    async def __call__(self, channel_id: str, message: SlackMessage):
+        self.called.set()
+        await self.release.wait()
+        self.sent.append((channel_id, message.text))
+
+
+class TestAsyncMessageBatcher:
+    """Test cases for AsyncMessageBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_per_channel_order(self):
+        """Test batches reach each channel in the order messages were added."""
+        sender = RecordingSender()
+        pipeline = AsyncMessageBatcher(sender, make_batcher(max_batch_size=2))
+        await pipeline.start()
+
+        for i in range(6):
+            for channel in ("c1", "c2", "c3"):
+                assert await pipeline.add_message(make_message(f"{channel}-{i}"), channel)
+        await pipeline.stop()
+
+        for channel in ("c1", "c2", "c3"):
+            texts = [text for sent_channel, text in sender.sent if sent_channel == channel]
+            assert texts == [f"{channel}-0,{channel}-1", f"{channel}-2,{channel}-3", f"{channel}-4,{channel}-5"]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_blocks_then_drops_on_timeout(self):
+        """Test producers wait for queue space and give up after the timeout."""
+        sender = RecordingSender(hold=True)
+        config = AsyncBatcherConfig(queue_size=2, enqueue_timeout_seconds=0.05)
+        pipeline = AsyncMessageBatcher(sender, make_batcher(max_batch_size=1), config)
+        await pipeline.start()
+
+        await pipeline.add_message(make_message("m1"), "c1")
+        await sender.called.wait()  # The flusher is stuck sending m1
+        assert await pipeline.add_message(make_message("m2"), "c1")
+        assert await pipeline.add_message(make_message("m3"), "c1")
+        assert not await pipeline.add_message(make_message("m4"), "c1")
+
+        # Space frees up while a producer is waiting
+        waiting = asyncio.create_task(pipeline.add_message(make_message("m5"), "c1"))
+        await asyncio.sleep(0.01)
+        sender.release.set()
+        assert await waiting
+
+        await pipeline.stop()
+        assert [text for _, text in sender.sent] == ["m1", "m2", "m3", "m5"]
+
+        stats = pipeline.get_stats()
+        assert stats['blocked_enqueues'] == 2
+        assert stats['dropped'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_blocked_producers(self):
+        """Test a message whose blocked put completes during stop is still sent."""
+        sender = RecordingSender(hold=True)
+        config = AsyncBatcherConfig(queue_size=1, enqueue_timeout_seconds=1.0)
+        pipeline = AsyncMessageBatcher(sender, make_batcher(max_batch_size=1), config)
+        await pipeline.start()
+
+        # The blocked producer resumes well after space frees up
+        queue, put = pipeline._queue, pipeline._queue.put
+
+        async def late_put(item):
+            while queue.full():
+                await asyncio.sleep(0.005)
+            await asyncio.sleep(0.05)
+            await put(item)
+
+        queue.put = late_put
+
+        await pipeline.add_message(make_message("m1"), "c1")
+        await sender.called.wait()
+        await pipeline.add_message(make_message("m2"), "c1")
+        waiting = asyncio.create_task(pipeline.add_message(make_message("m3"), "c1"))
+        await asyncio.sleep(0.01)
+
+        stopping = asyncio.create_task(pipeline.stop(flush=False))
+        await asyncio.sleep(0.01)
+        sender.release.set()
+        assert await waiting
+        await stopping
+
+        assert [text for _, text in sender.sent] == ["m1", "m2", "m3"]
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        """Test a full queue evicts the oldest queued message."""
+        sender = RecordingSender(hold=True)
+        config = AsyncBatcherConfig(queue_size=2, full_policy=QueueFullPolicy.DROP_OLDEST)
+        pipeline = AsyncMessageBatcher(sender, make_batcher(max_batch_size=1), config)
+        await pipeline.start()
+
+        await pipeline.add_message(make_message("m1"), "c1")
+        await sender.called.wait()
+        for message_id in ("m2", "m3", "m4"):
+            assert await pipeline.add_message(make_message(message_id), "c1")
+
+        sender.release.set()
+        await pipeline.stop()
+        assert [text for _, text in sender.sent] == ["m1", "m3", "m4"]
+        assert pipeline.get_stats()['dropped'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_batches_and_reports_latency(self):
+        """Test stop sends partial batches and latency histograms are populated."""
+        sender = RecordingSender()
+        pipeline = AsyncMessageBatcher(sender, make_batcher(max_batch_size=5))
+        await pipeline.start()
+
+        for i in range(3):
+            await pipeline.add_message(make_message(f"m{i}"), "c1")
+        await pipeline.add_message(make_message("x0"), "c2")
+        await pipeline.stop()
+
+        assert sorted(sender.sent) == [("c1", "m0,m1,m2"), ("c2", "x0")]
+
+        stats = pipeline.get_stats()
+        assert stats['processed'] == 4
+        assert stats['batches_sent'] == 2
+        assert stats['queue_wait_latency']['count'] == 4
+        assert stats['flush_latency']['count'] == 2
+        assert stats['flush_latency']['buckets']['le_inf'] == 2
+
+        with pytest.raises(RuntimeError):
+            await pipeline.add_message(make_message("late"), "c1")
+
+    def test_latency_histogram(self):
+        """Test bucket counts and bucket-based percentiles."""
+        histogram = LatencyHistogram((10, 100, 1000))
+        for seconds in (0.001, 0.002, 0.05, 0.5, 5.0):
+            histogram.observe(seconds)
+
+        summary = histogram.to_dict()
+        assert summary['buckets'] == {'le_10': 2, 'le_100': 3, 'le_1000': 4, 'le_inf': 5}
+        assert summary['p50_ms'] == 100
+        assert summary['p99_ms'] == 5000
+        assert summary['max_ms'] == 5000
@@ -0,0 +1,338 @@
+"""
+Tests for the incremental GitHub commit and pull request store.
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import httpx
+import pytest
+
+from devsync_ai.models.core import PRStatus
+from devsync_ai.services.github import GitHubService
+from devsync_ai.services.github_store import GitHubActivityStore, GitHubActivitySync, format_timestamp
+
+
+REPOSITORY = "test/repo"
+NOW = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeGitHubServer:
+    """In-memory GitHub REST API with pagination and ETags, counting full listings."""
+
+    def __init__(self, page_size: int = 100):
+        self.page_size = page_size
+        self.commits = {}  # By SHA
+        self.head = None  # Tip of the default branch
+        self.pulls = {}
+        self.requests = []
+        self.listings = 0
+        self.not_modified = 0
+
+    def add_commit(
+        self, committed_at: datetime, message: str, author: str = "dev", parents=None, branch: bool = False
+    ):
+        """Commit on top of the default branch, or on ``parents`` when given.
+
+        A ``branch`` commit leaves the default branch where it is.
+        """
+        date = format_timestamp(committed_at)
+        sha = hashlib.sha1(f"{date}{message}".encode()).hexdigest()
+        if parents is None:
+            parents = [self.head] if self.head else []
+        self.commits[sha] = {
+            "sha": sha,
+            "commit": {
+                "message": message,
+                "author": {"name": author, "date": date},
+                "committer": {"name": author, "date": date},
+            },
+            "parents": [{"sha": parent} for parent in parents],
+        }
+        if not branch:
+            self.head = sha
+        return sha
+
+    def reachable(self, sha: str) -> set:
+        seen, pending = set(), [sha]
+        while pending:
+            current = pending.pop()
+            if current not in seen:
+                seen.add(current)
+                pending.extend(parent["sha"] for parent in self.commits[current]["parents"])
+        return seen
+
+    def _headers(self):
+        return {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Reset": str(int(NOW.timestamp()) + 3600),
+        }
+
+    def _compare(self, base: str, head: str) -> httpx.Response:
+        if base not in self.commits or head not in self.commits:
+            return httpx.Response(404, json={"message": "Not Found"})
+        reachable = self.reachable(head)
+        commits = sorted(
+            (self.commits[sha] for sha in reachable - self.reachable(base)),
+            key=lambda c: c["commit"]["committer"]["date"]
+        )
+        self.listings += 1
+        return httpx.Response(200, json={
+            "status": "ahead" if base in reachable else "diverged",
+            "total_commits": len(commits),
+            "commits": commits,
+        }, headers=self._headers())
+
+    def open_pull(self, number: int, title: str, labels=()):
+        self.pulls[number] = {
+            "number": number,
+            "title": title,
+            "state": "open",
+            "draft": False,
+            "user": {"login": "dev"},
+            "created_at": format_timestamp(NOW - timedelta(days=2)),
+            "updated_at": format_timestamp(NOW - timedelta(days=1)),
+            "requested_reviewers": [],
+            "requested_teams": [],
+            "labels": [{"name": label} for label in labels],
+        }
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        query = parse_qs(urlparse(str(request.url)).query)
+        path = request.url.path
+
+        compare = re.fullmatch(rf"/repos/{REPOSITORY}/compare/(\w+)\.\.\.(\w+)", path)
+        if compare:
+            return self._compare(*compare.groups())
+
+        if path == f"/repos/{REPOSITORY}/commits":
+            items = sorted(
+                (self.commits[sha] for sha in self.reachable(self.head)),
+                key=lambda c: c["commit"]["committer"]["date"], reverse=True
+            ) if self.head else []
+            if "since" in query:
+                items = [c for c in items if c["commit"]["committer"]["date"] >= query["since"][0]]
+            if "until" in query:
+                items = [c for c in items if c["commit"]["committer"]["date"] <= query["until"][0]]
+        elif path == f"/repos/{REPOSITORY}/pulls":
+            items = [self.pulls[n] for n in sorted(self.pulls, reverse=True)]
+        else:
+            return httpx.Response(404, json={"message": "Not Found"})
+
+        per_page = min(int(query.get("per_page", ["30"])[0]), self.page_size)
+        page = int(query.get("page", ["1"])[0])
+        body = items[(page - 1) * per_page:page * per_page]
+        etag = '"%s"' % hashlib.sha1(json.dumps(body, sort_keys=True).encode()).hexdigest()
+        headers = {"ETag": etag, **self._headers()}
+
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return httpx.Response(304, headers=headers)
+
+        if page * per_page < len(items):
+            next_query = {k: v[0] for k, v in query.items()}
+            next_query["page"] = page + 1
+            headers["Link"] = f'<{request.url.copy_with(query=urlencode(next_query).encode())}>; rel="next"'
+        self.listings += 1
+        return httpx.Response(200, json=body, headers=headers)
+
+
+@pytest.fixture
+def github_server():
+    server = FakeGitHubServer(page_size=10)
+    # Two commits a day for 30 days, added oldest first
+    for k in reversed(range(60)):
+        server.add_commit(NOW - timedelta(hours=12 * k, minutes=30), f"feat: change {k}")
+    for number in range(1, 26):
+        server.open_pull(number, f"PR {number}")
+    return server
+
+
+def make_service(server: FakeGitHubServer, db_path: str) -> GitHubService:
+    sync = GitHubActivitySync(
+        GitHubActivityStore(db_path), token="test", transport=httpx.MockTransport(server)
+    )
+    return GitHubService(token="test", allowed_repository=REPOSITORY, activity_sync=sync)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "github_activity.db")
+
+
+@pytest.mark.asyncio
+async def test_second_run_makes_no_full_listings(github_server, db_path):
+    """An unchanged repository is answered from the store after 304s only."""
+    service = make_service(github_server, db_path)
+    since = NOW - timedelta(days=7)
+    try:
+        commits = await service.get_commits_since(REPOSITORY, since)
+        prs = await service.get_open_pull_requests(REPOSITORY)
+        assert len(commits) == 14
+        assert len(prs) == 25
+        # Commit paging stopped at the requested window: 2 pages, not 6
+        assert github_server.listings == 2 + 3
+
+        github_server.listings = 0
+        again = await service.get_commits_since(REPOSITORY, since)
+        prs_again = await service.get_open_pull_requests(REPOSITORY)
+        assert github_server.listings == 0
+        assert github_server.not_modified == 1 + 3
+        assert [c.sha for c in again] == [c.sha for c in commits]
+        assert [pr.id for pr in prs_again] == [pr.id for pr in prs]
+    finally:
+        await service.close()
+
+    # The store persists across service instances
+    restarted = make_service(github_server, db_path)
+    try:
+        assert len(await restarted.get_commits_since(REPOSITORY, since)) == 14
+        assert github_server.listings == 0
+    finally:
+        await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_new_commits_are_fetched_up_to_the_watermark(github_server, db_path):
+    """Only commits newer than the stored head are listed."""
+    service = make_service(github_server, db_path)
+    since = NOW - timedelta(days=7)
+    try:
+        await service.get_commits_since(REPOSITORY, since)
+        new_shas = [github_server.add_commit(NOW + timedelta(hours=h), f"fix: bug {h} (#4{h})") for h in range(3)]
+        github_server.listings = 0
+
+        commits = await service.get_commits_since(REPOSITORY, since, NOW + timedelta(days=1))
+        assert github_server.listings == 1
+        assert [c.sha for c in commits[:3]] == list(reversed(new_shas))
+        assert commits[0].category == "fix"
+        assert commits[0].pr_number == 42
+        assert commits[0].date == NOW + timedelta(hours=2)
+
+        # Reads are filtered locally by date
+        window = await service.get_commits_since(REPOSITORY, NOW - timedelta(days=2), NOW - timedelta(days=1))
+        assert len(window) == 2
+        assert github_server.listings == 1
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_earlier_window_is_backfilled_once(github_server, db_path):
+    """Asking for older commits lists only the range the store doesn't cover."""
+    service = make_service(github_server, db_path)
+    try:
+        await service.get_commits_since(REPOSITORY, NOW - timedelta(days=7))
+        github_server.listings = 0
+        backfill_requests = len(github_server.requests)
+
+        commits = await service.get_commits_since(REPOSITORY, NOW - timedelta(days=14))
+        assert len(commits) == 28
+        # 14 older commits in 2 pages; the head page is a 304
+        assert github_server.listings == 2
+        backfill = github_server.requests[backfill_requests]
+        assert "until" in parse_qs(urlparse(str(backfill.url)).query)
+
+        github_server.listings = 0
+        await service.get_commits_since(REPOSITORY, NOW - timedelta(days=10))
+        assert github_server.listings == 0
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_only_changed_pull_request_pages_are_listed(github_server, db_path):
+    """A change on one page re-lists that page; closed PRs leave the store."""
+    service = make_service(github_server, db_path)
+    try:
+        await service.get_open_pull_requests(REPOSITORY)
+        github_server.listings = 0
+
+        github_server.pulls[3]["labels"] = [{"name": "urgent"}]  # Last page
+        del github_server.pulls[4]
+        github_server.pulls[5]["requested_reviewers"] = [{"login": "reviewer"}]
+
+        prs = {pr.id: pr for pr in await service.get_open_pull_requests(REPOSITORY)}
+        assert github_server.listings == 1
+        assert "4" not in prs
+        assert prs["3"].labels == ["urgent"]
+        assert prs["5"].reviewers == ["reviewer"]
+        assert prs["5"].status == PRStatus.READY_FOR_REVIEW
+        assert len(prs) == 24
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_commits_from_a_merged_branch_are_stored(github_server, db_path):
+    """A merge brings in branch commits older than the stored head; they are not skipped."""
+    service = make_service(github_server, db_path)
+    since = NOW - timedelta(days=7)
+    try:
+        await service.get_commits_since(REPOSITORY, since)
+        head = github_server.head
+        base = github_server.commits[head]["parents"][0]["sha"]
+
+        # Branched from the commit before head and committed before it
+        feature = github_server.add_commit(
+            NOW - timedelta(hours=1), "feat: branch work", parents=[base], branch=True
+        )
+        merge = github_server.add_commit(
+            NOW + timedelta(hours=1), "Merge pull request #7 from dev/feature", parents=[head, feature]
+        )
+        github_server.listings = 0
+
+        commits = await service.get_commits_since(REPOSITORY, since, NOW + timedelta(days=1))
+        shas = [c.sha for c in commits]
+        assert shas[:3] == [merge, head, feature]
+        assert len(shas) == 16
+        # Head page plus one comparison
+        assert github_server.listings == 2
+        compare = github_server.requests[-1]
+        assert compare.url.path == f"/repos/{REPOSITORY}/compare/{head}...{merge}"
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_rewritten_history_is_listed_down_to_the_covered_range(github_server, db_path):
+    """When the stored head is no longer on the branch, commits are re-listed to the floor."""
+    service = make_service(github_server, db_path)
+    since = NOW - timedelta(days=7)
+    try:
+        await service.get_commits_since(REPOSITORY, since)
+        head = github_server.head
+        base = github_server.commits[head]["parents"][0]["sha"]
+
+        # Force-push: replace head with two commits on its parent
+        github_server.head = base
+        amended = github_server.add_commit(NOW - timedelta(minutes=20), "feat: change 0, amended")
+        follow_up = github_server.add_commit(NOW + timedelta(hours=1), "fix: follow-up")
+        github_server.listings = 0
+
+        commits = await service.get_commits_since(REPOSITORY, since, NOW + timedelta(days=1))
+        assert [c.sha for c in commits[:2]] == [follow_up, amended]
+        # Head page, the diverged comparison, then the second page down to the window
+        assert github_server.listings == 3
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_closing_the_last_open_pull_request_empties_the_store(db_path):
+    """An empty first page still replaces the stored open PRs."""
+    server = FakeGitHubServer()
+    server.open_pull(1, "Only PR")
+    service = make_service(server, db_path)
+    try:
+        assert [pr.id for pr in await service.get_open_pull_requests(REPOSITORY)] == ["1"]
+
+        del server.pulls[1]
+        assert await service.get_open_pull_requests(REPOSITORY) == []
+    finally:
+        await service.close()
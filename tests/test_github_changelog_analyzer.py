@@ -5,7 +5,9 @@ Tests cover data accuracy, edge case handling, ML-based classification,
 impact scoring, contributor analysis, and performance regression detection.
 """
 
+import asyncio
 import pytest
+from collections import Counter
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from dataclasses import dataclass
@@ -41,7 +43,8 @@ class TestGitHubChangelogAnalyzer:
         service.get_commits_since = AsyncMock()
         service.get_open_pull_requests = AsyncMock()
         service.get_repository = AsyncMock()
-        service._execute_with_retry = AsyncMock()
+        # Run the wrapped call, as the real retry helper does
+        service._execute_with_retry = AsyncMock(side_effect=lambda func, *args, **kwargs: func(*args, **kwargs))
         return service
 
     @pytest.fixture
@@ -160,7 +163,7 @@ class TestGitHubChangelogAnalyzer:
         mock_pr.additions = 100
         mock_pr.deletions = 50
         mock_pr.get_files.return_value = [Mock(filename="src/auth.py")]
-        mock_github_service._execute_with_retry.return_value = mock_pr
+        mock_repo.get_pull.return_value = mock_pr
         
         # Execute
         result = await analyzer.analyze_weekly_activity("test/repo", date_range)
@@ -238,7 +241,7 @@ class TestGitHubChangelogAnalyzer:
             Mock(filename="tests/test_auth.py"),
             Mock(filename="docs/api.md")
         ]
-        mock_github_service._execute_with_retry.return_value = mock_pr
+        mock_repo.get_pull.return_value = mock_pr
         
         # Execute
         result = await analyzer.calculate_pr_impact_score(sample_prs[0])
@@ -264,7 +267,7 @@ class TestGitHubChangelogAnalyzer:
         mock_pr.additions = 2000    # High additions
         mock_pr.deletions = 1000    # High deletions
         mock_pr.get_files.return_value = [Mock(filename=f"src/file_{i}.py") for i in range(50)]
-        mock_github_service._execute_with_retry.return_value = mock_pr
+        mock_repo.get_pull.return_value = mock_pr
         
         # Execute
         result = await analyzer.calculate_pr_impact_score(sample_prs[0])
@@ -417,7 +420,7 @@ class TestGitHubChangelogAnalyzer:
         ]
         mock_pr.get_files.return_value = mock_files
         
-        result = await analyzer._identify_affected_systems(mock_pr)
+        result = await analyzer._identify_affected_systems(mock_pr.get_files())
         
         # Should identify multiple systems
         assert "api" in result
@@ -440,7 +443,7 @@ class TestGitHubChangelogAnalyzer:
         ]
         mock_pr.get_files.return_value = mock_files
         
-        result = await analyzer._calculate_test_coverage_impact(mock_pr)
+        result = await analyzer._calculate_test_coverage_impact(mock_pr.get_files(), mock_pr.changed_files)
         
         # Should calculate percentage of test files
         assert result == 20.0  # 2 test files out of 10 total = 20%
@@ -457,7 +460,7 @@ class TestGitHubChangelogAnalyzer:
         ]
         mock_pr.get_files.return_value = mock_files
         
-        result = await analyzer._detect_pr_performance_impact(mock_pr)
+        result = await analyzer._detect_pr_performance_impact(mock_pr.get_files())
         
         # Should detect performance impact
         assert result is not None
@@ -562,6 +565,60 @@ class TestGitHubChangelogAnalyzer:
         )
         assert total_categorized == len(malformed_commits)
 
+    @pytest.mark.asyncio
+    async def test_pr_enrichment_fetches_files_once(self, analyzer, mock_github_service, sample_prs, date_range):
+        """Enrichment pages through each PR's files once and runs PRs concurrently."""
+        # Files of a recorded 75-file PR: three pages of 30
+        recorded_files = (
+            [f"src/api/handler_{i}.py" for i in range(40)]
+            + [f"tests/test_handler_{i}.py" for i in range(30)]
+            + [f"benchmarks/performance_{i}.py" for i in range(5)]
+        )
+        page_requests = Counter()
+
+        def make_github_pr(number):
+            def get_page(page):
+                # One request per page, as PyGithub's PaginatedList does
+                page_requests[number] += 1
+                return [Mock(filename=name) for name in recorded_files[page * 30:(page + 1) * 30]]
+
+            github_pr = Mock(changed_files=len(recorded_files), additions=900, deletions=300)
+            github_pr.get_files.return_value.get_page.side_effect = get_page
+            return github_pr
+
+        running = 0
+        max_running = 0
+
+        async def execute(func, *args, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return func(*args, **kwargs)
+
+        prs = [sample_prs[0].model_copy(update={"id": str(n)}) for n in range(1, 7)]
+        mock_repo = Mock()
+        mock_repo.get_pull.side_effect = make_github_pr
+        mock_github_service.get_repository.return_value = mock_repo
+        mock_github_service._execute_with_retry.side_effect = execute
+        mock_github_service.get_commits_since.return_value = []
+        mock_github_service.get_open_pull_requests.return_value = prs
+        analyzer.max_concurrent_enrichments = 3
+
+        result = await analyzer.analyze_weekly_activity("test/repo", date_range)
+
+        # Previously get_files() was paged through three times per PR
+        assert page_requests == {n: 3 for n in range(1, 7)}
+        assert mock_github_service.get_repository.await_count == 1
+        assert result.analysis_metadata["pr_api_requests"] == {str(n): 4 for n in range(1, 7)}
+        assert max_running == 3
+
+        impact = result.pull_requests[0].impact_score
+        assert sorted(impact.affected_systems) == ["api", "core", "testing"]
+        assert impact.test_coverage_impact == 40.0
+        assert len(impact.performance_impact.affected_metrics) == 5
+
 
 class TestGitHubChangelogAnalyzerIntegration:
     """Integration tests for GitHubChangelogAnalyzer."""
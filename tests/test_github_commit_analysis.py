@@ -13,6 +13,8 @@ def github_service():
     """Create a GitHub service instance for testing."""
     with patch("devsync_ai.services.github.settings") as mock_settings:
         mock_settings.github_token = "test_token"
+        mock_settings.github_activity_store_path = None
+        mock_settings.github_sdk_max_workers = 4
         mock_settings.github_repository = "asakohayase/kiro-devsync-ai"
         return GitHubService()
 
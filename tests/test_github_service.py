@@ -2,9 +2,10 @@
 
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from github import GithubException, RateLimitExceededException
 from github.PullRequest import PullRequest as GithubPR
+from github.Rate import Rate
 from github.Repository import Repository
 from github.NamedUser import NamedUser
 from github.Label import Label
@@ -18,6 +19,7 @@ def github_service():
     """Create a GitHub service instance for testing."""
     with patch("devsync_ai.services.github.settings") as mock_settings:
         mock_settings.github_token = "test_token"
+        mock_settings.github_activity_store_path = None
         return GitHubService()
 
 
@@ -113,6 +115,28 @@ class TestGitHubService:
         assert rate_limit_info.remaining == 4500
         assert isinstance(rate_limit_info.reset_time, datetime)
 
+    @pytest.mark.asyncio
+    async def test_check_rate_limit_with_pygithub_rate(self, github_service, mock_github_client):
+        """Test a tz-aware reset from PyGithub can be compared against when requesting."""
+        reset = datetime.now(timezone.utc) + timedelta(hours=1)
+        mock_rate_limit = Mock()
+        mock_rate_limit.core = Rate(
+            Mock(), {}, {"limit": 5000, "remaining": 4500, "reset": int(reset.timestamp())}, completed=True
+        )
+        mock_github_client.get_rate_limit.return_value = mock_rate_limit
+        github_service._github_client = mock_github_client
+        github_service._rate_limit_bucket.clear()
+
+        rate_limit_info = await github_service.check_rate_limit()
+        assert rate_limit_info.reset_time.tzinfo is not None
+
+        with patch("asyncio.sleep") as mock_sleep:
+            result = await github_service._execute_with_retry(Mock(return_value="ok"))
+
+        assert result == "ok"
+        mock_sleep.assert_not_called()
+        assert github_service._rate_limit_info.remaining == 4499
+
     @pytest.mark.asyncio
     async def test_check_rate_limit_error(self, github_service, mock_github_client):
         """Test rate limit check with GitHub API error."""
@@ -159,6 +183,7 @@ class TestGitHubService:
     async def test_execute_with_retry_success(self, github_service):
         """Test successful execution with retry mechanism."""
         mock_func = Mock(return_value="success")
+        github_service._rate_limit_bucket.clear()
 
         with patch.object(github_service, "check_rate_limit") as mock_check_rate:
             with patch.object(github_service, "_handle_rate_limit") as mock_handle_rate:
@@ -173,6 +198,51 @@ class TestGitHubService:
                 mock_check_rate.assert_called_once()
                 mock_handle_rate.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_with_retry_uses_cached_rate_limit(self, github_service):
+        """Test /rate_limit is only called when the cached state is missing or stale."""
+        github_service._rate_limit_bucket.clear()
+        github_service._rate_limit_bucket.stats["rate_limit_checks_saved"] = 0
+        mock_func = Mock(return_value="success")
+
+        async def fake_check():
+            github_service._rate_limit_info = RateLimitInfo(
+                5000, 4000, datetime.now() + timedelta(hours=1)
+            )
+
+        with patch.object(github_service, "check_rate_limit", side_effect=fake_check) as mock_check:
+            for _ in range(5):
+                await github_service._execute_with_retry(mock_func)
+
+            assert mock_check.call_count == 1
+            assert github_service.get_rate_limit_stats()["rate_limit_checks_saved"] == 4
+            # Each request drains a token from the local bucket
+            assert github_service._rate_limit_info.remaining == 3995
+
+            github_service._rate_limit_bucket.updated_at = datetime.now(timezone.utc) - timedelta(hours=1)
+            await github_service._execute_with_retry(mock_func)
+            assert mock_check.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_with_retry_reads_rate_limit_headers(self, github_service):
+        """Test rate limit state is taken from headers PyGithub already parsed."""
+        github_service._rate_limit_bucket.clear()
+        reset_epoch = int((datetime.now() + timedelta(minutes=30)).timestamp())
+        requester = Mock()
+        requester.rate_limiting = (4321, 5000)
+        requester.rate_limiting_resettime = reset_epoch
+        client = Mock()
+        client._Github__requester = requester
+        github_service._github_client = client
+
+        with patch.object(github_service, "check_rate_limit"):
+            await github_service._execute_with_retry(Mock(return_value="ok"))
+
+        info = github_service._rate_limit_info
+        assert info.remaining == 4321
+        assert info.limit == 5000
+        assert info.reset_time == datetime.fromtimestamp(reset_epoch, timezone.utc)
+
     @pytest.mark.asyncio
     async def test_execute_with_retry_rate_limit_exceeded(self, github_service):
         """Test retry mechanism with rate limit exceeded."""
@@ -6,6 +6,7 @@ capabilities of the JIRA Agent Hooks analytics engine.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, AsyncMock, patch
@@ -24,7 +25,14 @@ from devsync_ai.analytics.hook_analytics_engine import (
     shutdown_hook_analytics_engine
 )
 from devsync_ai.core.agent_hooks import HookExecutionResult
-from devsync_ai.analytics.analytics_data_manager import AnalyticsRecord
+from devsync_ai.analytics.analytics_data_manager import AnalyticsRecord, shutdown_analytics_data_manager
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_analytics_data_manager():
+    """Close the global data manager that engine background work may open."""
+    yield
+    await shutdown_analytics_data_manager()
 
 
 class TestHookAnalyticsEngine:
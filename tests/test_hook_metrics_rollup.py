@@ -0,0 +1,162 @@
+"""Tests for incremental hook execution rollups."""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from devsync_ai.analytics.analytics_data_manager import AnalyticsRecord
+from devsync_ai.analytics.hook_analytics_engine import HookAnalyticsEngine
+from devsync_ai.analytics.hook_metrics_rollup import (
+    HookMetricRollup,
+    HookMetricsRollupStore,
+    QuantileSketch,
+)
+from devsync_ai.core.agent_hooks import HookExecutionResult, HookStatus
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch."""
+
+    def test_relative_accuracy(self):
+        """Test quantiles stay within the configured relative error."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(6, 1) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = _exact_quantile(values, q)
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_merge_equals_single_sketch(self):
+        """Test merging partial sketches gives the same bins as one sketch."""
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 1001):
+            whole.add(value)
+            (left if value % 2 else right).add(value)
+
+        left.merge(right)
+
+        assert left.bins == whole.bins
+        assert left.quantile(0.99) == whole.quantile(0.99)
+        assert QuantileSketch.from_dict(left.to_dict()).bins == whole.bins
+
+
+class TestHookMetricsRollupStore:
+    """Test cases for HookMetricsRollupStore."""
+
+    def test_query_matches_brute_force(self):
+        """Test merged minute and hour buckets equal a scan of the raw executions."""
+        rng = random.Random(3)
+        now = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+        store = HookMetricsRollupStore(covered_since=now - timedelta(days=8))
+        executions = []
+        for _ in range(5000):
+            timestamp = now - timedelta(seconds=rng.randint(0, 7 * 24 * 3600))
+            execution = (rng.choice(["hook-a", "hook-b"]), rng.choice(["team-1", "team-2"]),
+                         rng.uniform(5, 5000), rng.random() > 0.1, timestamp)
+            executions.append(execution)
+            store.add(execution[0], execution[1], "status_change", *execution[2:])
+
+        start, end = now - timedelta(days=3, minutes=17), now - timedelta(hours=5, minutes=3)
+        series = store.query(start, end, hook_id="hook-a")
+
+        start_minute = start.replace(second=0, microsecond=0)
+        expected = [e for e in executions
+                    if e[0] == "hook-a" and start_minute <= e[4] < end.replace(second=0) + timedelta(minutes=1)]
+        merged = HookMetricRollup()
+        for rollup in series.values():
+            merged.merge(rollup)
+
+        assert set(series) <= {("hook-a", "team-1"), ("hook-a", "team-2")}
+        assert merged.count == len(expected)
+        assert merged.success_count == sum(1 for e in expected if e[3])
+        assert merged.total_execution_time_ms == pytest.approx(sum(e[2] for e in expected))
+        assert merged.min_execution_time_ms == min(e[2] for e in expected)
+        assert merged.max_execution_time_ms == max(e[2] for e in expected)
+        assert merged.percentile(95) == pytest.approx(
+            _exact_quantile([e[2] for e in expected], 0.95), rel=0.011
+        )
+
+    def test_prune_drops_expired_buckets(self):
+        """Test buckets past retention are removed and coverage moves forward."""
+        now = datetime.now(timezone.utc)
+        store = HookMetricsRollupStore(retention=timedelta(days=1), covered_since=now - timedelta(days=3))
+        store.add("hook-a", "team-1", "status_change", 10.0, True, now - timedelta(days=2))
+        store.add("hook-a", "team-1", "status_change", 20.0, True, now)
+
+        assert store.prune(now) == 2  # one minute and one hour bucket
+
+        assert not store.covers(now - timedelta(days=2))
+        series = store.query(now - timedelta(days=1), now)
+        assert series[("hook-a", "team-1")].count == 1
+
+    def test_week_report_is_fast(self):
+        """Test merging a week of minute buckets for many hooks stays in milliseconds."""
+        now = datetime.now(timezone.utc)
+        store = HookMetricsRollupStore(covered_since=now - timedelta(days=8))
+        for minute in range(0, 7 * 24 * 60, 3):
+            timestamp = now - timedelta(minutes=minute)
+            for hook in range(20):
+                store.add(f"hook-{hook}", "team-1", "status_change", float(minute % 997 + hook), True, timestamp)
+
+        start = time.perf_counter()
+        series = store.query(now - timedelta(days=7), now)
+        merged = HookMetricRollup()
+        for rollup in series.values():
+            merged.merge(rollup)
+        merged.percentile(99)
+        elapsed = time.perf_counter() - start
+
+        assert len(series) == 20
+        assert elapsed < 0.25
+
+
+class TestHookAnalyticsEngineRollups:
+    """The analytics engine serves metrics from rollups once backfilled."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_use_rollups_after_backfill(self):
+        """Test only the one-time backfill reads raw records."""
+        engine = HookAnalyticsEngine()
+        now = datetime.now(timezone.utc)
+        stored = [
+            AnalyticsRecord(
+                id=f"stored-{i}", timestamp=now - timedelta(hours=i, minutes=30), record_type="hook_execution",
+                team_id="team_alpha",
+                data={"hook_id": "hook-1", "hook_type": "status_change", "success": i % 5 != 0,
+                      "execution_time_ms": 100.0 + i},
+                metadata={}
+            )
+            for i in range(48)
+        ]
+
+        with patch('devsync_ai.analytics.hook_analytics_engine.get_analytics_data_manager') as mock_get_manager:
+            mock_manager = AsyncMock()
+            mock_get_manager.return_value = mock_manager
+            mock_manager.query_records.return_value = stored
+
+            await engine.record_hook_execution(HookExecutionResult(
+                hook_id="hook-1", execution_id="live", hook_type="status_change", event_id="event",
+                status=HookStatus.FAILED, execution_time_ms=5000.0,
+                metadata={"team_id": "team_alpha"}
+            ))
+
+            daily = await engine.get_hook_performance_metrics("hook-1")
+            report = await engine.generate_performance_report()
+
+        assert mock_manager.query_records.await_count == 1
+        assert daily.total_executions == 25  # 24 stored in the last day plus the live one
+        assert daily.max_execution_time_ms == 5000.0
+        assert daily.p99_execution_time_ms >= daily.p95_execution_time_ms > 100.0
+        assert report["summary"]["total_executions"] == 49
+        assert report["hook_metrics"][0]["p95_execution_time_ms"] > 0
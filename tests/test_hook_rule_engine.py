@@ -549,14 +549,72 @@ class TestHookRuleEngine:
     @pytest.mark.asyncio
     async def test_error_handling_evaluation_exception(self, rule_engine, sample_event):
         """Test error handling during rule evaluation."""
-        # Mock an exception during field extraction
-        with patch.object(rule_engine, '_extract_field_value', side_effect=Exception("Test error")):
+        # Mock an exception while a compiled rule reads the event
+        with patch.object(rule_engine, '_get_field_accessor', side_effect=Exception("Test error")):
+            rule_engine.clear_cache()
             result = await rule_engine.evaluate_rules(sample_event, 'engineering')
             
             # Should not crash, but return no match
             assert result.matched is False
             assert len(result.errors) > 0
     
+    @pytest.mark.asyncio
+    async def test_compiled_conditions_match_apply_operator(self, rule_engine, sample_event):
+        """Test compiled conditions agree with _apply_operator on extracted values."""
+        cases = [
+            ('event.event_type', RuleOperator.EQUALS, 'jira:issue_updated', True),
+            ('event.event_type', RuleOperator.NOT_EQUALS, 'jira:issue_updated', True),
+            ('ticket.priority.name', RuleOperator.IN, ['HIGH', 'critical'], False),
+            ('ticket.priority.name', RuleOperator.NOT_IN, 'low', False),
+            ('ticket.summary', RuleOperator.CONTAINS, 'ISSUE', False),
+            ('ticket.summary', RuleOperator.NOT_CONTAINS, 'issue', True),
+            ('event.classification.keywords', RuleOperator.CONTAINS, 'bug', True),
+            ('ticket.labels', RuleOperator.NOT_CONTAINS, 'Payment', False),
+            ('ticket.summary', RuleOperator.STARTS_WITH, 'critical', False),
+            ('ticket.summary', RuleOperator.ENDS_WITH, 'ISSUE', False),
+            ('ticket.summary', RuleOperator.REGEX, r'crit\w+', False),
+            ('ticket.summary', RuleOperator.REGEX, '[unclosed', True),
+            ('ticket.key', RuleOperator.GREATER_THAN, '3', True),
+            ('routing_hints.priority', RuleOperator.EQUALS, 'high', False),
+            ('stakeholders.roles.0', RuleOperator.EQUALS, 'assignee', True),
+            ('ticket.missing', RuleOperator.NOT_EQUALS, 'x', True),
+            ('ticket.missing', RuleOperator.EQUALS, 'x', True),
+        ]
+        
+        for field, operator, value, case_sensitive in cases:
+            condition = RuleCondition(field, operator, value, case_sensitive)
+            field_value = rule_engine._extract_field_value(field, sample_event)
+            if field_value is None:
+                expected = operator in (RuleOperator.NOT_EQUALS, RuleOperator.NOT_IN, RuleOperator.NOT_CONTAINS)
+            else:
+                expected = rule_engine._apply_operator(operator, field_value, value, case_sensitive)
+            
+            assert await rule_engine._evaluate_condition(condition, sample_event) is expected, (field, operator, value)
+    
+    @pytest.mark.asyncio
+    async def test_rules_compiled_once_per_load(self, rule_engine, sample_event):
+        """Test evaluation reuses compiled rules until the cache is cleared."""
+        await rule_engine.evaluate_rules(sample_event, 'engineering')
+        compiled = rule_engine._compiled_rules['engineering']
+        
+        await rule_engine.evaluate_rules(sample_event, 'engineering')
+        assert rule_engine._compiled_rules['engineering'] is compiled
+        assert [c.rule.priority for c in compiled.rules] == sorted(
+            (c.rule.priority for c in compiled.rules), reverse=True
+        )
+        
+        rule_engine.clear_cache('engineering')
+        assert 'engineering' not in rule_engine._compiled_rules
+    
+    @pytest.mark.asyncio
+    async def test_event_context_built_once_per_evaluation(self, rule_engine, sample_event):
+        """Test all rules of a team are evaluated against one event context."""
+        build_context = rule_engine._build_event_context
+        with patch.object(rule_engine, '_build_event_context', side_effect=build_context) as mock_build:
+            await rule_engine.evaluate_rules(sample_event, 'engineering')
+        
+        assert mock_build.call_count == 1
+    
     @pytest.mark.asyncio
     async def test_business_hours_validation(self, rule_engine):
         """Test business hours validation."""
@@ -636,6 +694,102 @@ class TestHookRuleEngine:
         result = await rule_engine.evaluate_rules(sample_event, 'complex')
         assert result.matched is True
         assert result.rule_id == 'complex_rule'
+    
+    def _write_dispatch_config(self, rule_engine):
+        """Write a team config mixing indexed and unindexed rules."""
+        def rule(rule_id, priority, conditions, logic='and'):
+            return {
+                'rule_id': rule_id,
+                'name': rule_id,
+                'hook_types': ['StatusChangeHook'],
+                'priority': priority,
+                'conditions': {'logic': logic, 'conditions': conditions}
+            }
+        
+        rules = [
+            rule(f'other_project_{i}', 50, [
+                {'field': 'event.project_key', 'operator': 'equals', 'value': f'OTHER{i}'}
+            ])
+            for i in range(20)
+        ]
+        rules += [
+            rule('created_only', 40, [
+                {'field': 'event.event_type', 'operator': 'equals', 'value': 'jira:issue_created'}
+            ]),
+            rule('proj_updated', 20, [
+                {'field': 'event.project_key', 'operator': 'in', 'value': ['proj', 'CORE'],
+                 'case_sensitive': False},
+                {'logic': 'and', 'conditions': [
+                    {'field': 'event.event_type', 'operator': 'equals', 'value': 'jira:issue_updated'}
+                ]}
+            ]),
+            rule('bug_fallback', 30, [
+                {'field': 'ticket.summary', 'operator': 'contains', 'value': 'database'},
+                {'field': 'event.project_key', 'operator': 'equals', 'value': 'PROJ'}
+            ], logic='or'),
+            rule('any_bug', 10, [
+                {'field': 'ticket.issue_type.name', 'operator': 'equals', 'value': 'Bug'}
+            ])
+        ]
+        
+        config = {'team_id': 'dispatch', 'team_name': 'Dispatch', 'rules': rules}
+        with open(Path(rule_engine.config_dir) / 'team_dispatch_hooks.yaml', 'w') as f:
+            yaml.dump(config, f)
+    
+    @pytest.mark.asyncio
+    async def test_indexed_dispatch_preserves_priority_order(self, rule_engine, sample_event):
+        """Test indexed dispatch returns the highest-priority matching rule."""
+        self._write_dispatch_config(rule_engine)
+        
+        result = await rule_engine.evaluate_rules(sample_event, 'dispatch')
+        
+        # The OR rule cannot be indexed and outranks the indexed match
+        assert result.matched is True
+        assert result.rule_id == 'bug_fallback'
+        assert result.metadata['evaluation_order'] == 21
+        assert result.metadata['candidate_rules'] == 1
+        
+        compiled = rule_engine._compiled_rules['dispatch']
+        assert set(compiled.indexes) == {'event.project_key', 'event.event_type', 'ticket.issue_type.name'}
+        assert [compiled.rules[p].rule.rule_id for p in compiled.unindexed] == ['bug_fallback']
+    
+    @pytest.mark.asyncio
+    async def test_indexed_dispatch_skips_non_candidates(self, rule_engine, sample_event):
+        """Test rules guarded on other values are never evaluated."""
+        self._write_dispatch_config(rule_engine)
+        sample_event.project_key = 'CORE'
+        
+        result = await rule_engine.evaluate_rules(sample_event, 'dispatch')
+        
+        # Case-insensitive guard matches; bug_fallback is evaluated but fails
+        assert result.rule_id == 'proj_updated'
+        assert result.metadata['candidate_rules'] == 2
+        
+        sample_event.event_type = 'jira:issue_deleted'
+        sample_event.ticket_details = {'summary': 'Unrelated', 'issue_type': {'name': 'Task'}}
+        result = await rule_engine.evaluate_rules(sample_event, 'dispatch')
+        
+        assert result.matched is False
+        assert result.metadata['evaluated_rules'] == 1
+        assert rule_engine.get_metrics()['candidates_per_event'] == 1.5
+    
+    @pytest.mark.asyncio
+    async def test_indexed_dispatch_matches_full_scan(self, rule_engine, sample_event):
+        """Test candidate selection agrees with evaluating every rule."""
+        self._write_dispatch_config(rule_engine)
+        team_rules = await rule_engine.load_team_rules('dispatch')
+        compiled = rule_engine._get_compiled_rules('dispatch', team_rules)
+        
+        for project_key in ['PROJ', 'proj', 'CORE', 'OTHER3', 'NONE', None]:
+            for event_type in ['jira:issue_updated', 'jira:issue_created']:
+                sample_event.project_key = project_key
+                sample_event.event_type = event_type
+                context = rule_engine._build_event_context(sample_event)
+                
+                expected = next((c.rule.rule_id for c in compiled.rules if c.matches(context)), None)
+                result = await rule_engine.evaluate_rules(sample_event, 'dispatch')
+                
+                assert result.rule_id == expected, (project_key, event_type)
 
 
 class TestRuleDataClasses:
@@ -12,7 +12,9 @@ This test suite covers all aspects of the IntelligentDataAggregator including:
 
 import asyncio
 import pytest
+import sys
 import time
+import tracemalloc
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
@@ -37,6 +39,16 @@ from devsync_ai.core.intelligent_data_aggregator import (
 )
 
 
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
 class TestCacheManager:
     """Test the intelligent caching system."""
     
@@ -99,15 +111,10 @@ class TestCacheManager:
         
         # Simulate access pattern
         cache_key = self.cache_manager._generate_cache_key(DataSourceType.GITHUB, "test", {})
-        now = datetime.utcnow()
         
-        # Add access pattern (every 10 minutes)
-        self.cache_manager._access_patterns[cache_key] = [
-            now - timedelta(minutes=30),
-            now - timedelta(minutes=20),
-            now - timedelta(minutes=10),
-            now
-        ]
+        # Record accesses every 10 minutes
+        for minutes in (0, 10, 20, 30):
+            self.cache_manager._record_access(cache_key, minutes * 60.0)
         
         optimized_ttl = self.cache_manager.optimize_ttl(DataSourceType.GITHUB, "test")
         # Should be around 50% of 10 minutes = 5 minutes = 300 seconds
@@ -129,6 +136,111 @@ class TestCacheManager:
         # Verify correct entry was cleared
         assert self.cache_manager.get(DataSourceType.GITHUB, "test1") is not None
         assert self.cache_manager.get(DataSourceType.GITHUB, "test2") is None
+    
+    def test_cache_key_accepts_datetimes(self):
+        """Test keys are built without serializing parameters."""
+        date_range = (datetime(2024, 1, 1), datetime(2024, 1, 8))
+        params = {"team_id": "team1", "date_range": date_range, "labels": ["a", "b"]}
+        
+        self.cache_manager.set(DataSourceType.GITHUB, "test", {"data": 1}, 3600, params)
+        assert self.cache_manager.get(DataSourceType.GITHUB, "test", dict(params)) == {"data": 1}
+    
+    def test_capacity_and_byte_budget(self):
+        """Test the cache evicts least recently used entries to stay within budget."""
+        cache_manager = CacheManager(max_entries=3, max_bytes=1000)
+        for i in range(5):
+            cache_manager.set(DataSourceType.GITHUB, f"repo{i}", {"i": i}, 3600)
+        
+        assert len(cache_manager) == 3
+        assert cache_manager.get(DataSourceType.GITHUB, "repo0") is None
+        assert cache_manager.get(DataSourceType.GITHUB, "repo4") == {"i": 4}
+        
+        cache_manager.set(DataSourceType.GITHUB, "large", {"blob": "x" * 800}, 3600)
+        assert cache_manager.get_stats()["size_bytes"] <= 1000
+        assert cache_manager.get_stats()["evictions"] >= 3
+    
+    def test_access_history_is_a_ring_buffer(self):
+        """Test access history keeps a fixed number of intervals and keys."""
+        cache_manager = CacheManager(access_history_size=4, max_tracked_keys=2)
+        for key in ("a", "b", "c"):
+            for timestamp in range(10):
+                cache_manager._record_access(key, float(timestamp))
+        
+        assert list(cache_manager._access_patterns) == ["b", "c"]
+        history = cache_manager._access_patterns["c"]
+        assert len(history.intervals) == 4
+        assert history.count == 10
+        assert history.average_interval == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """Test stale entries are served while warm_cache refreshes them."""
+        clock = FakeClock()
+        cache_manager = CacheManager(stale_while_revalidate=60, clock=clock)
+        loads = []
+        
+        async def collector():
+            loads.append(clock())
+            return {"version": len(loads)}
+        
+        assert await cache_manager.get_or_load(DataSourceType.JIRA, "board", collector) == {"version": 1}
+        
+        clock.now += 1801  # Past the default TTL, inside the stale window
+        assert cache_manager.get(DataSourceType.JIRA, "board") is None
+        assert await cache_manager.get_or_load(DataSourceType.JIRA, "board", collector) == {"version": 1}
+        assert await cache_manager.get_or_load(DataSourceType.JIRA, "board", collector) == {"version": 1}
+        
+        await asyncio.sleep(0)
+        assert len(loads) == 2  # One background refresh for both stale reads
+        assert cache_manager.get(DataSourceType.JIRA, "board") == {"version": 2}
+        
+        clock.now += 5000  # Past the stale window: a blocking load
+        assert cache_manager.clear_expired() == 1
+        assert await cache_manager.get_or_load(DataSourceType.JIRA, "board", collector) == {"version": 3}
+    
+    @pytest.mark.asyncio
+    async def test_background_expiry(self):
+        """Test the background task clears expired entries."""
+        cache_manager = CacheManager(expiry_resolution=0.01)
+        cache_manager.set(DataSourceType.GITHUB, "test", {"data": 1}, 0.02)
+        
+        cache_manager.start_background_expiry(interval=0.01)
+        await asyncio.sleep(0.1)
+        await cache_manager.stop_background_expiry()
+        
+        assert len(cache_manager) == 0
+        assert cache_manager.get_stats()["expirations"] == 1
+    
+    def test_memory_stays_flat_over_1m_gets(self):
+        """Soak test: memory does not grow with traffic."""
+        clock = FakeClock()
+        cache_manager = CacheManager(max_entries=100, max_tracked_keys=200, clock=clock)
+        params = {"team_id": "team1"}
+        
+        def run(gets: int):
+            for i in range(gets):
+                clock.now += 0.01
+                # Mostly hot keys, with a stream of cold keys forcing evictions
+                identifier = f"cold{i % 1000}" if i % 10 == 0 else f"hot{i % 50}"
+                if cache_manager.get(DataSourceType.GITHUB, identifier, params) is None:
+                    cache_manager.set(DataSourceType.GITHUB, identifier, {"id": i}, 60, params)
+        
+        # Fill the cache and access history before measuring
+        run(50_000)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            run(1_000_000)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        
+        assert len(cache_manager) <= 100
+        assert len(cache_manager._access_patterns) <= 200
+        assert all(len(history.intervals) <= 16 for history in cache_manager._access_patterns.values())
+        # Live allocations are unchanged after the steady state is reached
+        growth = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        assert growth < 256 * 1024
 
 
 class TestDataValidator:
@@ -459,6 +571,31 @@ class TestIntelligentDataAggregator:
         assert data_source.identifier == "test_service"
         assert data_source.service_instance == mock_service
     
+    @pytest.mark.asyncio
+    async def test_cache_warming_refetches_each_source(self):
+        """Test warming replaces cached data with a fresh fetch per source."""
+        self.aggregator.register_data_source(DataSourceType.GITHUB, "repo", Mock())
+        self.aggregator.register_data_source(DataSourceType.JIRA, "board", Mock())
+        date_range = (datetime(2025, 1, 1), datetime(2025, 1, 8))
+        params = {"team_id": "team1", "date_range": date_range}
+        cache = self.aggregator.cache_manager
+        cache.set(DataSourceType.GITHUB, "repo", {"version": "cached"}, 3600, params)
+        cache.set(DataSourceType.JIRA, "board", {"version": "cached"}, 3600, params)
+        
+        async def fetch(data_source, team_id, fetched_range):
+            return {"version": "fresh", "source": data_source.identifier}
+        
+        with patch.object(self.aggregator, "_fetch_github_data", AsyncMock(side_effect=fetch)) as github, \
+                patch.object(self.aggregator, "_fetch_jira_data", AsyncMock(side_effect=fetch)) as jira, \
+                patch.object(self.aggregator, "_fetch_team_metrics", AsyncMock(side_effect=fetch)):
+            await self.aggregator._warm_cache_for_team("team1", date_range)
+        
+        # Each source is fetched with its own data source, not the loop's last one
+        assert "repo" in [call.args[0].identifier for call in github.await_args_list]
+        assert "board" in [call.args[0].identifier for call in jira.await_args_list]
+        assert cache.get(DataSourceType.GITHUB, "repo", params) == {"version": "fresh", "source": "repo"}
+        assert cache.get(DataSourceType.JIRA, "board", params) == {"version": "fresh", "source": "board"}
+    
     def test_circuit_breaker_closed_to_open(self):
         """Test circuit breaker opening after failures."""
         mock_service = Mock()
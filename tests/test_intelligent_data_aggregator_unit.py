@@ -93,15 +93,10 @@ class TestCacheManager:
         
         # Simulate access pattern
         cache_key = self.cache_manager._generate_cache_key(DataSourceType.GITHUB, "test", {})
-        now = datetime.utcnow()
-        
-        # Add access pattern (every 10 minutes)
-        self.cache_manager._access_patterns[cache_key] = [
-            now - timedelta(minutes=30),
-            now - timedelta(minutes=20),
-            now - timedelta(minutes=10),
-            now
-        ]
+        
+        # Record accesses every 10 minutes
+        for minutes in (0, 10, 20, 30):
+            self.cache_manager._record_access(cache_key, minutes * 60.0)
         
         optimized_ttl = self.cache_manager.optimize_ttl(DataSourceType.GITHUB, "test")
         # Should be around 50% of 10 minutes = 5 minutes = 300 seconds
@@ -0,0 +1,246 @@
+"""
+Tests for the durable JIRA webhook ingestion queue.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from devsync_ai.webhooks.jira_ingestion_queue import JiraIngestionQueue
+
+
+def make_webhook(issue_key: str, timestamp: int, event: str = "jira:issue_updated") -> dict:
+    return {"webhookEvent": event, "timestamp": timestamp, "issue": {"key": issue_key}}
+
+
+async def enqueue(queue: JiraIngestionQueue, webhook: dict, headers: dict = None) -> dict:
+    return await queue.enqueue(json.dumps(webhook).encode(), webhook, headers or {})
+
+
+async def wait_until(condition, timeout: float = 5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class RecordingHandler:
+    """Handler recording processed webhooks, optionally failing or blocking."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.processed = []
+        self.active = {}
+        self.overlaps = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, webhook_data, headers, completed_steps):
+        issue_key = webhook_data["issue"]["key"]
+        if self.active.get(issue_key):
+            self.overlaps += 1
+        self.active[issue_key] = True
+        try:
+            await self.release.wait()
+            await asyncio.sleep(0)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("downstream unavailable")
+            self.processed.append((issue_key, webhook_data["timestamp"]))
+        finally:
+            self.active[issue_key] = False
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "journal.db")
+
+
+@pytest.mark.asyncio
+async def test_accepted_webhooks_are_processed(journal_path):
+    """Enqueued webhooks are drained by the workers and acknowledged once."""
+    handler = RecordingHandler()
+    queue = JiraIngestionQueue(handler, db_path=journal_path, workers=3, poll_interval=0.05)
+    await queue.start()
+    try:
+        for i in range(10):
+            receipt = await enqueue(queue, make_webhook(f"DEV-{i % 4}", 1000 + i))
+            assert receipt["duplicate"] is False
+
+        await wait_until(lambda: len(handler.processed) == 10)
+        stats = await queue.get_stats()
+        assert stats["depth"] == 0
+        assert stats["processed"] == 10
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_retries_of_a_delivery_are_deduplicated(journal_path):
+    """JIRA retries carry the same webhook identifier and are journaled once."""
+    handler = RecordingHandler()
+    queue = JiraIngestionQueue(handler, db_path=journal_path, poll_interval=0.05)
+    await queue.start()
+    try:
+        headers = {"X-Atlassian-Webhook-Identifier": "delivery-1"}
+        first = await enqueue(queue, make_webhook("DEV-1", 1000), headers)
+        retry = await enqueue(queue, make_webhook("DEV-1", 1000), headers)
+        # Without the header the payload timestamp identifies the delivery
+        second = await enqueue(queue, make_webhook("DEV-2", 2000))
+        second_retry = await enqueue(queue, make_webhook("DEV-2", 2000))
+
+        assert first["idempotency_key"] == "id:delivery-1"
+        assert (first["duplicate"], retry["duplicate"]) == (False, True)
+        assert (second["duplicate"], second_retry["duplicate"]) == (False, True)
+
+        await wait_until(lambda: len(handler.processed) == 2)
+        # Completed deliveries still deduplicate late retries
+        assert (await enqueue(queue, make_webhook("DEV-1", 1000), headers))["duplicate"] is True
+        assert queue.stats["duplicates"] == 3
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_same_issue_is_processed_in_order(journal_path):
+    """Webhooks for one issue run one at a time in arrival order."""
+    handler = RecordingHandler()
+    queue = JiraIngestionQueue(handler, db_path=journal_path, workers=4, poll_interval=0.05)
+    await queue.start()
+    try:
+        for i in range(20):
+            await enqueue(queue, make_webhook(f"DEV-{i % 2}", 1000 + i))
+
+        await wait_until(lambda: len(handler.processed) == 20)
+        assert handler.overlaps == 0
+        for issue_key in ("DEV-0", "DEV-1"):
+            timestamps = [ts for key, ts in handler.processed if key == issue_key]
+            assert timestamps == sorted(timestamps)
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_webhooks_are_retried_then_dead_lettered(journal_path):
+    """Handler errors are retried with backoff; persistent failures are dead-lettered."""
+    handler = RecordingHandler(failures=2)
+    queue = JiraIngestionQueue(
+        handler, db_path=journal_path, workers=1, retry_base_delay=0.01, poll_interval=0.01
+    )
+    await queue.start()
+    try:
+        await enqueue(queue, make_webhook("DEV-1", 1000))
+        await wait_until(lambda: handler.processed == [("DEV-1", 1000)])
+        assert queue.stats["retried"] == 2
+
+        handler.failures = 10
+        await enqueue(queue, make_webhook("DEV-2", 2000))
+        await wait_until(lambda: queue.stats["dead_lettered"] == 1)
+        stats = await queue.get_stats()
+        assert stats["dead_lettered"] == 1
+        assert stats["depth"] == 0
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_downstream_error_results_are_retried_then_dead_lettered(journal_path):
+    """Processing steps that report an error instead of raising still fail the entry."""
+    from devsync_ai.webhooks.routes import process_queued_jira_webhook
+
+    assignment_processor = Mock()
+    assignment_processor._is_assignment_change.side_effect = lambda data: data["issue"]["key"] == "DEV-1"
+    assignment_processor.process_webhook = AsyncMock(return_value={"success": False, "error": "JIRA unavailable"})
+    ticket_update = AsyncMock(return_value={"message": "database unavailable", "status": "error"})
+    notification = AsyncMock(return_value=True)
+    queue = JiraIngestionQueue(
+        process_queued_jira_webhook, db_path=journal_path, workers=1,
+        max_attempts=3, retry_base_delay=0.01, poll_interval=0.01
+    )
+    with patch.dict("sys.modules", {
+        "devsync_ai.webhooks.jira_assignment_webhook_processor": Mock(jira_assignment_processor=assignment_processor)
+    }), patch("devsync_ai.webhooks.routes.send_enhanced_notification", notification), \
+            patch("devsync_ai.webhooks.routes.process_jira_ticket_update", ticket_update):
+        await queue.start()
+        try:
+            await enqueue(queue, make_webhook("DEV-1", 1000))
+            await enqueue(queue, make_webhook("DEV-2", 2000))
+            await wait_until(lambda: queue.stats["dead_lettered"] == 2)
+            assert queue.stats["retried"] == 4
+            assert queue.stats["processed"] == 0
+            assert assignment_processor.process_webhook.await_count == 3
+            assert ticket_update.await_count == 3
+            # Notifications succeeded on the first attempt and were not repeated
+            assert notification.await_count == 2
+        finally:
+            await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_retries_skip_finished_steps_and_permanent_failures_are_not_retried(journal_path):
+    """A retry repeats only the failed step; a webhook that cannot succeed is dead-lettered at once."""
+    from devsync_ai.webhooks.routes import process_queued_jira_webhook
+
+    assignment_processor = Mock()
+    assignment_processor._is_assignment_change.return_value = False
+    notification = AsyncMock(return_value=True)
+
+    async def ticket_update(webhook_data):
+        if not webhook_data["issue"].get("key"):
+            return {"message": "Missing ticket key", "status": "error", "retryable": False}
+        if ticket_update.calls == 0:
+            ticket_update.calls += 1
+            return {"message": "database unavailable", "status": "error"}
+        return {"message": "updated", "status": "success"}
+    ticket_update.calls = 0
+
+    queue = JiraIngestionQueue(
+        process_queued_jira_webhook, db_path=journal_path, workers=1,
+        max_attempts=5, retry_base_delay=0.01, poll_interval=0.01
+    )
+    with patch.dict("sys.modules", {
+        "devsync_ai.webhooks.jira_assignment_webhook_processor": Mock(jira_assignment_processor=assignment_processor)
+    }), patch("devsync_ai.webhooks.routes.send_enhanced_notification", notification), \
+            patch("devsync_ai.webhooks.routes.process_jira_ticket_update", ticket_update):
+        await queue.start()
+        try:
+            await enqueue(queue, make_webhook("DEV-1", 1000))
+            await wait_until(lambda: queue.stats["processed"] == 1)
+            assert queue.stats["retried"] == 1
+            assert notification.await_count == 1
+
+            await enqueue(queue, {"webhookEvent": "jira:issue_updated", "timestamp": 2000, "issue": {}})
+            await wait_until(lambda: queue.stats["dead_lettered"] == 1)
+            assert queue.stats["retried"] == 1
+        finally:
+            await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_unfinished_webhooks_are_replayed_after_restart(journal_path):
+    """Accepted webhooks that were not processed survive a restart."""
+    handler = RecordingHandler()
+    handler.release.clear()  # Workers stall mid-processing, as in a crash
+    queue = JiraIngestionQueue(handler, db_path=journal_path, workers=2, poll_interval=0.05)
+    await queue.start()
+    for i in range(3):
+        await enqueue(queue, make_webhook(f"DEV-{i}", 1000 + i))
+    await wait_until(lambda: sum(handler.active.values()) == 2)
+
+    stats = await queue.get_stats()
+    assert stats["depth"] == 3
+    assert stats["in_flight"] == 2
+    assert stats["lag_seconds"] >= 0
+    await queue.stop()
+    assert handler.processed == []
+
+    replay = RecordingHandler()
+    restarted = JiraIngestionQueue(replay, db_path=journal_path, workers=2, poll_interval=0.05)
+    await restarted.start()
+    try:
+        await wait_until(lambda: len(replay.processed) == 3)
+        assert sorted(replay.processed) == [("DEV-0", 1000), ("DEV-1", 1001), ("DEV-2", 1002)]
+    finally:
+        await restarted.stop()
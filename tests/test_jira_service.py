@@ -1,7 +1,7 @@
 """Tests for JIRA service functionality."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from jira import JIRAError
 
@@ -670,3 +670,81 @@ class TestJiraService:
                 # Should include a date filter for last 24 hours
                 assert "updated >=" in jql_query
                 assert "ORDER BY updated DESC" in jql_query
+
+    def _make_tickets(self, count):
+        return [
+            JiraTicket(
+                key=f"TEST-{i}",
+                summary=f"Ticket {i}",
+                status="In Progress",
+                assignee="User1",
+                priority="High",
+                story_points=3,
+                last_updated=datetime.now(),
+                time_in_status=timedelta(days=1),
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_store_tickets_in_database_chunked_upsert(self, jira_service):
+        """Test chunked upsert makes one request per chunk and reports the upserted count."""
+        tickets = self._make_tickets(5)
+        mock_db = Mock()
+        mock_db.select = AsyncMock()
+        mock_db.upsert = AsyncMock(side_effect=lambda table, data, on_conflict: data)
+
+        with patch("devsync_ai.database.connection.get_database", AsyncMock(return_value=mock_db)):
+            summary = await jira_service.store_tickets_in_database(tickets, batch_size=2)
+
+        assert mock_db.upsert.call_count == 3
+        assert all(c.kwargs["on_conflict"] == "key" for c in mock_db.upsert.call_args_list)
+        mock_db.select.assert_not_called()
+        assert summary["upserted_count"] == 5
+        assert summary["stored_count"] is None
+        assert summary["updated_count"] is None
+        assert summary["error_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_store_tickets_in_database_retries_failed_chunk_only(self, jira_service):
+        """Test only the failing chunk is retried and reported."""
+        tickets = self._make_tickets(4)
+        calls = []
+
+        async def upsert(table, data, on_conflict):
+            calls.append([row["key"] for row in data])
+            if data[0]["key"] == "TEST-2":
+                raise Exception("HTTP 500")
+            return data
+
+        mock_db = Mock()
+        mock_db.select = AsyncMock(return_value=[])
+        mock_db.upsert = upsert
+
+        with patch("devsync_ai.database.connection.get_database", AsyncMock(return_value=mock_db)):
+            with patch("devsync_ai.services.jira.asyncio.sleep", AsyncMock()):
+                summary = await jira_service.store_tickets_in_database(
+                    tickets, batch_size=2, max_chunk_retries=1
+                )
+
+        assert calls == [["TEST-0", "TEST-1"], ["TEST-2", "TEST-3"], ["TEST-2", "TEST-3"]]
+        assert summary["upserted_count"] == 2
+        assert summary["error_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_store_tickets_in_database_per_ticket_mode(self, jira_service):
+        """Test batch_size=None keeps the per-ticket select/insert/update path."""
+        tickets = self._make_tickets(2)
+        mock_db = Mock()
+        mock_db.select = AsyncMock(side_effect=[[{"key": "TEST-0"}], []])
+        mock_db.update = AsyncMock(return_value=[])
+        mock_db.insert = AsyncMock(return_value=[])
+        mock_db.upsert = AsyncMock()
+
+        with patch("devsync_ai.database.connection.get_database", AsyncMock(return_value=mock_db)):
+            summary = await jira_service.store_tickets_in_database(tickets, batch_size=None)
+
+        mock_db.upsert.assert_not_called()
+        assert summary["updated_count"] == 1
+        assert summary["stored_count"] == 1
+        assert summary["upserted_count"] == 2
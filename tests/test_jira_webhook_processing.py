@@ -2,11 +2,14 @@
 Tests for JIRA webhook processing system.
 """
 
+import asyncio
 import json
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from fastapi import HTTPException
+
 from devsync_ai.core.agent_hook_dispatcher import (
     AgentHookDispatcher,
     WebhookSecurityValidator,
@@ -33,6 +36,7 @@ from devsync_ai.core.agent_hooks import (
     SignificanceLevel
 )
 from devsync_ai.core.hook_lifecycle_manager import HookLifecycleManager
+from devsync_ai.core.lane_executor import LaneExecutor
 
 # Configure pytest-asyncio
 pytestmark = pytest.mark.asyncio
@@ -351,6 +355,70 @@ class TestAgentHookDispatcher:
             assert 'metrics' in health
         finally:
             await lifecycle_manager.stop()
+    
+    async def test_worker_lanes_keep_ticket_order(self, sample_webhook_payload):
+        """Events for one ticket run in order while other tickets proceed."""
+        dispatcher, lifecycle_manager = await self.create_dispatcher()
+        dispatcher.executor = LaneExecutor(lanes=4)
+        
+        executed = []
+        
+        async def execute_event(webhook_data, event_type):
+            ticket_key = webhook_data['issue']['key']
+            await asyncio.sleep(0.001 * (3 - webhook_data['sequence']))
+            executed.append((ticket_key, webhook_data['sequence']))
+            return MagicMock(event_id=f"{ticket_key}-{webhook_data['sequence']}"), []
+        
+        try:
+            with patch.object(dispatcher, '_execute_event', side_effect=execute_event):
+                payloads = []
+                for ticket_key in ("DEV-1", "DEV-2", "DEV-3"):
+                    for sequence in range(3):
+                        payload = json.loads(json.dumps(sample_webhook_payload))
+                        payload['issue']['key'] = ticket_key
+                        payload['sequence'] = sequence
+                        payloads.append(payload)
+                
+                results = await asyncio.gather(*(
+                    dispatcher.dispatch_webhook_event(webhook_data=payload) for payload in payloads
+                ))
+            
+            assert [result.event_id for result in results] == [
+                f"{p['issue']['key']}-{p['sequence']}" for p in payloads
+            ]
+            for ticket_key in ("DEV-1", "DEV-2", "DEV-3"):
+                assert [seq for key, seq in executed if key == ticket_key] == [0, 1, 2]
+            assert dispatcher.get_metrics()['worker_lanes']['lanes'] == 4
+        finally:
+            await dispatcher.shutdown()
+            await lifecycle_manager.stop()
+    
+    async def test_worker_lanes_backpressure(self, sample_webhook_payload):
+        """A full lane answers 503 instead of queueing without bound."""
+        dispatcher, lifecycle_manager = await self.create_dispatcher()
+        dispatcher.executor = LaneExecutor(lanes=1, max_queue_per_lane=1, enqueue_timeout=0.01)
+        release = asyncio.Event()
+        
+        async def execute_event(webhook_data, event_type):
+            await release.wait()
+            return MagicMock(event_id="event"), []
+        
+        try:
+            with patch.object(dispatcher, '_execute_event', side_effect=execute_event):
+                running = asyncio.create_task(dispatcher.dispatch_webhook_event(sample_webhook_payload))
+                await asyncio.sleep(0.01)
+                queued = asyncio.create_task(dispatcher.dispatch_webhook_event(sample_webhook_payload))
+                await asyncio.sleep(0)
+                
+                with pytest.raises(HTTPException) as exc_info:
+                    await dispatcher.dispatch_webhook_event(sample_webhook_payload)
+                assert exc_info.value.status_code == 503
+                
+                release.set()
+                await asyncio.gather(running, queued)
+        finally:
+            await dispatcher.shutdown()
+            await lifecycle_manager.stop()
 
 
 class TestIssueUpdatedProcessor:
@@ -0,0 +1,140 @@
+"""
+Tests for the keyed lane executor.
+"""
+
+import asyncio
+
+import pytest
+
+from devsync_ai.core.lane_executor import LaneExecutor, LaneExecutorStoppedError, LaneFullError
+
+
+pytestmark = pytest.mark.asyncio
+
+
+def keys_on_distinct_lanes(executor: LaneExecutor, count: int) -> list:
+    """Keys that hash onto ``count`` different lanes."""
+    keys, lanes = [], set()
+    for i in range(1000):
+        key = f"DEV-{i}"
+        if executor.lane_for(key) not in lanes:
+            lanes.add(executor.lane_for(key))
+            keys.append(key)
+        if len(keys) == count:
+            return keys
+    raise AssertionError("not enough distinct lanes")
+
+
+async def test_same_key_runs_in_order_and_keys_run_in_parallel():
+    """Items for a key never overlap or reorder; different keys overlap."""
+    executor = LaneExecutor(lanes=4)
+    running = {}
+    overlaps = []
+    completed = []
+    concurrency = []
+
+    def work(key, n):
+        async def run():
+            if running.get(key):
+                overlaps.append(key)
+            running[key] = True
+            concurrency.append(sum(running.values()))
+            await asyncio.sleep(0.005)
+            running[key] = False
+            completed.append((key, n))
+            return n
+        return run
+
+    keys = keys_on_distinct_lanes(executor, 4)
+    futures = [await executor.submit(key, work(key, n)) for n in range(5) for key in keys]
+    results = await asyncio.gather(*futures)
+    await executor.stop()
+
+    assert results == [n for n in range(5) for _ in keys]
+    assert overlaps == []
+    assert max(concurrency) == 4
+    for key in keys:
+        assert [n for k, n in completed if k == key] == list(range(5))
+
+
+async def test_full_lane_applies_backpressure():
+    """Submitting to a full lane waits, then fails with LaneFullError."""
+    executor = LaneExecutor(lanes=1, max_queue_per_lane=2, enqueue_timeout=0.05)
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+
+    first = await executor.submit("DEV-1", blocked)
+    await asyncio.sleep(0)  # The worker takes the first item
+    await executor.submit("DEV-1", blocked)
+    await executor.submit("DEV-2", blocked)
+
+    with pytest.raises(LaneFullError):
+        await executor.submit("DEV-1", blocked)
+
+    metrics = executor.get_metrics()
+    assert metrics["total_depth"] == 2
+    assert metrics["per_lane"][0]["rejected"] == 1
+    assert metrics["per_lane"][0]["oldest_age_seconds"] >= 0.05
+
+    release.set()
+    await first
+    await executor.stop()
+    assert executor.get_metrics()["per_lane"][0]["processed"] == 3
+
+
+async def test_waiting_submitters_keep_their_order():
+    """Submitters blocked on a full lane enqueue in arrival order, ahead of newcomers."""
+    executor = LaneExecutor(lanes=1, max_queue_per_lane=1, enqueue_timeout=None)
+    order = []
+
+    def record(n):
+        async def run():
+            order.append(n)
+            await asyncio.sleep(0)
+        return run
+
+    submitters = [asyncio.create_task(executor.run("DEV-1", record(n))) for n in range(10)]
+    await asyncio.gather(*submitters)
+    await executor.stop()
+
+    assert order == list(range(10))
+
+
+async def test_failures_resolve_the_future_and_keep_the_lane_running():
+    """An exception is delivered to the submitter and counted."""
+    executor = LaneExecutor(lanes=1)
+
+    async def fail():
+        raise ValueError("boom")
+
+    async def succeed():
+        return "ok"
+
+    with pytest.raises(ValueError):
+        await executor.run("DEV-1", fail)
+    assert await executor.run("DEV-1", succeed) == "ok"
+
+    lane = executor.get_metrics()["per_lane"][0]
+    assert (lane["processed"], lane["failed"]) == (1, 1)
+    await executor.stop()
+
+
+async def test_submit_after_stop_is_rejected():
+    """A stopped executor does not restart itself for late submits."""
+    executor = LaneExecutor(lanes=2)
+
+    async def succeed():
+        return "ok"
+
+    assert await executor.run("DEV-1", succeed) == "ok"
+    await executor.stop()
+
+    with pytest.raises(LaneExecutorStoppedError):
+        await executor.submit("DEV-1", succeed)
+    assert not executor.running
+
+    executor.start()
+    assert await executor.run("DEV-1", succeed) == "ok"
+    await executor.stop()
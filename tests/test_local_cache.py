@@ -0,0 +1,199 @@
+"""Tests for the bounded in-process LocalCache."""
+
+import asyncio
+
+import pytest
+
+from devsync_ai.core.local_cache import EvictionPolicy, LocalCache, TimerWheel
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalCache:
+    """Test cases for LocalCache."""
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test LRU keeps recently read entries."""
+        cache = LocalCache(max_entries=3, policy=EvictionPolicy.LRU)
+        for key in "abc":
+            cache.put(key, key.upper())
+
+        assert cache.get("a") == "A"
+        cache.put("d", "D")
+
+        assert "b" not in cache
+        assert set(cache.keys()) == {"a", "c", "d"}
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_lfu_evicts_least_frequently_used(self):
+        """Test LFU evicts the least-read entry, oldest first on ties."""
+        cache = LocalCache(max_entries=3, policy=EvictionPolicy.LFU)
+        for key in "abc":
+            cache.put(key, key)
+        for _ in range(3):
+            cache.get("a")
+        cache.get("b")
+
+        cache.put("d", "d")
+        assert "c" not in cache
+
+        # The newest entry is never its own victim
+        cache.put("e", "e")
+        assert "d" not in cache
+        assert set(cache.keys()) == {"a", "b", "e"}
+
+    def test_tiny_lfu_rejects_one_hit_wonders(self):
+        """Test TinyLFU keeps popular entries when a cold key arrives."""
+        cache = LocalCache(max_entries=2, policy=EvictionPolicy.TINY_LFU)
+        cache.put("hot1", 1)
+        cache.put("hot2", 2)
+        for _ in range(5):
+            cache.get("hot1")
+            cache.get("hot2")
+
+        assert cache.put("cold", 3) is False
+        assert set(cache.keys()) == {"hot1", "hot2"}
+
+        # A key that keeps missing becomes popular enough to be admitted
+        for _ in range(10):
+            cache.get("warm")
+        assert cache.put("warm", 4) is True
+        assert "warm" in cache
+        assert cache.get_stats()["rejections"] == 1
+
+    def test_byte_budget(self):
+        """Test entries are evicted to stay within the byte budget."""
+        cache = LocalCache(max_entries=100, max_bytes=100, policy=EvictionPolicy.LRU)
+        for i in range(5):
+            cache.put(i, "x", size_bytes=30)
+
+        assert cache.size_bytes <= 100
+        assert len(cache) == 3
+        assert cache.put("huge", "x", size_bytes=101) is False
+
+        cache.delete(4)
+        assert cache.size_bytes == 60
+
+    def test_ttl_expiry_through_timer_wheel(self):
+        """Test expired entries are reclaimed without being read."""
+        clock = FakeClock()
+        cache = LocalCache(max_entries=10, clock=clock)
+        cache.put("short", 1, ttl=5)
+        cache.put("long", 2, ttl=60)
+        cache.put("forever", 3)
+
+        clock.now += 6
+        assert cache.purge_expired() == 1
+        assert "short" not in cache
+        assert cache.get("long") == 2
+
+        clock.now += 3600
+        assert cache.get("forever") == 3
+        assert "long" not in cache
+        assert cache.get_stats()["expirations"] == 2
+
+    def test_overwrite_reschedules_ttl(self):
+        """Test replacing an entry cancels its old deadline."""
+        clock = FakeClock()
+        cache = LocalCache(max_entries=10, clock=clock)
+        cache.put("key", "old", ttl=5)
+        cache.put("key", "new", ttl=30)
+
+        clock.now += 10
+        assert cache.get("key") == "new"
+        assert cache.size_bytes == len(b'"new"')
+
+    def test_timer_wheel_long_pause(self):
+        """Test advancing past a full rotation expires everything due."""
+        wheel = TimerWheel(tick=1.0, slots=8, now=0)
+        wheel.schedule("a", 3)
+        wheel.schedule("b", 20)
+        wheel.schedule("c", 100)
+
+        assert sorted(wheel.advance(50)) == ["a", "b"]
+        assert wheel.advance(99) == []
+        assert wheel.advance(100) == ["c"]
+
+    def test_hit_ratio(self):
+        """Test hit and miss accounting."""
+        cache = LocalCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(2 / 3, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_single_flight_coalesces_concurrent_loads(self):
+        """Test concurrent loads of one key run the loader once."""
+        cache = LocalCache()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(cache.single_flight("k", loader) for _ in range(10)))
+
+        assert calls == 1
+        assert [value for value, _ in results] == [1] * 10
+        assert sum(shared for _, shared in results) == 9
+        assert cache.get_stats()["coalesced_loads"] == 9
+
+        # Later loads run again
+        value, shared = await cache.single_flight("k", loader)
+        assert (value, shared) == (2, False)
+
+    @pytest.mark.asyncio
+    async def test_single_flight_propagates_errors(self):
+        """Test a failing load raises for every waiter and is not cached."""
+        cache = LocalCache()
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(
+            *(cache.single_flight("k", loader) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.get_stats()["inflight_loads"] == 0
+
+    def test_on_remove_hook(self):
+        """Test the removal hook sees evictions, deletions, replacements and expiry."""
+        clock = FakeClock()
+        removed = []
+        cache = LocalCache(
+            max_entries=2,
+            policy=EvictionPolicy.LRU,
+            clock=clock,
+            on_remove=lambda key, value: removed.append((key, value))
+        )
+        cache.put("a", 1, ttl=5)
+        cache.put("b", 2)
+        cache.put("b", 3)
+        cache.put("c", 4)
+        cache.delete("c")
+
+        assert removed == [("b", 2), ("a", 1), ("c", 4)]
+
+        cache.put("d", 5, ttl=5)
+        clock.now += 10
+        cache.purge_expired()
+        cache.clear()
+        assert removed[3:] == [("d", 5), ("b", 3)]
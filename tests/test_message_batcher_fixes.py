@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Test the MessageBatcher implementation consistency fixes."""
 
+import time
 import pytest
-from datetime import datetime
-from devsync_ai.core.message_batcher import MessageBatcher, BatchableMessage, ContentType, BatchConfig
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from devsync_ai.core.message_batcher import MessageBatcher, BatchableMessage, BatchGroup, ContentType, BatchConfig
 
 
 def test_channel_specific_data_structures():
@@ -196,5 +198,51 @@ def test_no_batch_groups_attribute_references():
     assert 'pending_messages' in stats
 
 
+def test_expired_sweep_only_visits_due_groups():
+    """Test flush_expired_batches only checks groups whose deadline has passed."""
+    batcher = MessageBatcher()
+    for i in range(3):
+        batcher.add_message(BatchableMessage(
+            id=f"msg{i}",
+            content_type=ContentType.PR_UPDATE,
+            timestamp=datetime.now(),
+            author="user1"
+        ), f"channel{i}")
+    
+    # Age one group past max_batch_age_minutes and re-index it
+    expired_group = list(batcher._channel_batch_groups["channel1"].values())[0]
+    expired_group.created_at = datetime.now() - timedelta(minutes=10)
+    batcher._schedule_group_expiry(expired_group, "channel1")
+    
+    # Deadlines are rounded up to the wheel's one-second tick
+    with patch("devsync_ai.core.message_batcher.time.time", return_value=time.time() + 2), \
+            patch.object(BatchGroup, "should_flush", autospec=True,
+                         side_effect=BatchGroup.should_flush) as should_flush:
+        flushed = batcher.flush_expired_batches()
+    
+    assert len(flushed) == 1
+    assert should_flush.call_count == 1
+    assert "channel1" not in batcher._channel_batch_groups
+    assert batcher.get_batch_stats()['active_batches'] == 2
+
+
+def test_batch_counters_match_state():
+    """Test incrementally maintained counters agree with the stored groups."""
+    batcher = MessageBatcher(BatchConfig(max_batch_size=3))
+    for i in range(20):
+        batcher.add_message(BatchableMessage(
+            id=f"msg{i}",
+            content_type=ContentType.PR_UPDATE if i % 2 else ContentType.JIRA_UPDATE,
+            timestamp=datetime.now(),
+            author=f"user{i % 3}"
+        ), f"channel{i % 4}")
+    batcher.flush_channel_batches("channel0")
+    
+    groups = [group for channel in batcher._channel_batch_groups.values() for group in channel.values()]
+    stats = batcher.get_batch_stats()
+    assert stats['active_batches'] == len(groups)
+    assert stats['pending_messages'] == sum(len(group.messages) for group in groups)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
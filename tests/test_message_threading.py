@@ -1,5 +1,7 @@
 """Tests for message threading functionality."""
 
+import random
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -321,6 +323,114 @@ class TestMessageThreadingManager:
         assert threading_manager.config.max_thread_age_hours == 48
         assert threading_manager.config.thread_similarity_threshold == 0.9
 
+    @staticmethod
+    def _golden_messages(count, seed):
+        """Generate messages with overlapping vocabulary, metadata keys and block counts."""
+        rng = random.Random(seed)
+        words = ["deploy", "auth", "service", "down", "latency", "api", "merge", "review",
+                 "build", "failed", "cache", "db", "timeout", "release", "hotfix", "login"]
+        keys = ["author", "service", "repository", "severity", "environment", "action"]
+        messages = []
+        for _ in range(count):
+            text = " ".join(rng.choice(words).capitalize() if rng.random() < 0.2 else rng.choice(words)
+                            for _ in range(rng.randint(0, 6)))
+            metadata = {key: "x" for key in rng.sample(keys, rng.randint(0, 4))}
+            blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": text}}] * rng.randint(0, 3)
+            messages.append(SlackMessage(blocks=blocks, text=text, metadata=metadata))
+        return messages
+
+    @staticmethod
+    def _brute_force_similarity(message, vector):
+        """Reference scoring over the full concatenated thread text."""
+        text1 = set((message.text or "").lower().split())
+        text2 = set(vector["text"].lower().split())
+        similarity = 0.0
+        if text1 and text2:
+            similarity += 0.4 * (len(text1 & text2) / len(text1 | text2))
+        keys1 = set(message.metadata or {})
+        keys2 = vector["keys"]
+        if keys1 | keys2:
+            similarity += 0.3 * (len(keys1 & keys2) / len(keys1 | keys2))
+        blocks1, blocks2 = len(message.blocks), vector["blocks"]
+        if blocks1 or blocks2:
+            similarity += 0.3 * (min(blocks1, blocks2) / max(blocks1, blocks2))
+        return min(similarity, 1.0)
+
+    @pytest.mark.parametrize("threshold", [0.2, 0.5, 0.6, 0.7, 0.8])
+    def test_indexed_similarity_matches_brute_force(self, threshold):
+        """Test indexed content lookups match a full Jaccard scan on a golden set."""
+        manager = MessageThreadingManager(ThreadingConfig(
+            strategies=[ThreadingStrategy.CONTENT_BASED],
+            thread_similarity_threshold=threshold
+        ))
+        channel_id = "golden"
+        reference = {}  # parent_ts -> vector, in creation order
+
+        for i, message in enumerate(self._golden_messages(300, seed=42)):
+            expected_ts, best = None, 0.0
+            for parent_ts, vector in reference.items():
+                similarity = self._brute_force_similarity(message, vector)
+                if similarity > best and similarity >= threshold:
+                    expected_ts, best = parent_ts, similarity
+
+            expected_related = sorted(
+                ((ts, s) for ts, s in ((ts, self._brute_force_similarity(message, v)) for ts, v in reference.items())
+                 if s >= 0.5),
+                key=lambda item: item[1], reverse=True
+            )[:5]
+            related = manager._find_content_related_threads(message, channel_id, 5)
+            assert [t.parent_message_ts for t in related] == [ts for ts, _ in expected_related]
+
+            assert manager.should_thread_message(message, channel_id) == expected_ts
+
+            if expected_ts and reference[expected_ts]["messages"] < 50:
+                assert manager.add_message_to_thread(message, channel_id, expected_ts)
+                vector = reference[expected_ts]
+                vector["text"] = f"{vector['text']} {message.text}".strip()
+                vector["keys"] |= set(message.metadata)
+                vector["blocks"] += len(message.blocks)
+                vector["messages"] += 1
+            elif expected_ts is None:
+                parent_ts = f"{1700000000 + i}.000100"
+                manager.create_thread_context(message, channel_id, parent_ts)
+                reference[parent_ts] = {
+                    "text": message.text, "keys": set(message.metadata),
+                    "blocks": len(message.blocks), "messages": 0
+                }
+
+    def test_thread_tokens_are_bounded_and_unindexed(self):
+        """Test per-thread word sets are capped and expired threads leave the indexes."""
+        manager = MessageThreadingManager(ThreadingConfig(max_tokens_per_thread=5))
+        channel_id = "test_channel"
+        parent_ts = "1234567890.123456"
+
+        context = manager.create_thread_context(
+            SlackMessage(blocks=[], text="one two three", metadata={'service': 'auth'}), channel_id, parent_ts
+        )
+        manager.add_message_to_thread(SlackMessage(blocks=[], text="four five six seven", metadata={}), channel_id, parent_ts)
+
+        vector = manager._content_vectors[channel_id][context.thread_id]
+        assert list(vector['tokens']) == ["three", "four", "five", "six", "seven"]
+        assert set(manager._token_index[channel_id]) == {"three", "four", "five", "six", "seven"}
+
+        context.last_updated = datetime.now() - timedelta(hours=25)
+        manager._cleanup_expired_threads(channel_id)
+
+        assert not manager._token_index[channel_id]
+        assert not manager._metadata_key_index[channel_id]
+        assert manager.get_thread_context(channel_id, parent_ts) is None
+
+    def test_thread_context_lookup_by_timestamp(self, threading_manager, sample_pr_message, sample_jira_message):
+        """Test thread contexts are found by parent timestamp."""
+        channel_id = "test_channel"
+        pr_context = threading_manager.create_thread_context(sample_pr_message, channel_id, "1.1")
+        jira_context = threading_manager.create_thread_context(sample_jira_message, channel_id, "2.2")
+
+        assert threading_manager.get_thread_context(channel_id, "1.1") is pr_context
+        assert threading_manager.get_thread_context(channel_id, "2.2") is jira_context
+        assert threading_manager.get_thread_context(channel_id, "3.3") is None
+        assert threading_manager.get_thread_context("other_channel", "1.1") is None
+
 
 class TestThreadedMessageFormatter:
     """Test suite for ThreadedMessageFormatter."""
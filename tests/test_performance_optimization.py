@@ -156,6 +156,221 @@ class TestQueryOptimizer:
         # Should be similar after parameter normalization
         assert "SELECT * FROM users WHERE id = ?" in sig1
         assert "SELECT * FROM users WHERE id = ?" in sig2
+    
+    @staticmethod
+    def _fake_connection(query_delay: float = 0):
+        """Connection recording EXPLAIN calls; returns (context manager factory, explains)."""
+        explains = []
+        
+        conn = AsyncMock()
+        
+        async def fetchval(query, *params):
+            explains.append(query)
+            return '[{"Plan": {"Total Cost": 12.5, "Node Type": "Seq Scan"}, "Planning Time": 0.1}]'
+        
+        async def fetch(query, *params):
+            if query_delay:
+                await asyncio.sleep(query_delay)
+            return [{"id": 1}]
+        
+        conn.fetchval.side_effect = fetchval
+        conn.fetch.side_effect = fetch
+        
+        class ConnectionContext:
+            async def __aenter__(self):
+                return conn
+            
+            async def __aexit__(self, *exc):
+                return False
+        
+        return ConnectionContext, explains
+    
+    @pytest.mark.asyncio
+    async def test_query_plan_sampling(self, optimizer):
+        """Test plans are captured for the first N executions, then 1 in K."""
+        optimizer.plan_sample_first_n = 2
+        optimizer.plan_sample_rate = 5
+        connection, explains = self._fake_connection()
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            for i in range(12):
+                await optimizer.execute_optimized_query(
+                    "SELECT * FROM changelog_entries WHERE team_id = $1", [f"team{i}"],
+                    cache_strategy=CacheStrategy.NO_CACHE
+                )
+        
+        # Executions 1, 2, 7 and 12
+        assert len(explains) == 4
+        assert all("ANALYZE" in query for query in explains)
+        
+        signature = optimizer._get_query_signature("SELECT * FROM changelog_entries WHERE team_id = $1")
+        assert optimizer.plan_cache[signature]["total_cost"] == 12.5
+        assert optimizer.query_stats[signature]["last_plan_cost"] == 12.5
+        
+        stats = await optimizer.get_cache_stats()
+        assert stats["query_plans"]["cached_plans"] == 1
+        assert stats["query_plans"]["plan_captures"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_slow_queries_logged_with_plan(self, optimizer):
+        """Test slow queries always get an (estimated) plan and are logged."""
+        optimizer.plan_sample_first_n = 0
+        optimizer.plan_sample_rate = 0
+        optimizer.slow_query_threshold = 0.01
+        connection, explains = self._fake_connection(query_delay=0.02)
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            await optimizer.execute_optimized_query(
+                "SELECT * FROM performance_metrics WHERE metric_type = $1", ["latency"],
+                cache_strategy=CacheStrategy.NO_CACHE
+            )
+        
+        assert len(explains) == 1
+        assert "ANALYZE" not in explains[0]
+        
+        stats = await optimizer.get_cache_stats()
+        slow = stats["slow_queries"]
+        assert slow["count"] == 1
+        assert slow["recent"][0]["execution_time"] >= 0.01
+        assert slow["recent"][0]["plan"]["node_type"] == "Seq Scan"
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_run_one_query(self, optimizer):
+        """Test concurrent cache misses on one key share a single database query."""
+        connection, explains = self._fake_connection(query_delay=0.02)
+        query = "SELECT * FROM changelog_entries WHERE team_id = $1"
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            results = await asyncio.gather(
+                *(optimizer.execute_optimized_query(query, ["team1"]) for _ in range(5))
+            )
+            # Served from the local cache afterwards
+            await optimizer.execute_optimized_query(query, ["team1"])
+        
+        assert all(result == [{"id": 1}] for result in results)
+        
+        stats = await optimizer.get_cache_stats()
+        assert stats["overall_performance"]["cache_misses"] == 1
+        assert stats["overall_performance"]["cache_hits"] == 5
+        assert stats["local_cache"]["coalesced_loads"] == 4
+        assert stats["local_cache"]["entries"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_query_plan_invalidation(self, optimizer):
+        """Test schema changes drop cached plans and restart sampling."""
+        optimizer.plan_sample_first_n = 1
+        optimizer.plan_sample_rate = 0
+        connection, explains = self._fake_connection()
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            for table in ["changelog_entries", "performance_alerts"]:
+                for _ in range(3):
+                    await optimizer.execute_optimized_query(
+                        f"SELECT * FROM {table}", cache_strategy=CacheStrategy.NO_CACHE
+                    )
+            assert len(explains) == 2
+            
+            optimizer.invalidate_query_plans("changelog_entries")
+            assert len(optimizer.plan_cache) == 1
+            
+            await optimizer.execute_optimized_query(
+                "SELECT * FROM changelog_entries", cache_strategy=CacheStrategy.NO_CACHE
+            )
+            await optimizer.execute_optimized_query(
+                "SELECT * FROM performance_alerts", cache_strategy=CacheStrategy.NO_CACHE
+            )
+        
+        assert len(explains) == 3
+        assert len(optimizer.plan_cache) == 2
+    
+    @pytest.mark.asyncio
+    async def test_query_plan_tracking_is_bounded(self):
+        """Test per-signature plan tracking keeps only the most recent signatures."""
+        optimizer = QueryOptimizer(plan_tracking_max_signatures=3, plan_sample_first_n=1, plan_sample_rate=0)
+        connection, explains = self._fake_connection()
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            for i in range(10):
+                await optimizer.execute_optimized_query(
+                    f"SELECT * FROM table_{i}", cache_strategy=CacheStrategy.NO_CACHE
+                )
+        
+        assert len(explains) == 10
+        stats = await optimizer.get_cache_stats()
+        assert stats["query_plans"]["tracked_signatures"] == 3
+        assert stats["query_plans"]["cached_plans"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_by_team_and_table_tags(self, optimizer):
+        """Test team and table invalidation only drops entries carrying the tag."""
+        connection, _ = self._fake_connection()
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            for team in ["team1", "team2"]:
+                await optimizer.execute_optimized_query(
+                    "SELECT * FROM changelog_entries WHERE team_id = $1", [team], team_id=team
+                )
+                await optimizer.execute_optimized_query(
+                    "SELECT a.* FROM analytics_records a JOIN teams t ON t.id = a.team_id WHERE t.id = $1",
+                    [team], team_id=team
+                )
+        
+        assert len(optimizer.local_cache) == 4
+        assert len(optimizer._tag_index["team:team1"]) == 2
+        assert len(optimizer._tag_index["table:teams"]) == 2
+        
+        await optimizer.invalidate_cache(team_id="team1")
+        assert len(optimizer.local_cache) == 2
+        assert "team:team1" not in optimizer._tag_index
+        
+        await optimizer.invalidate_cache(table="changelog_entries")
+        assert len(optimizer.local_cache) == 1
+        # The remaining entry is team2's analytics query
+        assert optimizer._tag_index["team:team2"] == set(optimizer.local_cache.keys())
+        assert "table:changelog_entries" not in optimizer._tag_index
+    
+    @pytest.mark.asyncio
+    async def test_tag_index_follows_evictions(self):
+        """Test evicted and expired entries leave the tag index."""
+        optimizer = QueryOptimizer(local_cache_max_entries=2)
+        
+        for i in range(3):
+            await optimizer._store_in_cache(
+                f"key{i}", [{"id": i}], CacheStrategy.SHORT_TERM, (f"team:team{i}", "table:t")
+            )
+        
+        assert len(optimizer.local_cache) == 2
+        assert optimizer._tag_index["table:t"] == set(optimizer.local_cache.keys())
+        assert len([tag for tag in optimizer._tag_index if tag.startswith("team:")]) == 2
+        
+        optimizer.local_cache.clear()
+        assert optimizer._tag_index == {}
+    
+    @pytest.mark.asyncio
+    async def test_tags_mirrored_to_redis(self, optimizer):
+        """Test tags are mirrored into Redis sets and invalidated through them."""
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_client = fakeredis.aioredis.FakeRedis()
+        optimizer.redis_client = redis_client
+        connection, _ = self._fake_connection()
+        
+        with patch('devsync_ai.core.query_optimizer.get_database_connection', connection):
+            for team in ["team1", "team2"]:
+                await optimizer.execute_optimized_query(
+                    "SELECT * FROM changelog_entries WHERE team_id = $1", [team], team_id=team
+                )
+        
+        team1_keys = await redis_client.smembers("tag:team:team1")
+        assert len(team1_keys) == 1
+        assert len(await redis_client.smembers("tag:table:changelog_entries")) == 2
+        assert 0 < await redis_client.ttl("tag:team:team1") <= 86400
+        
+        # One local and one Redis copy of team1's entry
+        removed = await optimizer.invalidate_tags("team:team1")
+        assert removed == 2
+        assert await redis_client.exists(*team1_keys) == 0
+        assert not await redis_client.exists("tag:team:team1")
+        assert len(await redis_client.keys("query:*")) == 1
 
 
 class TestLoadBalancer:
@@ -340,6 +555,171 @@ class TestRateLimiter:
         assert "queues" in stats
         assert "buckets" in stats
         assert "rules" in stats
+    
+    @staticmethod
+    def _limiter_with_clock(backend=None):
+        """Rate limiter on a manual clock with one rule per strategy."""
+        from devsync_ai.core.rate_limiter import RateLimitRule
+        
+        clock = Mock(return_value=1_000_000.0)
+        limiter = IntelligentRateLimiter(backend=backend, clock=clock)
+        limiter.add_rule(RateLimitRule(
+            name="bucket", requests_per_second=2.0, burst_capacity=4,
+            strategy=RateLimitStrategy.TOKEN_BUCKET
+        ))
+        limiter.add_rule(RateLimitRule(
+            name="sliding", requests_per_second=1.0, burst_capacity=10, window_size_seconds=10,
+            strategy=RateLimitStrategy.SLIDING_WINDOW
+        ))
+        limiter.add_rule(RateLimitRule(
+            name="fixed", requests_per_second=0.5, burst_capacity=10, window_size_seconds=10,
+            strategy=RateLimitStrategy.FIXED_WINDOW
+        ))
+        return limiter, clock
+    
+    @pytest.mark.asyncio
+    async def test_token_bucket_burst_and_refill(self):
+        """GCRA allows the burst, then one request per refill interval."""
+        limiter, clock = self._limiter_with_clock()
+        
+        results = await limiter.check_many([("client", "bucket")] * 5)
+        assert [result.allowed for result in results] == [True, True, True, True, False]
+        assert [result.remaining_quota for result in results[:4]] == [3, 2, 1, 0]
+        assert results[4].retry_after == pytest.approx(0.5)
+        assert results[4].reason == "Token bucket exhausted"
+        
+        clock.return_value += 0.5
+        assert (await limiter.check_rate_limit("client", "bucket")).allowed is True
+        assert (await limiter.check_rate_limit("client", "bucket")).allowed is False
+        
+        # Critical requests cost half a token
+        clock.return_value += 0.5
+        results = await limiter.check_many([("client", "bucket")] * 3, RequestPriority.CRITICAL)
+        assert [result.allowed for result in results] == [True, True, False]
+    
+    @pytest.mark.asyncio
+    async def test_sliding_window_weights_previous_window(self):
+        """The previous window counts in proportion to its overlap."""
+        limiter, clock = self._limiter_with_clock()
+        clock.return_value = 1_000_008.0  # 8s into a 10s window
+        
+        results = await limiter.check_many([("client", "sliding")] * 11)
+        assert sum(result.allowed for result in results) == 10
+        assert results[-1].reason == "Sliding window limit exceeded"
+        
+        # 2.5s into the next window, 75% of the previous 10 still count
+        clock.return_value = 1_000_012.5
+        results = await limiter.check_many([("client", "sliding")] * 4)
+        assert [result.allowed for result in results] == [True, True, False, False]
+        assert results[2].retry_after == pytest.approx(0.5)
+    
+    @pytest.mark.asyncio
+    async def test_check_many_matches_sequential_checks(self):
+        """A batch gives the same results as checking one request at a time."""
+        requests = [(f"client{i % 3}", endpoint) for i in range(30) for endpoint in ("bucket", "sliding", "fixed")]
+        
+        batched, _ = self._limiter_with_clock()
+        sequential, _ = self._limiter_with_clock()
+        
+        batch_results = await batched.check_many(requests)
+        single_results = [await sequential.check_rate_limit(client, endpoint) for client, endpoint in requests]
+        
+        assert [(r.allowed, r.remaining_quota) for r in batch_results] == \
+            [(r.allowed, r.remaining_quota) for r in single_results]
+        assert batched.get_rate_limit_stats()["overall"] == sequential.get_rate_limit_stats()["overall"]
+    
+    @pytest.mark.asyncio
+    async def test_request_stats_are_bounded_without_losing_totals(self):
+        """Per endpoint/client stats are LRU-bounded; overall totals count every request."""
+        limiter, _ = self._limiter_with_clock()
+        limiter.max_tracked_stats = 10
+        
+        await limiter.check_many([(f"client{i}", "bucket") for i in range(25)])
+        await limiter.check_many([("client0", "bucket")] * 5)
+        
+        stats = limiter.get_rate_limit_stats()
+        assert len(limiter.request_stats) == 10
+        # client0's first entry was evicted by the other clients
+        assert limiter.request_stats["bucket_client0"]["total_requests"] == 5
+        assert stats["overall"]["total_requests"] == 30
+        assert stats["overall"]["throttled_requests"] == 2
+        assert stats["adaptive_state"] == {}
+
+    @pytest.mark.asyncio
+    async def test_idle_keys_are_evicted(self):
+        """Per-client state is dropped once it is equivalent to a fresh key."""
+        from devsync_ai.core.rate_limit_store import LocalRateLimitBackend, ShardedStateStore
+        
+        store = ShardedStateStore(shards=4, max_keys_per_shard=50)
+        limiter, clock = self._limiter_with_clock(LocalRateLimitBackend(store))
+        
+        await limiter.check_many([(f"client{i}", "bucket") for i in range(100)])
+        await limiter.check_many([(f"client{i}", "fixed") for i in range(100)])
+        assert len(store) == 200 - store.get_stats()["evicted_keys"]
+        assert len(store) <= 4 * 50
+        
+        # Buckets refill in 0.5s, the fixed window ends within 10s
+        clock.return_value += 10
+        for _ in range(4):
+            limiter.backend.sweep(clock())
+        assert len(store) == 0
+        assert limiter.get_rate_limit_stats()["buckets"]["tracked_keys"] == 0
+        
+        # Fresh state behaves like a new client
+        assert (await limiter.check_rate_limit("client0", "bucket")).remaining_quota == 3
+    
+    @pytest.mark.asyncio
+    async def test_throttled_queue_is_bounded(self):
+        """Throttled requests beyond the queue size drop the oldest."""
+        limiter = IntelligentRateLimiter(max_queued_requests=5)
+        
+        results = await limiter.check_many([("client", "github_api")] * 50)
+        
+        assert sum(not result.allowed for result in results) == 40
+        assert len(limiter.priority_queues[RequestPriority.NORMAL]) == 5
+    
+    @pytest.mark.asyncio
+    async def test_still_throttled_request_keeps_one_queue_entry(self):
+        """Re-checking a throttled request neither duplicates nor reorders it."""
+        limiter, clock = self._limiter_with_clock()
+        
+        results = await limiter.check_many([("client", "fixed")] * 6)
+        assert [result.allowed for result in results] == [True] * 5 + [False]
+        queue = limiter.priority_queues[RequestPriority.NORMAL]
+        throttled = queue[0]
+        
+        for _ in range(4):
+            clock.return_value += 1
+            await limiter._process_throttled_once()
+            assert list(queue) == [throttled]
+        
+        # The next window lets it through
+        clock.return_value += 10
+        await limiter._process_throttled_once()
+        assert len(queue) == 0
+    
+    @pytest.mark.asyncio
+    async def test_redis_backend_matches_local_backend(self):
+        """The Lua implementation makes the same decisions as the local one."""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        from devsync_ai.core.rate_limit_store import RedisRateLimitBackend
+        
+        local, local_clock = self._limiter_with_clock()
+        shared, shared_clock = self._limiter_with_clock(RedisRateLimitBackend(fakeredis.aioredis.FakeRedis()))
+        
+        requests = [(f"client{i % 2}", endpoint) for i in range(12) for endpoint in ("bucket", "sliding", "fixed")]
+        for step in (0.0, 0.3, 4.0, 7.7, 12.0):
+            local_clock.return_value = shared_clock.return_value = 1_000_000.0 + step
+            local_results = await local.check_many(requests)
+            shared_results = await shared.check_many(requests)
+            
+            assert [(r.allowed, r.remaining_quota) for r in shared_results] == \
+                [(r.allowed, r.remaining_quota) for r in local_results]
+            for shared_result, local_result in zip(shared_results, local_results):
+                assert shared_result.reset_time == pytest.approx(local_result.reset_time, abs=1e-3)
+                if local_result.retry_after is not None:
+                    assert shared_result.retry_after == pytest.approx(local_result.retry_after, abs=1e-3)
 
 
 class TestMemoryOptimizer:
@@ -0,0 +1,193 @@
+"""
+Tests for WebSocket fan-out in the real-time monitoring system.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from devsync_ai.analytics.monitoring_data_manager import HealthStatus, SystemHealthSnapshot
+from devsync_ai.analytics.real_time_monitoring import RealTimeMonitoringSystem
+from devsync_ai.analytics.websocket_fanout import SlowConsumerPolicy
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeWebSocket:
+    """WebSocket recording sent messages; sends wait while the gate is closed."""
+
+    def __init__(self, stalled: bool = False):
+        self.stalled = stalled
+        self.gate = asyncio.Event()
+        if not stalled:
+            self.gate.set()
+        self.sent = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        await self.gate.wait()
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+
+def make_health(tick: int) -> SystemHealthSnapshot:
+    return SystemHealthSnapshot(
+        timestamp=datetime.now(timezone.utc),
+        total_hooks=3,
+        active_hooks=2,
+        total_executions=tick,
+        overall_success_rate=1.0,
+        avg_execution_time_ms=10.0,
+        executions_per_minute=1.0,
+        error_count_last_hour=0,
+        health_status=HealthStatus.HEALTHY,
+        alerts_count=0
+    )
+
+
+def stub_collection(system: RealTimeMonitoringSystem):
+    """Replace data collection with a history point per tick."""
+    ticks = []
+
+    async def collect():
+        ticks.append(asyncio.get_running_loop().time())
+        system.current_system_health = make_health(len(ticks))
+        system.performance_history.append({'timestamp': system.current_system_health.timestamp, 'tick': len(ticks)})
+        system._history_appended += 1
+
+    async def noop():
+        pass
+
+    system._collect_system_metrics = collect
+    system._update_performance_caches = noop
+    system._check_alert_conditions = noop
+    system._cleanup_old_data = noop
+    return ticks
+
+
+async def test_stalled_clients_do_not_hold_up_the_loop():
+    """With 500 clients, some never reading, ticks stay on schedule and others get every update."""
+    system = RealTimeMonitoringSystem(update_interval=0.05, max_queued_messages=8, send_timeout=None)
+    ticks = stub_collection(system)
+    sockets = [FakeWebSocket(stalled=i % 50 == 0) for i in range(500)]
+    for websocket in sockets:
+        await system.connect_websocket(websocket)
+
+    await system._start_monitoring()
+    await asyncio.sleep(1.0)
+    await system.shutdown()
+
+    intervals = [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+    # A stalled send used to block the loop for good after the first tick
+    assert len(ticks) >= 18
+    assert max(intervals) < 0.25
+
+    healthy = [ws for ws in sockets if not ws.stalled]
+    for websocket in healthy:
+        updates = [m for m in websocket.sent if m['type'] == 'system_update']
+        assert websocket.sent[0]['type'] == 'initial_data'
+        assert [m['seq'] for m in updates] == list(range(1, len(updates) + 1))
+        assert len(updates) >= len(ticks) - 1
+        # History timestamps are serialized
+        assert isinstance(updates[-1]['performance_history'][-1]['timestamp'], str)
+    assert all(ws.closed for ws in sockets)
+
+
+async def test_slow_client_queue_is_bounded_and_coalesces_snapshots():
+    """A stalled client keeps one pending snapshot; other messages drop oldest first."""
+    system = RealTimeMonitoringSystem(max_queued_messages=4, send_timeout=None)
+    stub_collection(system)
+    stalled = FakeWebSocket(stalled=True)
+    await system.connect_websocket(stalled)
+    await asyncio.sleep(0)  # Sender picks up initial_data and stalls on it
+
+    for _ in range(10):
+        await system._collect_system_metrics()
+        await system._broadcast_system_update()
+    for i in range(10):
+        await system._broadcast_to_connections({'type': 'event', 'n': i})
+
+    stats = system.get_connection_stats()
+    assert stats['max_queue_depth'] == 4
+    assert stats['coalesced_messages'] == 9
+    assert stats['dropped_messages'] == 7
+
+    drop_oldest = RealTimeMonitoringSystem(
+        max_queued_messages=4, send_timeout=None, slow_consumer_policy=SlowConsumerPolicy.DROP_OLDEST
+    )
+    stub_collection(drop_oldest)
+    await drop_oldest.connect_websocket(FakeWebSocket(stalled=True))
+    await asyncio.sleep(0)
+    for _ in range(10):
+        await drop_oldest._collect_system_metrics()
+        await drop_oldest._broadcast_system_update()
+    assert drop_oldest.get_connection_stats()['dropped_messages'] == 6
+
+    await system.fanout.close_all()
+    await drop_oldest.fanout.close_all()
+
+
+async def test_stalled_send_times_out_and_disconnects():
+    """A send exceeding the timeout drops the client."""
+    system = RealTimeMonitoringSystem(send_timeout=0.05)
+    websocket = FakeWebSocket(stalled=True)
+    await system.connect_websocket(websocket)
+    assert websocket in system.active_connections
+
+    await asyncio.sleep(0.1)
+    assert websocket not in system.active_connections
+    assert system.get_connection_stats()['disconnected_clients'] == 1
+
+
+async def test_delta_updates_rebuild_the_full_history():
+    """Delta clients get the appended points only, falling back to full updates after a gap."""
+    system = RealTimeMonitoringSystem(send_timeout=None)
+    stub_collection(system)
+    full_client, delta_client = FakeWebSocket(), FakeWebSocket()
+    await system.connect_websocket(full_client)
+    await system.connect_websocket(delta_client, delta_updates=True)
+
+    async def tick(count: int = 1):
+        for _ in range(count):
+            await system._collect_system_metrics()
+        await system._broadcast_system_update()
+        await asyncio.sleep(0)
+
+    for _ in range(5):
+        await tick()
+    await tick(3)  # Several points between updates
+
+    kinds = [m['type'] for m in delta_client.sent[1:]]
+    assert kinds == ['system_update'] + ['system_update_delta'] * 5
+
+    history = []
+    for message in delta_client.sent[1:]:
+        if message['type'] == 'system_update':
+            history = message['performance_history']
+        else:
+            assert message['base_seq'] == message['seq'] - 1
+            history = (history + message['performance_history_append'])[-message['history_window']:]
+    assert history == full_client.sent[-1]['performance_history']
+    assert [point['tick'] for point in history] == list(range(1, 9))
+
+    # Updates coalesced while the client was slow leave a gap: it gets a full update
+    delta_client.gate.clear()
+    for _ in range(3):
+        await tick()
+    delta_client.gate.set()
+    await asyncio.sleep(0.01)
+
+    caught_up = delta_client.sent[-2:]
+    assert [(m['type'], m['seq']) for m in caught_up] == [('system_update_delta', 7), ('system_update', 9)]
+    assert caught_up[-1]['performance_history'] == full_client.sent[-1]['performance_history']
+    assert system.get_connection_stats()['coalesced_messages'] == 1
+
+    await system.fanout.close_all()
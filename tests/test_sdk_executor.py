@@ -0,0 +1,157 @@
+"""Tests for running blocking SDK calls off the event loop."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from devsync_ai.services.github import GitHubService
+from devsync_ai.services.jira import JiraService
+from devsync_ai.services.sdk_executor import SDKExecutor, get_sdk_executor
+
+
+async def _measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Return the worst observed delay of a periodic timer on the event loop."""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+def _slow_sdk_call(value):
+    time.sleep(0.2)
+    return value
+
+
+class TestSDKExecutor:
+    """Test cases for SDKExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_from_worker_thread(self):
+        """Test calls run on the pool's threads, not the loop thread."""
+        executor = SDKExecutor("test", max_workers=2)
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("test_sdk")
+        assert executor.get_stats()["completed"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_queue_depth(self):
+        """Test calls beyond max_workers wait in the queue."""
+        executor = SDKExecutor("capped", max_workers=2)
+
+        results = await asyncio.gather(*(executor.run(_slow_sdk_call, i) for i in range(6)))
+
+        stats = executor.get_stats()
+        assert results == list(range(6))
+        assert stats["max_queue_depth"] >= 4
+        assert stats["queue_depth"] == 0
+        assert stats["active"] == 0
+        assert stats["completed"] == 6
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self):
+        """Test SDK exceptions surface to the awaiting coroutine."""
+        executor = SDKExecutor("failing", max_workers=1)
+
+        def boom():
+            raise RuntimeError("sdk failure")
+
+        with pytest.raises(RuntimeError):
+            await executor.run(boom)
+
+        assert executor.get_stats()["failed"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_calls_leave_the_queue(self):
+        """Test calls cancelled before starting are not counted as queued."""
+        executor = SDKExecutor("cancelled", max_workers=1)
+        running = asyncio.ensure_future(executor.run(_slow_sdk_call, 0))
+        queued = [asyncio.ensure_future(executor.run(_slow_sdk_call, i)) for i in range(1, 4)]
+        await asyncio.sleep(0.05)
+        assert executor.get_stats()["queue_depth"] == 3
+
+        queued[0].cancel()
+        await asyncio.sleep(0)
+        assert executor.get_stats()["queue_depth"] == 2
+
+        executor.shutdown(wait=False)
+        assert await running == 0
+        assert executor.get_stats()["queue_depth"] == 0
+
+    def test_get_sdk_executor_is_shared(self):
+        """Test services share one executor per name."""
+        assert get_sdk_executor("shared-test", 3) is get_sdk_executor("shared-test", 5)
+        assert get_sdk_executor("shared-test").max_workers == 3
+
+
+class TestEventLoopResponsiveness:
+    """Slow SDK calls must not stall other coroutines."""
+
+    @pytest.mark.asyncio
+    async def test_github_calls_do_not_block_loop(self):
+        """Test event-loop lag stays low while slow PyGithub calls run."""
+        service = GitHubService(token="test-token", allowed_repository="owner/repo")
+        stop = asyncio.Event()
+
+        with patch.object(service, "check_rate_limit"):
+            monitor = asyncio.create_task(_measure_loop_lag(stop))
+            await asyncio.gather(
+                *(service._execute_with_retry(_slow_sdk_call, i) for i in range(4))
+            )
+            stop.set()
+            worst_lag = await monitor
+
+        assert worst_lag < 0.02
+
+    @pytest.mark.asyncio
+    async def test_jira_calls_do_not_block_loop(self):
+        """Test event-loop lag stays low while slow jira-python calls run."""
+        service = JiraService(
+            server_url="https://test.atlassian.net", username="test@example.com", token="token"
+        )
+        stop = asyncio.Event()
+
+        monitor = asyncio.create_task(_measure_loop_lag(stop))
+        await asyncio.gather(*(service._execute_with_retry(_slow_sdk_call, i) for i in range(4)))
+        stop.set()
+        worst_lag = await monitor
+
+        assert worst_lag < 0.02
+
+    @pytest.mark.asyncio
+    async def test_lazy_mergeable_state_read_in_pool(self):
+        """Test lazy PyGithub attribute access in check_merge_conflicts runs off the loop."""
+        service = GitHubService(token="test-token", allowed_repository="owner/repo")
+        loop_thread = threading.get_ident()
+        access_threads = []
+
+        class LazyPR:
+            @property
+            def mergeable(self):
+                access_threads.append(threading.get_ident())
+                return None
+
+            @property
+            def mergeable_state(self):
+                access_threads.append(threading.get_ident())
+                time.sleep(0.05)
+                return "unknown"
+
+        repo = Mock()
+        repo.get_pull.return_value = LazyPR()
+
+        with patch.object(service, "get_repository", return_value=repo):
+            with patch.object(service, "check_rate_limit"):
+                has_conflicts = await service.check_merge_conflicts("owner/repo", 1)
+
+        assert has_conflicts is False
+        assert access_threads
+        assert loop_thread not in access_threads
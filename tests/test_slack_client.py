@@ -0,0 +1,142 @@
+"""Tests for AsyncSlackClient connection pooling and rate limiting."""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from devsync_ai.services.slack import AsyncSlackClient, SlackService, close_slack_clients, get_slack_client
+
+
+class StubSlackAPI:
+    """Local Slack Web API stand-in that records connections and request times."""
+
+    def __init__(self):
+        self.connections = set()
+        self.request_times = []
+        self.rate_limit_first = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.request_times.append(time.monotonic())
+        body = await request.json()
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        if self.rate_limit_first:
+            self.rate_limit_first -= 1
+            return web.json_response(
+                {"ok": False, "error": "rate_limited"}, status=429, headers={"Retry-After": "1"}
+            )
+
+        return web.json_response(
+            {"ok": True, "channel": body.get("channel"), "ts": str(len(self.request_times))}
+        )
+
+
+@pytest_asyncio.fixture
+async def slack_api():
+    stub = StubSlackAPI()
+    app = web.Application()
+    app.router.add_route("*", "/api/{method}", stub.handle)
+    server = TestServer(app)
+    await server.start_server()
+    stub.base_url = str(server.make_url("/api"))
+    yield stub
+    await server.close()
+
+
+class TestAsyncSlackClient:
+    """Test cases for AsyncSlackClient."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_requests(self, slack_api):
+        """Test sequential requests share one pooled connection."""
+        client = AsyncSlackClient("xoxb-test", base_url=slack_api.base_url)
+
+        for i in range(20):
+            await client.send_message(channel=f"C{i}", text="hello")
+        await client.close()
+
+        assert len(slack_api.request_times) == 20
+        assert len(slack_api.connections) == 1
+
+    @pytest.mark.asyncio
+    async def test_send_many_preserves_order_and_limits_connections(self, slack_api):
+        """Test send_many fans out concurrently and reuses pooled connections."""
+        async with AsyncSlackClient(
+            "xoxb-test", base_url=slack_api.base_url, connection_limit_per_host=4
+        ) as client:
+            messages = [{"channel": f"C{i}", "text": f"message {i}"} for i in range(30)]
+            results = await client.send_many(messages, max_concurrency=8)
+
+        assert [result["channel"] for result in results] == [f"C{i}" for i in range(30)]
+        assert slack_api.max_in_flight <= 8
+        assert len(slack_api.connections) <= client.connection_limit_per_host
+
+    @pytest.mark.asyncio
+    async def test_close_slack_clients_releases_open_sessions(self, slack_api):
+        """Test shutdown closes the pooled session of every client that opened one."""
+        clients = [AsyncSlackClient("xoxb-test", base_url=slack_api.base_url) for _ in range(3)]
+        for client in clients[:2]:
+            await client.send_message(channel="C1", text="hello")
+        sessions = [client._session for client in clients[:2]]
+
+        await close_slack_clients()
+
+        assert all(session.closed for session in sessions)
+        assert all(client._session is None for client in clients)
+
+    @pytest.mark.asyncio
+    async def test_slack_services_share_one_client_per_token(self, monkeypatch):
+        """Test services created per request reuse one client, released on shutdown."""
+        monkeypatch.setattr("devsync_ai.services.slack.settings.slack_bot_token", "xoxb-shared", raising=False)
+
+        services = [SlackService() for _ in range(3)]
+        assert all(service.client is get_slack_client("xoxb-shared") for service in services)
+        assert get_slack_client("xoxb-other") is not services[0].client
+
+        await close_slack_clients()
+        assert SlackService().client is not services[0].client
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_all_in_flight_requests(self, slack_api):
+        """Test a rate_limited response delays every request, not only the failing one."""
+        slack_api.rate_limit_first = 1
+
+        async with AsyncSlackClient("xoxb-test", base_url=slack_api.base_url) as client:
+            start = time.monotonic()
+            await client.send_message(channel="C0", text="first")
+            results = await client.send_many(
+                [{"channel": f"C{i}", "text": "x"} for i in range(1, 4)]
+            )
+
+        assert all(result["ok"] for result in results)
+        # The rate-limited request plus everything after it waited for Retry-After
+        assert all(ts - start >= 0.9 for ts in slack_api.request_times[1:])
+
+    @pytest.mark.asyncio
+    async def test_method_tier_window(self, slack_api):
+        """Test requests beyond a method's per-minute tier wait for the window."""
+        client = AsyncSlackClient("xoxb-test", base_url=slack_api.base_url)
+        client.POST_MESSAGE_PER_MINUTE = 2
+
+        await client.send_message(channel="C1", text="a")
+        await client.send_message(channel="C1", text="b")
+        # A different channel has its own chat.postMessage window
+        await client.send_message(channel="C2", text="c")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.send_message(channel="C1", text="d"), timeout=0.2)
+
+        status = client.get_rate_limit_status()
+        assert status["recent_requests"]["chat.postMessage/C1"] == 2
+        await client.close()
@@ -387,6 +387,101 @@ def test_comprehensive_example():
     return True
 
 
+
+# Outputs of the previous multi-pass pipeline for texts it handled correctly
+PARITY_CASES = [
+    (
+        {},
+        "## Summary\n\nRefactors the **token refresh** flow so *expired* sessions retry once.\n"
+        "Thanks @alice and @bob.dev for the review!\n\n### Changes\n- Move `refresh()` into the auth service\n"
+        "- Add retry with backoff\n\n  * Nested bullet item\n\nDocs: https://docs.example.com/auth?tab=1&lang=en",
+        "## Summary\n\nRefactors the *token refresh* flow so _expired_ sessions retry once.\n"
+        "Thanks <@alice> and <@bob.dev> for the review!\n\n### Changes\n\u2022 Move `refresh()` into the auth service\n"
+        "\u2022 Add retry with backoff\n\u2022 Nested bullet item\n\n"
+        "Docs: <https://docs.example.com/auth?tab=1&amp;lang=en|docs.example.com/auth?tab=1&amp;lang=en>"
+    ),
+    (
+        {},
+        "```python\ndef hello():\n    print('world')\n```\nThen run:\n```\nSELECT * FROM users WHERE id = 1;\n```",
+        "```python\ndef hello():\n    print(&#x27;world&#x27;)\n```\nThen run:\n```sql\nSELECT * FROM users WHERE id = 1;\n```"
+    ),
+    (
+        {},
+        "Use <b>bold</b> & \"quotes\" \u2014 it's fine.\n1. step one\n2. step two\n+ plus bullet",
+        "Use &lt;b&gt;bold&lt;/b&gt; &amp; &quot;quotes&quot; \u2014 it&#x27;s fine.\n1. step one\n2. step two\n\u2022 plus bullet"
+    ),
+    (
+        {'enable_markdown_conversion': False},
+        "**not bold** ping @carol see https://example.com/x",
+        "**not bold** ping <@carol> see <https://example.com/x|example.com/x>"
+    ),
+    (
+        {'enable_auto_linking': False},
+        "**bold** *it* @dave https://example.com",
+        "*bold* _it_ @dave https://example.com"
+    ),
+]
+
+
+def test_single_pass_parity():
+    """Test the single-pass scanner reproduces the previous output exactly."""
+    for config_overrides, text, expected in PARITY_CASES:
+        processor = TextProcessor(ProcessingConfig(max_length=10000, **config_overrides))
+        assert processor.process_text(text).processed_text == expected
+
+
+def test_references_are_linked_once():
+    """Test generated links are not re-linked and PR references get PR links."""
+    config = ProcessingConfig(
+        github_repo="company/repo",
+        jira_base_url="https://jira.company.com",
+        max_length=10000
+    )
+    processor = TextProcessor(config)
+
+    result = processor.process_text(
+        "Fixes #123 (DEV-456) in commit abc123def456; PR #7 by @alice, "
+        "see [the docs](https://docs.company.com/a#12) and `#99 @bob`."
+    )
+
+    assert result.processed_text == (
+        "Fixes <https://github.com/company/repo/issues/123|#123> "
+        "(<https://jira.company.com/browse/DEV-456|DEV-456>) in commit "
+        "<https://github.com/company/repo/commit/abc123def456|abc123d>; "
+        "<https://github.com/company/repo/pull/7|PR #7> by <@alice>, "
+        "see <https://docs.company.com/a#12|the docs> and `#99 @bob`."
+    )
+    assert [item.content_type for item in result.detected_content] == [
+        ContentType.GITHUB_ISSUE,
+        ContentType.GITHUB_PR,
+        ContentType.JIRA_TICKET,
+        ContentType.COMMIT_HASH,
+        ContentType.USER_MENTION,
+        ContentType.URL
+    ]
+
+
+def test_repeated_text_is_served_from_cache():
+    """Test processing results are cached per text and configuration."""
+    processor = TextProcessor(ProcessingConfig(github_repo="company/repo"))
+    text = "Fixes #123 thanks @alice"
+
+    first = processor.process_text(text)
+    second = processor.process_text(text)
+    assert second.processed_text == first.processed_text
+    assert second.detected_content == first.detected_content
+    assert second.detected_content is not first.detected_content
+    assert processor._cache.stats.hits == 1
+
+    processor.config.enable_auto_linking = False
+    assert processor.process_text(text).processed_text == "Fixes #123 thanks @alice"
+    assert processor._cache.stats.hits == 1
+
+    uncached = TextProcessor(ProcessingConfig(cache_size=0))
+    assert uncached._cache is None
+    assert uncached.process_text(text).processed_text == "Fixes #123 thanks <@alice>"
+
+
 if __name__ == "__main__":
     print("🚀 Text Processing Utilities Test Suite")
     print("=" * 60)